@@ -6,6 +6,8 @@ import time
 from abc import ABC, abstractmethod
 from typing import Any
 
+from citrasense.acquisition.retry_scheduler import RetryHandle, RetryScheduler
+
 
 class BaseWorkQueue(ABC):
     """Base class for background work queues with worker threads, retry logic, and exponential backoff."""
@@ -29,13 +31,16 @@ class BaseWorkQueue(ABC):
         # Retry tracking (per-stage)
         self.retry_counts: dict[str, int] = {}
         self.last_failure: dict[str, float] = {}
-        self._pending_timers: list[threading.Timer] = []
+        # Retries wait on the shared scheduler thread, not one Timer thread each.
+        self._retry_scheduler = RetryScheduler.shared()
+        self._pending_retries: set[RetryHandle] = set()
         self._timer_lock = threading.Lock()
         self._clear_epoch: int = 0
 
-        # In-flight work item tracking (used by clear() to cancel active work)
+        # In-flight work items keyed by worker thread ident (used by clear()
+        # to cancel active work on every worker, not just the latest one)
         self._current_item_lock = threading.Lock()
-        self._current_item: dict[str, Any] | None = None
+        self._in_flight: dict[int, dict[str, Any]] = {}
 
         # Lifetime counters — increments are GIL-safe for simple int in CPython;
         # the lock exists to give atomic multi-field snapshots in get_stats().
@@ -175,17 +180,14 @@ class BaseWorkQueue(ABC):
 
         def resubmit():
             with self._timer_lock:
-                if timer in self._pending_timers:
-                    self._pending_timers.remove(timer)
+                self._pending_retries.discard(handle)
             self._set_retry_scheduled_time(item, None)
             self._update_status_on_resubmit(item)
             self.work_queue.put(item)
 
-        timer = threading.Timer(backoff, resubmit)
-        timer.daemon = True
         with self._timer_lock:
-            self._pending_timers.append(timer)
-        timer.start()
+            handle = self._retry_scheduler.schedule(backoff, resubmit)
+            self._pending_retries.add(handle)
 
     def _worker_loop(self):
         """Worker thread main loop."""
@@ -197,8 +199,9 @@ class BaseWorkQueue(ABC):
 
                 task_id = item["task_id"]
 
+                worker_id = threading.get_ident()
                 with self._current_item_lock:
-                    self._current_item = item
+                    self._in_flight[worker_id] = item
                 try:
                     self._set_executing(item, True)
                     self.total_attempts += 1
@@ -252,7 +255,7 @@ class BaseWorkQueue(ABC):
 
                 finally:
                     with self._current_item_lock:
-                        self._current_item = None
+                        self._in_flight.pop(worker_id, None)
                     self.work_queue.task_done()
 
             except queue.Empty:
@@ -270,13 +273,14 @@ class BaseWorkQueue(ABC):
         self._clear_epoch += 1
 
         with self._current_item_lock:
-            if self._current_item is not None:
-                self._cancel_current_item(self._current_item)
+            in_flight = list(self._in_flight.values())
+        for item in in_flight:
+            self._cancel_current_item(item)
 
         with self._timer_lock:
-            for t in self._pending_timers:
-                t.cancel()
-            self._pending_timers.clear()
+            for handle in self._pending_retries:
+                handle.cancel()
+            self._pending_retries.clear()
 
         # Max out retry counts so _should_retry() returns False for any
         # in-flight task that completes after this point.
@@ -323,6 +327,12 @@ class BaseWorkQueue(ABC):
         self.logger.info(f"Stopping {self.__class__.__name__}...")
         self.running = False
 
+        # Retries would re-queue into a queue nobody reads any more.
+        with self._timer_lock:
+            for handle in self._pending_retries:
+                handle.cancel()
+            self._pending_retries.clear()
+
         # Send poison pills
         for _ in range(self.num_workers):
             self.work_queue.put(None)
@@ -9,6 +9,11 @@ Two item shapes flow through the queue, dispatched on ``item["kind"]``:
   → artifact writer) runs and either enqueues an upload or drops the
   observation with a logged reason.
 
+Optical presentation artifacts (annotated JPEG, HTML report) are built
+inline by default.  With a :class:`RenderQueue` attached and
+``defer_presentation_rendering`` enabled they are handed to that lane
+after the pipeline returns, so the upload isn't held up by rendering.
+
 Radar work does not retry — the chain is deterministic and idempotent
 — so failures on that path are surfaced as ``_on_permanent_failure``
 immediately by the base worker loop after the (small) max-retry
@@ -25,6 +30,7 @@ from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 from citrasense.acquisition.base_work_queue import BaseWorkQueue
+from citrasense.acquisition.render_queue import RenderJob, RenderQueue
 from citrasense.pipelines.optical.optical_processing_context import OpticalProcessingContext
 
 if TYPE_CHECKING:
@@ -38,7 +44,7 @@ class ProcessingQueue(BaseWorkQueue):
     processing.
     """
 
-    def __init__(self, num_workers: int = 1, settings=None, logger=None):
+    def __init__(self, num_workers: int = 1, settings=None, logger=None, render_queue: RenderQueue | None = None):
         """
         Initialize processing queue.
 
@@ -46,8 +52,15 @@ class ProcessingQueue(BaseWorkQueue):
             num_workers: Number of concurrent processing threads (default: 1)
             settings: Settings instance with retry configuration
             logger: Logger instance
+            render_queue: Lane for deferred presentation rendering (None renders inline)
         """
         super().__init__(num_workers, settings, logger)
+        self.render_queue = render_queue
+
+    @property
+    def defers_rendering(self) -> bool:
+        """True when presentation artifacts go to the render lane instead of being built inline."""
+        return self.render_queue is not None and bool(getattr(self.settings, "defer_presentation_rendering", False))
 
     def submit(self, task_id: str, image_path: Path, context: dict, on_complete: Callable):
         """
@@ -179,6 +192,7 @@ class ProcessingQueue(BaseWorkQueue):
                 pointing_report=item["context"].get("pointing_report"),
                 tracking_mode=item["context"].get("tracking_mode"),
                 logger=self.logger,
+                defer_rendering=self.defers_rendering,
             )
             processor_registry = item["context"].get("processor_registry")
             if processor_registry is None:
@@ -201,6 +215,9 @@ class ProcessingQueue(BaseWorkQueue):
                     context.image_path.name,
                 )
 
+            if context.defer_rendering:
+                item["render_job"] = self._build_render_job(item, context)
+
             # Success
             self.logger.info(f"Task {task_id} processed in {result.total_time:.2f}s")
             return (True, result)
@@ -232,7 +249,53 @@ class ProcessingQueue(BaseWorkQueue):
         if retention == 0:
             self._cleanup_working_dir(task_id, sensor_id)
 
-        on_complete(task_id, result)
+        render_job = item.pop("render_job", None)
+        try:
+            on_complete(task_id, result)
+        finally:
+            # After on_complete, so the analysis-index row the render callback updates already exists.
+            if render_job is not None and self.render_queue is not None:
+                self.render_queue.submit(render_job)
+
+    def _build_render_job(self, item: dict[str, Any], context: OpticalProcessingContext) -> RenderJob | None:
+        """Package the deferred annotated image (and, if output is kept, the HTML report) as a render job.
+
+        The snapshot holds everything the annotated render needs, so it
+        survives the working-dir cleanup.  The report reads its inputs
+        from the working dir, so it is only built when that dir is retained.
+        """
+        from citrasense.pipelines.optical.annotated_image_processor import AnnotatedImageProcessor
+        from citrasense.pipelines.optical.report_generator import generate_html_report
+
+        snapshot = context.deferred_annotation
+        keep_output = getattr(self.settings, "processing_output_retention_hours", 0) != 0
+        if snapshot is None and not keep_output:
+            return None
+        on_rendered: Callable[[str, str, bytes], None] | None = item["context"].get("on_rendered")
+        working_dir = context.working_dir
+        logger = self.logger
+
+        def _render(job: RenderJob) -> dict[str, Any]:
+            out: dict[str, Any] = {}
+            if snapshot is not None:
+                processor = AnnotatedImageProcessor()
+                image_bytes = processor.render(snapshot, job.check_cancelled)
+                preview_path, _ = processor.write_rendered(image_bytes, snapshot, write_working_copy=keep_output)
+                out["image_path"] = str(preview_path)
+                # The rolling preview may already hold another task's render by the time on_done runs.
+                out["image_bytes"] = image_bytes
+            if keep_output:
+                job.check_cancelled()
+                report = generate_html_report(working_dir, report_logger=logger)
+                out["report_path"] = str(report) if report else None
+            return out
+
+        def _done(job: RenderJob) -> None:
+            result = job.result or {}
+            if on_rendered and result.get("image_path"):
+                on_rendered(job.task_id, result["image_path"], result["image_bytes"])
+
+        return RenderJob(task_id=item["task_id"], render=_render, on_done=_done)
 
     def _on_permanent_failure(self, item):
         """Handle permanent processing failure (fail-open: upload raw image)."""
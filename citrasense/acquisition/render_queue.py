@@ -0,0 +1,283 @@
+"""Deferred render lane for presentation artifacts.
+
+The annotated preview JPEG and the HTML report are for humans — nothing
+downstream of processing needs them before the upload.  When deferral is
+enabled, :class:`ProcessingQueue` snapshots what the renderer needs and
+hands a :class:`RenderJob` to this lane instead of rendering inline, so
+the task reaches the :class:`UploadQueue` as soon as the science is done.
+
+The lane has its own worker budget (``render_workers``) and differs from
+:class:`BaseWorkQueue` in three ways that matter for throwaway work:
+
+- **Keyed by task** — submitting a second job for the same task (the next
+  exposure of a multi-image task) supersedes and cancels the first.
+- **Cancellable** — jobs poll :meth:`RenderJob.check_cancelled` between
+  render steps; pending jobs past ``max_pending`` are dropped oldest-first
+  so a slow renderer can't pin a backlog of full-resolution frames.
+- **On demand** — :meth:`RenderQueue.render_now` runs a pending job in the
+  caller's thread (or waits for the in-flight one) when the web UI asks
+  for an artifact that hasn't been built yet.
+
+There are no retries: a failed render is logged and forgotten.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+
+class RenderCancelled(Exception):
+    """Raised inside a render callable when its job has been cancelled."""
+
+
+@dataclass
+class RenderJob:
+    """One task's deferred presentation work.
+
+    Attributes:
+        task_id: Task the artifacts belong to (dedupe / lookup key).
+        render: Callable doing the work; receives the job so it can call
+            :meth:`check_cancelled` between steps.  Its return value is
+            stored on :attr:`result`.
+        on_done: Called with the job after a successful render, before
+            :meth:`wait` returns — so on-demand callers see its side effects.
+    """
+
+    task_id: str
+    render: Callable[[RenderJob], Any]
+    on_done: Callable[[RenderJob], None] | None = None
+    submitted_at: float = field(default_factory=time.time)
+    started_at: float | None = None
+    finished_at: float | None = None
+    result: Any = None
+    error: str | None = None
+    _cancel_event: threading.Event = field(default_factory=threading.Event, repr=False)
+    _done_event: threading.Event = field(default_factory=threading.Event, repr=False)
+
+    def cancel(self) -> None:
+        self._cancel_event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancel_event.is_set()
+
+    def check_cancelled(self) -> None:
+        """Raise :class:`RenderCancelled` if the job was cancelled."""
+        if self._cancel_event.is_set():
+            raise RenderCancelled(self.task_id)
+
+    @property
+    def done(self) -> bool:
+        return self._done_event.is_set()
+
+    @property
+    def succeeded(self) -> bool:
+        return self.done and self.error is None and not self.cancelled
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """Block until the job finishes (rendered, failed or cancelled)."""
+        return self._done_event.wait(timeout)
+
+
+class RenderQueue:
+    """Worker pool for :class:`RenderJob`s, keyed by task id."""
+
+    def __init__(self, num_workers: int = 1, logger=None, max_pending: int = 8):
+        """
+        Initialize render queue.
+
+        Args:
+            num_workers: Concurrent render threads (the lane's CPU budget)
+            logger: Logger instance
+            max_pending: Queued jobs kept before the oldest is dropped
+        """
+        self.num_workers = max(1, num_workers)
+        self.max_pending = max(1, max_pending)
+        self.logger = logger.getChild(type(self).__name__)
+        self.workers: list[threading.Thread] = []
+        self.running = False
+
+        self._cond = threading.Condition()
+        self._pending: OrderedDict[str, RenderJob] = OrderedDict()
+        self._in_flight: dict[str, RenderJob] = {}
+
+        self.total_submitted = 0
+        self.total_rendered = 0
+        self.total_failed = 0
+        self.total_cancelled = 0
+        self.total_on_demand = 0
+        self._render_seconds = 0.0
+
+    # ── Submission / cancellation ──────────────────────────────────────
+
+    def submit(self, job: RenderJob) -> None:
+        """Queue *job*, superseding any pending or in-flight job for the same task."""
+        dropped: list[RenderJob] = []
+        with self._cond:
+            previous = self._pending.pop(job.task_id, None)
+            if previous is not None:
+                dropped.append(previous)
+            running = self._in_flight.get(job.task_id)
+            if running is not None:
+                running.cancel()
+            self._pending[job.task_id] = job
+            while len(self._pending) > self.max_pending:
+                _tid, oldest = self._pending.popitem(last=False)
+                self.logger.warning(f"Render backlog full, dropping render for {oldest.task_id}")
+                dropped.append(oldest)
+            self.total_submitted += 1
+            self._cond.notify()
+        for old in dropped:
+            self._finish_cancelled(old)
+
+    def cancel(self, task_id: str) -> bool:
+        """Cancel the pending or in-flight job for *task_id*.  Returns True if one existed."""
+        with self._cond:
+            job = self._pending.pop(task_id, None)
+            running = self._in_flight.get(task_id)
+        if job is not None:
+            self._finish_cancelled(job)
+        if running is not None:
+            running.cancel()
+        return job is not None or running is not None
+
+    def clear(self) -> int:
+        """Cancel every pending and in-flight job.  Returns the number of pending jobs dropped."""
+        with self._cond:
+            pending = list(self._pending.values())
+            self._pending.clear()
+            for running in self._in_flight.values():
+                running.cancel()
+        for job in pending:
+            self._finish_cancelled(job)
+        return len(pending)
+
+    def render_now(self, task_id: str, timeout: float = 30.0) -> RenderJob | None:
+        """Render *task_id*'s artifacts on demand.
+
+        A pending job is taken off the queue and run in the calling thread;
+        an in-flight one is waited on (up to *timeout*).  Returns the job,
+        or ``None`` if the lane has nothing for that task.
+        """
+        running: RenderJob | None = None
+        with self._cond:
+            job = self._pending.pop(task_id, None)
+            if job is not None:
+                self._in_flight[task_id] = job
+                self.total_on_demand += 1
+            else:
+                running = self._in_flight.get(task_id)
+        if job is not None:
+            self.logger.info(f"Rendering {task_id} on demand")
+            self._run(job)
+            return job
+        if running is not None:
+            running.wait(timeout)
+            return running
+        return None
+
+    def has_job(self, task_id: str) -> bool:
+        with self._cond:
+            return task_id in self._pending or task_id in self._in_flight
+
+    # ── Worker ─────────────────────────────────────────────────────────
+
+    def _next_job(self) -> RenderJob | None:
+        with self._cond:
+            while self.running and not self._pending:
+                self._cond.wait(timeout=1)
+            if not self.running:
+                return None
+            task_id, job = self._pending.popitem(last=False)
+            self._in_flight[task_id] = job
+            return job
+
+    def _worker_loop(self):
+        while self.running:
+            job = self._next_job()
+            if job is not None:
+                self._run(job)
+
+    def _run(self, job: RenderJob) -> None:
+        job.started_at = time.time()
+        try:
+            job.check_cancelled()
+            job.result = job.render(job)
+            job.check_cancelled()
+            if job.on_done is not None:
+                job.on_done(job)
+            with self._cond:
+                self.total_rendered += 1
+                self._render_seconds += time.time() - job.started_at
+        except RenderCancelled:
+            self.logger.debug(f"Render for {job.task_id} cancelled")
+            with self._cond:
+                self.total_cancelled += 1
+        except Exception as e:
+            job.error = str(e)
+            self.logger.warning(f"Render failed for {job.task_id}: {e}", exc_info=True)
+            with self._cond:
+                self.total_failed += 1
+        finally:
+            job.finished_at = time.time()
+            with self._cond:
+                if self._in_flight.get(job.task_id) is job:
+                    del self._in_flight[job.task_id]
+            job._done_event.set()
+
+    def _finish_cancelled(self, job: RenderJob) -> None:
+        job.cancel()
+        job.finished_at = time.time()
+        with self._cond:
+            self.total_cancelled += 1
+        job._done_event.set()
+
+    # ── Lifecycle / stats ──────────────────────────────────────────────
+
+    def is_idle(self) -> bool:
+        """Return True if no jobs are queued or rendering."""
+        with self._cond:
+            return not self._pending and not self._in_flight
+
+    def get_stats(self) -> dict:
+        """Return a consistent snapshot of lifetime counters."""
+        with self._cond:
+            return {
+                "submitted": self.total_submitted,
+                "rendered": self.total_rendered,
+                "failed": self.total_failed,
+                "cancelled": self.total_cancelled,
+                "on_demand": self.total_on_demand,
+                "pending": len(self._pending),
+                "avg_render_seconds": (
+                    round(self._render_seconds / self.total_rendered, 3) if self.total_rendered else None
+                ),
+            }
+
+    def start(self):
+        """Start worker threads."""
+        self.running = True
+        for i in range(self.num_workers):
+            worker = threading.Thread(
+                target=self._worker_loop, name=f"{self.__class__.__name__}-Worker-{i}", daemon=True
+            )
+            worker.start()
+            self.workers.append(worker)
+            self.logger.info(f"Started {self.__class__.__name__} worker {i}")
+
+    def stop(self):
+        """Stop workers; pending renders are cancelled (they are presentation-only)."""
+        self.logger.info(f"Stopping {self.__class__.__name__}...")
+        self.running = False
+        self.clear()
+        with self._cond:
+            self._cond.notify_all()
+        for worker in self.workers:
+            worker.join(timeout=5)
+        self.workers = []
+        self.logger.info(f"{self.__class__.__name__} stopped")
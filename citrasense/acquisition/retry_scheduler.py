@@ -0,0 +1,110 @@
+"""One timer thread for every delayed retry in the process.
+
+:class:`BaseWorkQueue` used to start a :class:`threading.Timer` (a thread)
+per failed item.  That is fine for a handful of retries.  During a long
+upload outage it meant thousands of sleeping threads.
+:class:`RetryScheduler` keeps a heap of due times instead.  One daemon
+thread sleeps until the earliest one and runs its callback.
+
+Callbacks run on the scheduler thread and must be quick (re-queue an
+item, not do the work).  An exception in one is logged and does not stop
+the others.
+"""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+import logging
+import threading
+import time
+from collections.abc import Callable
+
+logger = logging.getLogger("citrasense.RetryScheduler")
+
+
+class RetryHandle:
+    """A scheduled callback; :meth:`cancel` stops it from running if it hasn't yet."""
+
+    __slots__ = ("callback", "cancelled", "due", "fired")
+
+    def __init__(self, due: float, callback: Callable[[], None]) -> None:
+        self.due = due
+        self.callback = callback
+        self.cancelled = False
+        self.fired = False
+
+    def cancel(self) -> None:
+        self.cancelled = True
+
+    @property
+    def finished(self) -> bool:
+        return self.cancelled or self.fired
+
+
+class RetryScheduler:
+    """Heap of pending callbacks served by a single lazily-started daemon thread."""
+
+    _shared: RetryScheduler | None = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, name: str = "RetryScheduler") -> None:
+        self._name = name
+        self._heap: list[tuple[float, int, RetryHandle]] = []
+        self._seq = itertools.count()
+        self._cond = threading.Condition()
+        self._thread: threading.Thread | None = None
+
+    @classmethod
+    def shared(cls) -> RetryScheduler:
+        """The process-wide scheduler used by every work queue."""
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+
+    def schedule(self, delay: float, callback: Callable[[], None]) -> RetryHandle:
+        """Run *callback* on the scheduler thread after *delay* seconds."""
+        handle = RetryHandle(time.monotonic() + max(0.0, delay), callback)
+        with self._cond:
+            heapq.heappush(self._heap, (handle.due, next(self._seq), handle))
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name=self._name, daemon=True)
+                self._thread.start()
+            self._cond.notify()
+        return handle
+
+    def expedite(self, handles: list[RetryHandle]) -> None:
+        """Make the given still-pending callbacks due now."""
+        now = time.monotonic()
+        with self._cond:
+            for handle in handles:
+                if not handle.finished and handle.due > now:
+                    handle.due = now
+                    heapq.heappush(self._heap, (now, next(self._seq), handle))
+            self._cond.notify()
+
+    def pending(self) -> int:
+        with self._cond:
+            return sum(1 for _, _, h in self._heap if not h.finished)
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while True:
+                    # Drop cancelled entries and stale copies left behind by expedite().
+                    while self._heap and (self._heap[0][2].finished or self._heap[0][0] != self._heap[0][2].due):
+                        heapq.heappop(self._heap)
+                    if not self._heap:
+                        self._cond.wait()
+                        continue
+                    wait = self._heap[0][0] - time.monotonic()
+                    if wait <= 0:
+                        break
+                    self._cond.wait(wait)
+                handle = heapq.heappop(self._heap)[2]
+                handle.fired = True
+            try:
+                handle.callback()
+            except Exception:
+                logger.exception("Retry callback failed")
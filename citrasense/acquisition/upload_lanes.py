@@ -0,0 +1,182 @@
+"""Size-aware work queue for :class:`~citrasense.acquisition.upload_queue.UploadQueue`.
+
+A plain FIFO made a radar batch or a few KB of observation JSON wait
+behind every 60 MB FITS image queued before it.  :class:`UploadLanes` is
+a drop-in :class:`queue.Queue` for :class:`BaseWorkQueue` workers that
+sorts items into lanes:
+
+- ``radar`` and ``observations`` — small, latency-sensitive JSON posts.
+  Always handed out first, in submission order.
+- ``image`` — FITS uploads.  At most ``image_slots`` run at once, so with
+  several workers one is always free for small payloads.  Images are
+  ordered by ``queued_at + size / IMAGE_AGING_BYTES_PER_S``.  A smaller
+  image can therefore overtake a bigger one queued shortly before it, but
+  it can't starve it.
+
+``qsize()`` is the total backlog.  ``get()`` only returns items a worker
+may start now.  Poison pills (``None``) go last, as in a FIFO.  Per-lane
+throughput and queue-age figures come from :meth:`UploadLanes.lane_stats`.
+"""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+import queue
+import statistics
+import time
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+LANES = ("radar", "observations", "image")
+
+#: Images trade queue position against size at this rate: a 60 MB image
+#: yields to smaller ones queued up to a minute after it.
+IMAGE_AGING_BYTES_PER_S = 1_000_000
+
+_THROUGHPUT_WINDOW_S = 60.0
+_RECENT_WAITS = 256
+
+
+@dataclass
+class _LaneStats:
+    pending: int = 0
+    in_flight: int = 0
+    completed: int = 0
+    failed: int = 0
+    bytes: int = 0
+    recent_waits: deque[float] = field(default_factory=lambda: deque(maxlen=_RECENT_WAITS))
+    # (finished_at, bytes) of uploads completed within the throughput window
+    recent_done: deque[tuple[float, int]] = field(default_factory=deque)
+
+
+class UploadLanes(queue.Queue):
+    """Priority work queue for upload items; see the module docstring.
+
+    Args:
+        classify: Maps a work item to ``(lane, size_bytes)``; lane is one of :data:`LANES`
+        image_slots: Image uploads allowed to run concurrently
+    """
+
+    def __init__(self, classify: Callable[[dict[str, Any]], tuple[str, int]], image_slots: int = 1) -> None:
+        self._classify = classify
+        self.image_slots = max(1, image_slots)
+        super().__init__()
+
+    # ── queue.Queue hooks (called with self.mutex held) ────────────────
+
+    def _init(self, maxsize: int) -> None:
+        self._small: list[tuple[int, int, dict[str, Any]]] = []
+        self._images: list[tuple[float, int, dict[str, Any]]] = []
+        self._pills = 0
+        self._seq = itertools.count()
+        self._active_images = 0
+        self._lanes = {name: _LaneStats() for name in LANES}
+
+    def _qsize(self) -> int:
+        # What get() may hand out right now; qsize() reports the whole backlog.
+        images = len(self._images) if self._active_images < self.image_slots else 0
+        return len(self._small) + images + self._pills
+
+    def _put(self, item: dict[str, Any] | None) -> None:
+        if item is None:
+            self._pills += 1
+            return
+        lane, size = item["_upload_lane"], item["_upload_bytes"]
+        now = time.time()
+        item["_queued_at"] = now
+        self._lanes[lane].pending += 1
+        if lane == "image":
+            heapq.heappush(self._images, (now + size / IMAGE_AGING_BYTES_PER_S, next(self._seq), item))
+        else:
+            heapq.heappush(self._small, (LANES.index(lane), next(self._seq), item))
+
+    def _get(self) -> dict[str, Any] | None:
+        if self._small:
+            item = heapq.heappop(self._small)[-1]
+        elif self._images and self._active_images < self.image_slots:
+            item = heapq.heappop(self._images)[-1]
+            self._active_images += 1
+        else:
+            self._pills -= 1
+            return None
+        stats = self._lanes[item["_upload_lane"]]
+        stats.pending -= 1
+        stats.in_flight += 1
+        stats.recent_waits.append(time.time() - item["_queued_at"])
+        return item
+
+    # ── Public API ─────────────────────────────────────────────────────
+
+    def put(self, item: dict[str, Any] | None, block: bool = True, timeout: float | None = None) -> None:
+        # Classify outside the mutex: it may stat files or serialise payloads.
+        if item is not None:
+            item["_upload_lane"], item["_upload_bytes"] = self._classify(item)
+        super().put(item, block, timeout)
+
+    def qsize(self) -> int:
+        with self.mutex:
+            return len(self._small) + len(self._images) + self._pills
+
+    def finish(self, item: dict[str, Any], success: bool) -> None:
+        """Record the outcome of an item handed out by :meth:`get` and free its image slot.
+
+        Items that did not come through :meth:`get` (direct ``_execute_work``
+        calls in tests) are ignored.
+        """
+        lane = item.pop("_upload_lane", None)
+        if lane is None:
+            return
+        size = item.pop("_upload_bytes", 0)
+        now = time.time()
+        with self.not_empty:
+            stats = self._lanes[lane]
+            stats.in_flight -= 1
+            if success:
+                stats.completed += 1
+                stats.bytes += size
+                stats.recent_done.append((now, size))
+            else:
+                stats.failed += 1
+            if lane == "image":
+                self._active_images -= 1
+                self.not_empty.notify()
+
+    def drain(self) -> list[dict[str, Any]]:
+        """Remove and return every pending item, including images waiting for a slot."""
+        with self.mutex:
+            items = [entry[-1] for entry in self._small + self._images]
+            self._small.clear()
+            self._images.clear()
+            for item in items:
+                self._lanes[item.pop("_upload_lane")].pending -= 1
+        for _ in items:
+            self.task_done()
+        return items
+
+    def lane_stats(self) -> dict[str, dict[str, Any]]:
+        """Per-lane backlog, throughput over the last minute and queue-wait figures."""
+        now = time.time()
+        queued_at: dict[str, list[float]] = {name: [] for name in LANES}
+        with self.mutex:
+            for entry in self._small + self._images:
+                queued_at[entry[-1]["_upload_lane"]].append(entry[-1]["_queued_at"])
+            result = {}
+            for name, stats in self._lanes.items():
+                while stats.recent_done and stats.recent_done[0][0] < now - _THROUGHPUT_WINDOW_S:
+                    stats.recent_done.popleft()
+                waits = list(stats.recent_waits)
+                result[name] = {
+                    "pending": stats.pending,
+                    "in_flight": stats.in_flight,
+                    "completed": stats.completed,
+                    "failed": stats.failed,
+                    "bytes": stats.bytes,
+                    "bytes_per_second": round(sum(b for _, b in stats.recent_done) / _THROUGHPUT_WINDOW_S, 1),
+                    "oldest_pending_age_s": round(now - min(queued_at[name]), 3) if queued_at[name] else 0.0,
+                    "wait_p50_s": round(statistics.median(waits), 3) if waits else None,
+                    "wait_max_s": round(max(waits), 3) if waits else None,
+                }
+        return result
@@ -8,15 +8,49 @@ payload per item, posted in a batch-of-one to
 Completion (mark_task_complete, stage cleanup, stats) is handled by the
 telescope task's _on_image_done callback after all images for a task finish.
 Radar uploads run independently of any Task object.
+
+Items wait in :class:`~citrasense.acquisition.upload_lanes.UploadLanes`
+rather than a FIFO.  Radar batches and observation JSON go out ahead of
+FITS images, and images never occupy every worker.
+
+With an :class:`~citrasense.acquisition.upload_spool.UploadSpool`, every
+item is written to disk at submit time and removed once it is uploaded
+(or given up on).  :meth:`UploadQueue.resubmit_spooled` brings the
+leftovers back after a restart.
+
+After :data:`OFFLINE_AFTER_FAILURES` failures in a row the queue treats
+the uplink as down:
+
+- Failed and newly submitted items are *parked*.  A parked item is a slim
+  in-memory stub; its payload stays in the spool.  Parking does not use
+  up the item's retries.
+- One parked item at a time is retried every
+  :attr:`UploadQueue.probe_interval_seconds`.
+- The first success empties the parking list back into the lanes and
+  makes every pending backoff retry due now.  The backlog then drains on
+  all workers at once instead of trickling out as backoff timers expire.
 """
 
 from __future__ import annotations
 
+import json
+import os
+import threading
+from collections import deque
 from collections.abc import Callable
 from pathlib import Path
 from typing import Any
 
 from citrasense.acquisition.base_work_queue import BaseWorkQueue
+from citrasense.acquisition.retry_scheduler import RetryHandle
+from citrasense.acquisition.upload_lanes import UploadLanes
+from citrasense.acquisition.upload_spool import UploadSpool
+
+#: Consecutive failed uploads after which the uplink is treated as down.
+OFFLINE_AFTER_FAILURES = 5
+
+# Item fields that are reloaded from the spool instead of kept while parked.
+_SPOOLED_FIELDS = ("payload", "processing_result", "satellite_observations")
 
 
 class UploadQueue(BaseWorkQueue):
@@ -29,16 +63,42 @@ class UploadQueue(BaseWorkQueue):
     all images for a task have finished (see _on_image_done).
     """
 
-    def __init__(self, num_workers: int = 1, settings=None, logger=None):
+    #: While offline, one parked item is retried this often to notice the uplink coming back.
+    probe_interval_seconds: float = 5.0
+
+    def __init__(
+        self,
+        num_workers: int = 1,
+        settings=None,
+        logger=None,
+        spool: UploadSpool | None = None,
+        sensor_id: str = "",
+    ):
         """
         Initialize upload queue.
 
         Args:
-            num_workers: Number of concurrent upload threads (default: 1, network is bottleneck)
+            num_workers: Number of concurrent upload threads; all but one may carry images
             settings: Settings instance with retry configuration
             logger: Logger instance
+            spool: Durable store for items not yet uploaded; None keeps them in memory only
+            sensor_id: Owner of this queue's rows in a shared *spool*
         """
         super().__init__(num_workers, settings, logger)
+        self.work_queue = UploadLanes(self._classify, image_slots=num_workers - 1)
+        self.spool = spool
+        self.sensor_id = sensor_id
+
+        # Uplink state (see module docstring)
+        self._link_lock = threading.Lock()
+        self._consecutive_failures = 0
+        self.offline = False
+        self._parked: deque[dict[str, Any]] = deque()
+        self._probe: RetryHandle | None = None
+        self._stopped = False
+        # task_id -> [images outstanding, any succeeded, api_client] for items recovered from the spool
+        self._recovered_tasks: dict[str, list] = {}
+        self._recovered_lock = threading.Lock()
 
         # Session-scoped counters for upload path breakdown
         self.observation_uploads: int = 0
@@ -46,6 +106,35 @@ class UploadQueue(BaseWorkQueue):
         self.satellites_identified: int = 0
         self.radar_observation_uploads: int = 0
 
+    def get_lane_stats(self) -> dict[str, dict[str, Any]]:
+        """Per-lane backlog, throughput and queue age (see :meth:`UploadLanes.lane_stats`)."""
+        return self.work_queue.lane_stats()
+
+    def clear(self) -> int:
+        # Drain the lanes first: the base class's get_nowait() would count items as started,
+        # and images held back for a free slot are invisible to it anyway.
+        drained = self.work_queue.drain()
+        for item in drained:
+            self._abandon_image(item)
+        count = len(drained) + super().clear()
+        with self._link_lock:
+            count += len(self._parked)
+            self._parked.clear()
+            if self._probe is not None:
+                self._probe.cancel()
+        if self.spool is not None:
+            self.spool.discard(self.sensor_id)
+        return count
+
+    def stop(self):
+        # Parked and retrying items stay in the spool for the next queue to resubmit.
+        self._stopped = True
+        with self._link_lock:
+            self._parked.clear()
+            if self._probe is not None:
+                self._probe.cancel()
+        super().stop()
+
     def get_stats(self) -> dict:
         """Return lifetime counters including upload path breakdown."""
         stats = super().get_stats()
@@ -54,6 +143,11 @@ class UploadQueue(BaseWorkQueue):
             stats["image_uploads"] = self.image_uploads
             stats["satellites_identified"] = self.satellites_identified
             stats["radar_observation_uploads"] = self.radar_observation_uploads
+        with self._link_lock:
+            stats["parked"] = len(self._parked)
+            stats["offline"] = int(self.offline)
+        if self.spool is not None:
+            stats["spooled"] = self.spool.count(self.sensor_id)
         return stats
 
     def submit(
@@ -83,7 +177,7 @@ class UploadQueue(BaseWorkQueue):
             sensor_location: Observer location dict with latitude/longitude/altitude keys
         """
         self.logger.info(f"Queuing task {task_id} for upload")
-        self.work_queue.put(
+        self._enqueue(
             {
                 "kind": "optical",
                 "task_id": task_id,
@@ -114,7 +208,7 @@ class UploadQueue(BaseWorkQueue):
         straightforward.
         """
         task_id = f"radar:{sensor_id}:{id(payload)}"
-        self.work_queue.put(
+        self._enqueue(
             {
                 "kind": "radar",
                 "task_id": task_id,
@@ -126,11 +220,202 @@ class UploadQueue(BaseWorkQueue):
             }
         )
 
+    # ── Spool / uplink state ───────────────────────────────────────────
+
+    def _enqueue(self, item: dict[str, Any]) -> None:
+        if self.spool is not None:
+            item["spool_id"] = self.spool.add(self.sensor_id, item["task_id"], item["kind"], self._spool_record(item))
+            if self.offline:
+                self._park(item)
+                return
+        self.work_queue.put(item)
+
+    def _spool_record(self, item: dict[str, Any]) -> dict[str, Any]:
+        if item["kind"] == "radar":
+            return {"sensor_id": item["sensor_id"], "payload": item["payload"]}
+        sat_obs, _ = self._observation_path(item)
+        return {
+            "image_path": item["image_path"],
+            "telescope_record": item.get("telescope_record"),
+            "sensor_location": item.get("sensor_location"),
+            "satellite_observations": sat_obs,
+        }
+
+    def _unspool(self, item: dict[str, Any]) -> None:
+        spool_id = item.get("spool_id")
+        if self.spool is not None and spool_id is not None:
+            try:
+                self.spool.remove(spool_id)
+            except Exception as exc:
+                self.spool.release(spool_id)
+                self.logger.warning("Could not remove spooled upload %s: %s", spool_id, exc)
+
+    def _park(self, item: dict[str, Any]) -> None:
+        """Hold a spooled item without a retry timer until the uplink is back."""
+        stub = {k: v for k, v in item.items() if k not in _SPOOLED_FIELDS}
+        with self._link_lock:
+            self._parked.append(stub)
+            if self._probe is None or self._probe.finished:
+                self._probe = self._retry_scheduler.schedule(self.probe_interval_seconds, self._send_probe)
+
+    def _unpark(self, stub: dict[str, Any]) -> bool:
+        """Reload a parked stub's payload from the spool and queue it; False if it was discarded."""
+        assert self.spool is not None
+        record = self.spool.get(stub["spool_id"])
+        if record is None:
+            return False
+        if stub["kind"] == "radar":
+            stub["payload"] = record["payload"]
+        else:
+            stub["processing_result"] = None
+            stub["satellite_observations"] = record.get("satellite_observations") or []
+        self.work_queue.put(stub)
+        return True
+
+    def _send_probe(self) -> None:
+        with self._link_lock:
+            stub = self._parked.popleft() if self._parked else None
+        if stub is not None:
+            self.logger.info("Uplink looks down; probing with %s", stub["task_id"])
+            self._unpark(stub)
+
+    def _note_outcome(self, success: bool) -> None:
+        with self._link_lock:
+            if not success:
+                self._consecutive_failures += 1
+                if self.spool is not None and not self.offline and self._consecutive_failures >= OFFLINE_AFTER_FAILURES:
+                    self.offline = True
+                    self.logger.warning(
+                        "%d uploads failed in a row; parking uploads until the uplink is back",
+                        self._consecutive_failures,
+                    )
+                return
+            self._consecutive_failures = 0
+            if not self.offline:
+                return
+            self.offline = False
+            if self._probe is not None:
+                self._probe.cancel()
+            parked, self._parked = self._parked, deque()
+        with self._timer_lock:
+            waiting = list(self._pending_retries)
+        self.logger.info("Uplink is back: draining %d parked and %d waiting uploads", len(parked), len(waiting))
+        self._retry_scheduler.expedite(waiting)
+        for stub in parked:
+            self._unpark(stub)
+
+    def _should_retry(self, task_id: str) -> bool:
+        # Failures while offline are parked, not counted against the item.
+        return self.offline or super()._should_retry(task_id)
+
+    def _schedule_retry(self, item: dict[str, Any]):
+        if self._stopped:
+            # A worker that outlived stop(): leave the row for the next queue (or restart).
+            self.logger.info("Upload queue stopped; leaving %s in the spool", item["task_id"])
+            return
+        if self.offline and item.get("spool_id") is not None:
+            self._park(item)
+            return
+        super()._schedule_retry(item)
+
+    def resubmit_spooled(self, api_client: Any, settings: Any) -> int:
+        """Queue every row left in the spool for this sensor (after a restart); returns the count.
+
+        Recovered optical items have no Task object any more.  When the
+        last recovered image of a task finishes, the task is marked
+        complete on the server if any of them uploaded.
+        """
+        if self.spool is None:
+            return 0
+        count = 0
+        for row in self.spool.pending(self.sensor_id):
+            record = row["record"]
+            if row["kind"] == "radar":
+                item = {
+                    "kind": "radar",
+                    "task_id": f"radar:{record['sensor_id']}:spool-{row['spool_id']}",
+                    "sensor_id": record["sensor_id"],
+                    "payload": record["payload"],
+                    "on_complete": None,
+                }
+            else:
+                item = {
+                    "kind": "optical",
+                    "task_id": row["task_id"],
+                    "task": None,
+                    "image_path": record["image_path"],
+                    "processing_result": None,
+                    "satellite_observations": record.get("satellite_observations") or [],
+                    "telescope_record": record.get("telescope_record"),
+                    "sensor_location": record.get("sensor_location"),
+                    "on_complete": self._on_recovered_image_done,
+                }
+                if not self._observation_path(item)[1] and not Path(record["image_path"]).exists():
+                    self.logger.warning(
+                        "Dropping spooled upload for %s: %s is gone", row["task_id"], record["image_path"]
+                    )
+                    self.spool.remove(row["spool_id"])
+                    continue
+                with self._recovered_lock:
+                    entry = self._recovered_tasks.setdefault(row["task_id"], [0, False, api_client])
+                    entry[0] += 1
+            item.update(api_client=api_client, settings=settings, spool_id=row["spool_id"])
+            self.work_queue.put(item)
+            count += 1
+        if count:
+            self.logger.info("Resubmitted %d spooled upload(s) from a previous run", count)
+        return count
+
+    def _on_recovered_image_done(self, task_id: str, success: bool) -> None:
+        # Upload workers finish a task's images concurrently; only the last one may complete it.
+        with self._recovered_lock:
+            entry = self._recovered_tasks.get(task_id)
+            if entry is None:
+                return
+            entry[0] -= 1
+            entry[1] = entry[1] or success
+            if entry[0] > 0:
+                return
+            del self._recovered_tasks[task_id]
+        if entry[1]:
+            try:
+                entry[2].mark_task_complete(task_id)
+            except Exception as exc:
+                self.logger.error("Could not mark recovered task %s complete: %s", task_id, exc)
+
+    # ── Execution ──────────────────────────────────────────────────────
+
+    def _classify(self, item: dict[str, Any]) -> tuple[str, int]:
+        """Lane and approximate payload size of a work item, for :class:`UploadLanes`."""
+        if item.get("kind") == "radar":
+            return "radar", len(json.dumps(item["payload"], default=str))
+        sat_obs, can_upload_obs = self._observation_path(item)
+        if can_upload_obs:
+            return "observations", len(json.dumps(sat_obs, default=str))
+        try:
+            return "image", os.path.getsize(item["image_path"])
+        except OSError:
+            return "image", 0
+
     def _execute_work(self, item):
         """Execute one upload work item — optical or radar."""
-        if item.get("kind") == "radar":
-            return self._execute_radar(item)
-        return self._execute_optical(item)
+        success = False
+        spool_id = item.get("spool_id") if self.spool is not None else None
+        if spool_id is not None:
+            self.spool.lease(spool_id)
+        try:
+            if item.get("kind") == "radar":
+                success, result = self._execute_radar(item)
+            else:
+                success, result = self._execute_optical(item)
+            return success, result
+        finally:
+            self.work_queue.finish(item, success)
+            self._note_outcome(success)
+            # A success keeps the lease until _unspool removes the row.
+            if not success and spool_id is not None:
+                self.spool.record_attempt(spool_id)
+                self.spool.release(spool_id)
 
     def _execute_radar(self, item: dict[str, Any]):
         api_client = item["api_client"]
@@ -159,16 +444,11 @@ class UploadQueue(BaseWorkQueue):
         self.logger.info(f"Uploading task {task_id}")
 
         # Decide which upload path to take
-        sat_obs = []
-        pr = item.get("processing_result")
-        if pr and pr.extracted_data:
-            sat_obs = pr.extracted_data.get("satellite_matcher.satellite_observations") or []
-
+        sat_obs, can_upload_obs = self._observation_path(item)
         telescope_record = item.get("telescope_record")
         telescope_id = telescope_record["id"] if telescope_record else None
         sensor_location = item.get("sensor_location")
         has_calibrated_mag = any(obs.get("mag") is not None for obs in sat_obs)
-        can_upload_obs = bool(sat_obs and telescope_record and sensor_location and has_calibrated_mag)
 
         if sat_obs and not has_calibrated_mag:
             self.logger.warning(
@@ -211,8 +491,22 @@ class UploadQueue(BaseWorkQueue):
         self.logger.info(f"Upload succeeded for task {task_id}")
         return (True, {"obs_path": can_upload_obs})
 
+    @staticmethod
+    def _observation_path(item: dict[str, Any]) -> tuple[list, bool]:
+        """Satellite observations of an optical item and whether they replace the FITS upload."""
+        sat_obs = item.get("satellite_observations") or []
+        pr = item.get("processing_result")
+        if pr and pr.extracted_data:
+            sat_obs = pr.extracted_data.get("satellite_matcher.satellite_observations") or []
+        has_calibrated_mag = any(obs.get("mag") is not None for obs in sat_obs)
+        can_upload_obs = bool(
+            sat_obs and item.get("telescope_record") and item.get("sensor_location") and has_calibrated_mag
+        )
+        return sat_obs, can_upload_obs
+
     def _on_success(self, item, result):
         """Handle successful upload completion."""
+        self._unspool(item)
         if item.get("kind") == "radar":
             self.radar_observation_uploads += 1
             self.logger.info("Radar observation uploaded for sensor %s", item.get("sensor_id"))
@@ -231,10 +525,7 @@ class UploadQueue(BaseWorkQueue):
 
         if obs_path:
             self.observation_uploads += 1
-            pr = item.get("processing_result")
-            if pr and pr.extracted_data:
-                sat_obs = pr.extracted_data.get("satellite_matcher.satellite_observations") or []
-                self.satellites_identified += len(sat_obs)
+            self.satellites_identified += len(self._observation_path(item)[0])
             if task_obj:
                 task_obj.set_status_msg("Observations uploaded")
         else:
@@ -258,6 +549,7 @@ class UploadQueue(BaseWorkQueue):
         Stage cleanup is deferred to the on_complete callback (_on_image_done)
         which waits until all images for the task have finished.
         """
+        self._unspool(item)
         if item.get("kind") == "radar":
             self.logger.error("Radar observation upload permanently failed for sensor %s", item.get("sensor_id"))
             on_complete = item.get("on_complete")
@@ -273,12 +565,22 @@ class UploadQueue(BaseWorkQueue):
         on_complete = item["on_complete"]
 
         self.logger.error(f"Task {task_id} upload permanently failed")
+        self._abandon_image(item)
 
         if task_obj:
             task_obj.set_status_msg("Upload permanently failed")
 
         on_complete(task_id, success=False)
 
+    def _abandon_image(self, item: dict[str, Any]) -> None:
+        """Let the API client drop the sidecar and resume state of an image upload that won't be retried."""
+        if item.get("kind") == "radar" or not item.get("image_path"):
+            return
+        try:
+            item["api_client"].abandon_image_upload(item["image_path"])
+        except Exception as exc:
+            self.logger.warning("Could not clean up abandoned upload of %s: %s", item["image_path"], exc)
+
     def _get_task_from_item(self, item):
         """Get Task object from work item."""
         if item.get("kind") == "radar":
@@ -0,0 +1,132 @@
+"""SQLite-backed spool of uploads that have not reached the server yet.
+
+Until the upload succeeds, :class:`~citrasense.acquisition.upload_queue.UploadQueue`
+writes the serialisable part of each item here: the radar payload, or the
+image path, telescope/location records and satellite observations.  A
+daemon restart during an outage therefore loses nothing.  On start each
+sensor's queue calls :meth:`UploadSpool.pending` and re-submits its rows.
+
+A row is *leased* while a worker is uploading it.  :meth:`UploadSpool.pending`
+skips leased rows, so after a config reload the new queue does not
+resubmit an upload the old queue's worker is still sending.
+
+One database serves every sensor (rows carry ``sensor_id``).  Like
+:class:`~citrasense.analysis.task_index.TaskIndex` it uses WAL mode with a
+single connection behind a lock.  ``synchronous=NORMAL`` means a power cut
+can lose the last few commits, but never corrupts the file.
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS upload_spool (
+    id          INTEGER PRIMARY KEY AUTOINCREMENT,
+    sensor_id   TEXT NOT NULL,
+    task_id     TEXT NOT NULL,
+    kind        TEXT NOT NULL,
+    record      TEXT NOT NULL,
+    attempts    INTEGER NOT NULL DEFAULT 0,
+    created_at  REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_upload_spool_sensor ON upload_spool(sensor_id, id);
+"""
+
+
+class UploadSpool:
+    """Durable store of pending upload records, keyed by an integer spool id."""
+
+    def __init__(self, db_path: Path) -> None:
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(db_path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA busy_timeout=5000")
+        self._conn.executescript(_SCHEMA)
+        self._conn.commit()
+        # Spool ids being uploaded right now (in memory: a restart frees them all).
+        self._leased: set[int] = set()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def add(self, sensor_id: str, task_id: str, kind: str, record: dict[str, Any]) -> int:
+        """Persist *record* and return its spool id."""
+        data = json.dumps(record, default=str)
+        with self._lock:
+            cur = self._conn.execute(
+                "INSERT INTO upload_spool (sensor_id, task_id, kind, record, created_at) VALUES (?, ?, ?, ?, ?)",
+                (sensor_id, task_id, kind, data, time.time()),
+            )
+            self._conn.commit()
+            return int(cur.lastrowid or 0)
+
+    def remove(self, spool_id: int) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM upload_spool WHERE id = ?", (spool_id,))
+            self._conn.commit()
+            self._leased.discard(spool_id)
+
+    def lease(self, spool_id: int) -> None:
+        """Mark *spool_id* as being uploaded; :meth:`pending` skips it until :meth:`release`."""
+        with self._lock:
+            self._leased.add(spool_id)
+
+    def release(self, spool_id: int) -> None:
+        with self._lock:
+            self._leased.discard(spool_id)
+
+    def record_attempt(self, spool_id: int) -> None:
+        with self._lock:
+            self._conn.execute("UPDATE upload_spool SET attempts = attempts + 1 WHERE id = ?", (spool_id,))
+            self._conn.commit()
+
+    def get(self, spool_id: int) -> dict[str, Any] | None:
+        """The stored record for *spool_id*, or None once it has been removed."""
+        with self._lock:
+            row = self._conn.execute("SELECT record FROM upload_spool WHERE id = ?", (spool_id,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def pending(self, sensor_id: str) -> list[dict[str, Any]]:
+        """Every spooled row for *sensor_id* that is not leased, oldest first."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT id, task_id, kind, record, attempts, created_at FROM upload_spool"
+                " WHERE sensor_id = ? ORDER BY id",
+                (sensor_id,),
+            ).fetchall()
+            rows = [row for row in rows if row[0] not in self._leased]
+        return [
+            {
+                "spool_id": row[0],
+                "task_id": row[1],
+                "kind": row[2],
+                "record": json.loads(row[3]),
+                "attempts": row[4],
+                "created_at": row[5],
+            }
+            for row in rows
+        ]
+
+    def discard(self, sensor_id: str) -> int:
+        """Drop every row for *sensor_id* (queue cleared); returns the count."""
+        with self._lock:
+            cur = self._conn.execute("DELETE FROM upload_spool WHERE sensor_id = ?", (sensor_id,))
+            self._conn.commit()
+            return cur.rowcount
+
+    def count(self, sensor_id: str | None = None) -> int:
+        with self._lock:
+            if sensor_id is None:
+                return self._conn.execute("SELECT COUNT(*) FROM upload_spool").fetchone()[0]
+            return self._conn.execute("SELECT COUNT(*) FROM upload_spool WHERE sensor_id = ?", (sensor_id,)).fetchone()[
+                0
+            ]
@@ -10,6 +10,9 @@ from pathlib import Path
 logger = logging.getLogger("citrasense.Retention")
 
 _PREVIEW_RETENTION_DAYS = 30
+# Processing subdirs that prune themselves.  ``radar/<sensor_id>/`` holds the
+# live radar artifact log, whose mtime doesn't move on append.
+_SELF_MANAGED_DIRS = frozenset({"radar"})
 
 
 def resolve_task_dir(processing_dir: Path, task_id: str) -> Path:
@@ -41,7 +44,8 @@ def cleanup_processing_output(processing_dir: Path, retention_hours: int) -> int
     (``processing/<sensor_id>/<task_id>/``).  A subdirectory is treated as
     a sensor dir if it contains nested dirs with processing artifacts — the
     cleanup then walks one level deeper before removing stale task dirs,
-    and finally prunes empty sensor dirs.
+    and finally prunes empty sensor dirs.  ``radar/`` is skipped: the radar
+    artifact logs age out their own segments.
 
     Returns the number of directories removed.  Skips if *retention_hours*
     is ``0`` (immediate cleanup handled by ProcessingQueue) or ``-1`` (keep
@@ -64,7 +68,7 @@ def cleanup_processing_output(processing_dir: Path, retention_hours: int) -> int
             return False
 
     for child in processing_dir.iterdir():
-        if not child.is_dir():
+        if not child.is_dir() or child.name in _SELF_MANAGED_DIRS:
             continue
         try:
             if _is_task_dir(child):
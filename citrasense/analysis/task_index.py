@@ -468,6 +468,15 @@ class TaskIndex:
             )
             self._conn.commit()
 
+    def update_annotated_image(self, task_id: str, image_path: str) -> None:
+        """UPDATE the annotated image columns once a deferred render lands (called from the render lane)."""
+        with self._lock:
+            self._conn.execute(
+                "UPDATE completed_tasks SET has_annotated_image = 1, annotated_image_path = ? WHERE task_id = ?",
+                (image_path, task_id),
+            )
+            self._conn.commit()
+
     # ── Reads ──────────────────────────────────────────────────────────
 
     def get_task(self, task_id: str) -> dict | None:
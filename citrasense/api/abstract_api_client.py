@@ -13,6 +13,17 @@ class AbstractCitraApiClient(ABC):
         """
         ...
 
+    def get_request_telemetry(self, summary: bool = False) -> dict:
+        """Per-endpoint request figures (latency, bytes, status codes); empty for clients that don't record any.
+
+        Args:
+            summary: Return the compact per-route form used in the status payload
+        """
+        return {}
+
+    def abandon_image_upload(self, filepath) -> None:  # noqa: B027
+        """Drop any state kept to resume an image upload that will not be retried; a no-op by default."""
+
     @abstractmethod
     def does_api_server_accept_key(self):
         pass
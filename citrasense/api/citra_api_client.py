@@ -1,4 +1,6 @@
+import logging
 import os
+import time
 from collections.abc import Sequence
 from datetime import datetime, timezone
 
@@ -7,6 +9,8 @@ from keplemon.elements import TopocentricElements
 from keplemon.time import Epoch
 
 from .abstract_api_client import AbstractCitraApiClient
+from .request_telemetry import BODY_PREVIEW_BYTES, RequestTelemetry, body_preview, route_for
+from .upload_engine import UploadEngine, UploadError
 
 
 def _build_filter_wavelength_lookup(telescope_record: dict) -> dict[str, tuple[float, float]]:
@@ -48,23 +52,52 @@ class CitraApiClient(AbstractCitraApiClient):
                 self.logger.error(f"Failed PUT /telescopes: {e}")
             return None
 
-    def __init__(self, host: str, token: str, use_ssl: bool = True, logger=None):
+    def __init__(
+        self, host: str, token: str, use_ssl: bool = True, logger=None, upload_engine: UploadEngine | None = None
+    ):
         self.base_url = ("https" if use_ssl else "http") + "://" + host
         self.token = token
         self.logger = logger.getChild(type(self).__name__) if logger else None
         self.client = httpx.Client(base_url=self.base_url, headers={"Authorization": f"Bearer {self.token}"})
+        # Signed upload URLs get their own pooled client: no bearer token, longer timeouts.
+        self.upload_engine = upload_engine or UploadEngine(logger=self.logger)
+        self.telemetry = RequestTelemetry()
+
+    def get_request_telemetry(self, summary: bool = False) -> dict:
+        return self.telemetry.summary() if summary else self.telemetry.snapshot()
 
     def __enter__(self):
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         self.client.close()
+        self.upload_engine.close()
 
     def _request(self, method: str, endpoint: str, **kwargs):
+        route = route_for(method, endpoint)
+        start = time.perf_counter()
         try:
             resp = self.client.request(method, endpoint, **kwargs)
+        except Exception as e:
+            self.telemetry.record(route, time.perf_counter() - start)
             if self.logger:
-                self.logger.debug(f"{method} {endpoint}: {resp.status_code} {resp.text}")
+                self.logger.error(f"Request error: {e}")
+            return None
+        latency = time.perf_counter() - start
+        self.telemetry.record(
+            route,
+            latency,
+            status_code=resp.status_code,
+            request_bytes=int(resp.request.headers.get("content-length", 0)),
+            response_bytes=len(resp.content),
+        )
+        if self.logger and self.logger.isEnabledFor(logging.DEBUG):
+            # Only a sampled, truncated body: /elsets/latest alone is ~26 MB.
+            line = f"{method} {endpoint}: {resp.status_code} in {latency * 1000:.0f} ms, {len(resp.content)} bytes"
+            if self.telemetry.should_log_body(route):
+                line += f": {body_preview(resp.content)}"
+            self.logger.debug(line)
+        try:
             resp.raise_for_status()
             return resp.json()
         except httpx.HTTPStatusError as e:
@@ -80,8 +113,8 @@ class CitraApiClient(AbstractCitraApiClient):
                         f"Received HTML error page (likely Cloudflare or server error) for {method} {endpoint}"
                     )
                 else:
-                    # Log full response for non-HTML errors (JSON, plain text, etc.)
-                    self.logger.error(f"HTTP error: {e.response.status_code} {response_text}")
+                    # Log the response (truncated) for non-HTML errors (JSON, plain text, etc.)
+                    self.logger.error(f"HTTP error: {e.response.status_code} {response_text[:BODY_PREVIEW_BYTES]}")
             return None
         except Exception as e:
             if self.logger:
@@ -295,38 +328,54 @@ class CitraApiClient(AbstractCitraApiClient):
         return True
 
     def upload_image(self, task_id, telescope_id, filepath):
-        """Upload an image file for a given task."""
-        file_size = os.path.getsize(filepath)
+        """Upload an image file for a given task.
+
+        The file is streamed through :attr:`upload_engine`.  When the signed-URL
+        response offers a ``resumableUploadUrl`` and the file spans more than
+        one chunk, it is sent in resumable chunks that pick up at the server's
+        offset after a failure; otherwise it goes up as the presigned form POST.
+        """
+        engine = self.upload_engine
+        try:
+            path = engine.prepare(filepath)
+            file_size = os.path.getsize(path)
+        except OSError as e:
+            if self.logger:
+                self.logger.error(f"Failed to prepare image {filepath} for upload: {e}")
+            return None
+        extension = "fits.gz" if path.suffix == ".gz" else "fits"
         signed_url_response = self._request(
             "POST",
-            f"/my/images?filename=citra_task_{task_id}_image.fits&telescope_id={telescope_id}&task_id={task_id}&file_size={file_size}",
+            f"/my/images?filename=citra_task_{task_id}_image.{extension}&telescope_id={telescope_id}&task_id={task_id}&file_size={file_size}",
         )
         if not signed_url_response or "uploadUrl" not in signed_url_response:
             if self.logger:
                 self.logger.error("Failed to get signed URL for image upload.")
             return None
 
-        upload_url = signed_url_response["uploadUrl"]
-        fields = signed_url_response["fields"]
-
-        # Prepare the multipart form data
-        files = {"file": (os.path.basename(filepath), open(filepath, "rb"), "application/fits")}
-        data = fields  # Fields provided in the signed URL response
-
-        # Perform the POST request to upload the file
+        resumable_url = signed_url_response.get("resumableUploadUrl")
         try:
-            response = httpx.post(upload_url, data=data, files=files)
-            if self.logger:
-                self.logger.debug(f"Image upload response: {response.status_code} {response.text}")
-            response.raise_for_status()
-            return signed_url_response.get("resultsUrl")  # Return the results URL if needed
-        except httpx.RequestError as e:
+            if resumable_url and file_size > engine.chunk_size:
+                engine.upload_resumable(resumable_url, path)
+            else:
+                response = engine.post_form(
+                    signed_url_response["uploadUrl"],
+                    signed_url_response["fields"],
+                    path,
+                    content_type="application/gzip" if extension == "fits.gz" else "application/fits",
+                )
+                if self.logger:
+                    self.logger.debug(f"Image upload response: {response.status_code} {response.text}")
+        except (httpx.HTTPError, UploadError, OSError) as e:
             if self.logger:
                 self.logger.error(f"Failed to upload image: {e}")
             return None
-        finally:
-            # Ensure the file is closed after the upload
-            files["file"][1].close()
+        engine.discard_prepared(filepath, path)
+        return signed_url_response.get("resultsUrl")  # Return the results URL if needed
+
+    def abandon_image_upload(self, filepath) -> None:
+        """Remove the compressed sidecar and resume state of an image upload that has been given up."""
+        self.upload_engine.abandon(filepath)
 
     def mark_task_complete(self, task_id):
         """Mark a task as complete using the API."""
@@ -0,0 +1,145 @@
+"""Per-endpoint request accounting for :class:`~citrasense.api.citra_api_client.CitraApiClient`.
+
+Every ``_request`` call is recorded against a *route*: the endpoint with
+its query string removed and its ID segments replaced by ``{id}``.  So
+``/telescopes/3f2a…/tasks?statuses=Pending`` and every other telescope's
+task poll share ``GET /telescopes/{id}/tasks``.  Each route keeps:
+
+- a fixed-bucket latency histogram plus p50/p95 over the last
+  ``_RECENT_LATENCIES`` requests
+- request and response byte totals and the largest response
+- HTTP status code counts and transport errors (no response at all)
+
+:meth:`RequestTelemetry.should_log_body` is the sampling gate for debug
+body logging.  It allows the first response of each route and every
+``body_sample_every``-th one after it.  :func:`body_preview` truncates
+what gets logged, so a 26 MB ``/elsets/latest`` body is never decoded in
+full just to be dropped by the log level.
+"""
+
+from __future__ import annotations
+
+import re
+import statistics
+import threading
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any
+
+#: Upper bounds (ms) of the latency histogram buckets; the last bucket is open-ended.
+LATENCY_BUCKETS_MS = (25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000)
+
+#: Body bytes shown by debug logging.
+BODY_PREVIEW_BYTES = 512
+
+_RECENT_LATENCIES = 256
+_ID_SEGMENT = re.compile(r"\d")
+
+
+def route_for(method: str, endpoint: str) -> str:
+    """``"GET /telescopes/{id}/tasks"`` for ``("GET", "/telescopes/abc-123/tasks?x=1")``."""
+    path = endpoint.split("?", 1)[0]
+    segments = ["{id}" if _ID_SEGMENT.search(seg) else seg for seg in path.split("/")]
+    return f"{method.upper()} {'/'.join(segments)}"
+
+
+def body_preview(content: bytes, limit: int = BODY_PREVIEW_BYTES) -> str:
+    """The first *limit* bytes of a body as text, with the total size when cut short."""
+    text = content[:limit].decode("utf-8", errors="replace")
+    if len(content) > limit:
+        return f"{text}… ({len(content)} bytes)"
+    return text
+
+
+@dataclass
+class _RouteStats:
+    requests: int = 0
+    transport_errors: int = 0
+    request_bytes: int = 0
+    response_bytes: int = 0
+    max_response_bytes: int = 0
+    latency_total_s: float = 0.0
+    status_codes: dict[int, int] = field(default_factory=dict)
+    buckets: list[int] = field(default_factory=lambda: [0] * (len(LATENCY_BUCKETS_MS) + 1))
+    recent_ms: deque[float] = field(default_factory=lambda: deque(maxlen=_RECENT_LATENCIES))
+
+
+class RequestTelemetry:
+    """Thread-safe per-route counters; see the module docstring.
+
+    Args:
+        body_sample_every: Log the body of one response in this many per route (after the first)
+    """
+
+    def __init__(self, body_sample_every: int = 50) -> None:
+        self.body_sample_every = max(1, body_sample_every)
+        self._lock = threading.Lock()
+        self._routes: dict[str, _RouteStats] = {}
+
+    def record(
+        self,
+        route: str,
+        latency_s: float,
+        *,
+        status_code: int | None = None,
+        request_bytes: int = 0,
+        response_bytes: int = 0,
+    ) -> None:
+        """Account one request; ``status_code=None`` means it failed before any response."""
+        latency_ms = latency_s * 1000.0
+        bucket = next((i for i, bound in enumerate(LATENCY_BUCKETS_MS) if latency_ms <= bound), -1)
+        with self._lock:
+            stats = self._routes.setdefault(route, _RouteStats())
+            stats.requests += 1
+            stats.latency_total_s += latency_s
+            stats.buckets[bucket] += 1
+            stats.recent_ms.append(latency_ms)
+            stats.request_bytes += request_bytes
+            if status_code is None:
+                stats.transport_errors += 1
+                return
+            stats.status_codes[status_code] = stats.status_codes.get(status_code, 0) + 1
+            stats.response_bytes += response_bytes
+            stats.max_response_bytes = max(stats.max_response_bytes, response_bytes)
+
+    def should_log_body(self, route: str) -> bool:
+        """True for the first response recorded on *route* and every ``body_sample_every``-th after it."""
+        with self._lock:
+            stats = self._routes.get(route)
+            count = stats.requests if stats else 0
+        return count <= 1 or count % self.body_sample_every == 0
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        """Everything recorded, per route (served by ``/api/metrics``)."""
+        with self._lock:
+            return {route: self._describe(stats, full=True) for route, stats in sorted(self._routes.items())}
+
+    def summary(self) -> dict[str, dict[str, Any]]:
+        """Compact per-route figures for the status payload."""
+        with self._lock:
+            return {route: self._describe(stats, full=False) for route, stats in sorted(self._routes.items())}
+
+    @staticmethod
+    def _describe(stats: _RouteStats, full: bool) -> dict[str, Any]:
+        recent = sorted(stats.recent_ms)
+        errors = stats.transport_errors + sum(n for code, n in stats.status_codes.items() if code >= 400)
+        result: dict[str, Any] = {
+            "requests": stats.requests,
+            "errors": errors,
+            "p50_ms": round(statistics.median(recent), 1) if recent else None,
+            "p95_ms": round(recent[min(len(recent) - 1, int(len(recent) * 0.95))], 1) if recent else None,
+            "response_bytes": stats.response_bytes,
+        }
+        if full:
+            bounds = [str(b) for b in LATENCY_BUCKETS_MS] + ["inf"]
+            result.update(
+                {
+                    "transport_errors": stats.transport_errors,
+                    "status_codes": {str(code): n for code, n in sorted(stats.status_codes.items())},
+                    "mean_ms": round(stats.latency_total_s * 1000.0 / stats.requests, 1),
+                    "latency_histogram_ms": dict(zip(bounds, stats.buckets, strict=True)),
+                    "request_bytes": stats.request_bytes,
+                    "max_response_bytes": stats.max_response_bytes,
+                }
+            )
+        return result
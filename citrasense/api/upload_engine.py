@@ -0,0 +1,415 @@
+"""Streaming, resumable image uploads over one pooled HTTP client.
+
+The signed-URL upload used to go out through a bare ``httpx.post``: a new
+TCP + TLS connection per image, and a failure at 95% meant the whole file
+was sent again on the next :class:`~citrasense.acquisition.base_work_queue.BaseWorkQueue`
+retry.  :class:`UploadEngine` keeps a single keep-alive
+:class:`httpx.Client` for all uploads and supports two transfer modes:
+
+- **Form POST** (:meth:`UploadEngine.post_form`) — the presigned multipart
+  POST the Citra API hands out.  The file is streamed from disk in blocks.
+- **Resumable** (:meth:`UploadEngine.upload_resumable`) — used when the
+  signed-URL response also offers a ``resumableUploadUrl``.  It follows
+  the tus 1.0 core protocol.  ``HEAD`` asks the server how many bytes it
+  already holds (``Upload-Offset``).  ``PATCH`` requests then send the
+  rest in chunks of at most :data:`DEFAULT_CHUNK_SIZE`, each streamed
+  from disk.  After a dropped connection, a 5xx or a ``409`` offset
+  mismatch, the engine asks the server for its offset again and carries
+  on from there.  A later retry of the whole upload does the same.
+
+With ``compress=True``, FITS files are gzipped before upload into a
+``.fits.gz`` sidecar next to the original.  This runs block by block, so
+memory use stays bounded.  The sidecar is deterministic (gzip mtime 0),
+so a resumed upload sends the same bytes the server already holds
+part of.  It is removed by :meth:`UploadEngine.discard_prepared` once the
+upload succeeds, or by :meth:`UploadEngine.abandon` when the upload is
+given up.
+
+:meth:`UploadEngine.stats` counts bytes sent and bytes *re-sent*, meaning
+bytes at an offset the engine had already transmitted for the same
+upload.  That is the cost of every failure that was not resumed.
+
+An optional :class:`BandwidthBudget` paces every byte the engine streams.
+It is shared by all upload workers (and all sensors, since the daemon has
+one engine), so concurrent image uploads together stay under the limit
+and leave the rest of the uplink to small API calls.
+"""
+
+from __future__ import annotations
+
+import gzip
+import os
+import shutil
+import threading
+import time
+from collections.abc import Iterator
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+#: Largest ``PATCH`` body in resumable mode.
+DEFAULT_CHUNK_SIZE = 8 * 1024 * 1024
+
+#: Consecutive failed chunks (without server progress) before giving up.
+DEFAULT_MAX_CHUNK_RETRIES = 3
+
+TUS_VERSION = "1.0.0"
+
+_READ_BLOCK = 256 * 1024
+_FITS_SUFFIXES = (".fits", ".fit", ".fts")
+
+
+class UploadError(RuntimeError):
+    """A resumable upload could not be completed; the server keeps what it received."""
+
+
+class BandwidthBudget:
+    """Token bucket limiting the combined rate of every stream that draws from it.
+
+    :meth:`consume` lets a caller go into debt and then sleeps off the
+    debt outside the lock.  Concurrent streams therefore share the rate
+    roughly evenly without any of them holding the lock while waiting.
+    """
+
+    def __init__(self, bytes_per_second: float, burst_bytes: int | None = None) -> None:
+        """
+        Args:
+            bytes_per_second: Sustained rate shared by all consumers
+            burst_bytes: Bytes that may go out at once after an idle spell (default: 0.25 s worth)
+        """
+        if bytes_per_second <= 0:
+            raise ValueError("bytes_per_second must be positive")
+        self.bytes_per_second = float(bytes_per_second)
+        self.burst_bytes = burst_bytes if burst_bytes is not None else max(64 * 1024, int(bytes_per_second / 4))
+        self._lock = threading.Lock()
+        self._tokens = float(self.burst_bytes)
+        self._last = time.monotonic()
+        self.bytes_consumed = 0
+        self.seconds_waited = 0.0
+
+    @classmethod
+    def from_mbps(cls, mbps: float) -> BandwidthBudget:
+        """A budget of *mbps* megabits per second."""
+        return cls(mbps * 1e6 / 8)
+
+    def consume(self, n: int) -> float:
+        """Take *n* bytes from the budget, sleeping until they are covered; returns the seconds slept."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst_bytes, self._tokens + (now - self._last) * self.bytes_per_second)
+            self._last = now
+            self._tokens -= n
+            self.bytes_consumed += n
+            wait = -self._tokens / self.bytes_per_second if self._tokens < 0 else 0.0
+            self.seconds_waited += wait
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "bytes_per_second": self.bytes_per_second,
+                "bytes_consumed": self.bytes_consumed,
+                "seconds_waited": round(self.seconds_waited, 3),
+            }
+
+
+@dataclass
+class _Counters:
+    uploads: int = 0
+    failures: int = 0
+    bytes_sent: int = 0
+    bytes_resent: int = 0
+    chunks: int = 0
+    resumes: int = 0
+    compressed_in: int = 0
+    compressed_out: int = 0
+
+
+class UploadEngine:
+    """Uploads files through a shared, connection-pooled :class:`httpx.Client`.
+
+    Thread-safe: upload workers may call it concurrently.  The client must
+    not carry the Citra API bearer token; signed URLs authenticate
+    themselves and usually point at a different host.
+    """
+
+    def __init__(
+        self,
+        *,
+        client: httpx.Client | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        max_chunk_retries: int = DEFAULT_MAX_CHUNK_RETRIES,
+        compress: bool = False,
+        budget: BandwidthBudget | None = None,
+        timeout: float = 120.0,
+        logger=None,
+    ) -> None:
+        """
+        Args:
+            client: HTTP client to use; by default one is created and owned by the engine
+            chunk_size: Largest ``PATCH`` body in resumable mode
+            max_chunk_retries: Consecutive failed chunks tolerated before :class:`UploadError`
+            compress: Gzip FITS files before upload (see :meth:`prepare`)
+            budget: Shared bandwidth limit for the bytes this engine streams; None for unlimited
+            timeout: Per-request read/write timeout of the default client, in seconds
+            logger: Logger for retry / resume messages
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be positive")
+        self._owns_client = client is None
+        self.client = client or httpx.Client(
+            timeout=httpx.Timeout(timeout, connect=15.0),
+            limits=httpx.Limits(max_connections=8, max_keepalive_connections=4),
+        )
+        self.chunk_size = chunk_size
+        self.max_chunk_retries = max_chunk_retries
+        self.compress = compress
+        self.budget = budget
+        self.logger = logger
+        self._lock = threading.Lock()
+        self._counters = _Counters()
+        # Furthest offset transmitted per (uploaded file, target), to tell re-sends apart.
+        self._high_water: dict[tuple[str, str], int] = {}
+
+    def close(self) -> None:
+        if self._owns_client:
+            self.client.close()
+
+    # ── Preparation ────────────────────────────────────────────────────
+
+    def prepare(self, filepath: str | os.PathLike) -> Path:
+        """The file to actually upload for *filepath*: a gzip sidecar for FITS when compressing.
+
+        An existing sidecar at least as new as the source is reused, so a
+        retried upload resumes against identical bytes.
+        """
+        path = Path(filepath)
+        target = self._sidecar(path)
+        if target is None:
+            return path
+        if target.exists() and target.stat().st_mtime >= path.stat().st_mtime:
+            return target
+        partial = target.with_name(target.name + ".part")
+        with open(path, "rb") as src, open(partial, "wb") as raw:
+            with gzip.GzipFile(filename="", mode="wb", fileobj=raw, compresslevel=6, mtime=0) as gz:
+                shutil.copyfileobj(src, gz, _READ_BLOCK)
+        os.replace(partial, target)
+        with self._lock:
+            self._counters.compressed_in += path.stat().st_size
+            self._counters.compressed_out += target.stat().st_size
+        return target
+
+    def discard_prepared(self, filepath: str | os.PathLike, prepared: Path) -> None:
+        """Remove the sidecar :meth:`prepare` made for *filepath*, if any."""
+        if Path(filepath) != prepared:
+            prepared.unlink(missing_ok=True)
+
+    def abandon(self, filepath: str | os.PathLike) -> None:
+        """Forget an upload of *filepath* that will not be retried.
+
+        Removes the gzip sidecar (and any half-written one) and the resume
+        bookkeeping kept for it.  The source file is left alone.
+        """
+        path = Path(filepath)
+        sidecar = self._sidecar(path)
+        uploaded = {str(path)}
+        if sidecar is not None:
+            uploaded.add(str(sidecar))
+            sidecar.unlink(missing_ok=True)
+            sidecar.with_name(sidecar.name + ".part").unlink(missing_ok=True)
+        with self._lock:
+            for key in [k for k in self._high_water if k[0] in uploaded]:
+                del self._high_water[key]
+
+    def _sidecar(self, path: Path) -> Path | None:
+        """Where :meth:`prepare` puts the gzip copy of *path*; None when it uploads *path* as is."""
+        if not self.compress or path.suffix.lower() not in _FITS_SUFFIXES:
+            return None
+        return path.with_name(path.name + ".gz")
+
+    # ── Form POST ──────────────────────────────────────────────────────
+
+    def post_form(
+        self,
+        url: str,
+        fields: dict[str, Any],
+        path: Path,
+        *,
+        filename: str | None = None,
+        content_type: str = "application/fits",
+    ) -> httpx.Response:
+        """Stream *path* as the ``file`` part of a multipart POST (presigned-POST style).
+
+        Raises:
+            httpx.HTTPError: On transport failure or a non-2xx response
+        """
+        key = (str(path), "form")
+        with open(path, "rb") as f:
+            reader = _CountingReader(f, self.budget)
+            try:
+                response = self.client.post(
+                    url, data=fields, files={"file": (filename or path.name, reader, content_type)}
+                )
+                response.raise_for_status()
+            except httpx.HTTPError:
+                self._account(key, 0, reader.count, done=False)
+                self._count_failure()
+                raise
+        self._account(key, 0, reader.count, done=True)
+        return response
+
+    # ── Resumable (tus core) ───────────────────────────────────────────
+
+    def upload_resumable(self, url: str, path: Path) -> int:
+        """Send *path* to the resumable upload resource at *url*, starting at the server's offset.
+
+        Returns:
+            The final offset, i.e. the file size.
+
+        Raises:
+            UploadError: After :attr:`max_chunk_retries` consecutive chunks
+                failed without the server's offset moving
+        """
+        size = path.stat().st_size
+        key = (str(path), url)
+        failures = 0
+        offset = self._server_offset(url)
+        if offset:
+            with self._lock:
+                self._counters.resumes += 1
+            if self.logger:
+                self.logger.info(f"Resuming upload of {path.name} at {offset}/{size} bytes")
+        with open(path, "rb") as f:
+            while offset < size:
+                length = min(self.chunk_size, size - offset)
+                body = _ChunkStream(f, offset, length, self.budget)
+                try:
+                    response = self.client.patch(
+                        url,
+                        content=iter(body),
+                        headers={
+                            "Tus-Resumable": TUS_VERSION,
+                            "Upload-Offset": str(offset),
+                            "Content-Type": "application/offset+octet-stream",
+                            "Content-Length": str(length),
+                        },
+                    )
+                    response.raise_for_status()
+                    new_offset = int(response.headers["Upload-Offset"])
+                except (httpx.HTTPError, KeyError, ValueError) as exc:
+                    self._account(key, offset, body.sent, done=False)
+                    failures += 1
+                    if failures > self.max_chunk_retries:
+                        self._count_failure()
+                        raise UploadError(
+                            f"Upload of {path.name} stalled at {offset}/{size} bytes after {failures} failed chunks"
+                        ) from exc
+                    if self.logger:
+                        self.logger.warning(f"Chunk at offset {offset} of {path.name} failed ({exc}); resuming")
+                    previous, offset = offset, self._server_offset(url)
+                    if offset > previous:
+                        failures = 0
+                    continue
+                self._account(key, offset, body.sent, done=False)
+                with self._lock:
+                    self._counters.chunks += 1
+                offset = new_offset
+                failures = 0
+        self._account(key, size, 0, done=True)
+        return offset
+
+    def _server_offset(self, url: str) -> int:
+        try:
+            response = self.client.head(url, headers={"Tus-Resumable": TUS_VERSION})
+            response.raise_for_status()
+            return int(response.headers["Upload-Offset"])
+        except (httpx.HTTPError, KeyError, ValueError) as exc:
+            self._count_failure()
+            raise UploadError(f"Could not read the upload offset from {url}: {exc}") from exc
+
+    # ── Accounting ─────────────────────────────────────────────────────
+
+    def _account(self, key: tuple[str, str], start: int, sent: int, *, done: bool) -> None:
+        with self._lock:
+            high_water = self._high_water.get(key, 0)
+            c = self._counters
+            c.bytes_sent += sent
+            c.bytes_resent += max(0, min(start + sent, high_water) - start)
+            if done:
+                c.uploads += 1
+                self._high_water.pop(key, None)
+            else:
+                self._high_water[key] = max(high_water, start + sent)
+
+    def _count_failure(self) -> None:
+        with self._lock:
+            self._counters.failures += 1
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            c = self._counters
+            stats = {
+                "uploads": c.uploads,
+                "failures": c.failures,
+                "bytes_sent": c.bytes_sent,
+                "bytes_resent": c.bytes_resent,
+                "chunks": c.chunks,
+                "resumes": c.resumes,
+                "compression_ratio": round(c.compressed_out / c.compressed_in, 4) if c.compressed_in else None,
+            }
+        if self.budget is not None:
+            stats["budget"] = self.budget.stats()
+        return stats
+
+
+class _CountingReader:
+    """File wrapper counting (and pacing) the bytes httpx actually pulls for the request body."""
+
+    def __init__(self, f, budget: BandwidthBudget | None = None) -> None:
+        self._f = f
+        self._budget = budget
+        self.count = 0
+
+    def read(self, n: int = -1) -> bytes:
+        data = self._f.read(n)
+        if self._budget is not None and data:
+            self._budget.consume(len(data))
+        self.count += len(data)
+        return data
+
+    def fileno(self) -> int:
+        return self._f.fileno()
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        return self._f.seek(offset, whence)
+
+    def tell(self) -> int:
+        return self._f.tell()
+
+
+class _ChunkStream:
+    """``length`` bytes of *f* from *offset*, yielded in blocks as the transport asks for them."""
+
+    def __init__(self, f, offset: int, length: int, budget: BandwidthBudget | None = None) -> None:
+        self._f = f
+        self._offset = offset
+        self._length = length
+        self._budget = budget
+        self.sent = 0
+
+    def __iter__(self) -> Iterator[bytes]:
+        self._f.seek(self._offset)
+        remaining = self._length
+        while remaining > 0:
+            block = self._f.read(min(_READ_BLOCK, remaining))
+            if not block:
+                return
+            if self._budget is not None:
+                self._budget.consume(len(block))
+            remaining -= len(block)
+            self.sent += len(block)
+            yield block
@@ -12,10 +12,12 @@ if TYPE_CHECKING:
     from citrasense.sensors.sensor_runtime import SensorRuntime
     from citrasense.sensors.telescope.telescope_sensor import TelescopeSensor
 
+from citrasense.acquisition.upload_spool import UploadSpool
 from citrasense.analysis.retention import cleanup_previews, cleanup_processing_output
 from citrasense.analysis.task_index import TaskIndex
 from citrasense.api.citra_api_client import AbstractCitraApiClient, CitraApiClient
 from citrasense.api.dummy_api_client import DummyApiClient
+from citrasense.api.upload_engine import BandwidthBudget, UploadEngine
 from citrasense.astro.elset_cache import ElsetCache
 from citrasense.catalogs.apass_catalog import ApassCatalog
 from citrasense.hardware.filter_sync import sync_filters_to_backend
@@ -115,6 +117,8 @@ class CitraSenseDaemon:
         # analysis landed.  Idempotent and cheap after convergence (early
         # short-circuit when no NULL rows remain), so safe on every start.
         self.task_index.backfill_sensor_ids(self.settings.directories.processing_dir)
+        # Uploads not yet accepted by the server survive restarts here
+        self.upload_spool = UploadSpool(self.settings.directories.data_dir / "upload_spool.db")
         self._retention_timer: threading.Timer | None = None
 
         # Note: Work queues and stage tracking now managed by TaskDispatcher + SensorRuntime
@@ -295,6 +299,15 @@ class CitraSenseDaemon:
                     self.settings.personal_access_token,
                     self.settings.use_ssl,
                     CITRASENSE_LOGGER,
+                    upload_engine=UploadEngine(
+                        compress=self.settings.compress_image_uploads,
+                        budget=(
+                            BandwidthBudget.from_mbps(self.settings.upload_bandwidth_mbps)
+                            if self.settings.upload_bandwidth_mbps > 0
+                            else None
+                        ),
+                        logger=CITRASENSE_LOGGER,
+                    ),
                 )
 
             # Warm-start elset cache from disk (source-aware: discards if API source changed)
@@ -509,6 +522,7 @@ class CitraSenseDaemon:
                 ground_station=self.ground_station,
                 preview_bus=self.preview_bus,
                 task_index=self.task_index,
+                upload_spool=self.upload_spool,
                 sensor_bus=self.sensor_bus,
                 web_server=self.web_server,
                 on_annotated_image=self._on_annotated_image,
@@ -910,6 +924,13 @@ class CitraSenseDaemon:
                 pass
             self.task_index = None
 
+        if self.upload_spool:
+            try:
+                self.upload_spool.close()
+            except Exception:
+                pass
+            self.upload_spool = None
+
         CITRASENSE_LOGGER.info("Shutdown complete.")
 
         # 6. Stop web server (tears down log handler — must be last)
@@ -0,0 +1,2477 @@
+"""Micro-benchmarks for hot paths in the processing pipeline.
+
+Each subcommand times one component in isolation against synthetic input,
+prints a table, and (with ``--output``) writes the numbers as a JSON report
+using the same envelope as :mod:`citrasense.cli.loadtest`.  Nothing here
+needs hardware, the daemon, or external binaries.
+
+Usage
+-----
+::
+
+    # SExtractor catalog ingest: ASCII vs binary FITS_LDAC, plus config staging
+    python -m citrasense.cli.bench sextractor-catalog --sizes 1000,10000,100000
+
+    python -m citrasense.cli.bench sextractor-catalog --output bench_sextractor.json
+
+    # RA/Dec -> pixel: per-point loop vs astropy batch vs linearized TAN
+    python -m citrasense.cli.bench wcs-projection --predictions 10000 --stars 50000
+
+    # Bytes written per exposure by FITS enrichment (astropy update vs header patch)
+    python -m citrasense.cli.bench fits-enrichment --frame-size 6248 4176
+
+    # Moravian readout latency / peak allocation against a fake gxccd handle
+    python -m citrasense.cli.bench moravian-readout --frame-size 9576 6388
+
+    # Ximea snapshot-mosaic datacube save: materialized cube vs streamed bands
+    python -m citrasense.cli.bench ximea-datacube --patterns 4,5
+
+    # KStars capture tail: last frame on disk -> completion noticed
+    python -m citrasense.cli.bench capture-tail --frames 3
+
+    # Mount state cache: slew-settle detection latency and serial commands per hour
+    python -m citrasense.cli.bench mount-cache --slew-seconds 1.0
+
+    # Web preview: JSON data URL vs binary pyramid levels (encode time, bytes on the wire)
+    python -m citrasense.cli.bench preview --frame-size 6248 4176
+
+    # Allsky capture cycle CPU: data-URL round trip vs shared JPEG bytes + archive append
+    python -m citrasense.cli.bench allsky-capture --frame-size 1920 1080
+
+    # Allsky timelapse lookup: file-per-frame directory listing vs indexed archive seek
+    python -m citrasense.cli.bench allsky-archive --frames 3000
+
+    # Web event-loop latency while logging 10k lines/s: per-line coroutines vs batched stream
+    python -m citrasense.cli.bench web-log --lines-per-second 10000
+
+    # Sensor bus publish rate: fnmatch scan vs compiled trie router (cold and cached)
+    python -m citrasense.cli.bench bus --subscriptions 10,100,1000
+
+    # Radar Alt/Az -> ICRS: per-detection SkyCoord vs cached batched engine
+    python -m citrasense.cli.bench radar-azel --detections 10000
+
+    # Radar tasked-satellite gate with 1k queued tasks: snapshot scan vs published ID set
+    python -m citrasense.cli.bench radar-filter --tasks 1000
+    python -m citrasense.cli.bench radar-history --detections 1000000
+    python -m citrasense.cli.bench radar-artifacts --observations 20000
+
+    # Image upload with a link drop at 95%: bare POST vs pooled form POST vs resumable chunks
+    python -m citrasense.cli.bench image-upload --size-mb 64 --fail-at 0.95
+
+    # Upload backlog drain at several uplink speeds: FIFO single worker vs lanes vs lanes + bandwidth budget
+    python -m citrasense.cli.bench upload-drain --uplinks 20,50,100
+
+    # 10k radar uploads through an outage: in-memory retries vs durable spool (memory offline, drain time)
+    python -m citrasense.cli.bench upload-spool --items 10000
+
+    # Task poll sync with 5k pending tasks on 4 sensors: full heap rebuild vs incremental (CPU, heap-lock hold)
+    python -m citrasense.cli.bench task-poll --tasks 5000 --sensors 4
+"""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+import ctypes
+import heapq
+import io
+import json
+import logging
+import os
+import queue
+import random
+import shutil
+import statistics
+import tempfile
+import threading
+import time
+import tracemalloc
+from collections import deque
+from collections.abc import Callable
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+import click
+import numpy as np
+import pandas as pd
+from astropy.io import fits
+from dateutil import parser as dtparser
+from PIL import Image
+from pydantic import BaseModel
+
+from citrasense.acquisition.upload_queue import UploadQueue
+from citrasense.acquisition.upload_spool import UploadSpool
+from citrasense.api.upload_engine import BandwidthBudget, UploadEngine, UploadError
+from citrasense.astro.altaz_icrs import AltAzToIcrs
+from citrasense.cli.loadtest import host_info, synthetic_radar_payload, write_report
+from citrasense.cli.upload_stand_in import LocalUploadServer
+from citrasense.hardware.capture_watcher import CaptureWatcher
+from citrasense.hardware.devices.camera.fits_writer import write_capture_fits
+from citrasense.hardware.devices.camera.moravian_camera import MoravianCamera
+from citrasense.hardware.devices.camera.ximea_camera import XimeaHyperspectralCamera
+from citrasense.hardware.devices.mount.mount_state_cache import MountStateCache
+from citrasense.logging.web_log_handler import WebLogHandler
+from citrasense.pipelines.common.artifact_writer import dump_json
+from citrasense.pipelines.optical.processor_dependencies import read_ldac_catalog, read_source_catalog
+from citrasense.pipelines.optical.source_extractor_processor import stage_sextractor_configs
+from citrasense.pipelines.optical.wcs_projection import WcsProjection
+from citrasense.pipelines.radar.radar_artifact_log import DEFAULT_MAX_SEGMENT_BYTES, RadarArtifactLog
+from citrasense.pipelines.radar.radar_detection_filter import RadarDetectionFilter
+from citrasense.pipelines.radar.radar_processing_context import RadarProcessingContext
+from citrasense.sensors.allsky.frame_archive import AllskyFrameArchive
+from citrasense.sensors.bus import Delivery, DeliveryMode, InProcessBus
+from citrasense.sensors.preview_bus import PREVIEW_SIZES, PreviewFrame, preview_level
+from citrasense.sensors.radar.detection_buffer import DetectionRingBuffer
+from citrasense.sensors.radar.events import RadarObservationEvent
+from citrasense.sensors.telescope.fits_enrichment import (
+    _add_location_metadata,
+    _add_task_metadata,
+    enrich_fits_metadata,
+)
+from citrasense.tasks.task import Task
+from citrasense.tasks.task_dispatcher import TaskDispatcher
+from citrasense.version import get_version_info
+from citrasense.web.connection_manager import pack_binary_message
+
+REPORT_SCHEMA_VERSION = 1
+
+_SEXTRACTOR_CONFIG_DIR = Path(__file__).resolve().parent.parent / "pipelines" / "optical" / "sextractor_configs"
+
+# (parameter, FITS TFORM, ASCII printf format) — mirrors sextractor_configs/default.param.
+_SEXTRACTOR_PARAMS: tuple[tuple[str, str, str], ...] = (
+    ("NUMBER", "J", "%10d"),
+    ("EXT_NUMBER", "I", "%3d"),
+    ("FLUX_AUTO", "E", "%12.7g"),
+    ("FLUXERR_AUTO", "E", "%12.7g"),
+    ("MAG_AUTO", "E", "%8.4f"),
+    ("MAGERR_AUTO", "E", "%8.4f"),
+    ("X_IMAGE", "E", "%10.3f"),
+    ("Y_IMAGE", "E", "%10.3f"),
+    ("ALPHA_J2000", "D", "%11.7f"),
+    ("DELTA_J2000", "D", "%+11.7f"),
+    ("FWHM_IMAGE", "E", "%8.2f"),
+    ("ELONGATION", "E", "%8.3f"),
+    ("ELLIPTICITY", "E", "%8.3f"),
+)
+
+
+# ── Shared helpers ─────────────────────────────────────────────────────
+
+
+def time_call(fn: Callable[[], Any], repeat: int) -> dict[str, float]:
+    """Run *fn* ``repeat`` times and return min / median wall time in seconds."""
+    timings = []
+    for _ in range(max(1, repeat)):
+        t0 = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - t0)
+    return {"min": round(min(timings), 6), "median": round(statistics.median(timings), 6)}
+
+
+def bench_report(benchmark: str, params: dict[str, Any], results: Any) -> dict[str, Any]:
+    """Wrap benchmark *results* in the standard report envelope."""
+    return {
+        "schema_version": REPORT_SCHEMA_VERSION,
+        "tool": "citrasense.cli.bench",
+        "benchmark": benchmark,
+        "version": get_version_info(),
+        "started_at": datetime.now(timezone.utc).isoformat(),
+        "host": host_info(),
+        "params": params,
+        "results": results,
+    }
+
+
+def _parse_sizes(value: str) -> list[int]:
+    try:
+        sizes = [int(v) for v in value.split(",") if v.strip()]
+    except ValueError as e:
+        raise click.BadParameter(f"expected comma-separated integers, got {value!r}") from e
+    if not sizes or any(n <= 0 for n in sizes):
+        raise click.BadParameter("sizes must be positive integers")
+    return sizes
+
+
+# ── SExtractor catalogs ────────────────────────────────────────────────
+
+
+def synthetic_sextractor_columns(n: int, seed: int = 0) -> dict[str, np.ndarray]:
+    """Plausible SExtractor output columns for *n* sources."""
+    rng = np.random.default_rng(seed)
+    mag = rng.uniform(-14.0, -6.0, n)
+    elongation = 1.0 + rng.exponential(0.15, n)
+    return {
+        "NUMBER": np.arange(1, n + 1, dtype=np.int32),
+        "EXT_NUMBER": np.ones(n, dtype=np.int16),
+        "FLUX_AUTO": 10.0 ** (-0.4 * mag),
+        "FLUXERR_AUTO": 10.0 ** (-0.4 * mag) * rng.uniform(0.001, 0.05, n),
+        "MAG_AUTO": mag,
+        "MAGERR_AUTO": rng.uniform(0.001, 0.2, n),
+        "X_IMAGE": rng.uniform(1.0, 6248.0, n),
+        "Y_IMAGE": rng.uniform(1.0, 4176.0, n),
+        "ALPHA_J2000": rng.uniform(150.0, 152.0, n),
+        "DELTA_J2000": rng.uniform(20.0, 22.0, n),
+        "FWHM_IMAGE": rng.uniform(1.5, 6.0, n),
+        "ELONGATION": elongation,
+        "ELLIPTICITY": 1.0 - 1.0 / elongation,
+    }
+
+
+def write_ascii_catalog(path: Path, columns: dict[str, np.ndarray]) -> Path:
+    """Write *columns* as an ``ASCII_HEAD`` SExtractor catalog."""
+    header = "\n".join(f"# {i:3d} {name}" for i, (name, _tform, _fmt) in enumerate(_SEXTRACTOR_PARAMS, start=1))
+    table = np.column_stack([columns[name] for name, _tform, _fmt in _SEXTRACTOR_PARAMS])
+    np.savetxt(path, table, fmt=[fmt for _name, _tform, fmt in _SEXTRACTOR_PARAMS], header=header, comments="")
+    return path
+
+
+def write_ldac_catalog(path: Path, columns: dict[str, np.ndarray]) -> Path:
+    """Write *columns* as a ``FITS_LDAC`` SExtractor catalog (LDAC_IMHEAD + LDAC_OBJECTS)."""
+    imhead = fits.Header({"NAXIS": 2, "NAXIS1": 6248, "NAXIS2": 4176}).tostring()
+    imhead_hdu = fits.BinTableHDU.from_columns(
+        [fits.Column(name="Field Header Card", format=f"{len(imhead)}A", array=np.array([imhead]))],
+        name="LDAC_IMHEAD",
+    )
+    objects_hdu = fits.BinTableHDU.from_columns(
+        [fits.Column(name=name, format=tform, array=columns[name]) for name, tform, _fmt in _SEXTRACTOR_PARAMS],
+        name="LDAC_OBJECTS",
+    )
+    fits.HDUList([fits.PrimaryHDU(), imhead_hdu, objects_hdu]).writeto(path, overwrite=True)
+    return path
+
+
+def _legacy_stage_and_cleanup(config_dir: Path, working_dir: Path) -> None:
+    """What ``_extract_sources`` did per frame before staging was cached."""
+    names = ["default.sex", "default.param", "default.conv", "default.nnw"]
+    for name in names:
+        shutil.copy(config_dir / name, working_dir / name)
+    for name in names:
+        (working_dir / name).unlink()
+
+
+def _legacy_parse_sex_catalog(catalog_path: Path) -> pd.DataFrame:
+    """The row-by-row ASCII catalog parser ``SourceExtractorProcessor`` used before ``read_source_catalog``."""
+    sources = []
+    with open(catalog_path) as f:
+        for line in f:
+            if line.startswith("#"):
+                continue
+            cols = line.split()
+            if len(cols) < 12:
+                continue
+            try:
+                sources.append(
+                    {
+                        "ra": float(cols[8]),
+                        "dec": float(cols[9]),
+                        "mag": float(cols[4]),
+                        "magerr": float(cols[5]),
+                        "fwhm": float(cols[10]),
+                        "elongation": float(cols[11]),
+                    }
+                )
+            except (ValueError, IndexError):
+                continue
+    return pd.DataFrame(sources)
+
+
+def bench_sextractor_catalog(sizes: list[int], repeat: int, work_dir: Path) -> dict[str, Any]:
+    """Time catalog ingest (ASCII vs FITS_LDAC) per size, plus per-frame config staging cost."""
+    parse_results = []
+    for n in sizes:
+        cols = synthetic_sextractor_columns(n)
+        ascii_path = write_ascii_catalog(work_dir / f"ascii_{n}.cat", cols)
+        ldac_path = write_ldac_catalog(work_dir / f"ldac_{n}.cat", cols)
+
+        ascii_rows = time_call(lambda p=ascii_path: _legacy_parse_sex_catalog(p), repeat)
+        ascii_pandas = time_call(lambda p=ascii_path: read_source_catalog(p), repeat)
+        ldac = time_call(lambda p=ldac_path: read_ldac_catalog(p), repeat)
+        parse_results.append(
+            {
+                "sources": n,
+                "ascii_bytes": ascii_path.stat().st_size,
+                "ldac_bytes": ldac_path.stat().st_size,
+                "ascii_row_parser_seconds": ascii_rows,
+                "ascii_read_csv_seconds": ascii_pandas,
+                "ldac_seconds": ldac,
+                "ldac_speedup_vs_row_parser": round(ascii_rows["median"] / max(ldac["median"], 1e-9), 1),
+            }
+        )
+
+    stage_dir = work_dir / "stage_legacy"
+    stage_dir.mkdir(exist_ok=True)
+    staging = {
+        "per_frame_copy_seconds": time_call(
+            lambda: _legacy_stage_and_cleanup(_SEXTRACTOR_CONFIG_DIR, stage_dir), repeat
+        ),
+        "cached_stage_seconds": time_call(
+            lambda: stage_sextractor_configs(_SEXTRACTOR_CONFIG_DIR, work_dir / "stage"), repeat
+        ),
+    }
+    return {"parse": parse_results, "config_staging": staging}
+
+
+# ── WCS projection ─────────────────────────────────────────────────────
+
+
+def synthetic_wcs_header(width: int = 6248, height: int = 4176, sip: bool = False) -> fits.Header:
+    """A plate-solve-like TAN header (0.72"/px, slightly rotated), optionally with SIP terms."""
+    header = fits.Header()
+    header.update(
+        {
+            "NAXIS": 2,
+            "NAXIS1": width,
+            "NAXIS2": height,
+            "CTYPE1": "RA---TAN-SIP" if sip else "RA---TAN",
+            "CTYPE2": "DEC--TAN-SIP" if sip else "DEC--TAN",
+            "CRVAL1": 150.3,
+            "CRVAL2": 21.1,
+            "CRPIX1": width / 2 + 0.5,
+            "CRPIX2": height / 2 + 0.5,
+            "CD1_1": -2.0e-4,
+            "CD1_2": 1.5e-6,
+            "CD2_1": 1.5e-6,
+            "CD2_2": 2.0e-4,
+        }
+    )
+    if sip:
+        header.update({"A_ORDER": 2, "B_ORDER": 2, "A_2_0": 2.0e-7, "A_0_2": 1.0e-7, "B_1_1": 1.5e-7})
+    return header
+
+
+def _sky_points(projection: WcsProjection, n: int, rng: np.random.Generator, spill: float) -> tuple:
+    """*n* RA/Dec points scattered over the detector, *spill* fraction beyond its edges."""
+    width, height = projection.shape or (6248, 4176)
+    x = rng.uniform(-spill * width, (1 + spill) * width, n)
+    y = rng.uniform(-spill * height, (1 + spill) * height, n)
+    return projection.wcs.all_pix2world(x, y, 0)
+
+
+def bench_wcs_projection(
+    predictions: int, stars: int, repeat: int, loop_sample: int, seed: int = 0
+) -> list[dict[str, Any]]:
+    """Time one frame's RA/Dec → pixel conversions for TAN and TAN-SIP solutions.
+
+    The per-point loop (how the annotator used to convert) is timed on a
+    ``loop_sample`` subset and scaled to the full point count.
+    """
+    rng = np.random.default_rng(seed)
+    return [
+        _bench_one_wcs(label, synthetic_wcs_header(sip=sip), predictions, stars, repeat, loop_sample, rng)
+        for label, sip in (("tan", False), ("tan-sip", True))
+    ]
+
+
+def _bench_one_wcs(
+    label: str,
+    header: fits.Header,
+    predictions: int,
+    stars: int,
+    repeat: int,
+    loop_sample: int,
+    rng: np.random.Generator,
+) -> dict[str, Any]:
+    projection = WcsProjection.from_header(header)
+    assert projection is not None
+    pred_ra, pred_dec = _sky_points(projection, predictions, rng, spill=0.5)
+    star_ra, star_dec = _sky_points(projection, stars, rng, spill=0.3)
+    ra = np.concatenate([pred_ra, star_ra])
+    dec = np.concatenate([pred_dec, star_dec])
+    total = ra.size
+
+    sample = min(loop_sample, total)
+    wcs = projection.wcs
+    loop = time_call(
+        lambda: [wcs.world_to_pixel_values(float(r), float(d)) for r, d in zip(ra[:sample], dec[:sample], strict=True)],
+        1,
+    )
+    scale = total / max(sample, 1)
+    batch = time_call(lambda: wcs.all_world2pix(ra, dec, 0, quiet=True), repeat)
+    shared = time_call(lambda: projection.world_to_pixel_values(ra, dec), repeat)
+    build = time_call(lambda: WcsProjection.from_header(header), repeat)
+
+    x_exact, y_exact = wcs.all_world2pix(ra, dec, 0, quiet=True)
+    x_fast, y_fast = projection.world_to_pixel_values(ra, dec)
+    on_frame = projection.contains(x_exact, y_exact)
+    err = np.hypot(x_fast - x_exact, y_fast - y_exact)[on_frame]
+    return {
+        "wcs": label,
+        "points": total,
+        "uses_linear": projection.uses_linear,
+        "linear_check_max_error_px": projection.linear_max_error_px,
+        "on_frame_max_error_px": float(np.nanmax(err)) if err.size else None,
+        "per_point_loop_seconds": {k: round(v * scale, 6) for k, v in loop.items()},
+        "astropy_batch_seconds": batch,
+        "projection_seconds": shared,
+        "projection_build_seconds": build,
+        "speedup_vs_loop": round(loop["median"] * scale / max(shared["median"], 1e-9), 1),
+    }
+
+
+# ── FITS enrichment ────────────────────────────────────────────────────
+
+_BENCH_TASK = SimpleNamespace(
+    id="00000000-0000-0000-0000-000000000000",
+    sensor_type="telescope",
+    satelliteName="STARLINK-1234",
+    groundStationName="Bench Ground Station",
+    telescopeName="Bench Telescope",
+    assigned_filter_name="Clear",
+)
+_BENCH_GROUND_STATION = {"name": "Bench Ground Station", "latitude": 38.8, "longitude": -104.8, "altitude": 1900.0}
+
+
+def _write_frame(path: Path, width: int, height: int, header_cards: int, padded: bool) -> None:
+    hdu = fits.PrimaryHDU(np.zeros((height, width), dtype=np.uint16))
+    for i in range(header_cards):
+        hdu.header[f"CAM{i}"] = (i, "camera card")
+    if padded:
+        write_capture_fits(hdu, path)
+    else:
+        hdu.writeto(path, overwrite=True)
+
+
+def _data_offset(path: Path) -> int:
+    with fits.open(path) as hdul:
+        return hdul[0]._data_offset  # type: ignore[union-attr]
+
+
+def _legacy_enrich(path: Path) -> int:
+    """The pre-patch enrichment (astropy update mode).  Returns bytes written.
+
+    astropy rewrites only the header when it still fits its blocks, and the
+    whole file (temp copy + rename) when it doesn't.
+    """
+    offset = _data_offset(path)
+    with fits.open(path, mode="update") as hdul:
+        header = hdul[0].header
+        _add_location_metadata(header, ground_station_record=_BENCH_GROUND_STATION)
+        _add_task_metadata(header, _BENCH_TASK, None, _BENCH_GROUND_STATION)
+        header["ORIGIN"] = ("Citra.space", "Data origin")
+    new_offset = _data_offset(path)
+    return new_offset if new_offset == offset else os.path.getsize(path)
+
+
+def _patched_enrich(path: Path) -> int:
+    patch = enrich_fits_metadata(str(path), task=_BENCH_TASK, ground_station=_BENCH_GROUND_STATION)
+    assert patch is not None
+    return patch.bytes_written
+
+
+def bench_fits_enrichment(width: int, height: int, header_cards: int, repeat: int, work_dir: Path) -> list[dict]:
+    """Bytes written and wall time per exposure for each enrichment path."""
+    cases = (
+        ("astropy-update", False, _legacy_enrich),
+        ("header-patch/padded-capture", True, _patched_enrich),
+        ("header-patch/external-file", False, _patched_enrich),
+    )
+    results = []
+    for name, padded, enrich in cases:
+        path = work_dir / "frame.fits"
+        timings, written = [], []
+        for _ in range(max(1, repeat)):
+            _write_frame(path, width, height, header_cards, padded)
+            t0 = time.perf_counter()
+            written.append(enrich(path))
+            timings.append(time.perf_counter() - t0)
+        results.append(
+            {
+                "path": name,
+                "file_bytes": os.path.getsize(path),
+                "bytes_written": max(written),
+                "seconds": {"min": round(min(timings), 6), "median": round(statistics.median(timings), 6)},
+            }
+        )
+    return results
+
+
+# ── Moravian readout ───────────────────────────────────────────────────
+
+
+class _BenchGxccd:
+    """Stand-in for a gxccd handle: serves a fixed frame once *readout_s* has passed after the exposure."""
+
+    is_initialized = True
+
+    def __init__(self, width: int, height: int, readout_s: float):
+        self.frame = np.random.default_rng(0).integers(0, 65535, size=(height, width), dtype=np.uint16)
+        self.readout_s = readout_s
+        self.ready_at = 0.0
+        self.detected_at = 0.0
+        self.polls = 0
+
+    def set_gain(self, gain: int) -> None:
+        pass
+
+    def set_binning(self, x: int, y: int) -> None:
+        pass
+
+    def start_exposure(self, exp_time: float, use_shutter: bool, x: int, y: int, w: int, h: int) -> None:
+        self.ready_at = time.monotonic() + exp_time + self.readout_s
+        self.polls = 0
+
+    def image_ready(self) -> bool:
+        self.polls += 1
+        if time.monotonic() < self.ready_at:
+            return False
+        self.detected_at = time.monotonic()
+        return True
+
+    def read_image(self, buf, size: int) -> None:
+        ctypes.memmove(buf, self.frame.ctypes.data, size)
+
+
+def _legacy_moravian_frame(gx: _BenchGxccd, width: int, height: int) -> np.ndarray:
+    """The pre-change readout: SDK buffer → bytes → array, full stats, tobytes → frombuffer for the FITS writer."""
+    size = width * 2 * height
+    buf = ctypes.create_string_buffer(size)
+    gx.read_image(buf, size)
+    data = np.frombuffer(bytes(buf), dtype=np.uint16).reshape((height, width))
+    _ = (int(data.min()), int(data.max()), int(np.median(data)), float(data.mean()))
+    return np.frombuffer(data.tobytes(), dtype=np.uint16).reshape((height, width))
+
+
+def _legacy_moravian_wait(gx: _BenchGxccd, duration: float) -> None:
+    if duration > 0.5:
+        time.sleep(duration - 0.2)
+    while not gx.image_ready():
+        time.sleep(0.05)
+
+
+def _measure_readout(read: Callable[[], np.ndarray], repeat: int) -> dict[str, Any]:
+    timings, peaks = [], []
+    for _ in range(max(1, repeat)):
+        tracemalloc.start()
+        t0 = time.perf_counter()
+        read()
+        timings.append(time.perf_counter() - t0)
+        peaks.append(tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+    return {
+        "readout_seconds": {"min": round(min(timings), 6), "median": round(statistics.median(timings), 6)},
+        # Steady state: the reusable buffer is allocated on the first frame only.
+        "peak_alloc_bytes": peaks[-1],
+    }
+
+
+def _measure_wait(wait: Callable[[_BenchGxccd, float], None], gx: _BenchGxccd, duration: float, repeat: int):
+    late, polls = [], []
+    for _ in range(max(1, repeat)):
+        gx.start_exposure(duration, True, 0, 0, 0, 0)
+        wait(gx, duration)
+        late.append(gx.detected_at - gx.ready_at)
+        polls.append(gx.polls)
+    return {"detect_lag_ms": round(statistics.median(late) * 1000, 2), "polls": int(statistics.median(polls))}
+
+
+def bench_moravian_readout(width: int, height: int, exposure: float, readout: float, repeat: int) -> list[dict]:
+    """Per-frame readout latency, peak allocation and image_ready detection lag, old vs new path."""
+    gx = _BenchGxccd(width, height, readout)
+    camera = MoravianCamera(logging.getLogger("citrasense.bench"))
+    camera._gxccd = gx  # type: ignore[assignment]
+    camera._camera_info = {"width": width, "height": height}
+
+    def _new_wait(g: _BenchGxccd, duration: float) -> None:
+        camera._wait_image_ready(g, time.monotonic() + duration)  # type: ignore[arg-type]
+
+    legacy = _measure_readout(lambda: _legacy_moravian_frame(gx, width, height), repeat)
+    legacy.update(_measure_wait(_legacy_moravian_wait, gx, exposure, repeat))
+    fresh = _measure_readout(lambda: camera._read_frame(np.empty((height, width), dtype=np.uint16)), repeat)
+    fresh.update(_measure_wait(_new_wait, gx, exposure, repeat))
+    reused = _measure_readout(lambda: camera._read_frame(camera._reusable_frame(width, height)), repeat)
+    reused.update({k: fresh[k] for k in ("detect_lag_ms", "polls")})
+    return [
+        {"path": "legacy", **legacy},
+        {"path": "capture_array", **fresh},
+        {"path": "take_exposure", **reused},
+    ]
+
+
+# ── Ximea datacube ─────────────────────────────────────────────────────
+
+# Snapshot-mosaic sensor sizes (MQ022HG-IM-SM4X4 / -SM5X5).
+_MOSAIC_FRAMES = {4: (1088, 2048), 5: (1085, 2045)}
+
+
+def _legacy_datacube_save(camera: XimeaHyperspectralCamera, mosaic: np.ndarray, path: Path) -> None:
+    """The pre-streaming save: zero-filled cube filled band by band, then one ImageHDU per band."""
+    n = int(np.sqrt(camera.spectral_bands))
+    out_h, out_w = mosaic.shape[0] // n, mosaic.shape[1] // n
+    cube = np.zeros((out_h, out_w, n * n), dtype=mosaic.dtype)
+    for band in range(n * n):
+        cube[:, :, band] = mosaic[band // n :: n, band % n :: n][:out_h, :out_w]
+    hdus: list[Any] = [fits.PrimaryHDU()]
+    for band in range(n * n):
+        hdus.append(fits.ImageHDU(cube[:, :, band], name=f"BAND_{band:03d}"))
+    write_capture_fits(fits.HDUList(hdus), path)
+
+
+def bench_ximea_datacube(patterns: list[int], repeat: int, work_dir: Path) -> list[dict]:
+    """Save time and peak Python-heap allocation per mosaic frame, legacy vs streamed."""
+    return [_bench_one_mosaic(n, repeat, work_dir) for n in patterns]
+
+
+def _bench_one_mosaic(n: int, repeat: int, work_dir: Path) -> dict[str, Any]:
+    height, width = _MOSAIC_FRAMES.get(n, (n * 218, n * 409))
+    mosaic = np.random.default_rng(n).integers(0, 4095, size=(height, width), dtype=np.uint16)
+    camera = XimeaHyperspectralCamera(logging.getLogger("citrasense.bench"), spectral_bands=n * n)
+    camera.data_mode = "datacube"
+    row: dict[str, Any] = {"pattern": f"{n}x{n}", "mosaic": [width, height], "mosaic_bytes": mosaic.nbytes}
+    paths = (
+        ("legacy", lambda p: _legacy_datacube_save(camera, mosaic, p)),
+        ("streamed", lambda p: camera._save_hyperspectral_data(mosaic, p)),
+    )
+    for name, save in paths:
+        path = work_dir / f"{name}_{n}.fits"
+        timings, peaks = [], []
+        for _ in range(max(1, repeat)):
+            tracemalloc.start()
+            t0 = time.perf_counter()
+            save(path)
+            timings.append(time.perf_counter() - t0)
+            peaks.append(tracemalloc.get_traced_memory()[1])
+            tracemalloc.stop()
+        row[name] = {
+            "seconds": {"min": round(min(timings), 6), "median": round(statistics.median(timings), 6)},
+            "peak_alloc_bytes": max(peaks),
+            "file_bytes": os.path.getsize(path),
+        }
+    row["frames_per_second"] = {
+        name: round(1.0 / max(row[name]["seconds"]["median"], 1e-9), 1) for name in ("legacy", "streamed")
+    }
+    return row
+
+
+# ── Capture tail latency ───────────────────────────────────────────────
+
+
+def _simulate_ekos(task_dir: Path, frames: int, interval: float, frame_bytes: int, closed_at: list[float]) -> None:
+    """Write *frames* FITS-sized files into per-filter subdirectories, recording when the last one closed."""
+    payload = b"\0" * frame_bytes
+    for i in range(frames):
+        time.sleep(interval)
+        sub = task_dir / "Light" / f"F{i % 3}"
+        sub.mkdir(parents=True, exist_ok=True)
+        with open(sub / f"frame_{i:03d}.fits", "wb") as f:
+            f.write(payload)
+    closed_at.append(time.monotonic())
+
+
+def _legacy_wait(task_dir: Path, frames: int, poll_s: float) -> None:
+    """The pre-watcher loop: glob the task directory, sleep ``poll_s``, repeat."""
+    while len(list(task_dir.rglob("*.fits")) + list(task_dir.rglob("*.fit"))) < frames:
+        time.sleep(poll_s)
+
+
+def bench_capture_tail(
+    frames: int, interval: float, frame_bytes: int, legacy_poll_s: float, repeat: int, work_dir: Path
+) -> list[dict]:
+    """Time from the last frame closing to the wait returning, per completion-detection strategy."""
+    strategies: list[tuple[str, Callable[[Path], None]]] = [
+        ("legacy-poll", lambda d: _legacy_wait(d, frames, legacy_poll_s)),
+    ]
+    for name, use_inotify in (("watcher-inotify", True), ("watcher-poll", False)):
+
+        def _watch(d: Path, use_inotify: bool = use_inotify) -> None:
+            with CaptureWatcher(d, use_inotify=use_inotify) as watcher:
+                while not watcher.wait_for(frames, timeout=1.0):
+                    pass
+
+        strategies.append((name, _watch))
+
+    results = []
+    for name, wait in strategies:
+        tails = []
+        for run in range(max(1, repeat)):
+            task_dir = work_dir / f"{name}-{run}"
+            task_dir.mkdir()
+            closed_at: list[float] = []
+            writer = threading.Thread(
+                target=_simulate_ekos, args=(task_dir, frames, interval, frame_bytes, closed_at), daemon=True
+            )
+            writer.start()
+            wait(task_dir)
+            done_at = time.monotonic()
+            writer.join()
+            tails.append(max(0.0, done_at - closed_at[0]))
+        results.append(
+            {
+                "strategy": name,
+                "tail_seconds": {
+                    "median": round(statistics.median(tails), 4),
+                    "max": round(max(tails), 4),
+                },
+            }
+        )
+    return results
+
+
+# ── Mount state cache ──────────────────────────────────────────────────
+
+
+class _BenchMount:
+    """Stand-in mount counting the serial commands ZwoAmMount issues per read."""
+
+    def __init__(self, parked: bool = False, tracking: bool = True) -> None:
+        self.parked = parked
+        self.tracking = tracking
+        self.slew_until = 0.0
+        self.commands = 0
+        self._lock = threading.Lock()
+
+    def _count(self, n: int = 1) -> None:
+        with self._lock:
+            self.commands += n
+
+    def get_radec(self) -> tuple[float, float]:
+        self._count(2)  # :GR# + :GD#
+        return 180.0, 45.0
+
+    def get_azimuth(self) -> float:
+        self._count()
+        return 120.0
+
+    def get_altitude(self) -> float:
+        self._count()
+        return 55.0
+
+    def is_tracking(self) -> bool:
+        self._count()
+        return self.tracking
+
+    def is_slewing(self) -> bool:
+        self._count()
+        return time.monotonic() < self.slew_until
+
+    def is_home(self) -> bool:
+        self._count()
+        return False
+
+    def is_parked(self) -> bool:
+        self._count()
+        return self.parked
+
+    def get_mount_mode(self) -> str:
+        self._count()
+        return "altaz"
+
+
+def _measure_settle(strategy: str, slew_s: float) -> tuple[float, int]:
+    """One slew: seconds from motion ending to the waiter returning, and serial commands during the wait."""
+    mount = _BenchMount()
+    cache = MountStateCache(mount, adaptive=strategy == "cache-wait")  # type: ignore[arg-type]
+    cache.start()
+    try:
+        time.sleep(0.05)
+        mount.slew_until = time.monotonic() + slew_s
+        before = mount.commands
+        if strategy == "cache-wait":
+            cache.wait_until_idle(timeout=slew_s + 30)
+        else:
+            sleep_s = 0.5 if strategy == "legacy-alignment-loop" else 0.1
+            while mount.is_slewing():
+                time.sleep(sleep_s)
+        return max(0.0, time.monotonic() - mount.slew_until), mount.commands - before
+    finally:
+        cache.stop()
+
+
+def _commands_per_hour(adaptive: bool, parked: bool, slewing: bool, seconds: float, time_scale: float) -> int:
+    """Serial commands/hour from the cache's background polling, with time compressed by *time_scale*."""
+    mount = _BenchMount(parked=parked)
+    if slewing:
+        mount.slew_until = float("inf")
+    cache = MountStateCache(
+        mount,  # type: ignore[arg-type]
+        poll_interval=0.5 / time_scale,
+        fast_poll_interval=0.1 / time_scale,
+        parked_poll_interval=5.0 / time_scale,
+        adaptive=adaptive,
+    )
+    cache.start()
+    time.sleep(seconds)
+    cache.stop()
+    return round(mount.commands / (seconds * time_scale) * 3600)
+
+
+def bench_mount_cache(slew_s: float, repeat: int, seconds: float, time_scale: float) -> dict:
+    """Slew-settle detection latency per wait strategy, and polling traffic per mount state."""
+    logging.getLogger("citrasense.MountStateCache").setLevel(logging.WARNING)
+    # Vary the slew length so the end of motion lands at a different phase of each poll loop.
+    slews = [slew_s + 0.5 * i / max(1, repeat) for i in range(max(1, repeat))]
+    settle = []
+    for strategy in ("legacy-alignment-loop", "legacy-task-loop", "cache-wait"):
+        runs = [_measure_settle(strategy, s) for s in slews]
+        latencies = [r[0] for r in runs]
+        settle.append(
+            {
+                "strategy": strategy,
+                "detect_latency_seconds": {
+                    "median": round(statistics.median(latencies), 4),
+                    "max": round(max(latencies), 4),
+                },
+                "commands_per_second_during_wait": round(
+                    statistics.median(n / s for (_, n), s in zip(runs, slews, strict=True)), 1
+                ),
+            }
+        )
+
+    traffic = []
+    for state, parked, slewing in (("parked", True, False), ("tracking", False, False), ("slewing", False, True)):
+        traffic.append(
+            {
+                "state": state,
+                "fixed_2hz_commands_per_hour": _commands_per_hour(False, parked, slewing, seconds, time_scale),
+                "adaptive_commands_per_hour": _commands_per_hour(True, parked, slewing, seconds, time_scale),
+            }
+        )
+    return {"settle": settle, "traffic": traffic}
+
+
+# ── Preview streaming ──────────────────────────────────────────────────
+
+
+def _legacy_preview_message(data: np.ndarray) -> bytes:
+    """The pre-pyramid broadcast: full-frame percentiles, full-size JPEG, base64 data URL in JSON."""
+    arr = data.astype(np.float32, copy=False)
+    lo, hi = np.percentile(arr, 2.0), np.percentile(arr, 98.0)
+    stretched = np.clip((arr - lo) / (hi - lo) * 255.0, 0, 255).astype(np.uint8)
+    buf = io.BytesIO()
+    Image.fromarray(stretched, mode="L").save(buf, format="JPEG", quality=85)
+    data_url = "data:image/jpeg;base64," + base64.b64encode(buf.getvalue()).decode("ascii")
+    return json.dumps({"type": "preview", "source": "bench", "sensor_id": "scope-0", "data": data_url}).encode()
+
+
+def _binary_preview_message(data: np.ndarray, level: int) -> bytes:
+    """What a subscriber at *level* receives: a fresh frame's encode at that level, in the binary envelope."""
+    encoded = PreviewFrame(data).jpeg(level)
+    header = {"type": "preview", "source": "bench", "sensor_id": "scope-0", "mime": "image/jpeg", "level": level}
+    return pack_binary_message(dict(header, width=encoded.width, height=encoded.height), encoded.jpeg)
+
+
+def bench_preview(width: int, height: int, repeat: int) -> list[dict]:
+    """Per-preview encode time and WebSocket message size: legacy JSON data URL vs each binary pyramid level."""
+    rng = np.random.default_rng(0)
+    data = rng.normal(1000, 30, (height, width)).clip(0, 65535).astype(np.uint16)
+    data[rng.integers(0, height, 2000), rng.integers(0, width, 2000)] = 60000
+
+    rows = []
+    cases = [("json-data-url", "full", lambda: _legacy_preview_message(data))]
+    for level in PREVIEW_SIZES:
+        cases.append(("binary", str(level or "full"), lambda level=level: _binary_preview_message(data, level)))
+    for path, level, fn in cases:
+        timing = time_call(fn, repeat)
+        rows.append({"path": path, "level": level, "bytes": len(fn()), **timing})
+    return rows
+
+
+# ── Allsky capture and archive ─────────────────────────────────────────
+
+
+def _legacy_allsky_cycle(frame: np.ndarray) -> bytes:
+    """The pre-change cycle: full-frame stretch, data URL, then base64-decode it back for ``latest.jpg``."""
+    arr = frame.astype(np.float32, copy=False)
+    gray = np.mean(arr, axis=2, dtype=np.float32)
+    lo, hi = np.percentile(gray, 2.0), np.percentile(gray, 98.0)
+    stretched = np.clip((arr - lo) / (hi - lo) * 255.0, 0, 255).astype(np.uint8)
+    buf = io.BytesIO()
+    Image.fromarray(stretched, mode="RGB").save(buf, format="JPEG", quality=85)
+    data_url = "data:image/jpeg;base64," + base64.b64encode(buf.getvalue()).decode("ascii")
+    return base64.b64decode(data_url.split(";base64,", 1)[1])
+
+
+def _process_time_call(fn: Callable[[], Any], repeat: int) -> dict[str, float]:
+    """Like :func:`time_call` but in process CPU seconds (all threads)."""
+    timings = []
+    for _ in range(max(1, repeat)):
+        t0 = time.process_time()
+        fn()
+        timings.append(time.process_time() - t0)
+    return {"min": round(min(timings), 6), "median": round(statistics.median(timings), 6)}
+
+
+def bench_allsky_capture(width: int, height: int, repeat: int, work_dir: Path) -> list[dict]:
+    """CPU per capture cycle (encode → latest.jpg bytes → preview message), legacy vs shared bytes."""
+    rng = np.random.default_rng(0)
+    frame = rng.normal(40, 8, (height, width, 3)).clip(0, 255).astype(np.uint8)
+    archive = AllskyFrameArchive(work_dir / "archive")
+    clock = iter(range(10**9))
+
+    def legacy() -> None:
+        _legacy_allsky_cycle(frame)
+
+    def shared(archive_frame: bool, thumbnail: bool) -> None:
+        preview = PreviewFrame(frame)
+        jpeg = preview.jpeg().jpeg
+        if archive_frame:
+            archive.append(jpeg, datetime.fromtimestamp(1.7e9 + next(clock), tz=timezone.utc))
+        if thumbnail:
+            preview.jpeg(preview_level(320))
+
+    cases = [
+        ("legacy-data-url", legacy),
+        ("shared-bytes", lambda: shared(False, False)),
+        ("shared-bytes+archive", lambda: shared(True, False)),
+        ("shared-bytes+archive+320px", lambda: shared(True, True)),
+    ]
+    return [{"path": name, "cpu_seconds": _process_time_call(fn, repeat)} for name, fn in cases]
+
+
+def _frame_file_name(t: float) -> str:
+    return datetime.fromtimestamp(t, tz=timezone.utc).strftime("%Y%m%dT%H%M%S.%fZ.jpg")
+
+
+def _legacy_directory_lookup(directory: Path, start: datetime, end: datetime) -> list[Path]:
+    """File-per-frame layout: list the directory, parse every name, filter and sort."""
+    lo, hi = _frame_file_name(start.timestamp()), _frame_file_name(end.timestamp())
+    return sorted(directory / n for n in os.listdir(directory) if lo <= n <= hi)
+
+
+def bench_allsky_archive(frames: int, interval: float, frame_bytes: int, repeat: int, work_dir: Path) -> dict:
+    """Time to find (and read) one hour of frames out of *frames*, per storage layout."""
+    payload = os.urandom(frame_bytes)
+    t0 = 1.7e9
+    directory = work_dir / "files"
+    directory.mkdir()
+    archive = AllskyFrameArchive(work_dir / "archive")
+    for i in range(frames):
+        t = t0 + i * interval
+        (directory / _frame_file_name(t)).write_bytes(payload)
+        archive.append(payload, datetime.fromtimestamp(t, tz=timezone.utc))
+
+    start = datetime.fromtimestamp(t0 + frames * interval / 2, tz=timezone.utc)
+    end = start + timedelta(hours=1)
+
+    def legacy_read() -> None:
+        for path in _legacy_directory_lookup(directory, start, end):
+            path.read_bytes()
+
+    def archive_read() -> None:
+        for _ in archive.iter_jpegs(start, end):
+            pass
+
+    hits = len(archive.frames_between(start, end))
+    cases = [
+        ("file-per-frame", "seek", lambda: _legacy_directory_lookup(directory, start, end)),
+        ("archive-cold", "seek", lambda: AllskyFrameArchive(archive.root).frames_between(start, end)),
+        ("archive-warm", "seek", lambda: archive.frames_between(start, end)),
+        ("file-per-frame", "seek+read", legacy_read),
+        ("archive-warm", "seek+read", archive_read),
+    ]
+    rows = [{"layout": layout, "op": op, **time_call(fn, repeat)} for layout, op, fn in cases]
+    return {"frames_in_window": hits, "results": rows}
+
+
+# ── Web log streaming ──────────────────────────────────────────────────
+
+
+class _LegacyWebLogHandler(logging.Handler):
+    """The pre-batching handler: regex per record, one ``run_coroutine_threadsafe`` per line."""
+
+    def __init__(self, web_app, loop) -> None:
+        super().__init__()
+        self.web_app = web_app
+        self.loop = loop
+
+    def emit(self, record: logging.LogRecord) -> None:
+        import re
+
+        if record.levelno < logging.ERROR and (
+            "WebSocket" in record.getMessage() or "HTTP Request:" in record.getMessage()
+        ):
+            return
+        entry = {
+            "timestamp": datetime.fromtimestamp(record.created).isoformat(),
+            "level": re.sub(r"\x1b\[\d+m", "", record.levelname),
+            "message": record.getMessage(),
+            "module": record.name,
+            "sensor_id": getattr(record, "sensor_id", None),
+        }
+        if self.loop.is_running():
+            asyncio.run_coroutine_threadsafe(self.web_app.broadcast_log(entry), self.loop)
+
+
+class _BenchWebApp:
+    """Serializes each message once per simulated client, as ConnectionManager.broadcast does."""
+
+    def __init__(self, clients: int) -> None:
+        self.clients = clients
+        self.messages = 0
+        self.lines = 0
+
+    async def _send(self, message: dict) -> None:
+        for _ in range(self.clients):
+            json.dumps(message)
+            await asyncio.sleep(0)
+        self.messages += 1
+
+    async def broadcast_log(self, entry: dict) -> None:
+        self.lines += 1
+        await self._send({"type": "log", "data": entry})
+
+    async def broadcast_logs(self, entries: list[dict], dropped: dict[str, int]) -> None:
+        self.lines += len(entries)
+        await self._send({"type": "logs", "data": entries, "dropped": dropped})
+
+
+def _measure_log_stream(strategy: str, lines_per_second: int, seconds: float, clients: int) -> dict[str, Any]:
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    app = _BenchWebApp(clients)
+    lags: list[float] = []
+    stop = threading.Event()
+
+    async def probe() -> None:
+        # Stands in for the 1 s status broadcast: how late does a 10 ms timer fire?
+        while not stop.is_set():
+            t0 = time.perf_counter()
+            await asyncio.sleep(0.01)
+            lags.append(time.perf_counter() - t0 - 0.01)
+
+    handler: logging.Handler
+    if strategy == "per-line":
+        handler = _LegacyWebLogHandler(app, loop)
+    else:
+        handler = WebLogHandler()
+        handler.set_web_app(app, loop)
+    logger = logging.getLogger(f"citrasense.bench.weblog.{strategy}")
+    logger.propagate = False
+    logger.setLevel(logging.DEBUG)
+    logger.handlers = [handler]
+
+    probe_future = asyncio.run_coroutine_threadsafe(probe(), loop)
+    levels = (logging.DEBUG,) * 8 + (logging.INFO, logging.WARNING)
+    chunk = max(1, lines_per_second // 100)
+    emitted = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < seconds:
+        for _ in range(chunk):
+            logger.log(levels[emitted % len(levels)], "exposure %d: star count %d", emitted, emitted * 7)
+            emitted += 1
+        time.sleep(max(0.0, start + emitted / lines_per_second - time.perf_counter()))
+    produced_s = time.perf_counter() - start
+
+    time.sleep(0.5)  # let the loop work off its backlog before the probe stops
+    stop.set()
+    probe_future.result(timeout=60)
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join(timeout=60)
+    loop.close()
+    logger.handlers = []
+
+    lags_ms = sorted(lag * 1000 for lag in lags)
+    row: dict[str, Any] = {
+        "strategy": strategy,
+        "lines_emitted": emitted,
+        "achieved_lines_per_second": round(emitted / produced_s),
+        "lines_delivered": app.lines,
+        "messages_sent": app.messages,
+        "loop_lag_ms": {
+            "p50": round(lags_ms[len(lags_ms) // 2], 2),
+            "p99": round(lags_ms[min(len(lags_ms) - 1, int(len(lags_ms) * 0.99))], 2),
+            "max": round(lags_ms[-1], 2),
+        },
+    }
+    if isinstance(handler, WebLogHandler):
+        row["dropped"] = handler.get_stats()["dropped"]
+    return row
+
+
+def bench_web_log(lines_per_second: int, seconds: float, clients: int) -> list[dict]:
+    """Event-loop timer lag while a producer thread logs at *lines_per_second*, per streaming strategy."""
+    return [_measure_log_stream(s, lines_per_second, seconds, clients) for s in ("per-line", "batched")]
+
+
+# ── Sensor bus routing ─────────────────────────────────────────────────
+
+
+class _FnmatchScanBus:
+    """The pre-router bus: ``fnmatchcase`` against every pattern on every publish."""
+
+    def __init__(self) -> None:
+        self._lock = threading.RLock()
+        self._subs: dict[str, list[Callable[[str, BaseModel], None]]] = {}
+
+    def publish(self, subject: str, event: BaseModel) -> None:
+        from fnmatch import fnmatchcase
+
+        with self._lock:
+            matched = []
+            for pattern, handlers in self._subs.items():
+                if pattern == subject or fnmatchcase(subject, pattern):
+                    matched.extend(handlers)
+        for handler in matched:
+            handler(subject, event)
+
+    def subscribe(self, subject_pattern: str, handler: Callable[[str, BaseModel], None], delivery=None) -> None:
+        with self._lock:
+            self._subs.setdefault(subject_pattern, []).append(handler)
+
+
+class _BusEvent(BaseModel):
+    value: int
+
+
+def _bus_patterns(count: int) -> list[str]:
+    """A daemon-like mix: per-sensor exact subjects, per-sensor wildcards, and a few cross-sensor globs."""
+    patterns = []
+    for i in range(count):
+        sensor = f"sensor-{i // 4}"
+        kind = i % 4
+        if kind == 0:
+            patterns.append(f"sensors.{sensor}.events.acquisition")
+        elif kind == 1:
+            patterns.append(f"sensors.{sensor}.events.*")
+        elif kind == 2:
+            patterns.append(f"sensors.{sensor}.events.status")
+        else:
+            patterns.append("sensors.*.events.status" if i % 40 == 3 else f"sensors.{sensor}.events.frame_captured")
+    return patterns
+
+
+def bench_bus(subscription_counts: list[int], publishes: int, repeat: int) -> list[dict]:
+    """Publishes per second against *subscription_counts* subscriptions, per routing strategy."""
+    event = _BusEvent(value=1)
+    results = []
+    for count in subscription_counts:
+        patterns = _bus_patterns(count)
+        sensors = max(1, count // 4)
+        subjects = [
+            f"sensors.sensor-{i % sensors}.events.{kind}"
+            for i, kind in enumerate(("acquisition", "status", "frame_captured") * 8)
+        ]
+        handled = [0]
+
+        def handler(subject: str, ev: BaseModel, handled: list[int] = handled) -> None:
+            handled[0] += 1
+
+        legacy = _FnmatchScanBus()
+        compiled = InProcessBus()
+        for pattern in patterns:
+            legacy.subscribe(pattern, handler)
+            compiled.subscribe(pattern, handler)
+
+        def run(bus: Any, cold: bool = False, subjects: list[str] = subjects) -> None:
+            for i in range(publishes):
+                if cold:
+                    bus._cache.clear()
+                bus.publish(subjects[i % len(subjects)], event)
+
+        strategies: list[tuple[str, Callable[[], None]]] = [
+            ("fnmatch-scan", lambda b=legacy: run(b)),
+            ("trie-cold", lambda b=compiled: run(b, cold=True)),
+            ("trie-cached", lambda b=compiled: run(b)),
+        ]
+        for name, fn in strategies:
+            handled[0] = 0
+            timing = time_call(fn, repeat)
+            results.append(
+                {
+                    "subscriptions": count,
+                    "strategy": name,
+                    "publishes": publishes,
+                    "deliveries_per_publish": round(handled[0] / (publishes * max(1, repeat)), 2),
+                    "publishes_per_second": round(publishes / timing["median"]) if timing["median"] else None,
+                    **timing,
+                }
+            )
+
+    # Publisher-side cost when the only subscriber is slow: inline waits for it, queued hands off.
+    subject = "sensors.radar-0.events.acquisition"
+    slow_publishes = max(1, publishes // 100)
+    for mode in (DeliveryMode.INLINE, DeliveryMode.QUEUED):
+        bus = InProcessBus()
+        sub = bus.subscribe(subject, lambda s, e: time.sleep(0.0005), Delivery(mode=mode, max_pending=slow_publishes))
+        timing = time_call(lambda b=bus: [b.publish(subject, event) for _ in range(slow_publishes)], 1)
+        sub.unsubscribe()
+        results.append(
+            {
+                "subscriptions": 1,
+                "strategy": f"slow-handler-{mode.value}",
+                "publishes": slow_publishes,
+                "deliveries_per_publish": 1.0,
+                "publishes_per_second": round(slow_publishes / timing["median"]) if timing["median"] else None,
+                **timing,
+            }
+        )
+    return results
+
+
+# ── Radar Alt/Az → ICRS ────────────────────────────────────────────────
+
+
+def _skycoord_radec(az: float, el: float, lat: float, lon: float, alt_m: float, epoch: str) -> tuple[float, float]:
+    """The pre-engine formatter path: fresh location, time, frame and SkyCoord per detection."""
+    from astropy import units as u
+    from astropy.coordinates import AltAz, EarthLocation, SkyCoord
+    from astropy.time import Time
+
+    location = EarthLocation(lat=lat * u.deg, lon=lon * u.deg, height=alt_m * u.m)
+    frame = AltAz(obstime=Time(epoch), location=location)
+    icrs = SkyCoord(alt=el * u.deg, az=az * u.deg, frame=frame).icrs
+    return float(icrs.ra.deg), float(icrs.dec.deg)  # type: ignore[attr-defined,union-attr]
+
+
+def bench_radar_azel(detections: int, legacy_detections: int, span_s: float, repeat: int) -> dict[str, Any]:
+    """Detections per second converted Alt/Az → ICRS, per path, plus worst disagreement with astropy."""
+    from astropy import units as u
+    from astropy.coordinates import SkyCoord
+
+    site = (38.82, -104.87, 1660.0)
+    rng = np.random.default_rng(41)
+    az = rng.uniform(0.0, 360.0, detections)
+    el = rng.uniform(5.0, 90.0, detections)
+    t0 = datetime(2026, 3, 15, 4, 0, tzinfo=timezone.utc).timestamp()
+    t = np.sort(t0 + rng.uniform(0.0, span_s, detections))
+    epochs = [datetime.fromtimestamp(v, tz=timezone.utc).isoformat().replace("+00:00", "Z") for v in t]
+    stamps = [datetime.fromtimestamp(v, tz=timezone.utc) for v in t]
+
+    engine = AltAzToIcrs(*site)
+    engine.transform(az, el, t)  # warm the bucket contexts; a live sensor reuses them all night
+    n_legacy = min(legacy_detections, detections)
+
+    rows = []
+    paths: list[tuple[str, int, Callable[[], Any]]] = [
+        (
+            "skycoord-per-detection",
+            n_legacy,
+            lambda: [_skycoord_radec(az[i], el[i], *site, epochs[i]) for i in range(n_legacy)],
+        ),
+        (
+            "engine-per-detection",
+            detections,
+            lambda: [engine.transform_one(az[i], el[i], stamps[i]) for i in range(detections)],
+        ),
+        ("engine-batched", detections, lambda: engine.transform(az, el, t)),
+    ]
+    for name, count, fn in paths:
+        timing = time_call(fn, 1 if name.startswith("skycoord") else repeat)
+        rows.append(
+            {
+                "path": name,
+                "detections": count,
+                "detections_per_second": round(count / timing["median"]) if timing["median"] else None,
+                "us_per_detection": round(timing["median"] / count * 1e6, 2),
+                **timing,
+            }
+        )
+
+    # Accuracy: engine vs a vectorized SkyCoord over every detection.
+    from astropy.coordinates import AltAz, EarthLocation
+    from astropy.time import Time
+
+    location = EarthLocation(lat=site[0] * u.deg, lon=site[1] * u.deg, height=site[2] * u.m)
+    reference = SkyCoord(
+        alt=el * u.deg, az=az * u.deg, frame=AltAz(obstime=Time(t, format="unix"), location=location)
+    ).icrs
+    ra, dec = engine.transform(az, el, t)
+    separation = SkyCoord(ra=ra * u.deg, dec=dec * u.deg).separation(reference).arcsec
+    return {
+        "results": rows,
+        "max_separation_arcsec": round(float(separation.max()), 6),
+        "median_separation_arcsec": round(float(np.median(separation)), 6),
+    }
+
+
+# ── Radar tasked-satellite filter ──────────────────────────────────────
+
+
+class _SnapshotOnlyIndex:
+    """The pre-index lookup: the filter can only copy and scan the task list."""
+
+    def __init__(self, dispatcher: TaskDispatcher) -> None:
+        self.get_tasks_snapshot = dispatcher.get_tasks_snapshot
+
+
+def _bench_dispatcher(tasks: int) -> TaskDispatcher:
+    silent = logging.getLogger("citrasense.bench.dispatcher")
+    silent.setLevel(logging.CRITICAL)
+    dispatcher = TaskDispatcher(api_client=None, logger=silent, settings=SimpleNamespace())
+    runtime = SimpleNamespace(sensor_id="scope-0", sensor_type="telescope", set_dispatcher=lambda d: None)
+    dispatcher.register_runtime(runtime)  # type: ignore[arg-type]
+    start = datetime(2026, 3, 15, 4, 0, tzinfo=timezone.utc)
+    queued = {}
+    for i in range(tasks):
+        t0 = start + timedelta(minutes=i)
+        queued[f"task-{i}"] = Task.from_dict(
+            {
+                "id": f"task-{i}",
+                "status": "Scheduled",
+                "taskStart": t0.isoformat(),
+                "taskStop": (t0 + timedelta(minutes=5)).isoformat(),
+                "satelliteId": f"sat-{i}",
+                "sensorId": "scope-0",
+            }
+        )
+    dispatcher.restore_task_dict(queued)
+    return dispatcher
+
+
+def bench_radar_filter(tasks: int, detections: int, repeat: int) -> list[dict]:
+    """Filter throughput with *tasks* queued, idle and while other threads hold the heap lock."""
+    dispatcher = _bench_dispatcher(tasks)
+    radar_filter = RadarDetectionFilter()
+    when = datetime(2026, 3, 15, 4, 0, tzinfo=timezone.utc)
+    # Half tasked (spread across the queue), half unknown.
+    uuids = [f"sat-{(i * 7919) % tasks}" if i % 2 else f"untasked-{i}" for i in range(detections)]
+
+    def make_contexts(index: Any) -> list[RadarProcessingContext]:
+        return [
+            RadarProcessingContext(
+                sensor_id="radar-0",
+                event=RadarObservationEvent(
+                    sensor_id="radar-0",
+                    modality="radar",
+                    timestamp=when,
+                    payload={"quality": {"snr_db": 20.0}, "target": {"citra_uuid": uuid}},
+                ),
+                forward_only_tasked_satellites=True,
+                task_index=index,
+            )
+            for uuid in uuids
+        ]
+
+    def contend(stop: threading.Event) -> None:
+        # Stand-in for the poll / runner / web threads: take the heap lock in short bursts.
+        while not stop.is_set():
+            with dispatcher.heap_lock:
+                dispatcher.pending_task_count  # noqa: B018
+            time.sleep(0)
+
+    results = []
+    for contended in (False, True):
+        for name, index in (("snapshot-scan", _SnapshotOnlyIndex(dispatcher)), ("tasked-id-set", dispatcher)):
+            contexts = make_contexts(index)
+            passed = [0]
+
+            def run(contexts: list[RadarProcessingContext] = contexts, passed: list[int] = passed) -> None:
+                passed[0] = sum(radar_filter.process(ctx) for ctx in contexts)
+
+            stop = threading.Event()
+            workers = [
+                threading.Thread(target=contend, args=(stop,), daemon=True) for _ in range(2 if contended else 0)
+            ]
+            for w in workers:
+                w.start()
+            try:
+                timing = time_call(run, repeat)
+            finally:
+                stop.set()
+                for w in workers:
+                    w.join()
+            results.append(
+                {
+                    "lookup": name,
+                    "contended": contended,
+                    "tasks": tasks,
+                    "detections": detections,
+                    "passed": passed[0],
+                    "detections_per_second": round(detections / timing["median"]) if timing["median"] else None,
+                    **timing,
+                }
+            )
+    return results
+
+
+# ── Radar detection history ────────────────────────────────────────────
+
+
+class _DequeDetectionBuffer:
+    """The previous ring buffer: a deque of slim dicts, filtered by a full scan."""
+
+    def __init__(self, maxlen: int) -> None:
+        self._buf: deque[dict[str, Any]] = deque(maxlen=maxlen)
+        self._lock = threading.Lock()
+
+    def append(self, slim: dict[str, Any]) -> None:
+        with self._lock:
+            self._buf.append(slim)
+
+    def snapshot_since(self, since_ts: float) -> list[dict[str, Any]]:
+        with self._lock:
+            snapshot = list(self._buf)
+        return [d for d in snapshot if float(d.get("ts_unix") or 0.0) > since_ts]
+
+    def downsample(self, since_ts: float, max_points: int) -> list[dict[str, Any]]:
+        rows = self.snapshot_since(since_ts)
+        step = max(1, -(-len(rows) // max_points))
+        return rows[::step]
+
+
+def _radar_slim_dicts(count: int, t0: float, rate_hz: float = 10.0):
+    rng = np.random.default_rng(43)
+    snr = rng.uniform(3.0, 30.0, count).tolist()
+    rng_km = rng.uniform(200.0, 3000.0, count).tolist()
+    for i in range(count):
+        yield {
+            "ts": "",
+            "ts_unix": t0 + i / rate_hz,
+            "sensor_id": "radar-0",
+            "range_km": rng_km[i],
+            "range_rate_km_s": -1.5,
+            "doppler_hz": 500.0,
+            "snr_db": snr[i],
+            "sat_uuid": f"sat-{i % 50}",
+            "sat_name": f"SAT {i % 50}",
+            "az_deg": 180.0,
+            "el_deg": 45.0,
+            "alt_km": 550.0,
+            "station": f"K{i % 6:03d}",
+        }
+
+
+def bench_radar_history(detections: int, repeat: int) -> list[dict]:
+    """Retained-history memory and query latency, deque of dicts vs columnar buffer, both holding *detections*."""
+    t0 = 1_773_550_800.0
+    t_end = t0 + (detections - 1) / 10.0
+    queries: list[tuple[str, Callable[[Any], list]]] = [
+        ("since-cursor-1s", lambda buf: buf.snapshot_since(t_end - 1.0)),
+        ("last-5-min", lambda buf: buf.snapshot_since(t_end - 300.0)),
+        ("last-1-h-500-points", lambda buf: buf.downsample(t_end - 3600.0, 500)),
+        ("all-500-points", lambda buf: buf.downsample(t0 - 1.0, 500)),
+    ]
+    results = []
+    for name, factory in (("deque-of-dicts", _DequeDetectionBuffer), ("columnar", DetectionRingBuffer)):
+        tracemalloc.start()
+        buf = factory(detections)
+        start = time.perf_counter()
+        for slim in _radar_slim_dicts(detections, t0):
+            buf.append(slim)
+        fill_s = time.perf_counter() - start
+        retained = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        for query, run in queries:
+            rows = [0]
+
+            def call(buf: Any = buf, run: Callable[[Any], list] = run, rows: list[int] = rows) -> None:
+                rows[0] = len(run(buf))
+
+            timing = time_call(call, repeat)
+            results.append(
+                {
+                    "buffer": name,
+                    "query": query,
+                    "detections": detections,
+                    "rows": rows[0],
+                    "retained_mb": round(retained / 1e6, 1),
+                    "appends_per_second": round(detections / fill_s) if fill_s else None,
+                    **timing,
+                }
+            )
+        del buf
+    return results
+
+
+# ── Radar artifact log ─────────────────────────────────────────────────
+
+
+def _radar_artifact(i: int, when: datetime) -> dict:
+    return {
+        "sensor_id": "radar-0",
+        "received_at": when.isoformat(),
+        "observation": {
+            "observation_id": f"obs-{i}",
+            "timestamp": when.isoformat(),
+            "bistatic": {"bistatic_range_km": 1234.5 + i % 100, "doppler_hz": 512.25},
+            "quality": {"snr_db": 14.0},
+            "target": {"citra_uuid": f"sat-{i % 50}", "name": f"SAT {i % 50}"},
+            "geometry": {"az_deg": 180.0, "el_deg": 45.0, "alt_km": 550.0},
+        },
+        "drop_reason": None if i % 3 else "below_snr",
+        "upload_payload": None,
+    }
+
+
+def bench_radar_artifacts(observations: int, rate_hz: float, night_hours: float) -> list[dict]:
+    """Per-observation JSON files vs the segmented log: write throughput, files, bytes and a 1-minute range read.
+
+    Throughput counts until the data reaches the OS (neither layout
+    fsyncs per observation); the log's closing fsync is reported apart.
+    """
+    t0 = datetime(2026, 3, 15, 2, 0, tzinfo=timezone.utc)
+    stamps = [t0 + timedelta(seconds=i / rate_hz) for i in range(observations)]
+    records = [_radar_artifact(i, when) for i, when in enumerate(stamps)]
+    window = (t0 + timedelta(seconds=60), t0 + timedelta(seconds=120))
+    night = rate_hz * night_hours * 3600.0
+
+    results = []
+    with tempfile.TemporaryDirectory(prefix="citrasense_bench_") as tmp:
+        legacy_dir = Path(tmp) / "per-file"
+        legacy_dir.mkdir()
+        start = time.perf_counter()
+        for i, (record, when) in enumerate(zip(records, stamps, strict=True)):
+            name = when.strftime("%Y%m%dT%H%M%S.%f") + f"Z_obs-{i}.json"
+            dump_json(legacy_dir, name, record)
+        write_s = time.perf_counter() - start
+        start = time.perf_counter()
+        lo, hi = (w.strftime("%Y%m%dT%H%M%S.%f") for w in window)
+        hits = [json.loads(p.read_text()) for p in sorted(legacy_dir.iterdir()) if lo <= p.name[:22] <= hi + "~"]
+        read_s = time.perf_counter() - start
+        size = sum(p.stat().st_size for p in legacy_dir.iterdir())
+        results.append(
+            {
+                "layout": "file-per-observation",
+                "observations": observations,
+                "observations_per_second": round(observations / write_s),
+                "caller_us_per_observation": round(write_s / observations * 1e6, 1),
+                "final_fsync_s": None,
+                "files": observations,
+                "bytes": size,
+                "files_per_night": round(night),
+                "range_read_ms": round(read_s * 1e3, 2),
+                "range_hits": len(hits),
+            }
+        )
+
+        log_dir = Path(tmp) / "log"
+        log = RadarArtifactLog(log_dir)
+        start = time.perf_counter()
+        for record, when in zip(records, stamps, strict=True):
+            log.append(record, when)
+        caller_s = time.perf_counter() - start
+        log.flush(fsync=False)
+        write_s = time.perf_counter() - start
+        log.close()
+        fsync_s = time.perf_counter() - start - write_s
+        start = time.perf_counter()
+        hits = RadarArtifactLog(log_dir).records_between(*window)
+        read_s = time.perf_counter() - start
+        stats = log.stats()
+        bytes_per_night = stats["bytes"] / observations * night
+        results.append(
+            {
+                "layout": "segmented-log",
+                "observations": observations,
+                "observations_per_second": round(observations / write_s),
+                "caller_us_per_observation": round(caller_s / observations * 1e6, 1),
+                "final_fsync_s": round(fsync_s, 3),
+                "files": stats["files"],
+                "bytes": stats["bytes"],
+                "files_per_night": 2 * max(1, -(-int(bytes_per_night) // DEFAULT_MAX_SEGMENT_BYTES)),
+                "range_read_ms": round(read_s * 1e3, 2),
+                "range_hits": len(hits),
+                "batches": stats["batches"],
+                "fsyncs": stats["fsyncs"],
+            }
+        )
+    return results
+
+
+# ── Image upload ───────────────────────────────────────────────────────
+
+
+def _synthetic_fits(path: Path, size_mb: float) -> None:
+    """A 16-bit sky-background frame of about *size_mb* (noise compresses like real data)."""
+    side = int((size_mb * 1e6 / 2) ** 0.5)
+    rng = np.random.default_rng(0)
+    data = (1000 + rng.normal(0.0, 12.0, (side, side))).astype(np.int16)
+    fits.PrimaryHDU(data).writeto(path, overwrite=True)
+
+
+def bench_image_upload(size_mb: float, uploads: int, fail_at: float, chunk_mb: float) -> list[dict]:
+    """Bytes on the wire and connections for *uploads* images whose first attempt drops at *fail_at*.
+
+    Every mode retries a failed upload straight away (the upload queue
+    would back off first).  The stand-in server counts body bytes as it
+    reads them; ``resent_bytes`` is what it received beyond one copy of
+    each file.  ``bare-post`` is the old per-image ``httpx.post``.
+    """
+    import httpx
+
+    chunk = int(chunk_mb * 1024 * 1024)
+    modes = [
+        ("bare-post", False),
+        ("pooled-form-post", False),
+        ("resumable", False),
+        ("resumable+gzip", True),
+    ]
+    results = []
+    with tempfile.TemporaryDirectory(prefix="citrasense_bench_") as tmp:
+        image = Path(tmp) / "frame.fits"
+        _synthetic_fits(image, size_mb)
+        for mode, compress in modes:
+            # No in-call chunk retries: the second attempt below plays the queue's retry.
+            engine = UploadEngine(chunk_size=chunk, compress=compress, max_chunk_retries=0)
+            path = engine.prepare(image)
+            size = path.stat().st_size
+            attempts = 0
+            with LocalUploadServer() as server:
+                start = time.perf_counter()
+                for _ in range(uploads):
+                    url = server.create_upload(size)
+                    if mode.startswith("resumable"):
+                        server.fail_at_offset(url, int(size * fail_at))
+                    else:
+                        server.fail_next(int(size * fail_at))
+                    for _attempt in range(2):
+                        attempts += 1
+                        try:
+                            if mode == "bare-post":
+                                with open(path, "rb") as f:
+                                    files = {"file": (path.name, f, "application/fits")}
+                                    httpx.post(server.form_url(), data={}, files=files).raise_for_status()
+                            elif mode == "pooled-form-post":
+                                engine.post_form(server.form_url(), {}, path)
+                            else:
+                                engine.upload_resumable(url, path)
+                            break
+                        except (httpx.HTTPError, UploadError):
+                            continue
+                elapsed = time.perf_counter() - start
+                stats = server.stats()
+            engine.discard_prepared(image, path)
+            engine.close()
+            results.append(
+                {
+                    "mode": mode,
+                    "uploads": uploads,
+                    "attempts": attempts,
+                    "file_bytes": size,
+                    "received_bytes": stats["bytes_received"],
+                    "resent_bytes": stats["bytes_received"] - uploads * size,
+                    "connections": stats["connections"],
+                    "seconds": round(elapsed, 3),
+                }
+            )
+    return results
+
+
+# ── Upload backlog drain ───────────────────────────────────────────────
+
+
+class _FifoUploadQueue(UploadQueue):
+    """The pre-lanes upload queue: one FIFO, whatever the workers."""
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.work_queue = queue.Queue()
+
+    def _execute_work(self, item):
+        if item.get("kind") == "radar":
+            return self._execute_radar(item)
+        return self._execute_optical(item)
+
+    def get_lane_stats(self) -> dict:
+        return {}
+
+
+class _StandInApiClient:
+    """Just the two upload calls, aimed at a :class:`LocalUploadServer`."""
+
+    def __init__(self, engine: UploadEngine, server: LocalUploadServer) -> None:
+        self.engine = engine
+        self.server = server
+
+    def upload_image(self, task_id: str, telescope_id: str | None, filepath: str) -> str:
+        self.engine.post_form(self.server.form_url("images"), {}, Path(filepath))
+        return "/results"
+
+    def upload_radar_observations(self, payloads: list[dict]) -> bool:
+        self.engine.client.post(self.server.form_url("radar"), json=payloads).raise_for_status()
+        return True
+
+
+def bench_upload_drain(uplinks_mbps: list[float], images: int, size_mb: float, radar_hz: float) -> list[dict]:
+    """Drain a backlog of *images* FITS uploads while radar batches keep arriving at *radar_hz*.
+
+    The stand-in server reads at the uplink rate across all connections,
+    so concurrent uploads compete for it like on a real link.  Radar
+    latency runs from submit to the upload completing.
+    """
+    rng = np.random.default_rng(0)
+    settings = SimpleNamespace(
+        max_task_retries=0, initial_retry_delay_seconds=1, max_retry_delay_seconds=1, keep_images=True
+    )
+    silent = logging.getLogger("citrasense.bench.upload")
+    silent.setLevel(logging.CRITICAL)
+    results = []
+    with tempfile.TemporaryDirectory(prefix="citrasense_bench_") as tmp:
+        paths = []
+        for i in range(images):
+            path = Path(tmp) / f"frame_{i}.fits"
+            path.write_bytes(rng.bytes(int(size_mb * 1e6)))
+            paths.append(path)
+        total_bytes = sum(p.stat().st_size for p in paths)
+
+        for mbps in uplinks_mbps:
+            rate = mbps * 1e6 / 8
+            modes = [
+                ("fifo-1-worker", _FifoUploadQueue, 1, None),
+                ("lanes-3-workers", UploadQueue, 3, None),
+                ("lanes-3-workers+budget", UploadQueue, 3, 0.8 * mbps),
+            ]
+            for mode, queue_cls, workers, budget_mbps in modes:
+                budget = BandwidthBudget.from_mbps(budget_mbps) if budget_mbps else None
+                latencies: list[float] = []
+                latency_lock = threading.Lock()
+                with LocalUploadServer(bandwidth_bytes_per_s=rate) as server:
+                    engine = UploadEngine(budget=budget)
+                    api = _StandInApiClient(engine, server)
+                    uq = queue_cls(num_workers=workers, settings=settings, logger=silent)
+                    uq.start()
+                    start = time.perf_counter()
+                    for i, path in enumerate(paths):
+                        uq.submit(f"img-{i}", None, str(path), None, api, {"id": "tel"}, settings, lambda *a, **k: None)
+
+                    # Radar batches arrive for as long as the images take at full uplink speed.
+                    expected = total_bytes / rate
+                    submitted = 0
+                    while time.perf_counter() - start < expected:
+                        t_submit = time.perf_counter()
+
+                        def on_done(
+                            ok: bool, t_submit: float = t_submit, latencies=latencies, lock=latency_lock
+                        ) -> None:
+                            with lock:
+                                latencies.append(time.perf_counter() - t_submit)
+
+                        payload = {"observation_id": f"r{submitted}", "rows": rng.normal(size=32).tolist()}
+                        uq.submit_radar_observation("radar-0", payload, api, settings, on_complete=on_done)
+                        submitted += 1
+                        time.sleep(1.0 / radar_hz)
+                    while not uq.is_idle():
+                        time.sleep(0.01)
+                    drain = time.perf_counter() - start
+                    lanes = uq.get_lane_stats()
+                    uq.stop()
+                    engine.close()
+                latencies.sort()
+                results.append(
+                    {
+                        "uplink_mbps": mbps,
+                        "mode": mode,
+                        "workers": workers,
+                        "budget_mbps": budget_mbps,
+                        "images": images,
+                        "image_bytes": total_bytes,
+                        "radar_batches": submitted,
+                        "drain_seconds": round(drain, 3),
+                        "ideal_seconds": round(expected, 3),
+                        "radar_latency_p50_s": round(latencies[len(latencies) // 2], 3) if latencies else None,
+                        "radar_latency_p95_s": round(latencies[int(len(latencies) * 0.95)], 3) if latencies else None,
+                        "radar_latency_max_s": round(latencies[-1], 3) if latencies else None,
+                        "image_wait_max_s": lanes.get("image", {}).get("wait_max_s"),
+                    }
+                )
+    return results
+
+
+# ── Upload spool ───────────────────────────────────────────────────────
+
+
+class _OutageApiClient:
+    """Radar uploads fail at once while ``online`` is False, then take *upload_ms* each."""
+
+    def __init__(self, upload_ms: float) -> None:
+        self.online = False
+        self.upload_s = upload_ms / 1000.0
+        self.uploaded = 0
+        self._lock = threading.Lock()
+
+    def upload_radar_observations(self, payloads: list[dict]) -> bool:
+        if not self.online:
+            raise ConnectionError("uplink down")
+        time.sleep(self.upload_s)
+        with self._lock:
+            self.uploaded += len(payloads)
+        return True
+
+
+def bench_upload_spool(
+    items: int, upload_ms: float, retry_delay: float, workers: int, probe_interval: float = 5.0
+) -> list[dict]:
+    """Submit *items* radar uploads during an outage, then reconnect and time the drain.
+
+    ``in-memory`` is the queue without a spool: every item fails once and
+    waits on a *retry_delay* backoff in RAM.  ``spool`` parks items in
+    SQLite after :data:`OFFLINE_AFTER_FAILURES` failures and drains them
+    once the next probe succeeds.  Memory is what tracemalloc attributes
+    to the backlog at the end of the outage.
+    """
+    from citrasense.acquisition.upload_queue import OFFLINE_AFTER_FAILURES
+
+    silent = logging.getLogger("citrasense.bench.spool")
+    silent.setLevel(logging.CRITICAL)
+    settings = SimpleNamespace(
+        max_task_retries=3,
+        initial_retry_delay_seconds=retry_delay,
+        max_retry_delay_seconds=max(retry_delay, 300),
+        keep_images=True,
+    )
+    rng = random.Random(0)
+    now = datetime.now(timezone.utc)
+    payloads = [synthetic_radar_payload(rng, f"det-{i}", now) for i in range(items)]
+    results = []
+    for mode in ("in-memory", "spool"):
+        with tempfile.TemporaryDirectory(prefix="citrasense_bench_") as tmp:
+            spool = UploadSpool(Path(tmp) / "spool.db") if mode == "spool" else None
+            api = _OutageApiClient(upload_ms)
+            uq = UploadQueue(num_workers=workers, settings=settings, logger=silent, spool=spool, sensor_id="radar-0")
+            uq.probe_interval_seconds = probe_interval
+            uq.start()
+            threads_before = threading.active_count()
+            tracemalloc.start()
+            baseline = tracemalloc.take_snapshot()
+
+            start = time.perf_counter()
+            for payload in payloads:
+                uq.submit_radar_observation("radar-0", dict(payload), api, settings)
+            submit_s = time.perf_counter() - start
+
+            def failed_once(uq: UploadQueue = uq) -> bool:
+                with uq._timer_lock:
+                    waiting = len(uq._pending_retries)
+                return waiting + uq.get_stats()["parked"] >= items
+
+            while not failed_once():
+                time.sleep(0.01)
+            offline_s = time.perf_counter() - start
+            memory = sum(stat.size_diff for stat in tracemalloc.take_snapshot().compare_to(baseline, "filename"))
+            tracemalloc.stop()
+            threads = threading.active_count() - threads_before
+
+            api.online = True
+            reconnect = time.perf_counter()
+            while api.uploaded < items:
+                time.sleep(0.01)
+            drain_s = time.perf_counter() - reconnect
+            stats = uq.get_stats()
+            uq.stop()
+            spool_bytes = sum(p.stat().st_size for p in Path(tmp).glob("spool.db*")) if spool else 0
+            if spool is not None:
+                spool.close()
+        results.append(
+            {
+                "mode": mode,
+                "items": items,
+                "workers": workers,
+                "submit_seconds": round(submit_s, 3),
+                "offline_settle_seconds": round(offline_s, 3),
+                "offline_memory_bytes": memory,
+                "offline_extra_threads": threads,
+                "drain_seconds": round(drain_s, 3),
+                "permanent_failures": stats["permanent_failures"],
+                "spool_file_bytes": spool_bytes,
+                "offline_after_failures": OFFLINE_AFTER_FAILURES if spool else None,
+            }
+        )
+    return results
+
+
+# ── Task poll sync ─────────────────────────────────────────────────────
+
+
+def _full_rebuild_sync(dispatcher: TaskDispatcher, tasks: list[dict]) -> float:
+    """The pre-incremental poll body: parse everything and rebuild heaps under ``heap_lock``.
+
+    Returns how long the lock was held.
+    """
+    now = int(time.time())
+    locked_at = time.perf_counter()
+    with dispatcher.heap_lock:
+        api_task_map = {}
+        for task_dict in tasks:
+            task = Task.from_dict(task_dict)
+            if task.id and task.status in ("Pending", "Scheduled"):
+                api_task_map[task.id] = task
+        current_ids = {v for v in dispatcher._current_task_ids.values() if v}
+        for sid in list(dispatcher._sensor_heaps):
+            heap = dispatcher._sensor_heaps[sid]
+            ids = dispatcher._sensor_task_ids[sid]
+            new_heap = []
+            for entry in heap:
+                if entry[2] in current_ids or entry[2] in api_task_map:
+                    new_heap.append(entry)
+                else:
+                    ids.discard(entry[2])
+                    dispatcher._sensor_task_dicts[sid].pop(entry[2], None)
+            if len(new_heap) != len(heap):
+                dispatcher._sensor_heaps[sid] = new_heap
+                heapq.heapify(new_heap)
+        all_known = dispatcher._all_task_ids()
+        for tid, task in api_task_map.items():
+            if tid in all_known or tid in current_ids:
+                continue
+            rt = dispatcher._runtime_for_task(task)
+            if rt is None:
+                continue
+            start_epoch = int(dtparser.isoparse(task.taskStart).timestamp())
+            stop_epoch = int(dtparser.isoparse(task.taskStop).timestamp()) if task.taskStop else 0
+            if stop_epoch and stop_epoch < now:
+                continue
+            heapq.heappush(dispatcher._sensor_heaps[rt.sensor_id], (start_epoch, stop_epoch, tid, task))
+            dispatcher._sensor_task_ids[rt.sensor_id].add(tid)
+            dispatcher._sensor_task_dicts[rt.sensor_id][tid] = task
+        dispatcher._publish_tasked_satellites()
+    return time.perf_counter() - locked_at
+
+
+def _poll_task_dict(rng: random.Random, name: str, sensors: int, start: datetime) -> dict:
+    t0 = start + timedelta(seconds=30 * rng.randrange(20_000))
+    return {
+        "id": f"task-{name}",
+        "type": "Track",
+        "status": "Scheduled",
+        "updateEpoch": start.isoformat(),
+        "taskStart": t0.isoformat(),
+        "taskStop": (t0 + timedelta(minutes=5)).isoformat(),
+        "satelliteId": f"sat-{name}",
+        "satelliteName": f"SAT {name}",
+        "sensorId": f"scope-{rng.randrange(sensors)}",
+    }
+
+
+def bench_task_poll(tasks: int, sensors: int, polls: int, churn: float) -> list[dict]:
+    """CPU time and ``heap_lock`` hold per poll, full rebuild vs incremental sync.
+
+    ``steady`` re-polls an unchanged task list.  ``churn`` modifies the
+    start time of a *churn* fraction of tasks each poll and swaps in the
+    same number of brand-new tasks (so as many disappear).  Every poll
+    gets freshly decoded dicts, as from the API client.
+    """
+    silent = logging.getLogger("citrasense.bench.task_poll")
+    silent.setLevel(logging.CRITICAL)
+    start = datetime.now(timezone.utc) + timedelta(hours=1)
+    rng = random.Random(0)
+    base = [_poll_task_dict(rng, str(i), sensors, start) for i in range(tasks)]
+    changed = max(1, int(tasks * churn))
+
+    def poll_list(poll: int, scenario: str) -> list[dict]:
+        polled = [dict(d) for d in base]
+        if scenario == "churn":
+            for j in range(changed):
+                d = polled[(poll * changed + j) % tasks]
+                d["taskStart"] = (dtparser.isoparse(d["taskStart"]) + timedelta(seconds=poll)).isoformat()
+                d["updateEpoch"] = f"{start.isoformat()}#{poll}"
+            polled.extend(_poll_task_dict(rng, f"new-{poll}-{j}", sensors, start) for j in range(changed))
+        return polled
+
+    results = []
+    for scenario in ("steady", "churn"):
+        lists = [poll_list(p, scenario) for p in range(polls + 1)]
+        for mode in ("full-rebuild", "incremental"):
+            dispatcher = TaskDispatcher(api_client=None, logger=silent, settings=SimpleNamespace())
+            for n in range(sensors):
+                runtime = SimpleNamespace(
+                    sensor_id=f"scope-{n}", sensor_type="telescope", set_dispatcher=lambda d: None
+                )
+                dispatcher.register_runtime(runtime)  # type: ignore[arg-type]
+            cpu: list[float] = []
+            held: list[float] = []
+            for polled in lists:
+                t0 = time.process_time()
+                if mode == "incremental":
+                    hold = dispatcher._sync_tasks([dict(d) for d in polled])["lock_hold_s"]
+                else:
+                    hold = _full_rebuild_sync(dispatcher, [dict(d) for d in polled])
+                cpu.append(time.process_time() - t0)
+                held.append(hold)
+            results.append(
+                {
+                    "scenario": scenario,
+                    "mode": mode,
+                    "tasks": tasks,
+                    "sensors": sensors,
+                    "polls": polls,
+                    "changed_per_poll": changed if scenario == "churn" else 0,
+                    "pending": dispatcher.pending_task_count,
+                    "first_poll_cpu_ms": round(cpu[0] * 1e3, 2),
+                    "poll_cpu_ms_median": round(statistics.median(cpu[1:]) * 1e3, 3),
+                    "lock_hold_ms_median": round(statistics.median(held[1:]) * 1e3, 3),
+                    "lock_hold_ms_max": round(max(held[1:]) * 1e3, 3),
+                }
+            )
+    return results
+
+
+@click.group()
+def cli() -> None:
+    """Micro-benchmarks for citrasense pipeline hot paths."""
+
+
+@cli.command("sextractor-catalog")
+@click.option("--sizes", default="1000,10000,100000", show_default=True, help="Comma-separated source counts.")
+@click.option("--repeat", type=int, default=5, show_default=True, help="Timed runs per measurement.")
+@click.option("--output", type=click.Path(dir_okay=False, path_type=Path), default=None, help="Write JSON report.")
+def sextractor_catalog(sizes: str, repeat: int, output: Path | None) -> None:
+    """ASCII vs FITS_LDAC catalog parse time, and per-frame config staging cost."""
+    size_list = _parse_sizes(sizes)
+    with tempfile.TemporaryDirectory(prefix="citrasense_bench_") as tmp:
+        results = bench_sextractor_catalog(size_list, repeat, Path(tmp))
+
+    click.echo(f"{'sources':>9} {'ascii rows':>12} {'ascii csv':>12} {'ldac':>12} {'speedup':>8}")
+    for r in results["parse"]:
+        click.echo(
+            f"{r['sources']:>9} {r['ascii_row_parser_seconds']['median'] * 1000:>10.2f}ms "
+            f"{r['ascii_read_csv_seconds']['median'] * 1000:>10.2f}ms "
+            f"{r['ldac_seconds']['median'] * 1000:>10.2f}ms {r['ldac_speedup_vs_row_parser']:>7}x"
+        )
+    staging = results["config_staging"]
+    click.echo(
+        f"config staging per frame: {staging['per_frame_copy_seconds']['median'] * 1000:.3f}ms copy+cleanup, "
+        f"{staging['cached_stage_seconds']['median'] * 1000:.3f}ms cached"
+    )
+    if output is not None:
+        write_report(bench_report("sextractor-catalog", {"sizes": size_list, "repeat": repeat}, results), output)
+        click.echo(f"Report: {output}")
+
+
+@cli.command("wcs-projection")
+@click.option("--predictions", type=int, default=10000, show_default=True, help="TLE predictions per frame.")
+@click.option("--stars", type=int, default=50000, show_default=True, help="Catalog stars per frame.")
+@click.option("--repeat", type=int, default=5, show_default=True, help="Timed runs per measurement.")
+@click.option("--loop-sample", type=int, default=2000, show_default=True, help="Points timed in the per-point loop.")
+@click.option("--output", type=click.Path(dir_okay=False, path_type=Path), default=None, help="Write JSON report.")
+def wcs_projection(predictions: int, stars: int, repeat: int, loop_sample: int, output: Path | None) -> None:
+    """Per-point vs batched RA/Dec → pixel conversion for one frame."""
+    if predictions < 0 or stars < 0 or predictions + stars == 0:
+        raise click.BadParameter("need at least one prediction or star")
+    results = bench_wcs_projection(predictions, stars, repeat, loop_sample)
+
+    click.echo(f"{'wcs':>8} {'points':>7} {'loop':>11} {'astropy':>10} {'shared':>10} {'speedup':>8} {'linear':>7}")
+    for r in results:
+        click.echo(
+            f"{r['wcs']:>8} {r['points']:>7} {r['per_point_loop_seconds']['median'] * 1000:>9.1f}ms "
+            f"{r['astropy_batch_seconds']['median'] * 1000:>8.2f}ms {r['projection_seconds']['median'] * 1000:>8.2f}ms "
+            f"{r['speedup_vs_loop']:>7}x {'yes' if r['uses_linear'] else 'no':>7}"
+        )
+    if output is not None:
+        params = {"predictions": predictions, "stars": stars, "repeat": repeat, "loop_sample": loop_sample}
+        write_report(bench_report("wcs-projection", params, results), output)
+        click.echo(f"Report: {output}")
+
+
+@cli.command("fits-enrichment")
+@click.option("--frame-size", type=(int, int), default=(6248, 4176), show_default=True, help="Frame width height.")
+@click.option(
+    "--header-cards",
+    type=int,
+    default=25,
+    show_default=True,
+    help="Camera cards in the captured header (25 leaves too little room in the first block).",
+)
+@click.option("--repeat", type=int, default=3, show_default=True, help="Timed runs per path.")
+@click.option("--output", type=click.Path(dir_okay=False, path_type=Path), default=None, help="Write JSON report.")
+def fits_enrichment(frame_size: tuple[int, int], header_cards: int, repeat: int, output: Path | None) -> None:
+    """Bytes written per exposure: astropy update mode vs the header-only patch."""
+    width, height = frame_size
+    with tempfile.TemporaryDirectory(prefix="citrasense_bench_") as tmp:
+        results = bench_fits_enrichment(width, height, header_cards, repeat, Path(tmp))
+
+    click.echo(f"{'path':>28} {'file':>12} {'written':>12} {'time':>10}")
+    for r in results:
+        click.echo(
+            f"{r['path']:>28} {r['file_bytes']:>12} {r['bytes_written']:>12} {r['seconds']['median'] * 1000:>8.2f}ms"
+        )
+    if output is not None:
+        params = {"frame_size": [width, height], "header_cards": header_cards, "repeat": repeat}
+        write_report(bench_report("fits-enrichment", params, results), output)
+        click.echo(f"Report: {output}")
+
+
+@cli.command("moravian-readout")
+@click.option("--frame-size", type=(int, int), default=(9576, 6388), show_default=True, help="Frame width height.")
+@click.option("--exposure", type=float, default=1.0, show_default=True, help="Simulated exposure seconds.")
+@click.option("--readout", type=float, default=0.013, show_default=True, help="Simulated readout after exposure end.")
+@click.option("--repeat", type=int, default=5, show_default=True, help="Frames per path.")
+@click.option("--output", type=click.Path(dir_okay=False, path_type=Path), default=None, help="Write JSON report.")
+def moravian_readout(
+    frame_size: tuple[int, int], exposure: float, readout: float, repeat: int, output: Path | None
+) -> None:
+    """MoravianCamera frame readout: copies and polling before vs after, against a fake gxccd handle."""
+    width, height = frame_size
+    results = bench_moravian_readout(width, height, exposure, readout, repeat)
+
+    click.echo(f"{'path':>14} {'readout':>10} {'peak alloc':>14} {'detect lag':>11} {'polls':>6}")
+    for r in results:
+        click.echo(
+            f"{r['path']:>14} {r['readout_seconds']['median'] * 1000:>8.2f}ms {r['peak_alloc_bytes']:>14} "
+            f"{r['detect_lag_ms']:>9.2f}ms {r['polls']:>6}"
+        )
+    if output is not None:
+        params = {"frame_size": [width, height], "exposure": exposure, "readout": readout, "repeat": repeat}
+        write_report(bench_report("moravian-readout", params, results), output)
+        click.echo(f"Report: {output}")
+
+
+@cli.command("ximea-datacube")
+@click.option("--patterns", default="4,5", show_default=True, help="Comma-separated mosaic pattern sizes (N for NxN).")
+@click.option("--repeat", type=int, default=3, show_default=True, help="Timed saves per path.")
+@click.option("--output", type=click.Path(dir_okay=False, path_type=Path), default=None, help="Write JSON report.")
+def ximea_datacube(patterns: str, repeat: int, output: Path | None) -> None:
+    """Datacube FITS save for synthetic snapshot mosaics: materialized cube vs streamed bands."""
+    pattern_list = _parse_sizes(patterns)
+    with tempfile.TemporaryDirectory(prefix="citrasense_bench_") as tmp:
+        results = bench_ximea_datacube(pattern_list, repeat, Path(tmp))
+
+    click.echo(f"{'pattern':>8} {'path':>9} {'save':>10} {'fps':>7} {'peak alloc':>12}")
+    for r in results:
+        for name in ("legacy", "streamed"):
+            c = r[name]
+            click.echo(
+                f"{r['pattern']:>8} {name:>9} {c['seconds']['median'] * 1000:>8.1f}ms "
+                f"{r['frames_per_second'][name]:>7} {c['peak_alloc_bytes']:>12}"
+            )
+    if output is not None:
+        write_report(bench_report("ximea-datacube", {"patterns": pattern_list, "repeat": repeat}, results), output)
+        click.echo(f"Report: {output}")
+
+
+@cli.command("capture-tail")
+@click.option("--frames", type=int, default=3, show_default=True, help="Frames per simulated KStars task.")
+@click.option("--interval", type=float, default=0.7, show_default=True, help="Seconds between simulated frames.")
+@click.option("--frame-bytes", type=int, default=16 * 1024 * 1024, show_default=True, help="Bytes per frame file.")
+@click.option("--legacy-poll", type=float, default=5.0, show_default=True, help="Poll period of the old wait loop.")
+@click.option("--repeat", type=int, default=3, show_default=True, help="Simulated tasks per strategy.")
+@click.option("--output", type=click.Path(dir_okay=False, path_type=Path), default=None, help="Write JSON report.")
+def capture_tail(
+    frames: int, interval: float, frame_bytes: int, legacy_poll: float, repeat: int, output: Path | None
+) -> None:
+    """Dead time between the last KStars frame landing and the adapter noticing the task is complete."""
+    with tempfile.TemporaryDirectory(prefix="citrasense_bench_") as tmp:
+        results = bench_capture_tail(frames, interval, frame_bytes, legacy_poll, repeat, Path(tmp))
+
+    click.echo(f"{'strategy':>16} {'median tail':>12} {'max tail':>10}")
+    for r in results:
+        click.echo(
+            f"{r['strategy']:>16} {r['tail_seconds']['median'] * 1000:>10.1f}ms "
+            f"{r['tail_seconds']['max'] * 1000:>8.1f}ms"
+        )
+    if output is not None:
+        params = {
+            "frames": frames,
+            "interval": interval,
+            "frame_bytes": frame_bytes,
+            "legacy_poll": legacy_poll,
+            "repeat": repeat,
+        }
+        write_report(bench_report("capture-tail", params, results), output)
+        click.echo(f"Report: {output}")
+
+
+@cli.command("mount-cache")
+@click.option("--slew-seconds", type=float, default=1.0, show_default=True, help="Simulated slew duration.")
+@click.option("--repeat", type=int, default=5, show_default=True, help="Slews per wait strategy.")
+@click.option("--seconds", type=float, default=2.0, show_default=True, help="Wall time per traffic measurement.")
+@click.option("--time-scale", type=float, default=10.0, show_default=True, help="Poll-interval compression factor.")
+@click.option("--output", type=click.Path(dir_okay=False, path_type=Path), default=None, help="Write JSON report.")
+def mount_cache(slew_seconds: float, repeat: int, seconds: float, time_scale: float, output: Path | None) -> None:
+    """MountStateCache: slew-settle detection latency and serial commands per hour."""
+    results = bench_mount_cache(slew_seconds, repeat, seconds, time_scale)
+
+    click.echo(f"{'strategy':>22} {'median lag':>11} {'max lag':>9} {'cmds/s slewing':>15}")
+    for r in results["settle"]:
+        lag = r["detect_latency_seconds"]
+        click.echo(
+            f"{r['strategy']:>22} {lag['median'] * 1000:>9.1f}ms {lag['max'] * 1000:>7.1f}ms "
+            f"{r['commands_per_second_during_wait']:>15}"
+        )
+    click.echo(f"{'state':>10} {'fixed 2 Hz cmds/h':>18} {'adaptive cmds/h':>16}")
+    for r in results["traffic"]:
+        click.echo(f"{r['state']:>10} {r['fixed_2hz_commands_per_hour']:>18} {r['adaptive_commands_per_hour']:>16}")
+    if output is not None:
+        params = {"slew_seconds": slew_seconds, "repeat": repeat, "seconds": seconds, "time_scale": time_scale}
+        write_report(bench_report("mount-cache", params, results), output)
+        click.echo(f"Report: {output}")
+
+
+@cli.command("preview")
+@click.option("--frame-size", type=(int, int), default=(6248, 4176), show_default=True, help="Frame width height.")
+@click.option("--repeat", type=int, default=3, show_default=True, help="Timed runs per path.")
+@click.option("--output", type=click.Path(dir_okay=False, path_type=Path), default=None, help="Write JSON report.")
+def preview(frame_size: tuple[int, int], repeat: int, output: Path | None) -> None:
+    """Web preview encode time and bytes per message, JSON data URL vs binary pyramid."""
+    width, height = frame_size
+    results = bench_preview(width, height, repeat)
+
+    click.echo(f"{'path':>14} {'level':>6} {'encode':>10} {'bytes':>11}")
+    for r in results:
+        click.echo(f"{r['path']:>14} {r['level']:>6} {r['median'] * 1000:>8.1f}ms {r['bytes']:>11,}")
+    if output is not None:
+        params = {"width": width, "height": height, "repeat": repeat}
+        write_report(bench_report("preview", params, results), output)
+        click.echo(f"Report: {output}")
+
+
+@cli.command("allsky-capture")
+@click.option("--frame-size", type=(int, int), default=(1920, 1080), show_default=True, help="Frame width height.")
+@click.option("--repeat", type=int, default=5, show_default=True, help="Timed cycles per path.")
+@click.option("--output", type=click.Path(dir_okay=False, path_type=Path), default=None, help="Write JSON report.")
+def allsky_capture(frame_size: tuple[int, int], repeat: int, output: Path | None) -> None:
+    """Allsky capture-cycle CPU: data-URL round trip vs shared JPEG bytes."""
+    width, height = frame_size
+    with tempfile.TemporaryDirectory(prefix="citrasense_bench_") as tmp:
+        results = bench_allsky_capture(width, height, repeat, Path(tmp))
+
+    click.echo(f"{'path':>28} {'cpu median':>11}")
+    for r in results:
+        click.echo(f"{r['path']:>28} {r['cpu_seconds']['median'] * 1000:>9.1f}ms")
+    if output is not None:
+        params = {"width": width, "height": height, "repeat": repeat}
+        write_report(bench_report("allsky-capture", params, results), output)
+        click.echo(f"Report: {output}")
+
+
+@cli.command("allsky-archive")
+@click.option("--frames", type=int, default=3000, show_default=True, help="Frames stored (one night ≈ 1000-3000).")
+@click.option("--interval", type=float, default=30.0, show_default=True, help="Seconds between frames.")
+@click.option("--frame-bytes", type=int, default=4096, show_default=True, help="Payload bytes per frame.")
+@click.option("--repeat", type=int, default=5, show_default=True, help="Timed lookups per layout.")
+@click.option("--output", type=click.Path(dir_okay=False, path_type=Path), default=None, help="Write JSON report.")
+def allsky_archive(frames: int, interval: float, frame_bytes: int, repeat: int, output: Path | None) -> None:
+    """Allsky one-hour timelapse lookup: file-per-frame listing vs indexed archive."""
+    with tempfile.TemporaryDirectory(prefix="citrasense_bench_") as tmp:
+        results = bench_allsky_archive(frames, interval, frame_bytes, repeat, Path(tmp))
+
+    click.echo(f"{results['frames_in_window']} frames in the one-hour window out of {frames}")
+    click.echo(f"{'layout':>16} {'op':>10} {'median':>10}")
+    for r in results["results"]:
+        click.echo(f"{r['layout']:>16} {r['op']:>10} {r['median'] * 1000:>8.2f}ms")
+    if output is not None:
+        params = {"frames": frames, "interval": interval, "frame_bytes": frame_bytes, "repeat": repeat}
+        write_report(bench_report("allsky-archive", params, results), output)
+        click.echo(f"Report: {output}")
+
+
+@cli.command("web-log")
+@click.option("--lines-per-second", type=int, default=10000, show_default=True, help="Producer logging rate.")
+@click.option("--seconds", type=float, default=3.0, show_default=True, help="Logging duration per strategy.")
+@click.option("--clients", type=int, default=2, show_default=True, help="Simulated WebSocket clients.")
+@click.option("--output", type=click.Path(dir_okay=False, path_type=Path), default=None, help="Write JSON report.")
+def web_log(lines_per_second: int, seconds: float, clients: int, output: Path | None) -> None:
+    """Web event-loop latency while logging heavily: per-line coroutines vs batched stream."""
+    results = bench_web_log(lines_per_second, seconds, clients)
+
+    click.echo(f"{'strategy':>9} {'lines/s':>8} {'delivered':>10} {'messages':>9} {'lag p50':>9} {'p99':>9} {'max':>9}")
+    for r in results:
+        lag = r["loop_lag_ms"]
+        click.echo(
+            f"{r['strategy']:>9} {r['achieved_lines_per_second']:>8} {r['lines_delivered']:>10} "
+            f"{r['messages_sent']:>9} {lag['p50']:>7.2f}ms {lag['p99']:>7.2f}ms {lag['max']:>7.1f}ms"
+        )
+    if output is not None:
+        params = {"lines_per_second": lines_per_second, "seconds": seconds, "clients": clients}
+        write_report(bench_report("web-log", params, results), output)
+        click.echo(f"Report: {output}")
+
+
+@cli.command("bus")
+@click.option(
+    "--subscriptions", "subscriptions", default="10,100,1000", show_default=True, help="Comma-separated counts."
+)
+@click.option("--publishes", type=int, default=20000, show_default=True, help="Publishes per timing run.")
+@click.option("--repeat", type=int, default=3, show_default=True, help="Timing repetitions (median reported).")
+@click.option("--output", type=click.Path(dir_okay=False, path_type=Path), default=None, help="Write JSON report.")
+def bus(subscriptions: str, publishes: int, repeat: int, output: Path | None) -> None:
+    """Sensor bus publish rate: fnmatch scan vs compiled trie router."""
+    counts = _parse_sizes(subscriptions)
+    results = bench_bus(counts, publishes, repeat)
+
+    click.echo(f"{'subs':>6} {'strategy':>20} {'publishes/s':>12} {'deliveries':>11}")
+    for r in results:
+        click.echo(
+            f"{r['subscriptions']:>6} {r['strategy']:>20} {r['publishes_per_second']:>12} "
+            f"{r['deliveries_per_publish']:>11}"
+        )
+    if output is not None:
+        params = {"subscriptions": counts, "publishes": publishes, "repeat": repeat}
+        write_report(bench_report("bus", params, results), output)
+        click.echo(f"Report: {output}")
+
+
+@cli.command("radar-azel")
+@click.option("--detections", type=int, default=10000, show_default=True, help="Detections per engine run.")
+@click.option(
+    "--legacy-detections", type=int, default=300, show_default=True, help="Detections timed on the SkyCoord path."
+)
+@click.option("--span", "span_s", type=float, default=600.0, show_default=True, help="Seconds the detections span.")
+@click.option("--repeat", type=int, default=3, show_default=True, help="Timing repetitions (median reported).")
+@click.option("--output", type=click.Path(dir_okay=False, path_type=Path), default=None, help="Write JSON report.")
+def radar_azel(detections: int, legacy_detections: int, span_s: float, repeat: int, output: Path | None) -> None:
+    """Radar Alt/Az → ICRS throughput: per-detection SkyCoord vs cached batched engine."""
+    report = bench_radar_azel(detections, legacy_detections, span_s, repeat)
+
+    click.echo(f"{'path':>24} {'detections/s':>13} {'us/detection':>13}")
+    for r in report["results"]:
+        click.echo(f"{r['path']:>24} {r['detections_per_second']:>13} {r['us_per_detection']:>13.2f}")
+    click.echo(
+        f"max separation from astropy: {report['max_separation_arcsec']:.4f} arcsec "
+        f"(median {report['median_separation_arcsec']:.4f})"
+    )
+    if output is not None:
+        params = {
+            "detections": detections,
+            "legacy_detections": legacy_detections,
+            "span_s": span_s,
+            "repeat": repeat,
+        }
+        write_report(bench_report("radar-azel", params, report), output)
+        click.echo(f"Report: {output}")
+
+
+@cli.command("radar-filter")
+@click.option("--tasks", type=int, default=1000, show_default=True, help="Queued tasks in the dispatcher.")
+@click.option("--detections", type=int, default=5000, show_default=True, help="Detections filtered per run.")
+@click.option("--repeat", type=int, default=3, show_default=True, help="Timing repetitions (median reported).")
+@click.option("--output", type=click.Path(dir_okay=False, path_type=Path), default=None, help="Write JSON report.")
+def radar_filter(tasks: int, detections: int, repeat: int, output: Path | None) -> None:
+    """Radar tasked-satellite gate: dispatcher snapshot scan vs published satellite-ID set."""
+    results = bench_radar_filter(tasks, detections, repeat)
+
+    click.echo(f"{'lookup':>14} {'contended':>10} {'detections/s':>13} {'passed':>7}")
+    for r in results:
+        click.echo(f"{r['lookup']:>14} {r['contended']!s:>10} {r['detections_per_second']:>13} {r['passed']:>7}")
+    if output is not None:
+        params = {"tasks": tasks, "detections": detections, "repeat": repeat}
+        write_report(bench_report("radar-filter", params, results), output)
+        click.echo(f"Report: {output}")
+
+
+@cli.command("radar-history")
+@click.option("--detections", type=int, default=1_000_000, show_default=True, help="Detections retained.")
+@click.option("--repeat", type=int, default=5, show_default=True, help="Timing repetitions (median reported).")
+@click.option("--output", type=click.Path(dir_okay=False, path_type=Path), default=None, help="Write JSON report.")
+def radar_history(detections: int, repeat: int, output: Path | None) -> None:
+    """Radar detection history: retained memory and query latency, deque of dicts vs columnar ring buffer."""
+    results = bench_radar_history(detections, repeat)
+
+    click.echo(f"{'buffer':>15} {'query':>20} {'rows':>8} {'median ms':>10} {'retained MB':>12}")
+    for r in results:
+        click.echo(
+            f"{r['buffer']:>15} {r['query']:>20} {r['rows']:>8} {r['median'] * 1e3:>10.2f} {r['retained_mb']:>12}"
+        )
+    if output is not None:
+        params = {"detections": detections, "repeat": repeat}
+        write_report(bench_report("radar-history", params, results), output)
+        click.echo(f"Report: {output}")
+
+
+@cli.command("radar-artifacts")
+@click.option("--observations", type=int, default=20000, show_default=True, help="Artifacts written per layout.")
+@click.option("--rate-hz", type=float, default=10.0, show_default=True, help="Observation rate (sets timestamps).")
+@click.option("--night-hours", type=float, default=12.0, show_default=True, help="Night length for files-per-night.")
+@click.option("--output", type=click.Path(dir_okay=False, path_type=Path), default=None, help="Write JSON report.")
+def radar_artifacts(observations: int, rate_hz: float, night_hours: float, output: Path | None) -> None:
+    """Radar artifact persistence: one JSON file per observation vs the segmented, indexed log."""
+    results = bench_radar_artifacts(observations, rate_hz, night_hours)
+
+    click.echo(
+        f"{'layout':>21} {'obs/s':>8} {'caller us':>10} {'files':>7} {'MB':>7} {'files/night':>12}"
+        f" {'1-min read ms':>14}"
+    )
+    for r in results:
+        click.echo(
+            f"{r['layout']:>21} {r['observations_per_second']:>8} {r['caller_us_per_observation']:>10}"
+            f" {r['files']:>7} {r['bytes'] / 1e6:>7.1f} {r['files_per_night']:>12} {r['range_read_ms']:>14}"
+        )
+    if output is not None:
+        params = {"observations": observations, "rate_hz": rate_hz, "night_hours": night_hours}
+        write_report(bench_report("radar-artifacts", params, results), output)
+        click.echo(f"Report: {output}")
+
+
+@cli.command("image-upload")
+@click.option("--size-mb", type=float, default=64.0, show_default=True, help="Approximate FITS size.")
+@click.option("--uploads", type=int, default=4, show_default=True, help="Images uploaded per mode.")
+@click.option("--fail-at", type=float, default=0.95, show_default=True, help="Fraction sent when the link drops.")
+@click.option("--chunk-mb", type=float, default=8.0, show_default=True, help="Resumable chunk size.")
+@click.option("--output", type=click.Path(dir_okay=False, path_type=Path), default=None, help="Write JSON report.")
+def image_upload(size_mb: float, uploads: int, fail_at: float, chunk_mb: float, output: Path | None) -> None:
+    """Image upload after an injected link drop: bytes re-sent and connections opened per mode."""
+    results = bench_image_upload(size_mb, uploads, fail_at, chunk_mb)
+
+    click.echo(f"{'mode':>17} {'file MB':>8} {'received MB':>12} {'re-sent MB':>11} {'connections':>12} {'s':>7}")
+    for r in results:
+        click.echo(
+            f"{r['mode']:>17} {r['file_bytes'] / 1e6:>8.1f} {r['received_bytes'] / 1e6:>12.1f}"
+            f" {r['resent_bytes'] / 1e6:>11.1f} {r['connections']:>12} {r['seconds']:>7}"
+        )
+    if output is not None:
+        params = {"size_mb": size_mb, "uploads": uploads, "fail_at": fail_at, "chunk_mb": chunk_mb}
+        write_report(bench_report("image-upload", params, results), output)
+        click.echo(f"Report: {output}")
+
+
+@cli.command("upload-drain")
+@click.option("--uplinks", default="20,50,100", show_default=True, help="Comma-separated uplink speeds in Mbit/s.")
+@click.option("--images", type=int, default=4, show_default=True, help="FITS images in the backlog.")
+@click.option("--size-mb", type=float, default=8.0, show_default=True, help="Size of each image.")
+@click.option("--radar-hz", type=float, default=5.0, show_default=True, help="Radar batches submitted per second.")
+@click.option("--output", type=click.Path(dir_okay=False, path_type=Path), default=None, help="Write JSON report.")
+def upload_drain(uplinks: str, images: int, size_mb: float, radar_hz: float, output: Path | None) -> None:
+    """Upload backlog drain time and radar latency behind images at several uplink speeds."""
+    speeds = [float(v) for v in uplinks.split(",") if v.strip()]
+    results = bench_upload_drain(speeds, images, size_mb, radar_hz)
+
+    click.echo(f"{'Mbit/s':>7} {'mode':>24} {'drain s':>8} {'ideal s':>8} {'radar p50':>10} {'radar p95':>10}")
+    for r in results:
+        click.echo(
+            f"{r['uplink_mbps']:>7} {r['mode']:>24} {r['drain_seconds']:>8} {r['ideal_seconds']:>8}"
+            f" {r['radar_latency_p50_s']!s:>10} {r['radar_latency_p95_s']!s:>10}"
+        )
+    if output is not None:
+        params = {"uplinks_mbps": speeds, "images": images, "size_mb": size_mb, "radar_hz": radar_hz}
+        write_report(bench_report("upload-drain", params, results), output)
+        click.echo(f"Report: {output}")
+
+
+@cli.command("upload-spool")
+@click.option("--items", type=int, default=10000, show_default=True, help="Radar uploads submitted during the outage.")
+@click.option("--upload-ms", type=float, default=1.0, show_default=True, help="Time per upload once back online.")
+@click.option("--retry-delay", type=float, default=30.0, show_default=True, help="initial_retry_delay_seconds.")
+@click.option("--workers", type=int, default=3, show_default=True, help="Upload workers.")
+@click.option("--probe-interval", type=float, default=5.0, show_default=True, help="Offline probe interval (s).")
+@click.option("--output", type=click.Path(dir_okay=False, path_type=Path), default=None, help="Write JSON report.")
+def upload_spool(
+    items: int, upload_ms: float, retry_delay: float, workers: int, probe_interval: float, output: Path | None
+) -> None:
+    """Upload backlog through an outage: memory while offline and drain time after reconnect."""
+    results = bench_upload_spool(items, upload_ms, retry_delay, workers, probe_interval)
+
+    click.echo(
+        f"{'mode':>10} {'items':>7} {'submit s':>9} {'offline MB':>11} {'threads':>8} {'drain s':>8} {'spool MB':>9}"
+    )
+    for r in results:
+        click.echo(
+            f"{r['mode']:>10} {r['items']:>7} {r['submit_seconds']:>9} {r['offline_memory_bytes'] / 1e6:>11.1f}"
+            f" {r['offline_extra_threads']:>8} {r['drain_seconds']:>8} {r['spool_file_bytes'] / 1e6:>9.1f}"
+        )
+    if output is not None:
+        params = {
+            "items": items,
+            "upload_ms": upload_ms,
+            "retry_delay": retry_delay,
+            "workers": workers,
+            "probe_interval": probe_interval,
+        }
+        write_report(bench_report("upload-spool", params, results), output)
+        click.echo(f"Report: {output}")
+
+
+@cli.command("task-poll")
+@click.option("--tasks", type=int, default=5000, show_default=True, help="Pending tasks returned by each poll.")
+@click.option("--sensors", type=int, default=4, show_default=True, help="Telescope runtimes the tasks are spread over.")
+@click.option("--polls", type=int, default=20, show_default=True, help="Polls timed after the initial fill.")
+@click.option("--churn", type=float, default=0.01, show_default=True, help="Fraction of tasks changed per poll.")
+@click.option("--output", type=click.Path(dir_okay=False, path_type=Path), default=None, help="Write JSON report.")
+def task_poll(tasks: int, sensors: int, polls: int, churn: float, output: Path | None) -> None:
+    """Dispatcher task poll: full heap rebuild vs incremental sync (CPU per poll, heap-lock hold)."""
+    results = bench_task_poll(tasks, sensors, max(1, polls), churn)
+
+    click.echo(f"{'scenario':>8} {'mode':>13} {'pending':>8} {'cpu ms':>8} {'lock ms':>8} {'lock max':>9}")
+    for r in results:
+        click.echo(
+            f"{r['scenario']:>8} {r['mode']:>13} {r['pending']:>8} {r['poll_cpu_ms_median']:>8}"
+            f" {r['lock_hold_ms_median']:>8} {r['lock_hold_ms_max']:>9}"
+        )
+    if output is not None:
+        params = {"tasks": tasks, "sensors": sensors, "polls": polls, "churn": churn}
+        write_report(bench_report("task-poll", params, results), output)
+        click.echo(f"Report: {output}")
+
+
+if __name__ == "__main__":
+    cli()
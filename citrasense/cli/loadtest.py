@@ -0,0 +1,965 @@
+"""End-to-end load test for the acquisition → processing → upload pipeline.
+
+Drives the real :class:`~citrasense.tasks.task_dispatcher.TaskDispatcher`,
+:class:`~citrasense.sensors.sensor_runtime.SensorRuntime` and its queue trio
+against simulated hardware and a simulated Citra API, then writes a JSON
+report describing what the pipeline sustained.  No daemon, web server, or
+real hardware is started.
+
+What is simulated
+-----------------
+- **Tasks** — a :class:`DummyApiClient` subclass hands the dispatcher
+  synthetic ``Track`` tasks at a fixed arrival rate (``--task-rate`` per
+  hour).  The catalog is a single built-in GEO TLE, so no network access
+  is required.
+- **Frames** — :class:`DummyAdapter` renders real FITS star fields; the star
+  catalog is a seeded random scatter instead of APASS.  Exposures sleep for
+  ``--exposure`` seconds like a real camera would.
+- **Processing** — by default a lightweight SEP background + extraction
+  stage plus the real annotated-image render and HTML report
+  (``--pipeline frame-stats``).  ``--pipeline optical`` runs the full
+  optical chain (needs the external plate-solve / SExtractor binaries);
+  ``--pipeline none`` disables processing entirely.  ``--render inline``
+  builds the presentation artifacts before the upload instead of on the
+  deferred render lane — run both to compare upload latency.
+- **Radar** — a synthetic STREAMING sensor publishes detections on an
+  :class:`~citrasense.sensors.bus.InProcessBus` at ``--radar-rate`` Hz; they
+  go through the real radar filter → formatter → artifact writer chain.
+- **Uploads** — every upload sleeps ``--upload-latency`` seconds and fails
+  with probability ``--upload-failure-rate`` (exercising the queue retry
+  backoff).
+
+Slews, pointing convergence and target propagation are skipped: the
+synthetic observation task goes straight to exposure, so the numbers reflect
+the queue and pipeline machinery rather than the mount simulator.
+
+Report
+------
+The JSON report contains throughput (tasks/hour, radar detections/s),
+per-stage latency percentiles for the optical and radar paths, queue
+counters, and process RSS / open-file-descriptor samples taken every
+``--sample-interval`` seconds.
+
+Usage
+-----
+::
+
+    python -m citrasense.cli.loadtest --duration 600 --task-rate 720 --radar-rate 20 \\
+        --output loadtest.json
+
+    # Saturate uploads with a slow, flaky link:
+    python -m citrasense.cli.loadtest --upload-latency 2 --upload-failure-rate 0.1
+
+    # Upload latency with presentation rendering inline vs. deferred:
+    python -m citrasense.cli.loadtest --frame-size 6248 4176 --render inline --output inline.json
+    python -m citrasense.cli.loadtest --frame-size 6248 4176 --render deferred --output deferred.json
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import math
+import os
+import platform
+import random
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from collections.abc import Sequence
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any
+
+import click
+import numpy as np
+from dateutil import parser as dtparser
+
+from citrasense.api.dummy_api_client import DummyApiClient
+from citrasense.hardware.dummy_adapter import DummyAdapter
+from citrasense.pipelines.common.abstract_processor import AbstractImageProcessor
+from citrasense.pipelines.common.pipeline_registry import PipelineRegistry
+from citrasense.pipelines.common.processing_context import ProcessingContext
+from citrasense.pipelines.common.processor_result import ProcessorResult
+from citrasense.pipelines.optical.annotated_image_processor import AnnotatedImageProcessor
+from citrasense.sensors.abstract_sensor import (
+    AbstractSensor,
+    AcquisitionContext,
+    SensorAcquisitionMode,
+    SensorCapabilities,
+)
+from citrasense.sensors.bus import InProcessBus, SensorBus
+from citrasense.sensors.radar.events import RadarObservationEvent
+from citrasense.sensors.sensor_runtime import SensorRuntime
+from citrasense.sensors.telescope.tasks.base_telescope_task import AbstractBaseTelescopeTask
+from citrasense.sensors.telescope.telescope_sensor import TelescopeSensor
+from citrasense.settings.citrasense_settings import CitraSenseSettings, SensorConfig
+from citrasense.tasks.task import Task
+from citrasense.tasks.task_dispatcher import TASK_POLL_INTERVAL_SECONDS, TaskDispatcher
+from citrasense.version import get_version_info
+
+logger = logging.getLogger("citrasense.LoadTest")
+
+REPORT_SCHEMA_VERSION = 1
+
+_TELESCOPE_SENSOR_ID = "telescope-0"
+_TELESCOPE_CITRA_ID = "loadtest-telescope"
+_RADAR_SENSOR_ID = "radar-0"
+_RADAR_ANTENNA_ID = "loadtest-antenna"
+_SATELLITE_ID = "loadtest-sat-31862"
+
+# A GEO bird that never sets — keeps the synthetic task list independent of
+# the wall clock.  Same TLE as tests/unit/test_assets.
+_SATELLITE_TLE = (
+    "1 31862U 07032A   25316.09980537 -.00000107  00000-0  00000-0 0  9999",
+    "2 31862   0.0012 159.5685 0000202 351.6383 193.4457  1.00271504 43412",
+)
+
+# Tasks are generated this far ahead of "now" so the dispatcher (which only
+# polls every TASK_POLL_INTERVAL_SECONDS) always knows about a task before
+# it comes due.
+_TASK_LOOKAHEAD_SECONDS = 2 * TASK_POLL_INTERVAL_SECONDS
+
+# Optical path checkpoints, in pipeline order, and the spans reported
+# between them.  ``due`` is the task's ``taskStart``.
+OPTICAL_SPANS: tuple[tuple[str, str, str], ...] = (
+    ("dispatch_wait", "due", "released"),
+    ("imaging", "released", "imaged"),
+    ("processing", "imaged", "uploading"),
+    ("upload", "uploading", "done"),
+    ("end_to_end", "due", "done"),
+)
+
+RADAR_SPANS: tuple[tuple[str, str, str], ...] = (
+    ("processing", "published", "processed"),
+    ("upload", "processed", "uploaded"),
+    ("end_to_end", "published", "uploaded"),
+)
+
+
+@dataclass
+class LoadTestConfig:
+    """Knobs for a single load-test run."""
+
+    duration_seconds: float = 300.0
+    task_rate_per_hour: float = 360.0
+    task_window_seconds: float = 3600.0
+    exposure_seconds: float = 1.0
+    num_exposures: int = 1
+    frame_width: int = 1280
+    frame_height: int = 1024
+    stars_per_frame: int = 300
+    pipeline: str = "frame-stats"
+    render: str = "deferred"
+    radar_rate_hz: float = 10.0
+    radar_min_snr_db: float = 6.0
+    upload_latency_seconds: float = 0.5
+    radar_upload_latency_seconds: float = 0.02
+    upload_failure_rate: float = 0.0
+    retry_delay_seconds: int = 2
+    sample_interval_seconds: float = 1.0
+    drain_timeout_seconds: float = 120.0
+    seed: int = 0
+
+
+# ── Measurement helpers ────────────────────────────────────────────────
+
+
+class StageRecorder:
+    """Thread-safe per-item checkpoint timestamps.
+
+    Each item (task id, radar detection id) records the wall-clock time it
+    first reached each named checkpoint.  :meth:`durations` turns those into
+    per-span latency samples.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._marks: dict[str, dict[str, float]] = {}
+
+    def mark(self, key: str, checkpoint: str, at: float | None = None) -> None:
+        """Record *checkpoint* for *key*; only the first mark per checkpoint counts."""
+        with self._lock:
+            self._marks.setdefault(key, {}).setdefault(checkpoint, time.time() if at is None else at)
+
+    def count(self, checkpoint: str) -> int:
+        with self._lock:
+            return sum(1 for marks in self._marks.values() if checkpoint in marks)
+
+    def in_flight(self, start: str, end: str, terminal: Sequence[str] = ()) -> int:
+        """Items that reached *start* but neither *end* nor any *terminal* checkpoint."""
+        with self._lock:
+            return sum(
+                1
+                for marks in self._marks.values()
+                if start in marks and end not in marks and not any(t in marks for t in terminal)
+            )
+
+    def durations(self, spans: Sequence[tuple[str, str, str]]) -> dict[str, list[float]]:
+        """Return ``{span_name: [seconds, ...]}`` for items that reached both ends."""
+        with self._lock:
+            snapshot = [dict(m) for m in self._marks.values()]
+        out: dict[str, list[float]] = {name: [] for name, _start, _end in spans}
+        for marks in snapshot:
+            for name, start, end in spans:
+                if start in marks and end in marks:
+                    out[name].append(max(0.0, marks[end] - marks[start]))
+        return out
+
+
+def summarize_latencies(samples: Sequence[float]) -> dict[str, Any]:
+    """Reduce latency samples (seconds) to count / mean / p50 / p90 / p95 / p99 / max."""
+    if len(samples) == 0:
+        return {"count": 0, "mean": None, "p50": None, "p90": None, "p95": None, "p99": None, "max": None}
+    arr = np.asarray(samples, dtype=np.float64)
+    p50, p90, p95, p99 = np.percentile(arr, [50, 90, 95, 99])
+    return {
+        "count": int(arr.size),
+        "mean": round(float(arr.mean()), 6),
+        "p50": round(float(p50), 6),
+        "p90": round(float(p90), 6),
+        "p95": round(float(p95), 6),
+        "p99": round(float(p99), 6),
+        "max": round(float(arr.max()), 6),
+    }
+
+
+def current_rss_bytes() -> int | None:
+    """Resident set size of this process, or the peak RSS where /proc is unavailable."""
+    try:
+        with open("/proc/self/statm") as f:
+            pages = int(f.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError, AttributeError):
+        pass
+    try:
+        import resource
+
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return int(peak if sys.platform == "darwin" else peak * 1024)
+    except (ImportError, OSError):
+        return None
+
+
+def open_fd_count() -> int | None:
+    """Number of open file descriptors, or ``None`` when the platform can't tell us."""
+    for fd_dir in ("/proc/self/fd", "/dev/fd"):
+        try:
+            return len(os.listdir(fd_dir))
+        except OSError:
+            continue
+    return None
+
+
+class ResourceSampler:
+    """Background thread sampling RSS, open FDs and thread count at a fixed interval."""
+
+    def __init__(self, interval_seconds: float) -> None:
+        self.interval_seconds = max(0.05, interval_seconds)
+        self.samples: list[dict[str, Any]] = []
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._t0 = 0.0
+
+    def start(self) -> None:
+        self._t0 = time.monotonic()
+        self._sample()
+        self._thread = threading.Thread(target=self._run, name="LoadTestResourceSampler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+        self._sample()
+
+    def _run(self) -> None:
+        while not self._stop_event.wait(self.interval_seconds):
+            self._sample()
+
+    def _sample(self) -> None:
+        self.samples.append(
+            {
+                "t": round(time.monotonic() - self._t0, 3),
+                "rss_bytes": current_rss_bytes(),
+                "open_fds": open_fd_count(),
+                "threads": threading.active_count(),
+            }
+        )
+
+    def summary(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        for key in ("rss_bytes", "open_fds", "threads"):
+            values = [s[key] for s in self.samples if s[key] is not None]
+            if values:
+                out[key] = {"start": values[0], "peak": max(values), "end": values[-1]}
+            else:
+                out[key] = {"start": None, "peak": None, "end": None}
+        out["samples"] = self.samples
+        return out
+
+
+def host_info() -> dict[str, Any]:
+    """Interpreter / platform / CPU details stamped into every report."""
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+def write_report(report: dict[str, Any], path: Path) -> Path:
+    """Write *report* as pretty-printed JSON, creating parent directories."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(report, indent=2, default=str))
+    return path
+
+
+# ── Simulated API + hardware ───────────────────────────────────────────
+
+
+class LoadTestApiClient(DummyApiClient):
+    """:class:`DummyApiClient` with a fixed-rate task generator and tunable uploads.
+
+    Tasks are only generated with a ``taskStart`` inside the load window set
+    by :meth:`begin`, so the drain phase sees a finite backlog.
+    """
+
+    def __init__(self, config: LoadTestConfig, logger: logging.Logger | None = None):
+        self._config = config
+        self._rng = random.Random(config.seed)
+        self._next_task_at: float | None = None
+        self._generate_until = 0.0
+        self._counter_lock = threading.Lock()
+        self.tasks_generated = 0
+        self.upload_calls = 0
+        self.upload_failures = 0
+        self.bytes_uploaded = 0
+        self.radar_observations_uploaded = 0
+        super().__init__(logger=logger)
+
+    def _load_satellite_catalog(self) -> dict[str, dict[str, str]]:
+        return {
+            _SATELLITE_ID: {
+                "name": "LOADTEST GEO",
+                "tle_line1": _SATELLITE_TLE[0],
+                "tle_line2": _SATELLITE_TLE[1],
+            }
+        }
+
+    def begin(self, start_time: float, duration_seconds: float) -> None:
+        """Open the task-generation window ``[start_time, start_time + duration)``."""
+        with self._data_lock:
+            self._next_task_at = start_time + 1.0
+            self._generate_until = start_time + duration_seconds
+
+    def get_telescope_tasks(self, telescope_id, statuses=None, task_stop_after=None):
+        with self._data_lock:
+            telescope = self._ensure_telescope(telescope_id)
+            pool = [t for t in self._tasks[telescope_id] if t["status"] in ("Pending", "Scheduled")]
+            rate = self._config.task_rate_per_hour
+            if self._next_task_at is not None and rate > 0:
+                interval = 3600.0 / rate
+                horizon = min(time.time() + _TASK_LOOKAHEAD_SECONDS, self._generate_until)
+                while self._next_task_at < horizon:
+                    start = datetime.fromtimestamp(self._next_task_at, tz=timezone.utc)
+                    stop = start + timedelta(seconds=self._config.task_window_seconds)
+                    pool.append(self._make_task(_SATELLITE_ID, start, stop, telescope, self._ground_station))
+                    self.tasks_generated += 1
+                    self._next_task_at += interval
+            self._tasks[telescope_id] = pool
+            return list(pool)
+
+    def _random_filter_name(self, telescope: dict) -> str | None:
+        return None
+
+    def _simulate_upload(self, nbytes: int, latency: float) -> bool:
+        if latency > 0:
+            time.sleep(latency)
+        with self._counter_lock:
+            self.upload_calls += 1
+            if self._rng.random() < self._config.upload_failure_rate:
+                self.upload_failures += 1
+                return False
+            self.bytes_uploaded += nbytes
+        return True
+
+    def upload_image(self, task_id, telescope_id, filepath):
+        try:
+            nbytes = os.path.getsize(filepath)
+        except OSError:
+            nbytes = 0
+        if not self._simulate_upload(nbytes, self._config.upload_latency_seconds):
+            return None
+        return f"https://loadtest/results/{task_id}"
+
+    def upload_optical_observations(self, observations, telescope_record, sensor_location, task_id=None) -> bool:
+        return self._simulate_upload(len(json.dumps(observations, default=str)), self._config.upload_latency_seconds)
+
+    def upload_radar_observations(self, observations: list) -> bool:
+        ok = self._simulate_upload(
+            len(json.dumps(observations, default=str)), self._config.radar_upload_latency_seconds
+        )
+        if ok:
+            with self._counter_lock:
+                self.radar_observations_uploaded += len(observations)
+        return ok
+
+    def mark_task_complete(self, task_id):
+        with self._data_lock:
+            task = self._find_task_across_pools(task_id)
+            if task is not None:
+                task["status"] = "Succeeded"
+        return True
+
+
+class LoadTestAdapter(DummyAdapter):
+    """:class:`DummyAdapter` rendering a seeded random star field instead of APASS stars."""
+
+    def __init__(self, logger: logging.Logger, images_dir: Path, config: LoadTestConfig):
+        super().__init__(logger, images_dir, simulate_slow_operations=True, slow_delay_seconds=0.0)
+        self._star_rng = np.random.default_rng(config.seed)
+        self._stars_per_frame = config.stars_per_frame
+
+    def _fetch_catalog_stars(self, ra: float, dec: float, fov_deg: float):
+        n = self._stars_per_frame
+        r = fov_deg * np.sqrt(self._star_rng.uniform(0.0, 1.0, n))
+        theta = self._star_rng.uniform(0.0, 2 * math.pi, n)
+        decs = np.clip(dec + r * np.sin(theta), -89.9, 89.9)
+        ras = (ra + r * np.cos(theta) / max(math.cos(math.radians(dec)), 1e-3)) % 360.0
+        mags = self._star_rng.uniform(7.0, 13.5, n)
+        return ras, decs, mags
+
+
+class SyntheticObservationTask(AbstractBaseTelescopeTask):
+    """Exposure-only telescope task: no satellite lookup, no slew, no propagation.
+
+    Only runs under :class:`InstrumentedSensorRuntime`, which owns the recorder.
+    """
+
+    @property
+    def tracking_mode(self) -> str:
+        return "sidereal"
+
+    def execute(self):
+        sc = self.runtime.sensor_config
+        self.task.set_status_msg("Exposing...")
+        self.timing_info.stamp_now("imaging_started_at")
+        filepaths = [
+            self.hardware_adapter.take_image(self.task.id, sc.exposure_seconds) for _ in range(sc.num_exposures)
+        ]
+        self.timing_info.stamp_now("imaging_finished_at")
+        self.runtime.recorder.mark(self.task.id, "imaged")
+        return self.upload_image_and_mark_complete(filepaths)
+
+
+class FrameStatsProcessor(AbstractImageProcessor):
+    """Background estimate + source extraction with SEP — a cheap stand-in for the optical chain."""
+
+    name = "frame_stats"
+    friendly_name = "Frame Statistics"
+    description = "SEP background and source count (load-test stand-in for the optical pipeline)"
+
+    def process(self, context: ProcessingContext) -> ProcessorResult:
+        import sep
+
+        start = time.time()
+        data = np.ascontiguousarray(context.image_data, dtype=np.float32)
+        bkg = sep.Background(data)
+        sources = sep.extract(data - bkg, 5.0, err=bkg.globalrms, minarea=5)
+        return ProcessorResult(
+            should_upload=True,
+            extracted_data={"num_sources": len(sources), "background_rms": float(bkg.globalrms)},
+            confidence=1.0,
+            reason=f"{len(sources)} sources",
+            processing_time_seconds=time.time() - start,
+            processor_name=self.name,
+        )
+
+
+class FrameStatsRegistry(PipelineRegistry):
+    """Optical pipeline with the science stages swapped for :class:`FrameStatsProcessor`.
+
+    Keeps the optical hooks and the annotated-image stage, so presentation
+    rendering (inline or deferred) costs what it does in production.
+    """
+
+    def __init__(self, settings, logger):
+        super().__init__(settings, logger, modality="optical")
+        self.processors = [FrameStatsProcessor(), AnnotatedImageProcessor()]
+        self._processor_stats = {
+            p.name: {"runs": 0, "failures": 0, "last_failure_reason": None} for p in self.processors
+        }
+
+
+def synthetic_radar_payload(rng: random.Random, detection_id: str, now: datetime) -> dict[str, Any]:
+    """A ``pr_sensor`` observation for the load-test satellite with random geometry and SNR."""
+    return {
+        "timestamp": now.isoformat().replace("+00:00", "Z"),
+        "detection_id": detection_id,
+        "observation_id": detection_id,
+        "target": {"citra_uuid": _SATELLITE_ID},
+        "geometry": {
+            "az_deg": rng.uniform(0.0, 360.0),
+            "el_deg": rng.uniform(10.0, 85.0),
+            "receiver": {"lat_deg": 35.0, "lon_deg": -106.5, "alt_m": 1500.0},
+            "transmitter": {"lat_deg": 35.1, "lon_deg": -106.4, "freq_hz": 98e6},
+        },
+        "bistatic": {
+            "bistatic_range_km": rng.uniform(300.0, 2000.0),
+            "doppler_hz": rng.uniform(-500.0, 500.0),
+        },
+        "quality": {"snr_db": rng.uniform(3.0, 25.0)},
+    }
+
+
+class SyntheticRadarSensor(AbstractSensor):
+    """STREAMING sensor publishing synthetic ``pr_sensor`` observations at a fixed rate."""
+
+    sensor_type = "passive_radar"
+
+    def __init__(self, sensor_id: str, *, config: LoadTestConfig, recorder: StageRecorder) -> None:
+        super().__init__(sensor_id)
+        self.citra_antenna_id = _RADAR_ANTENNA_ID
+        self._detection_min_snr_db = config.radar_min_snr_db
+        self._forward_only_tasked = False
+        self._rate_hz = config.radar_rate_hz
+        self._recorder = recorder
+        self._rng = random.Random(config.seed + 1)
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+        self.published = 0
+
+    def connect(self, ctx: AcquisitionContext | None = None) -> bool:
+        return True
+
+    def disconnect(self) -> None:
+        self.stop_stream()
+
+    def is_connected(self) -> bool:
+        return True
+
+    def get_capabilities(self) -> SensorCapabilities:
+        return SensorCapabilities(acquisition_mode=SensorAcquisitionMode.STREAMING, modalities=("radar",))
+
+    def get_settings_schema(self) -> list[dict[str, Any]]:
+        return []
+
+    def start_stream(self, bus: SensorBus, ctx: AcquisitionContext) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, args=(bus,), name="LoadTestRadarStream", daemon=True)
+        self._thread.start()
+
+    def stop_stream(self) -> None:
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def _run(self, bus: SensorBus) -> None:
+        subject = f"sensors.{self.sensor_id}.events.acquisition"
+        interval = 1.0 / self._rate_hz
+        next_at = time.monotonic()
+        while not self._stop_event.is_set():
+            now = datetime.now(timezone.utc)
+            detection_id = f"det-{self.published:08d}"
+            event = RadarObservationEvent(
+                sensor_id=self.sensor_id,
+                timestamp=now,
+                payload=self._make_payload(detection_id, now),
+            )
+            self._recorder.mark(detection_id, "published")
+            bus.publish(subject, event)
+            self.published += 1
+            next_at += interval
+            delay = next_at - time.monotonic()
+            if delay > 0 and self._stop_event.wait(delay):
+                break
+
+    def _make_payload(self, detection_id: str, now: datetime) -> dict[str, Any]:
+        return synthetic_radar_payload(self._rng, detection_id, now)
+
+
+class InstrumentedSensorRuntime(SensorRuntime):
+    """:class:`SensorRuntime` that timestamps every stage transition into a :class:`StageRecorder`.
+
+    Telescope runtimes also swap the real slew-and-expose task for
+    :class:`SyntheticObservationTask`.
+    """
+
+    def __init__(self, sensor: AbstractSensor, *, recorder: StageRecorder, **kwargs: Any) -> None:
+        super().__init__(sensor, **kwargs)
+        self.recorder = recorder
+
+    def submit_task(self, task: Task, on_complete) -> None:
+        self.recorder.mark(task.id, "due", dtparser.isoparse(task.taskStart).timestamp())
+        self.recorder.mark(task.id, "released")
+        super().submit_task(task, on_complete)
+
+    def update_task_stage(self, task_id: str, stage: str) -> None:
+        self.recorder.mark(task_id, stage)
+        super().update_task_stage(task_id, stage)
+
+    def remove_task_from_all_stages(self, task_id: str) -> None:
+        self.recorder.mark(task_id, "done")
+        super().remove_task_from_all_stages(task_id)
+
+    def _create_telescope_task(self, task: Task) -> Any:
+        assert self.hardware_adapter is not None
+        return SyntheticObservationTask(
+            self.api_client,
+            self.hardware_adapter,
+            self.logger,
+            task,
+            settings=self.settings,
+            runtime=self,
+            location_service=self.location_service,
+            telescope_record=self.telescope_record,
+            ground_station=self.ground_station,
+            elset_cache=self.elset_cache,
+            processor_registry=self.processor_registry,
+        )
+
+    def _on_radar_processed(self, ctx, upload_ready: bool) -> None:
+        key = str(ctx.event.payload.get("detection_id"))
+        self.recorder.mark(key, "processed")
+        if not upload_ready or ctx.upload_payload is None:
+            self.recorder.mark(key, "dropped")
+            return
+
+        def _on_uploaded(ok: bool, _key: str = key) -> None:
+            self.recorder.mark(_key, "uploaded" if ok else "upload_failed")
+
+        self.upload_queue.submit_radar_observation(
+            sensor_id=ctx.sensor_id,
+            payload=ctx.upload_payload,
+            api_client=self.api_client,
+            settings=self.settings,
+            on_complete=_on_uploaded,
+        )
+
+
+# ── Harness ────────────────────────────────────────────────────────────
+
+
+def _build_settings(work_dir: Path, config: LoadTestConfig) -> CitraSenseSettings:
+    settings = CitraSenseSettings.load(base_dir=work_dir)
+    settings.sensors = [
+        SensorConfig(
+            id=_TELESCOPE_SENSOR_ID,
+            type="telescope",
+            adapter="dummy",
+            citra_sensor_id=_TELESCOPE_CITRA_ID,
+            observation_mode="sidereal",
+            exposure_seconds=config.exposure_seconds,
+            num_exposures=config.num_exposures,
+            processors_enabled=config.pipeline != "none",
+        ),
+        SensorConfig(id=_RADAR_SENSOR_ID, type="passive_radar", citra_sensor_id=_RADAR_ANTENNA_ID),
+    ]
+    settings.initial_retry_delay_seconds = config.retry_delay_seconds
+    settings.max_retry_delay_seconds = max(config.retry_delay_seconds, 4 * config.retry_delay_seconds)
+    settings.keep_images = False
+    settings.defer_presentation_rendering = config.render == "deferred"
+    for d in (settings.directories.images_dir, settings.directories.processing_dir):
+        d.mkdir(parents=True, exist_ok=True)
+    return settings
+
+
+def queue_stats(rt: SensorRuntime) -> dict[str, Any]:
+    """``get_stats()`` of each of *rt*'s queues, keyed by stage."""
+    return {
+        "acquisition": rt.acquisition_queue.get_stats(),
+        "processing": rt.processing_queue.get_stats(),
+        "upload": rt.upload_queue.get_stats(),
+        "render": rt.render_queue.get_stats(),
+    }
+
+
+def run_load_test(config: LoadTestConfig, work_dir: Path, log: logging.Logger | None = None) -> dict[str, Any]:
+    """Run one load test rooted at *work_dir* and return the report dict.
+
+    The run has two phases: a **load** phase of ``duration_seconds`` during
+    which tasks come due and radar detections stream in, followed by a
+    **drain** phase (bounded by ``drain_timeout_seconds``) that waits for
+    everything already accepted to finish uploading.  Throughput is computed
+    over both phases so a pipeline that merely queues work is not flattered.
+    """
+    log = log or logger
+    settings = _build_settings(work_dir, config)
+    api = LoadTestApiClient(config, logger=log)
+    dispatcher = TaskDispatcher(api, log, settings)
+    bus = InProcessBus()
+    optical = StageRecorder()
+    radar = StageRecorder()
+
+    adapter = LoadTestAdapter(log, settings.directories.images_dir, config)
+    telescope_record = api.get_telescope(_TELESCOPE_CITRA_ID)
+    telescope_record["horizontalPixelCount"] = config.frame_width
+    telescope_record["verticalPixelCount"] = config.frame_height
+    adapter.telescope_record = telescope_record
+    adapter.connect()
+    telescope = TelescopeSensor(_TELESCOPE_SENSOR_ID, adapter, adapter_key="dummy")
+    telescope.citra_record = telescope_record
+
+    registry: PipelineRegistry | None = None
+    if config.pipeline == "frame-stats":
+        registry = FrameStatsRegistry(settings, log)
+    runtimes: list[SensorRuntime] = [
+        InstrumentedSensorRuntime(
+            telescope,
+            recorder=optical,
+            logger=log,
+            settings=settings,
+            api_client=api,
+            hardware_adapter=adapter,
+            processor_registry=registry,
+            telescope_record=telescope_record,
+            ground_station=api.get_ground_station(telescope_record["groundStationId"]),
+        )
+    ]
+    radar_sensor: SyntheticRadarSensor | None = None
+    if config.radar_rate_hz > 0:
+        radar_sensor = SyntheticRadarSensor(_RADAR_SENSOR_ID, config=config, recorder=radar)
+        runtimes.append(
+            InstrumentedSensorRuntime(
+                radar_sensor, recorder=radar, logger=log, settings=settings, api_client=api, sensor_bus=bus
+            )
+        )
+    for rt in runtimes:
+        dispatcher.register_runtime(rt)
+
+    sampler = ResourceSampler(config.sample_interval_seconds)
+    sampler.start()
+    started_at = datetime.now(timezone.utc)
+    t0 = time.time()
+    api.begin(t0, config.duration_seconds)
+    for rt in runtimes:
+        rt.mark_connected()
+    dispatcher.start()
+
+    try:
+        time.sleep(config.duration_seconds)
+        if radar_sensor is not None:
+            radar_sensor.stop_stream()
+        load_end = time.time()
+
+        drained = False
+        deadline = load_end + config.drain_timeout_seconds
+        while time.time() < deadline:
+            if _is_drained(dispatcher, api, radar_sensor, radar):
+                drained = True
+                break
+            time.sleep(0.2)
+        end = time.time()
+    finally:
+        dispatcher.stop()
+        adapter.disconnect()
+        sampler.stop()
+
+    elapsed = end - t0
+    task_stats = dispatcher.get_task_stats()
+    radar_published = radar_sensor.published if radar_sensor else 0
+    radar_uploaded = radar.count("uploaded")
+    return {
+        "schema_version": REPORT_SCHEMA_VERSION,
+        "tool": "citrasense.cli.loadtest",
+        "version": get_version_info(),
+        "started_at": started_at.isoformat(),
+        "host": host_info(),
+        "config": asdict(config),
+        "timing": {
+            "load_seconds": round(load_end - t0, 3),
+            "drain_seconds": round(end - load_end, 3),
+            "elapsed_seconds": round(elapsed, 3),
+            "drained": drained,
+        },
+        "throughput": {
+            "tasks_generated": api.tasks_generated,
+            "tasks_started": task_stats["started"],
+            "tasks_succeeded": task_stats["succeeded"],
+            "tasks_failed": task_stats["failed"],
+            "tasks_pending_at_end": dispatcher.pending_task_count,
+            "tasks_per_hour": round(task_stats["succeeded"] * 3600.0 / elapsed, 2) if elapsed > 0 else 0.0,
+            "upload_calls": api.upload_calls,
+            "upload_failures": api.upload_failures,
+            "bytes_uploaded": api.bytes_uploaded,
+            "radar_published": radar_published,
+            "radar_dropped": radar.count("dropped"),
+            "radar_uploaded": radar_uploaded,
+            "radar_upload_failed": radar.count("upload_failed"),
+            "radar_published_per_second": round(radar_published / (load_end - t0), 2) if load_end > t0 else 0.0,
+            "radar_uploaded_per_second": round(radar_uploaded / elapsed, 2) if elapsed > 0 else 0.0,
+        },
+        "latency_seconds": {
+            "optical": {name: summarize_latencies(v) for name, v in optical.durations(OPTICAL_SPANS).items()},
+            "radar": {name: summarize_latencies(v) for name, v in radar.durations(RADAR_SPANS).items()},
+        },
+        "queues": {rt.sensor_id: queue_stats(rt) for rt in runtimes},
+        "resources": sampler.summary(),
+    }
+
+
+def _is_drained(
+    dispatcher: TaskDispatcher,
+    api: LoadTestApiClient,
+    radar_sensor: SyntheticRadarSensor | None,
+    radar: StageRecorder,
+) -> bool:
+    """True once every generated task and published detection has reached a terminal state."""
+    stats = dispatcher.get_task_stats()
+    if dispatcher.pending_task_count or dispatcher.current_task_ids:
+        return False
+    if any(dispatcher.get_tasks_by_stage().values()):
+        return False
+    # Tasks generated in the final poll window may not have reached the heap yet.
+    if stats["succeeded"] + stats["failed"] < api.tasks_generated:
+        return False
+    if radar_sensor is not None:
+        settled = radar.count("dropped") + radar.count("uploaded") + radar.count("upload_failed")
+        if settled < radar_sensor.published:
+            return False
+    # Deferred renders don't hold up scheduling, but let them finish so the report covers them.
+    if not all(rt.render_queue.is_idle() for rt in dispatcher.iter_runtimes()):
+        return False
+    return dispatcher.are_queues_idle()
+
+
+def setup_logging(verbose: bool) -> logging.Logger:
+    """Send citrasense logs to stderr — warnings only unless *verbose*."""
+    root = logging.getLogger("citrasense")
+    root.setLevel(logging.INFO if verbose else logging.WARNING)
+    if not any(isinstance(h, logging.StreamHandler) for h in root.handlers):
+        handler = logging.StreamHandler(sys.stderr)
+        handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)-8s %(name)s — %(message)s"))
+        root.addHandler(handler)
+    return logger
+
+
+def _fmt_ms(value: float | None) -> str:
+    return "-" if value is None else f"{value * 1000:.1f}"
+
+
+@click.command()
+@click.option("--duration", type=float, default=300.0, show_default=True, help="Load phase length in seconds.")
+@click.option("--task-rate", type=float, default=360.0, show_default=True, help="Telescope tasks per hour.")
+@click.option("--exposure", type=float, default=1.0, show_default=True, help="Exposure length in seconds.")
+@click.option("--num-exposures", type=int, default=1, show_default=True, help="Frames per task.")
+@click.option("--frame-size", type=(int, int), default=(1280, 1024), show_default=True, help="Frame WIDTH HEIGHT.")
+@click.option("--stars", type=int, default=300, show_default=True, help="Synthetic stars rendered per frame.")
+@click.option(
+    "--pipeline",
+    type=click.Choice(["frame-stats", "optical", "none"]),
+    default="frame-stats",
+    show_default=True,
+    help="Processing stage to run on each frame.",
+)
+@click.option(
+    "--render",
+    type=click.Choice(["deferred", "inline"]),
+    default="deferred",
+    show_default=True,
+    help="Build annotated image / HTML report on the render lane or before upload.",
+)
+@click.option("--radar-rate", type=float, default=10.0, show_default=True, help="Radar detections per second.")
+@click.option("--upload-latency", type=float, default=0.5, show_default=True, help="Seconds per image upload.")
+@click.option("--upload-failure-rate", type=float, default=0.0, show_default=True, help="Fraction of failed uploads.")
+@click.option("--sample-interval", type=float, default=1.0, show_default=True, help="Resource sampling period (s).")
+@click.option("--drain-timeout", type=float, default=120.0, show_default=True, help="Max seconds to wait for drain.")
+@click.option("--seed", type=int, default=0, show_default=True, help="RNG seed for stars, radar and failures.")
+@click.option(
+    "--output",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=None,
+    help="Report path.  Default: loadtest_<timestamp>.json in the current directory.",
+)
+@click.option(
+    "--work-dir",
+    type=click.Path(file_okay=False, path_type=Path),
+    default=None,
+    help="Root for config, images and processing output.  Default: a temporary directory removed afterwards.",
+)
+@click.option("--verbose", is_flag=True, help="Show INFO-level pipeline logs.")
+def cli(
+    duration: float,
+    task_rate: float,
+    exposure: float,
+    num_exposures: int,
+    frame_size: tuple[int, int],
+    stars: int,
+    pipeline: str,
+    render: str,
+    radar_rate: float,
+    upload_latency: float,
+    upload_failure_rate: float,
+    sample_interval: float,
+    drain_timeout: float,
+    seed: int,
+    output: Path | None,
+    work_dir: Path | None,
+    verbose: bool,
+) -> None:
+    """Run the acquisition → processing → upload pipeline under synthetic load."""
+    log = setup_logging(verbose)
+    config = LoadTestConfig(
+        duration_seconds=duration,
+        task_rate_per_hour=task_rate,
+        exposure_seconds=exposure,
+        num_exposures=num_exposures,
+        frame_width=frame_size[0],
+        frame_height=frame_size[1],
+        stars_per_frame=stars,
+        pipeline=pipeline,
+        render=render,
+        radar_rate_hz=radar_rate,
+        upload_latency_seconds=upload_latency,
+        upload_failure_rate=upload_failure_rate,
+        sample_interval_seconds=sample_interval,
+        drain_timeout_seconds=drain_timeout,
+        seed=seed,
+    )
+    if output is None:
+        output = Path(f"loadtest_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
+
+    cleanup = work_dir is None
+    root = work_dir or Path(tempfile.mkdtemp(prefix="citrasense_loadtest_"))
+    click.echo(f"Work directory: {root}")
+    click.echo(f"Running load test for {duration:.0f}s (+ drain)...")
+    try:
+        report = run_load_test(config, root, log)
+    finally:
+        if cleanup:
+            shutil.rmtree(root, ignore_errors=True)
+    write_report(report, output)
+
+    tp = report["throughput"]
+    click.echo()
+    click.echo("=" * 60)
+    click.echo("LOAD TEST SUMMARY")
+    click.echo("=" * 60)
+    click.echo(
+        f"  Tasks        : {tp['tasks_succeeded']} ok / {tp['tasks_failed']} failed / {tp['tasks_generated']} due"
+    )
+    click.echo(f"  Tasks/hour   : {tp['tasks_per_hour']}")
+    click.echo(f"  Radar        : {tp['radar_uploaded']} uploaded / {tp['radar_published']} published")
+    click.echo(f"  Drained      : {report['timing']['drained']} ({report['timing']['drain_seconds']}s)")
+    for modality, spans in report["latency_seconds"].items():
+        for name, s in spans.items():
+            click.echo(
+                f"  {modality:>7} {name:<14} p50 {_fmt_ms(s['p50']):>9} ms  "
+                f"p95 {_fmt_ms(s['p95']):>9} ms  p99 {_fmt_ms(s['p99']):>9} ms  n={s['count']}"
+            )
+    rss = report["resources"]["rss_bytes"]
+    if rss["peak"] is not None:
+        click.echo(f"  Peak RSS     : {rss['peak'] / 1e6:.1f} MB")
+    click.echo(f"  Report       : {output}")
+    click.echo()
+
+
+if __name__ == "__main__":
+    cli()
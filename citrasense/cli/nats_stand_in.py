@@ -0,0 +1,333 @@
+"""In-process NATS-compatible broker for replay and load tests.
+
+Speaks enough of the NATS client protocol (``INFO`` / ``CONNECT`` /
+``PING`` / ``PONG`` / ``SUB`` / ``UNSUB`` / ``PUB`` / ``HPUB`` →
+``MSG`` / ``HMSG``) for ``nats-py`` to connect, subscribe with ``*`` and
+``>`` wildcards or queue groups, publish, and do request-reply against
+other clients.  A request nobody answers gets the server's 503
+"no responders" status, so ``NatsClient.request`` fails fast instead of
+timing out.
+
+It is a single asyncio loop on a daemon thread: no clustering, auth,
+TLS, JetStream or slow-consumer eviction.  Outbound bytes a client has
+not read yet stay in that connection's transport buffer and are reported
+by :meth:`LocalNatsBroker.stats` as ``pending_bytes`` — the broker-side
+backlog when a subscriber can't keep up.
+
+Used by :mod:`citrasense.cli.radar_replay` so the real
+:class:`~citrasense.sensors.radar.nats_detection_source.NatsDetectionSource`
+can be driven without a ``nats-server`` binary.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import json
+import logging
+import threading
+from dataclasses import dataclass
+from typing import Any
+
+_NO_RESPONDERS_HEADER = b"NATS/1.0 503\r\n\r\n"
+_MAX_PAYLOAD = 8 * 1024 * 1024
+
+
+@dataclass(eq=False)
+class _Sub:
+    conn: _Connection
+    sid: str
+    tokens: list[str]
+    queue: str | None
+    max_msgs: int | None = None
+    delivered: int = 0
+
+
+class _Connection:
+    """Per-client protocol state; only touched on the broker loop."""
+
+    def __init__(self, cid: int, writer: asyncio.StreamWriter) -> None:
+        self.cid = cid
+        self.writer = writer
+        self.headers = False
+        self.no_responders = False
+        self.verbose = False
+        self.subs: dict[str, _Sub] = {}
+
+    def send(self, data: bytes) -> None:
+        if not self.writer.is_closing():
+            self.writer.write(data)
+
+    def pending_bytes(self) -> int:
+        transport = self.writer.transport
+        return 0 if transport.is_closing() else transport.get_write_buffer_size()
+
+
+class LocalNatsBroker:
+    """Minimal NATS server on ``127.0.0.1`` running in a background thread.
+
+    Usable as a context manager::
+
+        with LocalNatsBroker() as broker:
+            source = NatsDetectionSource(nats_url=broker.url, ...)
+            broker.publish("radar.sensor.radar-0.status", b"{}")
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, logger: logging.Logger | None = None) -> None:
+        """
+        Args:
+            host: Interface to listen on
+            port: TCP port; 0 picks a free one (see :attr:`url`)
+            logger: Logger for protocol errors
+        """
+        self._host = host
+        self._port = port
+        self._logger = logger or logging.getLogger("citrasense.NatsStandIn")
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._server: asyncio.AbstractServer | None = None
+        self._thread: threading.Thread | None = None
+        self._ready = threading.Event()
+        self._start_error: BaseException | None = None
+        self._connections: dict[int, _Connection] = {}
+        self._subs: list[_Sub] = []
+        self._cids = itertools.count(1)
+        self._queue_turn = itertools.count()
+        self.messages_in = 0
+        self.messages_out = 0
+        self.bytes_out = 0
+        self.no_responders_sent = 0
+
+    # ── Lifecycle ──────────────────────────────────────────────────────
+
+    @property
+    def url(self) -> str:
+        return f"nats://{self._host}:{self._port}"
+
+    def start(self) -> LocalNatsBroker:
+        if self._thread is not None:
+            return self
+        self._thread = threading.Thread(target=self._run, name="nats-stand-in", daemon=True)
+        self._thread.start()
+        if not self._ready.wait(timeout=10.0):
+            raise RuntimeError("NATS stand-in did not start within 10s")
+        if self._start_error is not None:
+            raise self._start_error
+        return self
+
+    def stop(self) -> None:
+        loop, thread = self._loop, self._thread
+        if loop is None or thread is None:
+            return
+        asyncio.run_coroutine_threadsafe(self._close(), loop).result(timeout=5.0)
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(timeout=5.0)
+        self._thread = None
+        self._loop = None
+
+    def __enter__(self) -> LocalNatsBroker:
+        return self.start()
+
+    def __exit__(self, *exc: object) -> None:
+        self.stop()
+
+    # ── Injection / introspection ──────────────────────────────────────
+
+    def publish(self, subject: str, data: bytes, reply: str | None = None) -> None:
+        """Publish *data* on *subject* as if a client had sent ``PUB``; callable from any thread."""
+        loop = self._loop
+        if loop is None:
+            raise RuntimeError("NATS stand-in is not running")
+        loop.call_soon_threadsafe(self._ingest, subject, reply, None, data, None)
+
+    def stats(self) -> dict[str, Any]:
+        """Counters plus the bytes queued towards clients that haven't read them yet."""
+        loop = self._loop
+        if loop is None:
+            return self._stats()
+        return asyncio.run_coroutine_threadsafe(self._async_stats(), loop).result(timeout=5.0)
+
+    async def _async_stats(self) -> dict[str, Any]:
+        return self._stats()
+
+    def _stats(self) -> dict[str, Any]:
+        return {
+            "connections": len(self._connections),
+            "subscriptions": len(self._subs),
+            "messages_in": self.messages_in,
+            "messages_out": self.messages_out,
+            "bytes_out": self.bytes_out,
+            "no_responders": self.no_responders_sent,
+            "pending_bytes": sum(c.pending_bytes() for c in self._connections.values()),
+        }
+
+    # ── Event loop ─────────────────────────────────────────────────────
+
+    def _run(self) -> None:
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        try:
+            self._server = loop.run_until_complete(asyncio.start_server(self._serve, self._host, self._port))
+            self._port = self._server.sockets[0].getsockname()[1]
+            self._loop = loop
+        except BaseException as exc:
+            self._start_error = exc
+            self._ready.set()
+            loop.close()
+            return
+        self._ready.set()
+        try:
+            loop.run_forever()
+        finally:
+            loop.close()
+
+    async def _close(self) -> None:
+        if self._server is not None:
+            self._server.close()
+        for conn in list(self._connections.values()):
+            conn.writer.close()
+        self._connections.clear()
+        self._subs.clear()
+
+    async def _serve(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        conn = _Connection(next(self._cids), writer)
+        self._connections[conn.cid] = conn
+        info = {
+            "server_id": f"citrasense-stand-in-{id(self):x}",
+            "server_name": "citrasense-stand-in",
+            "version": "2.10.0",
+            "proto": 1,
+            "headers": True,
+            "max_payload": _MAX_PAYLOAD,
+            "host": self._host,
+            "port": self._port,
+            "client_id": conn.cid,
+        }
+        conn.send(b"INFO " + json.dumps(info).encode() + b"\r\n")
+        try:
+            while await self._handle_line(conn, reader):
+                pass
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        except Exception as exc:
+            self._logger.warning("NATS stand-in dropped client %d: %s", conn.cid, exc)
+        finally:
+            self._connections.pop(conn.cid, None)
+            self._subs = [s for s in self._subs if s.conn is not conn]
+            writer.close()
+
+    async def _handle_line(self, conn: _Connection, reader: asyncio.StreamReader) -> bool:
+        line = await reader.readline()
+        if not line:
+            return False
+        op, _, rest = line.rstrip(b"\r\n").partition(b" ")
+        op = op.upper()
+        args = rest.decode().split()
+        if op == b"PUB":
+            subject, reply, size = args[0], (args[1] if len(args) == 3 else None), int(args[-1])
+            data = (await reader.readexactly(size + 2))[:-2]
+            self._ingest(subject, reply, None, data, conn)
+        elif op == b"HPUB":
+            subject, reply = args[0], (args[1] if len(args) == 4 else None)
+            header_size, total = int(args[-2]), int(args[-1])
+            body = (await reader.readexactly(total + 2))[:-2]
+            self._ingest(subject, reply, body[:header_size], body[header_size:], conn)
+        elif op == b"PING":
+            conn.send(b"PONG\r\n")
+        elif op == b"PONG":
+            pass
+        elif op == b"SUB":
+            sid = args[-1]
+            queue = args[1] if len(args) == 3 else None
+            sub = _Sub(conn, sid, args[0].split("."), queue)
+            conn.subs[sid] = sub
+            self._subs.append(sub)
+        elif op == b"UNSUB":
+            sub = conn.subs.get(args[0])
+            if sub is not None:
+                if len(args) > 1 and int(args[1]) > sub.delivered:
+                    sub.max_msgs = int(args[1])
+                else:
+                    self._remove(sub)
+        elif op == b"CONNECT":
+            options = json.loads(rest or b"{}")
+            conn.headers = bool(options.get("headers"))
+            conn.no_responders = bool(options.get("no_responders"))
+            conn.verbose = bool(options.get("verbose"))
+        else:
+            conn.send(b"-ERR 'Unknown Protocol Operation'\r\n")
+            return False
+        if conn.verbose and op not in (b"PING", b"PONG"):
+            conn.send(b"+OK\r\n")
+        return True
+
+    # ── Routing ────────────────────────────────────────────────────────
+
+    def _ingest(
+        self,
+        subject: str,
+        reply: str | None,
+        headers: bytes | None,
+        data: bytes,
+        origin: _Connection | None,
+    ) -> None:
+        self.messages_in += 1
+        self._route(subject, reply, headers, data, origin)
+
+    def _route(
+        self,
+        subject: str,
+        reply: str | None,
+        headers: bytes | None,
+        data: bytes,
+        origin: _Connection | None,
+    ) -> None:
+        tokens = subject.split(".")
+        targets: list[_Sub] = []
+        groups: dict[str, list[_Sub]] = {}
+        for sub in self._subs:
+            if not _matches(sub.tokens, tokens) or (headers is not None and not sub.conn.headers):
+                continue
+            if sub.queue is None:
+                targets.append(sub)
+            else:
+                groups.setdefault(sub.queue, []).append(sub)
+        turn = next(self._queue_turn)
+        targets.extend(members[turn % len(members)] for members in groups.values())
+
+        if not targets:
+            if reply and origin is not None and origin.headers and origin.no_responders:
+                self.no_responders_sent += 1
+                self._route(reply, None, _NO_RESPONDERS_HEADER, b"", None)
+            return
+        for sub in targets:
+            self._deliver(sub, subject, reply, headers, data)
+
+    def _deliver(self, sub: _Sub, subject: str, reply: str | None, headers: bytes | None, data: bytes) -> None:
+        reply_part = f" {reply}" if reply else ""
+        if headers is None:
+            frame = f"MSG {subject} {sub.sid}{reply_part} {len(data)}\r\n".encode() + data + b"\r\n"
+        else:
+            total = len(headers) + len(data)
+            head = f"HMSG {subject} {sub.sid}{reply_part} {len(headers)} {total}\r\n".encode()
+            frame = head + headers + data + b"\r\n"
+        sub.conn.send(frame)
+        self.messages_out += 1
+        self.bytes_out += len(frame)
+        sub.delivered += 1
+        if sub.max_msgs is not None and sub.delivered >= sub.max_msgs:
+            self._remove(sub)
+
+    def _remove(self, sub: _Sub) -> None:
+        sub.conn.subs.pop(sub.sid, None)
+        if sub in self._subs:
+            self._subs.remove(sub)
+
+
+def _matches(pattern: list[str], subject: list[str]) -> bool:
+    """NATS subject match: ``*`` is one token, a trailing ``>`` is one or more."""
+    for i, token in enumerate(pattern):
+        if token == ">":
+            return len(subject) > i
+        if i >= len(subject) or (token != "*" and token != subject[i]):
+            return False
+    return len(pattern) == len(subject)
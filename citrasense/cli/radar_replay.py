@@ -0,0 +1,631 @@
+"""Radar detection replay and load generator.
+
+Feeds ``pr_sensor``-shaped observations through the real radar ingest path
+at a ladder of controlled rates and reports the highest rate it sustains::
+
+    replayer → LocalNatsBroker → NatsDetectionSource (decode)
+             → PassiveRadarSensor (slim projection + bus publish)
+             → InProcessBus (queued delivery) → SensorRuntime
+             → processing queue → RadarPipeline (filter → formatter → artifact log)
+             → upload queue → simulated Citra API
+
+The broker is :class:`~citrasense.cli.nats_stand_in.LocalNatsBroker`, so no
+``nats-server`` is needed.  Detections are synthetic (the load-test payload)
+or replayed from a JSONL recording — either raw observations, one per line,
+or radar artifact-log records, whose ``observation`` field is used.  Each
+replayed message gets a fresh ``detection_id`` and a current ``timestamp``.
+
+What is measured
+----------------
+Every detection is stamped at each checkpoint and reported as spans:
+
+- ``transport`` — broker publish → NATS callback
+- ``decode`` — JSON decode in :class:`NatsDetectionSource`
+- ``bus_publish`` — sensor handler: slim projection, ring buffer, bus publish
+- ``bus_delivery`` — wait on the bus's queued subscription
+- ``processing_wait`` — wait on the processing queue
+- ``pipeline`` — filter + formatter
+- ``artifact_write`` — artifact-log append
+- ``upload_enqueue`` — hand-off to the upload queue
+- ``upload`` — upload queue wait + simulated upload
+- ``end_to_end`` — broker publish → uploaded
+
+Saturation
+----------
+Each rate step runs for ``--step-seconds``.  A step is *saturated* when
+fewer than ``--saturation-ratio`` of the detections published during the
+step were settled (uploaded, dropped by the filter, or failed) by the time
+it ended.  At the end of every step the tool also counts how many
+detections sit between each pair of checkpoints; the span holding the
+most is where the backlog forms.  The pipeline is drained between steps,
+and by default the ramp stops at the first saturated step.
+
+Usage
+-----
+::
+
+    python -m citrasense.cli.radar_replay --rates 50,100,200,400,800 --step-seconds 10 --output replay.json
+
+    # Replay a night of artifact-log records with a slow uplink:
+    python -m citrasense.cli.radar_replay --recording ~/radar/20260315-0000.jsonl --upload-latency 0.05
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import random
+import shutil
+import tempfile
+import threading
+import time
+from collections.abc import Sequence
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+import click
+
+from citrasense.cli.loadtest import (
+    LoadTestApiClient,
+    LoadTestConfig,
+    ResourceSampler,
+    StageRecorder,
+    host_info,
+    queue_stats,
+    setup_logging,
+    summarize_latencies,
+    synthetic_radar_payload,
+    write_report,
+)
+from citrasense.cli.nats_stand_in import LocalNatsBroker
+from citrasense.pipelines.radar import RadarArtifactWriter, RadarPipeline, radar_artifact_dir
+from citrasense.sensors.bus import InProcessBus
+from citrasense.sensors.radar.nats_detection_source import NatsDetectionSource
+from citrasense.sensors.radar.passive_radar_sensor import PassiveRadarSensor
+from citrasense.sensors.sensor_runtime import SensorRuntime
+from citrasense.settings.citrasense_settings import CitraSenseSettings, SensorConfig
+from citrasense.version import get_version_info
+
+logger = logging.getLogger("citrasense.RadarReplay")
+
+REPORT_SCHEMA_VERSION = 1
+
+_SENSOR_ID = "radar-0"
+_ANTENNA_ID = "replay-antenna"
+
+REPLAY_SPANS: tuple[tuple[str, str, str], ...] = (
+    ("transport", "published", "received"),
+    ("decode", "received", "decoded"),
+    ("bus_publish", "decoded", "bus_published"),
+    ("bus_delivery", "bus_published", "dispatched"),
+    ("processing_wait", "dispatched", "pipeline_start"),
+    ("pipeline", "pipeline_start", "write_start"),
+    ("artifact_write", "write_start", "written"),
+    ("upload_enqueue", "processed", "enqueued"),
+    ("upload", "enqueued", "uploaded"),
+    ("end_to_end", "published", "uploaded"),
+)
+
+#: Spans a detection can be waiting in; ``end_to_end`` overlaps all of them.
+BACKLOG_SPANS = REPLAY_SPANS[:-1]
+
+#: Checkpoints after which a detection is not expected to go any further.
+TERMINAL_CHECKPOINTS = ("dropped", "upload_failed")
+
+
+@dataclass
+class ReplayConfig:
+    """Knobs for a single replay run."""
+
+    rates_hz: tuple[float, ...] = (25.0, 50.0, 100.0, 200.0, 400.0, 800.0, 1600.0, 3200.0)
+    step_seconds: float = 10.0
+    recording: str | None = None
+    min_snr_db: float = 0.0
+    upload_latency_seconds: float = 0.02
+    upload_failure_rate: float = 0.0
+    saturation_ratio: float = 0.95
+    stop_at_saturation: bool = True
+    drain_timeout_seconds: float = 30.0
+    heartbeat_seconds: float = 1.0
+    sample_interval_seconds: float = 1.0
+    seed: int = 0
+
+
+def load_recording(path: Path) -> list[dict[str, Any]]:
+    """Observations from a JSONL file: raw payloads, or artifact-log records (their ``observation``)."""
+    observations: list[dict[str, Any]] = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            record = json.loads(line)
+            if isinstance(record, dict) and isinstance(record.get("observation"), dict):
+                record = record["observation"]
+            if isinstance(record, dict):
+                observations.append(record)
+    if not observations:
+        raise ValueError(f"No observations found in {path}")
+    return observations
+
+
+# ── Instrumented ingest path ───────────────────────────────────────────
+
+
+class ReplayProbe:
+    """Holds the current step's :class:`StageRecorder`; swapped between rate steps."""
+
+    def __init__(self) -> None:
+        self.recorder = StageRecorder()
+
+    def mark(self, key: Any, checkpoint: str, at: float | None = None) -> None:
+        if key is not None:
+            self.recorder.mark(str(key), checkpoint, at)
+
+
+def _detection_key(ctx: Any) -> Any:
+    return ctx.event.payload.get("detection_id")
+
+
+class InstrumentedNatsSource(NatsDetectionSource):
+    """:class:`NatsDetectionSource` timing the JSON decode of each observation."""
+
+    def __init__(self, *, probe: ReplayProbe, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self._probe = probe
+
+    def _decode(self, msg):
+        received = time.time()
+        payload = super()._decode(msg)
+        if payload is not None and msg.subject.endswith(".observations"):
+            key = payload.get("detection_id")
+            self._probe.mark(key, "received", received)
+            self._probe.mark(key, "decoded")
+        return payload
+
+
+class InstrumentedRadarSensor(PassiveRadarSensor):
+    """:class:`PassiveRadarSensor` marking when its observation handler has published to the bus."""
+
+    def __init__(self, sensor_id: str, *, probe: ReplayProbe, **kwargs: Any) -> None:
+        super().__init__(sensor_id, **kwargs)
+        self._probe = probe
+
+    def _on_observation(self, payload: dict[str, Any]) -> None:
+        super()._on_observation(payload)
+        self._probe.mark(payload.get("detection_id"), "bus_published")
+
+
+class InstrumentedArtifactWriter(RadarArtifactWriter):
+    def __init__(self, probe: ReplayProbe) -> None:
+        super().__init__()
+        self._probe = probe
+
+    def process(self, ctx) -> bool:
+        key = _detection_key(ctx)
+        self._probe.mark(key, "write_start")
+        try:
+            return super().process(ctx)
+        finally:
+            self._probe.mark(key, "written")
+
+
+class InstrumentedRadarPipeline(RadarPipeline):
+    def __init__(self, probe: ReplayProbe, writer: InstrumentedArtifactWriter) -> None:
+        super().__init__(writer=writer)
+        self._probe = probe
+
+    def process(self, ctx) -> bool:
+        self._probe.mark(_detection_key(ctx), "pipeline_start")
+        return super().process(ctx)
+
+
+class ReplaySensorRuntime(SensorRuntime):
+    """:class:`SensorRuntime` with the instrumented radar pipeline and bus / upload hand-off marks."""
+
+    def __init__(self, sensor: PassiveRadarSensor, *, probe: ReplayProbe, **kwargs: Any) -> None:
+        super().__init__(sensor, **kwargs)
+        self._probe = probe
+        self.artifact_writer = InstrumentedArtifactWriter(probe)
+        self._radar_pipeline = InstrumentedRadarPipeline(probe, self.artifact_writer)
+
+    def _on_streaming_event(self, subject: str, event) -> None:
+        self._probe.mark(getattr(event, "payload", {}).get("detection_id"), "dispatched")
+        super()._on_streaming_event(subject, event)
+
+    def _on_radar_processed(self, ctx, upload_ready: bool) -> None:
+        key = _detection_key(ctx)
+        self._probe.mark(key, "processed")
+        if not upload_ready or ctx.upload_payload is None:
+            self._probe.mark(key, "dropped")
+            return
+
+        def _on_uploaded(ok: bool, _key: Any = key) -> None:
+            self._probe.mark(_key, "uploaded" if ok else "upload_failed")
+
+        self.upload_queue.submit_radar_observation(
+            sensor_id=ctx.sensor_id,
+            payload=ctx.upload_payload,
+            api_client=self.api_client,
+            settings=self.settings,
+            on_complete=_on_uploaded,
+        )
+        self._probe.mark(key, "enqueued")
+
+
+# ── Publisher ──────────────────────────────────────────────────────────
+
+
+class DetectionReplayer:
+    """Publishes observations onto the broker at a fixed rate, stamping ``published``."""
+
+    def __init__(
+        self,
+        broker: LocalNatsBroker,
+        sensor_id: str,
+        probe: ReplayProbe,
+        recording: Sequence[dict[str, Any]] | None = None,
+        seed: int = 0,
+    ) -> None:
+        self._broker = broker
+        self._subject = f"radar.sensor.{sensor_id}.observations"
+        self._probe = probe
+        self._recording = recording
+        self._rng = random.Random(seed)
+        self._cursor = 0
+
+    def run_step(self, step: int, rate_hz: float, seconds: float) -> int:
+        """Publish ``rate_hz × seconds`` detections, catching up in bursts when the clock slips."""
+        total = max(1, round(rate_hz * seconds))
+        interval = 1.0 / rate_hz
+        start = time.monotonic()
+        sent = 0
+        while sent < total:
+            due = min(total, int((time.monotonic() - start) * rate_hz) + 1)
+            while sent < due:
+                self._publish(f"s{step:02d}-{sent:07d}")
+                sent += 1
+            delay = start + sent * interval - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+        return sent
+
+    def _publish(self, detection_id: str) -> None:
+        now = datetime.now(timezone.utc)
+        if self._recording:
+            payload = dict(self._recording[self._cursor % len(self._recording)])
+            self._cursor += 1
+            payload["detection_id"] = detection_id
+            payload["timestamp"] = now.isoformat().replace("+00:00", "Z")
+        else:
+            payload = synthetic_radar_payload(self._rng, detection_id, now)
+        data = json.dumps(payload).encode("utf-8")
+        self._probe.mark(detection_id, "published")
+        self._broker.publish(self._subject, data)
+
+
+class _Heartbeat:
+    """Publishes ``pr_sensor`` status messages so the sensor sees a live, running radar."""
+
+    def __init__(self, broker: LocalNatsBroker, sensor_id: str, interval: float) -> None:
+        self._broker = broker
+        self._sensor_id = sensor_id
+        self._interval = interval
+        self._stop_event = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="RadarReplayHeartbeat", daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        self._thread.join(timeout=5)
+
+    def _run(self) -> None:
+        while True:
+            status = {
+                "sensor_id": self._sensor_id,
+                "state": "running",
+                "timestamp": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
+            }
+            self._broker.publish(f"radar.sensor.{self._sensor_id}.status", json.dumps(status).encode("utf-8"))
+            if self._stop_event.wait(self._interval):
+                return
+
+
+# ── Harness ────────────────────────────────────────────────────────────
+
+
+def _build_settings(work_dir: Path) -> CitraSenseSettings:
+    settings = CitraSenseSettings.load(base_dir=work_dir)
+    settings.sensors = [SensorConfig(id=_SENSOR_ID, type="passive_radar", citra_sensor_id=_ANTENNA_ID)]
+    settings.initial_retry_delay_seconds = 1
+    settings.max_retry_delay_seconds = 4
+    settings.directories.processing_dir.mkdir(parents=True, exist_ok=True)
+    return settings
+
+
+def _bus_dropped(bus: InProcessBus) -> int:
+    return sum(s["dropped"] for s in bus.get_stats())
+
+
+def _settled(recorder: StageRecorder) -> int:
+    return sum(recorder.count(c) for c in ("uploaded", *TERMINAL_CHECKPOINTS))
+
+
+def _run_step(
+    step: int,
+    rate_hz: float,
+    config: ReplayConfig,
+    *,
+    probe: ReplayProbe,
+    replayer: DetectionReplayer,
+    broker: LocalNatsBroker,
+    bus: InProcessBus,
+    runtime: SensorRuntime,
+) -> dict[str, Any]:
+    recorder = probe.recorder = StageRecorder()
+    bus_dropped_before = _bus_dropped(bus)
+
+    t0 = time.time()
+    published = replayer.run_step(step, rate_hz, config.step_seconds)
+    t1 = time.time()
+    settled_in_step = _settled(recorder)
+    backlog = {name: recorder.in_flight(start, end, TERMINAL_CHECKPOINTS) for name, start, end in BACKLOG_SPANS}
+    broker_pending_bytes = broker.stats()["pending_bytes"]
+    queue_depths = {
+        "processing": runtime.processing_queue.work_queue.qsize(),
+        "upload": runtime.upload_queue.work_queue.qsize(),
+    }
+
+    drained = False
+    deadline = t1 + config.drain_timeout_seconds
+    while time.time() < deadline:
+        if _settled(recorder) + _bus_dropped(bus) - bus_dropped_before >= published:
+            drained = True
+            break
+        time.sleep(0.05)
+    t2 = time.time()
+
+    elapsed = t1 - t0
+    peak = max(backlog.values())
+    return {
+        "step": step,
+        "target_hz": rate_hz,
+        "offered_hz": round(published / elapsed, 2) if elapsed > 0 else 0.0,
+        "published": published,
+        "settled_in_step": settled_in_step,
+        "sustained_hz": round(settled_in_step / elapsed, 2) if elapsed > 0 else 0.0,
+        "saturated": settled_in_step < config.saturation_ratio * published,
+        "backlog_at_step_end": backlog,
+        "backlog_stage": max(backlog, key=backlog.__getitem__) if peak > 0 else None,
+        "queue_depths_at_step_end": queue_depths,
+        "broker_pending_bytes_at_step_end": broker_pending_bytes,
+        "bus_dropped": _bus_dropped(bus) - bus_dropped_before,
+        "uploaded": recorder.count("uploaded"),
+        "dropped": recorder.count("dropped"),
+        "upload_failed": recorder.count("upload_failed"),
+        "drained": drained,
+        "drain_seconds": round(t2 - t1, 3),
+        "latency_seconds": {name: summarize_latencies(v) for name, v in recorder.durations(REPLAY_SPANS).items()},
+    }
+
+
+def _saturation_summary(steps: Sequence[dict[str, Any]]) -> dict[str, Any]:
+    sustained = [s for s in steps if not s["saturated"]]
+    first = next((s for s in steps if s["saturated"]), None)
+    return {
+        "saturated_at_hz": first["target_hz"] if first else None,
+        "max_sustained_hz": max((s["sustained_hz"] for s in sustained), default=None),
+        "backlog_stage": first["backlog_stage"] if first else None,
+        "backlog": first["backlog_at_step_end"] if first else None,
+    }
+
+
+def run_replay(config: ReplayConfig, work_dir: Path, log: logging.Logger | None = None) -> dict[str, Any]:
+    """Run the rate ladder rooted at *work_dir* and return the report dict."""
+    log = log or logger
+    recording = load_recording(Path(config.recording)) if config.recording else None
+    settings = _build_settings(work_dir)
+    api = LoadTestApiClient(
+        LoadTestConfig(
+            task_rate_per_hour=0.0,
+            radar_upload_latency_seconds=config.upload_latency_seconds,
+            upload_failure_rate=config.upload_failure_rate,
+            seed=config.seed,
+        ),
+        logger=log,
+    )
+    probe = ReplayProbe()
+    bus = InProcessBus()
+    broker = LocalNatsBroker(logger=log).start()
+    heartbeat = _Heartbeat(broker, _SENSOR_ID, config.heartbeat_seconds)
+    source = InstrumentedNatsSource(probe=probe, nats_url=broker.url, sensor_id=_SENSOR_ID, logger=log)
+    sensor = InstrumentedRadarSensor(
+        _SENSOR_ID,
+        probe=probe,
+        source=source,
+        logger=log,
+        citra_antenna_id=_ANTENNA_ID,
+        detection_min_snr_db=config.min_snr_db,
+        announce_wait_seconds=max(5.0, 3 * config.heartbeat_seconds),
+    )
+    runtime = ReplaySensorRuntime(sensor, probe=probe, logger=log, settings=settings, api_client=api, sensor_bus=bus)
+    replayer = DetectionReplayer(broker, _SENSOR_ID, probe, recording, seed=config.seed)
+    sampler = ResourceSampler(config.sample_interval_seconds)
+    artifact_log = runtime.artifact_writer.log_for(radar_artifact_dir(settings.directories.processing_dir, _SENSOR_ID))
+
+    started_at = datetime.now(timezone.utc)
+    steps: list[dict[str, Any]] = []
+    heartbeat.start()
+    try:
+        if not sensor.connect():
+            raise RuntimeError(f"Radar sensor did not connect to the NATS stand-in at {broker.url}")
+        runtime.mark_connected()
+        sampler.start()
+        for step, rate in enumerate(config.rates_hz):
+            result = _run_step(
+                step, rate, config, probe=probe, replayer=replayer, broker=broker, bus=bus, runtime=runtime
+            )
+            steps.append(result)
+            log.info(
+                "Replay step %d: %.0f Hz offered, %.0f Hz sustained%s",
+                step,
+                result["offered_hz"],
+                result["sustained_hz"],
+                f" — saturated, backlog in {result['backlog_stage']}" if result["saturated"] else "",
+            )
+            if (result["saturated"] and config.stop_at_saturation) or not result["drained"]:
+                break
+    finally:
+        sampler.stop()
+        heartbeat.stop()
+        queues = queue_stats(runtime)
+        runtime.stop()
+        sensor.disconnect()
+        broker_stats = broker.stats()
+        broker.stop()
+    return {
+        "schema_version": REPORT_SCHEMA_VERSION,
+        "tool": "citrasense.cli.radar_replay",
+        "version": get_version_info(),
+        "started_at": started_at.isoformat(),
+        "host": host_info(),
+        "config": asdict(config),
+        "source": {"kind": "recording", "observations": len(recording)} if recording else {"kind": "synthetic"},
+        "saturation": _saturation_summary(steps),
+        "steps": steps,
+        "queues": queues,
+        "bus": bus.get_stats(),
+        "broker": broker_stats,
+        "artifact_log": artifact_log.stats(),
+        "resources": sampler.summary(),
+    }
+
+
+def _parse_rates(ctx: click.Context, param: click.Parameter, value: str) -> tuple[float, ...]:
+    try:
+        rates = tuple(float(v) for v in value.split(",") if v.strip())
+    except ValueError as exc:
+        raise click.BadParameter(str(exc)) from exc
+    if not rates or any(r <= 0 for r in rates):
+        raise click.BadParameter("expected a comma-separated list of positive rates")
+    return rates
+
+
+def _fmt_ms(value: float | None) -> str:
+    return "-" if value is None else f"{value * 1000:.2f}"
+
+
+@click.command()
+@click.option(
+    "--rates",
+    callback=_parse_rates,
+    default=",".join(f"{r:g}" for r in ReplayConfig.rates_hz),
+    show_default=True,
+    help="Comma-separated detection rates (Hz) to step through.",
+)
+@click.option("--step-seconds", type=float, default=10.0, show_default=True, help="Length of each rate step.")
+@click.option(
+    "--recording",
+    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+    default=None,
+    help="JSONL of observations or radar artifact-log records to replay.  Default: synthetic detections.",
+)
+@click.option("--min-snr", type=float, default=0.0, show_default=True, help="Detection SNR floor (dB) for the filter.")
+@click.option("--upload-latency", type=float, default=0.02, show_default=True, help="Seconds per radar upload.")
+@click.option("--upload-failure-rate", type=float, default=0.0, show_default=True, help="Fraction of failed uploads.")
+@click.option(
+    "--saturation-ratio",
+    type=float,
+    default=0.95,
+    show_default=True,
+    help="Fraction of a step's detections that must settle within the step.",
+)
+@click.option(
+    "--stop-at-saturation/--full-ramp",
+    default=True,
+    show_default=True,
+    help="Stop after the first saturated step or run every rate.",
+)
+@click.option("--drain-timeout", type=float, default=30.0, show_default=True, help="Max seconds to drain per step.")
+@click.option("--seed", type=int, default=0, show_default=True, help="RNG seed for synthetic detections and failures.")
+@click.option(
+    "--output",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=None,
+    help="Report path.  Default: radar_replay_<timestamp>.json in the current directory.",
+)
+@click.option(
+    "--work-dir",
+    type=click.Path(file_okay=False, path_type=Path),
+    default=None,
+    help="Root for config and radar artifacts.  Default: a temporary directory removed afterwards.",
+)
+@click.option("--verbose", is_flag=True, help="Show INFO-level pipeline logs.")
+def cli(
+    rates: tuple[float, ...],
+    step_seconds: float,
+    recording: Path | None,
+    min_snr: float,
+    upload_latency: float,
+    upload_failure_rate: float,
+    saturation_ratio: float,
+    stop_at_saturation: bool,
+    drain_timeout: float,
+    seed: int,
+    output: Path | None,
+    work_dir: Path | None,
+    verbose: bool,
+) -> None:
+    """Step radar detections through the NATS ingest path at rising rates and find where it saturates."""
+    log = setup_logging(verbose)
+    config = ReplayConfig(
+        rates_hz=rates,
+        step_seconds=step_seconds,
+        recording=str(recording) if recording else None,
+        min_snr_db=min_snr,
+        upload_latency_seconds=upload_latency,
+        upload_failure_rate=upload_failure_rate,
+        saturation_ratio=saturation_ratio,
+        stop_at_saturation=stop_at_saturation,
+        drain_timeout_seconds=drain_timeout,
+        seed=seed,
+    )
+    if output is None:
+        output = Path(f"radar_replay_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
+
+    cleanup = work_dir is None
+    root = work_dir or Path(tempfile.mkdtemp(prefix="citrasense_radar_replay_"))
+    click.echo(f"Work directory: {root}")
+    try:
+        report = run_replay(config, root, log)
+    finally:
+        if cleanup:
+            shutil.rmtree(root, ignore_errors=True)
+    write_report(report, output)
+
+    click.echo()
+    click.echo("=" * 60)
+    click.echo("RADAR REPLAY SUMMARY")
+    click.echo("=" * 60)
+    for step in report["steps"]:
+        flag = f"SATURATED (backlog: {step['backlog_stage']})" if step["saturated"] else "ok"
+        e2e = step["latency_seconds"]["end_to_end"]
+        click.echo(
+            f"  {step['target_hz']:>8g} Hz  sustained {step['sustained_hz']:>9.1f} Hz  "
+            f"e2e p50 {_fmt_ms(e2e['p50']):>8} ms  p99 {_fmt_ms(e2e['p99']):>8} ms  {flag}"
+        )
+    sat = report["saturation"]
+    if sat["saturated_at_hz"] is None:
+        click.echo(f"  No saturation up to {report['steps'][-1]['target_hz']:g} Hz")
+    else:
+        click.echo(f"  Saturated at {sat['saturated_at_hz']:g} Hz; backlog forms in {sat['backlog_stage']}")
+    click.echo(f"  Report: {output}")
+    click.echo()
+
+
+if __name__ == "__main__":
+    cli()
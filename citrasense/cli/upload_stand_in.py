@@ -0,0 +1,253 @@
+"""Local stand-in for the image upload endpoints, with failure injection.
+
+:class:`LocalUploadServer` is a threaded HTTP server on ``127.0.0.1``.  It
+serves the two upload modes of :class:`~citrasense.api.upload_engine.UploadEngine`:
+
+- ``POST /form/<name>`` — a presigned multipart POST.  The body is read and
+  kept; the response is ``204``.
+- ``/files/<id>`` — a tus 1.0 core resource created by
+  :meth:`LocalUploadServer.create_upload`.  ``HEAD`` reports
+  ``Upload-Offset`` / ``Upload-Length``.  ``PATCH`` appends at
+  ``Upload-Offset`` and answers ``409`` on a mismatch.  Bytes received
+  before a dropped connection are kept, as a tus server keeps them.
+
+:meth:`LocalUploadServer.fail_next` makes the next body-carrying request
+drop its connection after a given number of body bytes;
+:meth:`LocalUploadServer.fail_at_offset` drops whichever ``PATCH`` carries
+a given byte of a resumable upload.  This simulates a link failing
+part-way through an upload.
+
+With ``bandwidth_bytes_per_s`` set, all connections together read request
+bodies no faster than that rate, so TCP back-pressure makes clients see a
+slow uplink.  The server counts every body
+byte it reads, so tests and benchmarks can compare bytes received with
+the file size.
+"""
+
+from __future__ import annotations
+
+import itertools
+import socket
+import threading
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+from citrasense.api.upload_engine import BandwidthBudget
+
+_READ_BLOCK = 64 * 1024
+
+
+class _Resource:
+    def __init__(self, length: int) -> None:
+        self.length = length
+        self.data = bytearray()
+        self.fail_at: int | None = None
+
+
+class LocalUploadServer:
+    """Threaded upload server for tests and benchmarks; use as a context manager."""
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, bandwidth_bytes_per_s: float | None = None) -> None:
+        """
+        Args:
+            host: Interface to listen on
+            port: TCP port; 0 picks a free one (see :attr:`base_url`)
+            bandwidth_bytes_per_s: Combined body read rate of all connections; None for unthrottled
+        """
+        # Small burst so the throttle bites within a single request.
+        self._uplink = (
+            BandwidthBudget(bandwidth_bytes_per_s, burst_bytes=_READ_BLOCK) if bandwidth_bytes_per_s else None
+        )
+        self._lock = threading.Lock()
+        self._resources: dict[str, _Resource] = {}
+        self._forms: dict[str, bytes] = {}
+        self._failures: deque[int] = deque()
+        self._ids = itertools.count(1)
+        self.bytes_received = 0
+        self.requests: list[tuple[str, str]] = []
+        self.connections = 0
+        self._httpd = ThreadingHTTPServer((host, port), _make_handler(self))
+        self._httpd.daemon_threads = True
+        self._thread: threading.Thread | None = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> LocalUploadServer:
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._httpd.serve_forever, name="upload-stand-in", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        if self._thread is not None:
+            self._httpd.shutdown()
+            self._thread.join(timeout=5)
+            self._thread = None
+        self._httpd.server_close()
+
+    def __enter__(self) -> LocalUploadServer:
+        return self.start()
+
+    def __exit__(self, *exc: object) -> None:
+        self.stop()
+
+    # ── Test controls ──────────────────────────────────────────────────
+
+    def create_upload(self, length: int) -> str:
+        """Create a resumable resource for *length* bytes and return its URL."""
+        with self._lock:
+            upload_id = str(next(self._ids))
+            self._resources[upload_id] = _Resource(length)
+        return f"{self.base_url}/files/{upload_id}"
+
+    def form_url(self, name: str = "images") -> str:
+        return f"{self.base_url}/form/{name}"
+
+    def fail_next(self, after_bytes: int, times: int = 1) -> None:
+        """Drop the connection of the next *times* body-carrying requests after *after_bytes* of body."""
+        with self._lock:
+            self._failures.extend([after_bytes] * times)
+
+    def fail_at_offset(self, url: str, offset: int) -> None:
+        """Drop the connection of the ``PATCH`` to *url* that would carry byte *offset*, once."""
+        with self._lock:
+            self._resources[url.rsplit("/", 1)[-1]].fail_at = offset
+
+    def upload_data(self, url: str) -> bytes:
+        with self._lock:
+            return bytes(self._resources[url.rsplit("/", 1)[-1]].data)
+
+    def form_body(self, name: str = "images") -> bytes | None:
+        with self._lock:
+            return self._forms.get(name)
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "bytes_received": self.bytes_received,
+                "requests": len(self.requests),
+                "connections": self.connections,
+            }
+
+    # ── Handler hooks ──────────────────────────────────────────────────
+
+    def _take_failure(self) -> int | None:
+        with self._lock:
+            return self._failures.popleft() if self._failures else None
+
+    def _received(self, n: int) -> None:
+        with self._lock:
+            self.bytes_received += n
+        if self._uplink is not None:
+            self._uplink.consume(n)
+
+
+def _make_handler(server: LocalUploadServer) -> type[BaseHTTPRequestHandler]:
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def setup(self) -> None:
+            super().setup()
+            with server._lock:
+                server.connections += 1
+
+        def log_message(self, format: str, *args: Any) -> None:
+            pass
+
+        def _record(self) -> None:
+            with server._lock:
+                server.requests.append((self.command, self.path))
+
+        def _reply(self, status: int, headers: dict[str, str] | None = None) -> None:
+            self.send_response(status)
+            for name, value in (headers or {}).items():
+                self.send_header(name, value)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+        def _read_body(self, sink: bytearray, fail_after: int | None = None) -> bool:
+            """Read the body into *sink*; False when an injected failure dropped the connection."""
+            remaining = int(self.headers.get("Content-Length", 0))
+            queued = server._take_failure()
+            if queued is not None:
+                fail_after = queued if fail_after is None else min(fail_after, queued)
+            while remaining > 0:
+                want = min(_READ_BLOCK, remaining)
+                if fail_after is not None:
+                    want = min(want, fail_after - len(sink))
+                    if want <= 0:
+                        self.close_connection = True
+                        self.connection.shutdown(socket.SHUT_RDWR)
+                        return False
+                block = self.rfile.read(want)
+                if not block:
+                    return False
+                sink += block
+                remaining -= len(block)
+                server._received(len(block))
+            return True
+
+        def _resource(self) -> _Resource | None:
+            if not self.path.startswith("/files/"):
+                return None
+            with server._lock:
+                return server._resources.get(self.path.rsplit("/", 1)[-1])
+
+        def do_POST(self) -> None:
+            self._record()
+            if not self.path.startswith("/form/"):
+                self._reply(404)
+                return
+            body = bytearray()
+            if self._read_body(body):
+                with server._lock:
+                    server._forms[self.path.rsplit("/", 1)[-1]] = bytes(body)
+                self._reply(204)
+
+        def do_HEAD(self) -> None:
+            self._record()
+            resource = self._resource()
+            if resource is None:
+                self._reply(404)
+                return
+            with server._lock:
+                offset = len(resource.data)
+            self._reply(
+                200,
+                {
+                    "Tus-Resumable": "1.0.0",
+                    "Upload-Offset": str(offset),
+                    "Upload-Length": str(resource.length),
+                    "Cache-Control": "no-store",
+                },
+            )
+
+        def do_PATCH(self) -> None:
+            self._record()
+            resource = self._resource()
+            if resource is None:
+                self._reply(404)
+                return
+            length = int(self.headers.get("Content-Length", 0))
+            fail_after = None
+            with server._lock:
+                current = len(resource.data)
+                if resource.fail_at is not None and current <= resource.fail_at < current + length:
+                    fail_after, resource.fail_at = resource.fail_at - current, None
+            if int(self.headers.get("Upload-Offset", -1)) != current:
+                self.close_connection = True
+                self._reply(409, {"Upload-Offset": str(current)})
+                return
+            received = bytearray()
+            completed = self._read_body(received, fail_after)
+            with server._lock:
+                resource.data += received[: resource.length - len(resource.data)]
+                offset = len(resource.data)
+            if completed:
+                self._reply(204, {"Tus-Resumable": "1.0.0", "Upload-Offset": str(offset)})
+
+    return Handler
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import logging
 import math
+import time
 from abc import ABC, abstractmethod
 from collections import deque
 from collections.abc import Callable
@@ -23,6 +24,9 @@ if TYPE_CHECKING:
     from citrasense.logging.sensor_logger import SensorLoggerAdapter
     from citrasense.safety.safety_monitor import SafetyMonitor
 
+# Poll period of the default wait_for_telescope_idle (adapters without a state cache).
+_IDLE_POLL_INTERVAL_S = 0.1
+
 
 class SettingSchemaEntry(TypedDict, total=False):
     name: str
@@ -584,6 +588,30 @@ class AbstractAstroHardwareAdapter(ABC):
         """Check if the telescope is currently moving."""
         pass
 
+    def wait_for_telescope_idle(
+        self, timeout: float | None = None, cancelled: Callable[[], bool] | None = None
+    ) -> bool:
+        """Block until the telescope stops moving.
+
+        The default polls :meth:`telescope_is_moving`; adapters with a
+        ``MountStateCache`` override this to wait on its change notifications.
+
+        Args:
+            timeout: Seconds to wait (None = no limit)
+            cancelled: Checked between polls; returning True abandons the wait
+
+        Returns:
+            True once idle, False on timeout or cancellation.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self.telescope_is_moving():
+            if cancelled is not None and cancelled():
+                return False
+            if deadline is not None and time.monotonic() > deadline:
+                return False
+            time.sleep(_IDLE_POLL_INTERVAL_S)
+        return True
+
     @abstractmethod
     def select_camera(self, device_name: str) -> bool:
         """Select a specific camera by name."""
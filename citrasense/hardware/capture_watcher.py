@@ -0,0 +1,276 @@
+"""Event-driven detection of image files landing in a capture directory.
+
+Adapters that hand capture off to external software (KStars/Ekos) learn a
+frame is done only when its file appears.  :class:`CaptureWatcher` tracks
+a directory tree and wakes waiters the moment a matching file is
+*closed* — via inotify on Linux (loaded through ctypes, no extra
+dependency) and by rescanning every ``poll_interval`` elsewhere or when
+inotify is unavailable.
+
+With inotify, only ``IN_CLOSE_WRITE`` / ``IN_MOVED_TO`` count, so a file
+still being written is never reported.  The polling fallback can't tell,
+so it only reports a file once its size is unchanged across two scans.
+Files already present when inotify watching starts are taken as complete.
+"""
+
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import logging
+import os
+import select
+import struct
+import sys
+import threading
+import time
+from pathlib import Path
+
+DEFAULT_SUFFIXES = (".fits", ".fit")
+DEFAULT_POLL_INTERVAL_S = 0.5
+
+# <sys/inotify.h>
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_Q_OVERFLOW = 0x00004000
+_IN_ISDIR = 0x40000000
+_IN_NONBLOCK = os.O_NONBLOCK
+_IN_CLOEXEC = 0o2000000
+_WATCH_MASK = _IN_CLOSE_WRITE | _IN_MOVED_TO | _IN_CREATE
+_EVENT_HEADER = struct.Struct("iIII")
+
+
+class _Inotify:
+    """Minimal ctypes binding: one inotify fd, recursive directory watches."""
+
+    def __init__(self) -> None:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self._add_watch = libc.inotify_add_watch
+        self._add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        self.fd = libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self.dirs: dict[int, Path] = {}
+
+    def watch(self, directory: Path) -> None:
+        wd = self._add_watch(self.fd, os.fsencode(directory), _WATCH_MASK)
+        if wd < 0:
+            raise OSError(ctypes.get_errno(), f"inotify_add_watch failed for {directory}")
+        self.dirs[wd] = directory
+
+    def read_events(self) -> list[tuple[Path, int]]:
+        """Drain pending events as ``(path, mask)``; ``(Path(), _IN_Q_OVERFLOW)`` on overflow."""
+        try:
+            buf = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return []
+        events = []
+        offset = 0
+        while offset < len(buf):
+            wd, mask, _cookie, length = _EVENT_HEADER.unpack_from(buf, offset)
+            offset += _EVENT_HEADER.size
+            name = buf[offset : offset + length].rstrip(b"\0")
+            offset += length
+            if mask & _IN_Q_OVERFLOW:
+                events.append((Path(), _IN_Q_OVERFLOW))
+            elif wd in self.dirs and name:
+                events.append((self.dirs[wd] / os.fsdecode(name), mask))
+        return events
+
+    def close(self) -> None:
+        os.close(self.fd)
+
+
+class CaptureWatcher:
+    """Tracks finished image files under *root* and wakes waiters as they arrive."""
+
+    def __init__(
+        self,
+        root: Path,
+        suffixes: tuple[str, ...] = DEFAULT_SUFFIXES,
+        logger: logging.Logger | None = None,
+        poll_interval: float = DEFAULT_POLL_INTERVAL_S,
+        use_inotify: bool = True,
+    ):
+        """
+        Args:
+            root: Directory tree to watch (must exist for inotify; polled until it does otherwise)
+            suffixes: Lower-case file suffixes that count as captured images
+            logger: Logger instance
+            poll_interval: Rescan period of the polling fallback
+            use_inotify: Set False to force the polling backend
+        """
+        self.root = Path(root).absolute()
+        self.suffixes = tuple(s.lower() for s in suffixes)
+        self.logger = logger or logging.getLogger(__name__)
+        self.poll_interval = poll_interval
+        self.backend = "poll"
+
+        self._cond = threading.Condition()
+        self._files: dict[str, float] = {}  # absolute path -> time.time() first seen complete
+        self._woken = False
+        self._running = False
+        self._thread: threading.Thread | None = None
+        self._inotify: _Inotify | None = None
+        self._wake_r, self._wake_w = -1, -1
+        self._poll_sizes: dict[str, int] = {}
+
+        if use_inotify and sys.platform.startswith("linux"):
+            try:
+                self._inotify = _Inotify()
+                self.backend = "inotify"
+            except (OSError, AttributeError) as e:
+                self.logger.debug(f"inotify unavailable, polling {self.root}: {e}")
+
+    # ── Public API ─────────────────────────────────────────────────────
+
+    def start(self) -> CaptureWatcher:
+        """Begin watching; files already present (and complete) are picked up by an initial scan."""
+        if self._inotify is not None:
+            try:
+                self._watch_tree(self.root)
+            except OSError as e:
+                self.logger.debug(f"Cannot watch {self.root} with inotify, polling instead: {e}")
+                self._inotify.close()
+                self._inotify = None
+                self.backend = "poll"
+        if self._inotify is not None:
+            self._wake_r, self._wake_w = os.pipe()
+            # Watch first, then scan, so nothing lands in between unseen.
+            self._scan_complete(self.root)
+        else:
+            self._scan_poll()
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name=f"CaptureWatcher-{self.root.name}", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._running = False
+        if self._wake_w >= 0:
+            os.write(self._wake_w, b"x")
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+        if self._inotify is not None:
+            self._inotify.close()
+            self._inotify = None
+        for fd in (self._wake_r, self._wake_w):
+            if fd >= 0:
+                os.close(fd)
+        self._wake_r = self._wake_w = -1
+        self.wake()
+
+    def __enter__(self) -> CaptureWatcher:
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    def files(self) -> list[str]:
+        """Absolute paths of the finished images seen so far, in arrival order."""
+        with self._cond:
+            return sorted(self._files, key=self._files.__getitem__)
+
+    @property
+    def last_file_at(self) -> float | None:
+        """Wall-clock time the most recent image was seen complete."""
+        with self._cond:
+            return max(self._files.values(), default=None)
+
+    def wait_for(self, count: int, timeout: float) -> bool:
+        """Block until at least *count* images are present, :meth:`wake` is called, or *timeout* expires.
+
+        Returns True if the count was reached.
+        """
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            while len(self._files) < count and not self._woken:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._cond.wait(remaining)
+            self._woken = False
+            return len(self._files) >= count
+
+    def wake(self) -> None:
+        """Release :meth:`wait_for` early (e.g. on an external state change)."""
+        with self._cond:
+            self._woken = True
+            self._cond.notify_all()
+
+    # ── Backends ───────────────────────────────────────────────────────
+
+    def _run(self) -> None:
+        while self._running:
+            try:
+                if self._inotify is not None:
+                    self._pump_inotify()
+                else:
+                    time.sleep(self.poll_interval)
+                    self._scan_poll()
+            except Exception as e:
+                self.logger.warning(f"Capture watcher error on {self.root}: {e}")
+                time.sleep(self.poll_interval)
+
+    def _pump_inotify(self) -> None:
+        assert self._inotify is not None
+        ready, _, _ = select.select([self._inotify.fd, self._wake_r], [], [], 1.0)
+        if self._inotify.fd not in ready:
+            return
+        for path, mask in self._inotify.read_events():
+            if mask & _IN_Q_OVERFLOW:
+                self.logger.debug("inotify queue overflow, rescanning")
+                self._scan_complete(self.root)
+            elif mask & _IN_ISDIR:
+                if mask & (_IN_CREATE | _IN_MOVED_TO):
+                    # Files may have landed before the watch was added: watch, then scan.
+                    self._watch_tree(path)
+                    self._scan_complete(path)
+            elif mask & (_IN_CLOSE_WRITE | _IN_MOVED_TO):
+                self._add(path)
+
+    def _watch_tree(self, directory: Path) -> None:
+        assert self._inotify is not None
+        self._inotify.watch(directory)
+        for dirpath, dirnames, _ in os.walk(directory):
+            for name in dirnames:
+                self._inotify.watch(Path(dirpath) / name)
+
+    def _scan_complete(self, directory: Path) -> None:
+        """Add every matching file under *directory* (used where closure is already known or can't be)."""
+        for path in self._iter_images(directory):
+            self._add(path)
+
+    def _scan_poll(self) -> None:
+        """Add files whose size held steady since the previous scan."""
+        sizes = {}
+        for path in self._iter_images(self.root):
+            try:
+                sizes[str(path)] = path.stat().st_size
+            except OSError:
+                continue
+        for key, size in sizes.items():
+            if self._poll_sizes.get(key) == size:
+                self._add(Path(key))
+        self._poll_sizes = sizes
+
+    def _iter_images(self, directory: Path):
+        if not directory.is_dir():
+            return
+        for dirpath, _, filenames in os.walk(directory):
+            for name in filenames:
+                if name.lower().endswith(self.suffixes):
+                    yield Path(dirpath) / name
+
+    def _add(self, path: Path) -> None:
+        if not path.name.lower().endswith(self.suffixes):
+            return
+        key = str(path.absolute())
+        with self._cond:
+            if key in self._files:
+                return
+            self._files[key] = time.time()
+            self._cond.notify_all()
+        self.logger.debug(f"Capture landed: {key}")
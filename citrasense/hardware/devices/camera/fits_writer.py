@@ -0,0 +1,184 @@
+"""Capture-time FITS writing with reserved header space.
+
+Frames are enriched after capture with site, task and target cards (see
+:mod:`citrasense.sensors.telescope.fits_enrichment`).  The enrichment
+patches the primary header in place, which only works if the new cards
+fit in the header blocks already on disk — otherwise the whole data block
+has to move.  Cameras write through :func:`write_capture_fits`, which
+leaves a block of blank cards at the end of the primary header for that.
+
+:func:`write_image_extensions` is the streaming counterpart for cameras
+that produce many image extensions per exposure (hyperspectral band
+cubes): the file layout is computed from the headers up front, the file is
+memory-mapped, and each extension's data is written into place from a
+(possibly strided) source view by a thread pool — no per-extension arrays
+or HDU objects are built.
+
+astropy is imported lazily: camera adapters treat it as optional.
+"""
+
+from __future__ import annotations
+
+import mmap
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from astropy.io import fits
+
+# One 2880-byte header block.  Enrichment adds ~10 cards (plus CONTINUE
+# cards for long target names); the rest is headroom for later additions.
+HEADER_RESERVE_CARDS = 36
+
+
+def reserve_header_space(header: fits.Header, cards: int = HEADER_RESERVE_CARDS) -> None:
+    """Pad *header* with trailing blank cards so later keywords can be added without growing it.
+
+    astropy fills trailing blanks first when a new keyword is set, so the
+    padding is consumed transparently.  Existing trailing blanks count
+    towards *cards*.
+    """
+    from astropy.io import fits
+
+    trailing = 0
+    for card in reversed(header.cards):
+        if not card.is_blank:
+            break
+        trailing += 1
+    for _ in range(cards - trailing):
+        header.append(fits.Card(), useblanks=False, bottom=True)
+
+
+def write_capture_fits(hdus: fits.PrimaryHDU | fits.HDUList, save_path: Path | str) -> None:
+    """Write a freshly captured frame, reserving enrichment space in the primary header."""
+    from astropy.io import fits
+
+    primary = hdus[0] if isinstance(hdus, fits.HDUList) else hdus
+    reserve_header_space(primary.header)
+    hdus.writeto(save_path, overwrite=True)
+
+
+# ── Streaming image extensions ─────────────────────────────────────────
+
+_BLOCK_SIZE = 2880
+
+# Native dtype -> (BITPIX, BZERO).  Unsigned 16/32-bit data is stored
+# signed with an offset, which for two's complement is just the top bit flipped.
+_FITS_IMAGE_TYPES: dict[str, tuple[int, int]] = {
+    "uint8": (8, 0),
+    "int16": (16, 0),
+    "uint16": (16, 1 << 15),
+    "int32": (32, 0),
+    "uint32": (32, 1 << 31),
+    "float32": (-32, 0),
+    "float64": (-64, 0),
+}
+
+
+def image_extension_header(shape: tuple[int, int], dtype: np.dtype, name: str | None = None) -> fits.Header:
+    """Mandatory IMAGE extension cards for a 2-D array of *shape* / *dtype*.
+
+    Raises:
+        ValueError: If *dtype* has no FITS image representation.
+    """
+    from astropy.io import fits
+
+    try:
+        bitpix, bzero = _FITS_IMAGE_TYPES[np.dtype(dtype).name]
+    except KeyError:
+        raise ValueError(f"Unsupported FITS image dtype: {dtype}") from None
+    header = fits.Header(
+        [
+            ("XTENSION", "IMAGE", "Image extension"),
+            ("BITPIX", bitpix, "array data type"),
+            ("NAXIS", 2, "number of array dimensions"),
+            ("NAXIS1", shape[1]),
+            ("NAXIS2", shape[0]),
+            ("PCOUNT", 0, "number of parameters"),
+            ("GCOUNT", 1, "number of groups"),
+        ]
+    )
+    if bzero:
+        header["BSCALE"] = 1
+        header["BZERO"] = bzero
+    if name:
+        header["EXTNAME"] = name
+    return header
+
+
+def write_image_extensions(
+    save_path: Path | str,
+    primary_header: fits.Header,
+    extensions: list[tuple[fits.Header, np.ndarray]],
+    max_workers: int | None = None,
+) -> None:
+    """Stream a data-less primary HDU plus one IMAGE extension per ``(header, data)`` pair.
+
+    *data* may be any 2-D view (e.g. a strided slice of a larger frame);
+    it is converted to FITS big-endian representation directly into a
+    ``mmap`` of the output file, one worker per extension.  Headers must
+    come from :func:`image_extension_header` (plus any extra cards).  The
+    primary header is padded with :func:`reserve_header_space` like
+    :func:`write_capture_fits`.
+
+    Args:
+        save_path: Output file (overwritten)
+        primary_header: Extra primary cards; the mandatory ones are added here
+        extensions: ``(header, data)`` per image extension, in file order
+        max_workers: Writer threads (default: one per CPU, capped at the extension count)
+    """
+    from astropy.io import fits
+
+    primary = fits.Header(
+        [
+            ("SIMPLE", True, "conforms to FITS standard"),
+            ("BITPIX", 8, "array data type"),
+            ("NAXIS", 0, "number of array dimensions"),
+            ("EXTEND", True),
+        ]
+    )
+    primary.extend(card for card in primary_header.cards if card.keyword not in primary)
+    reserve_header_space(primary)
+
+    blobs: list[bytes] = [primary.tostring().encode("ascii")]
+    offset = len(blobs[0])
+    placements: list[tuple[int, np.ndarray, np.dtype, int]] = []
+    for header, data in extensions:
+        if data.ndim != 2 or (header["NAXIS2"], header["NAXIS1"]) != data.shape:
+            raise ValueError(f"Extension data shape {data.shape} does not match its header")
+        head = header.tostring().encode("ascii")
+        offset += len(head)
+        bzero = int(header.get("BZERO", 0))
+        disk_dtype = np.dtype(data.dtype).newbyteorder(">")
+        placements.append((offset, data, disk_dtype, bzero))
+        offset += _padded(data.size * disk_dtype.itemsize)
+        blobs.append(head)
+
+    with open(save_path, "wb+") as f:
+        f.truncate(offset)
+        with mmap.mmap(f.fileno(), offset) as out:
+            # Header blocks: primary at 0, each extension header just before its data.
+            out[: len(blobs[0])] = blobs[0]
+            for head, (data_offset, *_rest) in zip(blobs[1:], placements, strict=True):
+                out[data_offset - len(head) : data_offset] = head
+
+            def _write(placement: tuple[int, np.ndarray, np.dtype, int]) -> None:
+                data_offset, data, disk_dtype, bzero = placement
+                dest = np.ndarray(data.shape, dtype=disk_dtype, buffer=out, offset=data_offset)
+                if bzero:
+                    np.bitwise_xor(data, np.asarray(bzero, dtype=data.dtype), out=dest)
+                else:
+                    dest[...] = data
+
+            # No msync: like a plain write(), the kernel writes the dirty pages back.
+            workers = max_workers or min(len(placements), os.cpu_count() or 1)
+            with ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="FitsBandWriter") as pool:
+                list(pool.map(_write, placements))
+
+
+def _padded(nbytes: int) -> int:
+    return -(-nbytes // _BLOCK_SIZE) * _BLOCK_SIZE
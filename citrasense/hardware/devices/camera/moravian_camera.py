@@ -8,8 +8,8 @@ exposed via get_integrated_filter_wheel() for DirectHardwareAdapter.
 from __future__ import annotations
 
 import logging
+import threading
 import time
-from ctypes import create_string_buffer
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import TYPE_CHECKING, cast
@@ -18,6 +18,7 @@ import numpy as np
 
 from citrasense.hardware.abstract_astro_hardware_adapter import SettingSchemaEntry
 from citrasense.hardware.devices.camera import AbstractCamera
+from citrasense.hardware.devices.camera.fits_writer import write_capture_fits
 from citrasense.hardware.devices.filter_wheel import AbstractFilterWheel
 from citrasense.location.gps_fix import GPSFix
 
@@ -26,6 +27,15 @@ if TYPE_CHECKING:
     from citrasense.hardware.devices.moravian_bindings import GxccdCamera
     from citrasense.logging.sensor_logger import SensorLoggerAdapter
 
+# image_ready polling: sleep through the exposure, then poll with a backoff
+# that starts tight (readout often finishes within a few ms of the nominal
+# end) and relaxes to _READY_POLL_MAX_S.  Gx CCDs in low-noise read modes
+# can take tens of seconds to digitize, hence the generous timeout.
+_READY_LEAD_S = 0.2
+_READY_POLL_MIN_S = 0.002
+_READY_POLL_MAX_S = 0.05
+_READY_TIMEOUT_S = 120.0
+
 
 def _probe_moravian_cameras() -> tuple[list[dict[str, str | int]], list[dict[str, str | int]]]:
     """Enumerate Moravian cameras via the native SDK.
@@ -227,6 +237,9 @@ class MoravianCamera(AbstractCamera):
         self._has_gps: bool = False
         self._has_mechanical_shutter: bool = False
         self._active_read_mode: str = ""
+        self._abort_event = threading.Event()
+        self._frame_buffer: np.ndarray | None = None
+        self.last_readout_seconds: float | None = None
 
     def connect(self) -> bool:
         try:
@@ -429,6 +442,11 @@ class MoravianCamera(AbstractCamera):
         binning: int = 1,
         shutter_closed: bool = False,
     ) -> np.ndarray:
+        binned_w, binned_h = self._expose(duration, gain, binning, shutter_closed)
+        return self._read_frame(np.empty((binned_h, binned_w), dtype=np.uint16))
+
+    def _expose(self, duration: float, gain: int | float | None, binning: int, shutter_closed: bool) -> tuple[int, int]:
+        """Start an exposure and block until the camera has the image.  Returns the binned (width, height)."""
         if not self.is_connected():
             raise RuntimeError("Camera not connected")
         assert self._gxccd is not None
@@ -455,36 +473,64 @@ class MoravianCamera(AbstractCamera):
             binning,
             "open" if use_shutter else "closed",
         )
+        self._abort_event.clear()
         self._last_exposure_start = datetime.now(timezone.utc)
         cam.start_exposure(duration, use_shutter, 0, 0, w, h)
 
         t0 = time.monotonic()
+        self._wait_image_ready(cam, t0 + duration)
+        self.logger.debug("image_ready after %.3fs (requested %.3fs)", time.monotonic() - t0, duration)
+        return w // binning, h // binning
 
-        # Sleep for most of the exposure, then poll (per gxccd.h recommendation)
-        if duration > 0.5:
-            time.sleep(duration - 0.2)
-        while not cam.image_ready():
-            time.sleep(0.05)
+    def _wait_image_ready(self, cam: GxccdCamera, expected_end: float) -> None:
+        """Sleep through the exposure, then poll ``image_ready`` with a bounded backoff.
 
-        self.logger.debug("image_ready after %.3fs (requested %.3fs)", time.monotonic() - t0, duration)
+        Sleeps on the abort event, so :meth:`abort_exposure` from another
+        thread ends the wait immediately.
 
-        binned_w = w // binning
-        binned_h = h // binning
-        buf_size = binned_w * 2 * binned_h
-        buf = create_string_buffer(buf_size)
-        cam.read_image(buf, buf_size)
-
-        data = np.frombuffer(bytes(buf), dtype=np.uint16).reshape((binned_h, binned_w))
-        self.logger.debug(
-            "Exposure complete: %dx%d, min=%d, max=%d, median=%d, mean=%.0f",
-            binned_w,
-            binned_h,
-            int(data.min()),
-            int(data.max()),
-            int(np.median(data)),
-            float(data.mean()),
-        )
-        return data
+        Raises:
+            RuntimeError: If the exposure was aborted.
+            TimeoutError: If the image isn't ready ``_READY_TIMEOUT_S`` after the nominal end.
+        """
+        deadline = expected_end + _READY_TIMEOUT_S
+        lead = expected_end - _READY_LEAD_S - time.monotonic()
+        if lead > 0 and self._abort_event.wait(lead):
+            raise RuntimeError("Exposure aborted")
+        interval = _READY_POLL_MIN_S
+        while not cam.image_ready():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError(f"Camera image not ready {_READY_TIMEOUT_S:.0f}s after exposure end")
+            if self._abort_event.wait(min(interval, remaining)):
+                raise RuntimeError("Exposure aborted")
+            interval = min(interval * 2, _READY_POLL_MAX_S)
+
+    def _read_frame(self, out: np.ndarray) -> np.ndarray:
+        """Download the image straight into *out* (C-contiguous uint16, shape ``(h, w)``)."""
+        assert self._gxccd is not None
+        t0 = time.perf_counter()
+        # gxccd_read_image takes a void*: the SDK writes into the array's memory, no intermediate copy.
+        self._gxccd.read_image(out.ctypes.data, out.nbytes)
+        self.last_readout_seconds = time.perf_counter() - t0
+
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(
+                "Exposure complete: %dx%d in %.3fs, min=%d, max=%d, mean=%.0f",
+                out.shape[1],
+                out.shape[0],
+                self.last_readout_seconds,
+                int(out.min()),
+                int(out.max()),
+                float(out.mean()),
+            )
+        return out
+
+    def _reusable_frame(self, width: int, height: int) -> np.ndarray:
+        """Readout buffer kept across exposures, reallocated only when the binned size changes."""
+        buf = self._frame_buffer
+        if buf is None or buf.shape != (height, width):
+            buf = self._frame_buffer = np.empty((height, width), dtype=np.uint16)
+        return buf
 
     def get_gps_location(self) -> GPSFix | None:
         if not self._has_gps or self._gxccd is None:
@@ -545,7 +591,10 @@ class MoravianCamera(AbstractCamera):
         save_path: Path | None = None,
         shutter_closed: bool = False,
     ) -> Path:
-        data = self.capture_array(duration, gain, offset, binning, shutter_closed=shutter_closed)
+        # The frame only lives until _save_fits has written it, so read into the
+        # camera's reusable buffer rather than allocating a fresh one per exposure.
+        binned_w, binned_h = self._expose(duration, gain, binning, shutter_closed)
+        data = self._read_frame(self._reusable_frame(binned_w, binned_h))
         exposure_start, date_src = self._resolve_exposure_timestamp()
 
         if save_path is None:
@@ -554,7 +603,7 @@ class MoravianCamera(AbstractCamera):
 
         gain_val = gain if gain is not None else self._default_gain
         self._save_fits(
-            data.tobytes(),
+            data,
             data.shape[1],
             data.shape[0],
             duration,
@@ -569,7 +618,7 @@ class MoravianCamera(AbstractCamera):
 
     def _save_fits(
         self,
-        buf: bytes,
+        buf: bytes | np.ndarray,
         width: int,
         height: int,
         exp_time: float,
@@ -582,7 +631,7 @@ class MoravianCamera(AbstractCamera):
         import numpy as np
         from astropy.io import fits
 
-        # gxccd returns 16-bit LE, bottom-up (Cartesian origin)
+        # gxccd returns 16-bit LE, bottom-up (Cartesian origin); frombuffer is a view, not a copy
         data = np.frombuffer(buf, dtype=np.uint16).reshape((height, width))
         # FITS convention: first pixel is bottom-left, same as gxccd -- no flip needed
 
@@ -607,9 +656,10 @@ class MoravianCamera(AbstractCamera):
         if temp is not None:
             hdr["CCD-TEMP"] = (temp, "Sensor temperature in C")
 
-        hdu.writeto(save_path, overwrite=True)
+        write_capture_fits(hdu, save_path)
 
     def abort_exposure(self):
+        self._abort_event.set()
         if self.is_connected() and self._gxccd:
             try:
                 self._gxccd.abort_exposure(download=False)
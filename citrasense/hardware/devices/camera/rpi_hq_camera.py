@@ -10,6 +10,7 @@ import numpy as np
 
 from citrasense.hardware.abstract_astro_hardware_adapter import SettingSchemaEntry
 from citrasense.hardware.devices.camera import AbstractCamera
+from citrasense.hardware.devices.camera.fits_writer import write_capture_fits
 
 
 class RaspberryPiHQCamera(AbstractCamera):
@@ -301,7 +302,7 @@ class RaspberryPiHQCamera(AbstractCamera):
             hdu.header["CAMERA"] = "IMX477"
             date_obs = self._last_exposure_start or datetime.now(timezone.utc)
             hdu.header["DATE-OBS"] = (date_obs.isoformat(), "UTC exposure start")
-            hdu.writeto(save_path, overwrite=True)
+            write_capture_fits(hdu, save_path)
 
         except ImportError:
             self.logger.error("astropy not installed. Install with: pip install astropy")
@@ -10,6 +10,7 @@ import numpy as np
 
 from citrasense.hardware.abstract_astro_hardware_adapter import SettingSchemaEntry
 from citrasense.hardware.devices.camera import AbstractCamera
+from citrasense.hardware.devices.camera.fits_writer import write_capture_fits
 
 
 def _probe_usb_cameras() -> list[dict[str, str | int]]:
@@ -416,7 +417,7 @@ class UsbCamera(AbstractCamera):
             hdu.header["CAMERA"] = f"Index {self.camera_index}"
             date_obs = self._last_exposure_start or datetime.now(timezone.utc)
             hdu.header["DATE-OBS"] = (date_obs.isoformat(), "UTC exposure start")
-            hdu.writeto(save_path, overwrite=True)
+            write_capture_fits(hdu, save_path)
 
         except ImportError:
             self.logger.error("astropy not installed. Install with: pip install astropy")
@@ -10,6 +10,11 @@ import numpy as np
 
 from citrasense.hardware.abstract_astro_hardware_adapter import SettingSchemaEntry
 from citrasense.hardware.devices.camera import AbstractCamera
+from citrasense.hardware.devices.camera.fits_writer import (
+    image_extension_header,
+    write_capture_fits,
+    write_image_extensions,
+)
 
 
 class XimeaHyperspectralCamera(AbstractCamera):
@@ -527,60 +532,56 @@ class XimeaHyperspectralCamera(AbstractCamera):
             save_path: Path to save the image
         """
         if self.data_mode == "datacube":
-            # Create 3D datacube by demosaicing the spectral mosaic
-            datacube = self._demosaic_to_datacube(data)
-
-            # Save as multi-extension FITS (one extension per spectral band)
+            # Stream each spectral band from the mosaic straight into its FITS
+            # extension (one extension per band) — no datacube is materialized
             try:
-                # Create primary HDU with basic metadata
                 from astropy.io import fits
 
-                primary_hdu = fits.PrimaryHDU()
+                primary_header = fits.Header()
                 # Hyperspectral metadata
-                primary_hdu.header["HIERARCH SPECTRAL_TYPE"] = "hyperspectral"
-                primary_hdu.header["HIERARCH SPECTRAL_BANDS"] = self.spectral_bands
-                primary_hdu.header["HIERARCH DATA_MODE"] = "datacube"
-                primary_hdu.header["HIERARCH SENSOR_TYPE"] = "snapshot_mosaic"
+                primary_header["HIERARCH SPECTRAL_TYPE"] = "hyperspectral"
+                primary_header["HIERARCH SPECTRAL_BANDS"] = self.spectral_bands
+                primary_header["HIERARCH DATA_MODE"] = "datacube"
+                primary_header["HIERARCH SENSOR_TYPE"] = "snapshot_mosaic"
 
                 # Capture metadata
                 if hasattr(self, "_last_exposure_us"):
-                    primary_hdu.header["EXPTIME"] = self._last_exposure_us / 1000000.0  # seconds
+                    primary_header["EXPTIME"] = self._last_exposure_us / 1000000.0  # seconds
                 if hasattr(self, "_last_gain_db"):
-                    primary_hdu.header["GAIN"] = self._last_gain_db
+                    primary_header["GAIN"] = self._last_gain_db
                 date_obs = self._last_exposure_start or datetime.now(timezone.utc)
-                primary_hdu.header["DATE-OBS"] = date_obs.isoformat()
+                primary_header["DATE-OBS"] = date_obs.isoformat()
 
                 # Camera metadata
                 if self._camera_info:
                     if "serial_number" in self._camera_info:
-                        primary_hdu.header["CAMSER"] = self._camera_info["serial_number"]
+                        primary_header["CAMSER"] = self._camera_info["serial_number"]
                     if "model" in self._camera_info:
-                        primary_hdu.header["INSTRUME"] = self._camera_info["model"]
+                        primary_header["INSTRUME"] = self._camera_info["model"]
 
                 # Wavelength calibration metadata in primary header (if available)
                 if self.wavelength_calibration:
-                    primary_hdu.header["HIERARCH WAVELENGTH_UNIT"] = "nm"
-                    primary_hdu.header["HIERARCH WAVELENGTH_COUNT"] = len(self.wavelength_calibration)
+                    primary_header["HIERARCH WAVELENGTH_UNIT"] = "nm"
+                    primary_header["HIERARCH WAVELENGTH_COUNT"] = len(self.wavelength_calibration)
 
-                # Create image HDU for each spectral band
-                hdu_list = [primary_hdu]
-                for i in range(datacube.shape[2]):
-                    band_hdu = fits.ImageHDU(datacube[:, :, i], name=f"BAND_{i:03d}")
-                    band_hdu.header["BANDNUM"] = i
+                # Image extension header for each spectral band
+                extensions = []
+                for i, band in enumerate(self._demosaic_band_views(data)):
+                    band_header = image_extension_header(band.shape, band.dtype, name=f"BAND_{i:03d}")
+                    band_header["BANDNUM"] = i
 
                     # Add wavelength information if calibrated
                     if self.wavelength_calibration and i < len(self.wavelength_calibration):
-                        band_hdu.header["WAVELENG"] = self.wavelength_calibration[i]
-                        band_hdu.header["WAVEUNIT"] = "nm"
+                        band_header["WAVELENG"] = self.wavelength_calibration[i]
+                        band_header["WAVEUNIT"] = "nm"
 
-                    hdu_list.append(band_hdu)  # type: ignore[reportArgumentType]
+                    extensions.append((band_header, band))
 
-                hdul = fits.HDUList(hdu_list)
-                hdul.writeto(save_path, overwrite=True)
+                write_image_extensions(save_path, primary_header, extensions)
                 self.logger.debug(f"Saved hyperspectral datacube as multi-extension FITS: {save_path}")
             except ImportError:
                 # Fallback: save as 3D numpy array
-                np.save(save_path.with_suffix(".npy"), datacube)
+                np.save(save_path.with_suffix(".npy"), self._demosaic_to_datacube(data))
                 self.logger.warning("astropy not available, saved datacube as .npy")
 
         else:  # "raw" or default
@@ -640,7 +641,7 @@ class XimeaHyperspectralCamera(AbstractCamera):
                             chunk = wavelength_str[chunk_start : chunk_start + chunk_size]
                             hdu.header[f"HIERARCH WAVELENGTHS_{i}"] = chunk
 
-                hdu.writeto(save_path, overwrite=True)
+                write_capture_fits(hdu, save_path)
                 self.logger.debug(f"Saved hyperspectral image as FITS: {save_path}")
             except ImportError:
                 np.save(save_path.with_suffix(".npy"), data)
@@ -675,9 +676,43 @@ class XimeaHyperspectralCamera(AbstractCamera):
         Raises:
             ValueError: If spectral_bands is not a perfect square
         """
+        import numpy as np
+
+        tiles = self._mosaic_tiles(mosaic_data)
+        out_height, pattern_size, out_width, _ = tiles.shape
+        num_bands = pattern_size * pattern_size
+
+        # One strided copy: (row, band_row, col, band_col) -> (row, col, band_row, band_col)
+        datacube = np.empty((out_height, out_width, num_bands), dtype=mosaic_data.dtype)
+        datacube.reshape(out_height, out_width, pattern_size, pattern_size)[...] = tiles.transpose(0, 2, 1, 3)
+
+        height, width = mosaic_data.shape[:2]
+        self.logger.debug(f"Demosaiced {height}x{width} mosaic into {out_height}x{out_width}x{num_bands} datacube")
+
+        return datacube
+
+    def _demosaic_band_views(self, mosaic_data) -> list[np.ndarray]:
+        """Per-band zero-copy views of a snapshot mosaic, in band order (row-major within the pattern).
+
+        Band ``i`` is ``mosaic[i // N::N, i % N::N]`` cropped to whole
+        pattern tiles — the same pixels as ``_demosaic_to_datacube(...)[:, :, i]``.
+
+        Raises:
+            ValueError: If spectral_bands is not a perfect square
+        """
+        tiles = self._mosaic_tiles(mosaic_data)
+        pattern_size = tiles.shape[1]
+        return [tiles[:, r, :, c] for r in range(pattern_size) for c in range(pattern_size)]
+
+    def _mosaic_tiles(self, mosaic_data) -> np.ndarray:
+        """View the mosaic as ``(out_height, N, out_width, N)`` pattern tiles without copying.
+
+        Rows/columns beyond the last whole tile (dimensions that aren't
+        multiples of N) are dropped.
+        """
         import math
 
-        import numpy as np
+        from numpy.lib.stride_tricks import as_strided
 
         # Calculate pattern size from spectral_bands using square root
         # This works for any N×N pattern (4×4=16, 5×5=25, 6×6=36, 7×7=49, 8×8=64, etc.)
@@ -694,22 +729,10 @@ class XimeaHyperspectralCamera(AbstractCamera):
         height, width = mosaic_data.shape[:2]
         out_height = height // pattern_size
         out_width = width // pattern_size
-        num_bands = pattern_size * pattern_size
-
-        # Create output datacube
-        datacube = np.zeros((out_height, out_width, num_bands), dtype=mosaic_data.dtype)
-
-        # Extract each spectral band from the mosaic
-        for band_idx in range(num_bands):
-            row_offset = band_idx // pattern_size
-            col_offset = band_idx % pattern_size
-
-            # Extract this band's pixels from the mosaic
-            band_data = mosaic_data[row_offset::pattern_size, col_offset::pattern_size]
-
-            # Handle size mismatch (if image dimensions aren't perfect multiples)
-            datacube[:, :, band_idx] = band_data[:out_height, :out_width]
-
-        self.logger.debug(f"Demosaiced {height}x{width} mosaic into {out_height}x{out_width}x{num_bands} datacube")
-
-        return datacube
+        row_stride, col_stride = mosaic_data.strides[:2]
+        return as_strided(
+            mosaic_data,
+            shape=(out_height, pattern_size, out_width, pattern_size),
+            strides=(row_stride * pattern_size, row_stride, col_stride * pattern_size, col_stride),
+            writeable=False,
+        )
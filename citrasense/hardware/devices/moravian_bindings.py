@@ -383,7 +383,8 @@ class GxccdCamera:
         self._check(self._lib.gxccd_image_ready(self._handle, byref(ready)))
         return ready.value
 
-    def read_image(self, buf: ctypes.Array, size: int) -> None:  # type: ignore[type-arg]
+    def read_image(self, buf: ctypes.Array | int, size: int) -> None:  # type: ignore[type-arg]
+        """Download the image into *buf* — a ctypes buffer or a raw address (e.g. ``ndarray.ctypes.data``)."""
         assert self._handle is not None
         self._check(self._lib.gxccd_read_image(self._handle, buf, c_size_t(size)))
 
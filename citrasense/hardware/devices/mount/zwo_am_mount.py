@@ -277,6 +277,14 @@ class ZwoAmMount(AbstractMount):
 
     def disconnect(self) -> None:
         self._transport.close()
+        latency = self._transport.get_stats()["latency"]
+        if latency:
+            self.logger.debug(
+                "Command round-trips: %s",
+                ", ".join(
+                    f"{name} n={h['count']} p50={h['p50_ms']}ms p95={h['p95_ms']}ms" for name, h in latency.items()
+                ),
+            )
         self.logger.info("Mount disconnected")
 
     def is_connected(self) -> bool:
@@ -318,14 +326,13 @@ class ZwoAmMount(AbstractMount):
         self.logger.info("Slew aborted")
 
     def get_radec(self) -> tuple[float, float]:
-        ra_resp = self._transport.send_command_with_retry(ZwoAmCommands.get_ra())
+        ra_resp, dec_resp = self._transport.send_commands_with_retry([ZwoAmCommands.get_ra(), ZwoAmCommands.get_dec()])
         parsed_ra = ZwoAmResponseParser.parse_ra(ra_resp)
         if parsed_ra is None:
             raise RuntimeError(f"Failed to parse RA response: {ra_resp!r}")
         ra_hours = ZwoAmResponseParser.hms_to_decimal_hours(*parsed_ra)
         ra_deg = ra_hours * 15.0
 
-        dec_resp = self._transport.send_command_with_retry(ZwoAmCommands.get_dec())
         parsed_dec = ZwoAmResponseParser.parse_dec(dec_resp)
         if parsed_dec is None:
             raise RuntimeError(f"Failed to parse Dec response: {dec_resp!r}")
@@ -510,8 +517,9 @@ class ZwoAmMount(AbstractMount):
 
     def get_limits(self) -> tuple[int | None, int | None]:
         """Read the mount's lower (horizon) and upper (overhead) altitude limits."""
-        lower_resp = self._transport.send_command_with_retry(ZwoAmCommands.get_altitude_limit_lower())
-        upper_resp = self._transport.send_command_with_retry(ZwoAmCommands.get_altitude_limit_upper())
+        lower_resp, upper_resp = self._transport.send_commands_with_retry(
+            [ZwoAmCommands.get_altitude_limit_lower(), ZwoAmCommands.get_altitude_limit_upper()]
+        )
         return (
             ZwoAmResponseParser.parse_altitude_limit(lower_resp),
             ZwoAmResponseParser.parse_altitude_limit(upper_resp),
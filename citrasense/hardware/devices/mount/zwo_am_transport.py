@@ -6,34 +6,232 @@ Provides an abstract transport interface and two concrete implementations:
 
 Both carry the same ``:#``-terminated command/response protocol, so the
 ``ZwoAmMount`` device class is transport-agnostic.
+
+A reader thread owns the receive side: it blocks on the port, hands bytes
+to a :class:`ResponseFramer`, and completes requests in the order they
+were written (the firmware answers strictly in order).  Callers wait on an
+event instead of sleep-polling for characters, so a round-trip costs only
+what the wire and firmware cost.  Because matching is by order, several
+``#``-terminated status queries can be in flight at once (see
+:meth:`ZwoAmTransport.send_commands`).  Set/GoTo commands — whose ``1``/``0``
+replies may omit the ``#`` or trail extra text — still run alone on the line,
+and the next request waits for the line to go quiet and drops any trailer.
+
+Every response is timed per command type (``:GR``, ``:GU``, ``:MS`` …) into
+a :class:`LatencyHistogram`; :meth:`ZwoAmTransport.get_stats` reports them.
 """
 
 from __future__ import annotations
 
+import bisect
 import logging
+import re
+import select
 import socket
 import threading
 import time
 from abc import ABC, abstractmethod
-from typing import Any
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, TypeVar
 
 logger = logging.getLogger("citrasense.ZwoAmTransport")
 
 DEFAULT_BAUD_RATE = 9600
 DEFAULT_TIMEOUT_S = 2.0
 DEFAULT_RETRY_COUNT = 3
+DEFAULT_MAX_IN_FLIGHT = 4
 
-# Brief pause after fire-and-forget commands to let firmware process them.
+# Minimum gap after a fire-and-forget command before the next write, to let
+# firmware process it.  Enforced on the next write, not by blocking the sender.
 _FIRE_AND_FORGET_DELAY_S = 0.05
 
+# Idle time the line needs after a SHORT reply before the next request is
+# written; anything arriving meanwhile is trailing text and is dropped.
+_SHORT_TRAILER_QUIET_S = 0.05
+
+# How long one blocking read in the reader thread may wait for input.  Only
+# bounds shutdown latency — data wakes the reader immediately.
+_READ_SLICE_S = 0.25
+
+# Round-trip histogram bucket upper bounds (ms); one overflow bucket follows.
+_LATENCY_BUCKETS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000)
+
+_COMMAND_TYPE_RE = re.compile(r":?[A-Za-z]+")
+
+_T = TypeVar("_T")
+
+
+# ---------------------------------------------------------------------------
+# Response framing
+# ---------------------------------------------------------------------------
+
+
+class FrameKind(Enum):
+    """How the response to a command is delimited on the wire."""
+
+    HASH = "hash"
+    """Text terminated by ``#`` (all ``:G..#`` queries)."""
+
+    SHORT = "short"
+    """A single digit, with or without a trailing ``#`` (set/GoTo acks); otherwise ``#``-terminated text."""
+
+
+class ResponseFramer:
+    """Splits the mount's byte stream into responses.
+
+    Bytes are buffered with :meth:`feed`; :meth:`pop` returns the next
+    complete response for the expected :class:`FrameKind`, or ``None`` if
+    it has not fully arrived.  A ``#`` directly following a bare-digit
+    ``SHORT`` reply is dropped, so firmware that does and doesn't terminate
+    those replies frames the same.
+    """
+
+    def __init__(self) -> None:
+        self._buf = bytearray()
+        self._swallow_hash = False
+
+    def feed(self, data: bytes) -> None:
+        self._buf += data
+
+    def pop(self, kind: FrameKind) -> str | None:
+        self._apply_swallow()
+        if not self._buf:
+            return None
+        if kind is FrameKind.SHORT and self._buf[0] in b"0123456789":
+            frame = chr(self._buf[0])
+            del self._buf[0]
+            self._swallow_hash = True
+            return frame
+        end = self._buf.find(b"#")
+        if end < 0:
+            return None
+        frame = self._buf[: end + 1].decode("ascii", errors="replace")
+        del self._buf[: end + 1]
+        return frame.rstrip("#") if kind is FrameKind.SHORT else frame
+
+    def discard(self) -> int:
+        """Drop everything buffered; returns how many unsolicited bytes were dropped."""
+        self._apply_swallow()
+        dropped = len(self._buf)
+        self._buf.clear()
+        return dropped
+
+    @property
+    def partial(self) -> str:
+        return self._buf.decode("ascii", errors="replace")
+
+    def _apply_swallow(self) -> None:
+        if self._swallow_hash and self._buf:
+            self._swallow_hash = False
+            if self._buf[0] == ord("#"):
+                del self._buf[0]
+
+
+# ---------------------------------------------------------------------------
+# Latency histogram
+# ---------------------------------------------------------------------------
+
+
+class LatencyHistogram:
+    """Fixed-bucket round-trip latency histogram (log-spaced, milliseconds)."""
+
+    def __init__(self) -> None:
+        self.counts = [0] * (len(_LATENCY_BUCKETS_MS) + 1)
+        self.count = 0
+        self.total_s = 0.0
+        self.max_s = 0.0
+
+    def record(self, seconds: float) -> None:
+        self.counts[bisect.bisect_left(_LATENCY_BUCKETS_MS, seconds * 1000.0)] += 1
+        self.count += 1
+        self.total_s += seconds
+        self.max_s = max(self.max_s, seconds)
+
+    def percentile_ms(self, q: float) -> float | None:
+        """Upper bound of the bucket holding the *q*-th percentile, capped at the observed max."""
+        if not self.count:
+            return None
+        max_ms = round(self.max_s * 1000.0, 3)
+        rank = q / 100.0 * self.count
+        seen = 0
+        for i, n in enumerate(self.counts):
+            seen += n
+            if n and seen >= rank and i < len(_LATENCY_BUCKETS_MS):
+                return min(float(_LATENCY_BUCKETS_MS[i]), max_ms)
+        return max_ms
+
+    def to_dict(self) -> dict[str, Any]:
+        labels = [f"<={b}ms" for b in _LATENCY_BUCKETS_MS] + [f">{_LATENCY_BUCKETS_MS[-1]}ms"]
+        return {
+            "count": self.count,
+            "mean_ms": round(self.total_s / self.count * 1000.0, 3) if self.count else None,
+            "p50_ms": self.percentile_ms(50),
+            "p95_ms": self.percentile_ms(95),
+            "max_ms": round(self.max_s * 1000.0, 3),
+            "buckets": {label: n for label, n in zip(labels, self.counts, strict=True) if n},
+        }
+
+
+def command_type(command: str) -> str:
+    """Histogram key for *command*: its leading mnemonic (``:Sr12:00:00#`` → ``:Sr``)."""
+    match = _COMMAND_TYPE_RE.match(command)
+    return match.group(0) if match else command
+
+
+@dataclass
+class _PendingResponse:
+    """A written command waiting for its response."""
+
+    command: str
+    kind: FrameKind
+    sent_at: float
+    response: str | None = None
+    error: Exception | None = None
+    abandoned: bool = False
+    done: threading.Event = field(default_factory=threading.Event, repr=False)
+
+
+# ---------------------------------------------------------------------------
+# Abstract transport
+# ---------------------------------------------------------------------------
+
 
 class ZwoAmTransport(ABC):
-    """Abstract byte transport for ZWO mounts."""
+    """Abstract byte transport for ZWO mounts.
+
+    Subclasses provide the raw byte I/O (:meth:`_write` and
+    :meth:`_read_available`); request framing, pipelining and timing live
+    here.
+    """
 
-    def __init__(self, timeout_s: float = DEFAULT_TIMEOUT_S, retry_count: int = DEFAULT_RETRY_COUNT) -> None:
+    def __init__(
+        self,
+        timeout_s: float = DEFAULT_TIMEOUT_S,
+        retry_count: int = DEFAULT_RETRY_COUNT,
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+    ) -> None:
         self.timeout_s = timeout_s
         self.retry_count = max(1, retry_count)
+        self.max_in_flight = max(1, max_in_flight)
+        # Serialises writes, and is held for the whole round-trip of commands
+        # that must have the line to themselves (set/GoTo acks).
         self._lock = threading.RLock()
+        # Guards the in-flight queue, framer and stats; the reader thread notifies on it.
+        self._cond = threading.Condition(threading.Lock())
+        self._in_flight: deque[_PendingResponse] = deque()
+        self._framer = ResponseFramer()
+        self._reader: threading.Thread | None = None
+        self._reader_stop = threading.Event()
+        self._reader_error: Exception | None = None
+        self._quiet_until = 0.0
+        self._last_rx = 0.0
+        self._settle_pending = False
+        self._latency: dict[str, LatencyHistogram] = {}
+        self.stray_bytes = 0
+        self.timeouts = 0
 
     @abstractmethod
     def open(self) -> None:
@@ -50,143 +248,265 @@ class ZwoAmTransport(ABC):
     def _write(self, data: bytes) -> None: ...
 
     @abstractmethod
-    def _read_until_hash(self) -> str:
-        """Read bytes until ``#`` terminator, returning the full response including ``#``."""
+    def _read_available(self) -> bytes:
+        """Block up to ``_READ_SLICE_S`` for input; return what arrived (``b""`` if nothing).
 
-    @abstractmethod
-    def _clear_input(self) -> None:
-        """Discard any buffered incoming bytes."""
+        Raises ``OSError`` (or a subclass) when the connection is lost.
+        """
+
+    def _reset_input_buffer(self) -> None:  # noqa: B027
+        """Discard bytes buffered by the OS/driver (optional)."""
 
     # ---- high-level helpers (shared by both transports) ----
 
     def send_command(self, command: str) -> str:
-        """Send *command* and return the ``#``-terminated response string."""
-        with self._lock:
-            self._clear_input()
-            self._write(command.encode("ascii"))
-            response = self._read_until_hash()
+        """Send *command* and return the ``#``-terminated response string.
+
+        Other queries may be in flight at the same time; responses are
+        matched to commands by order.
+        """
+        response = self._await(self._submit(command, FrameKind.HASH))
+        logger.debug("TX %s  RX %s", command, response)
+        return response
+
+    def send_commands(self, commands: list[str]) -> list[str]:
+        """Pipeline several ``#``-terminated queries and return their responses in order.
+
+        Up to ``max_in_flight`` are written back-to-back before the first
+        response is awaited, so the batch costs roughly one round-trip plus
+        the firmware's processing time instead of one round-trip each.
+        """
+        pending = [self._submit(command, FrameKind.HASH) for command in commands]
+        responses = [self._await(p) for p in pending]
+        for command, response in zip(commands, responses, strict=True):
             logger.debug("TX %s  RX %s", command, response)
-            return response
+        return responses
 
     def send_command_with_retry(self, command: str) -> str:
-        with self._lock:
-            last_error: Exception | None = None
-            for attempt in range(self.retry_count):
-                try:
-                    self._clear_input()
-                    self._write(command.encode("ascii"))
-                    response = self._read_until_hash()
-                    logger.debug("TX %s  RX %s", command, response)
-                    return response
-                except Exception as exc:
-                    logger.warning("Command %r failed (attempt %d/%d): %s", command, attempt + 1, self.retry_count, exc)
-                    last_error = exc
-                    time.sleep(0.1)
-            raise last_error  # type: ignore[misc]
+        return self._with_retry(command, self.send_command)
+
+    def send_commands_with_retry(self, commands: list[str]) -> list[str]:
+        return self._with_retry(" ".join(commands), lambda _: self.send_commands(commands))
 
     def send_command_no_response(self, command: str) -> None:
         """Send a fire-and-forget command (no response expected)."""
         with self._lock:
+            self._ensure_reader()
+            self._pace()
             self._write(command.encode("ascii"))
+            self._quiet_until = time.monotonic() + _FIRE_AND_FORGET_DELAY_S
             logger.debug("TX %s  (no response)", command)
-            time.sleep(_FIRE_AND_FORGET_DELAY_S)
-
-    def _read_bool_response(self) -> str:
-        """Read a ``1``/``0`` boolean response, tolerating missing ``#``.
-
-        Must be called while ``_lock`` is already held and after the
-        command bytes have been written.  Returns the raw buffer string
-        (``"1"`` or ``"0"``).
-        """
-        buf = ""
-        deadline = time.monotonic() + self.timeout_s
-        while time.monotonic() < deadline:
-            ch = self._try_read_one()
-            if ch is None:
-                if buf in ("1", "0"):
-                    time.sleep(0.05)
-                    extra = self._try_read_one()
-                    if extra and extra != "#":
-                        buf += extra
-                    break
-                time.sleep(0.01)
-                continue
-            if ch == "#":
-                break
-            buf += ch
-            if buf in ("1", "0"):
-                time.sleep(0.1)
-        return buf
 
     def send_command_bool(self, command: str) -> bool:
         """Send a command that returns ``1`` / ``0`` (possibly without ``#``).
 
         ZWO firmware is inconsistent — some boolean replies omit the ``#``.
-        This method tolerates both forms with a short post-read wait.
+        The framer completes on the digit and drops a ``#`` if one follows.
+        A timeout reads as ``False``.
         """
-        with self._lock:
-            self._clear_input()
-            self._write(command.encode("ascii"))
-            buf = self._read_bool_response()
-            logger.debug("TX %s  RX(bool) %s", command, buf)
-            return buf == "1"
+        buf = self._send_exclusive(command)
+        logger.debug("TX %s  RX(bool) %s", command, buf)
+        return buf == "1"
 
     def send_command_bool_with_retry(self, command: str) -> bool:
-        with self._lock:
-            last_error: Exception | None = None
-            for attempt in range(self.retry_count):
-                try:
-                    self._clear_input()
-                    self._write(command.encode("ascii"))
-                    buf = self._read_bool_response()
-                    logger.debug("TX %s  RX(bool) %s", command, buf)
-                    return buf == "1"
-                except Exception as exc:
-                    logger.warning("Bool cmd %r failed (%d/%d): %s", command, attempt + 1, self.retry_count, exc)
-                    last_error = exc
-                    time.sleep(0.1)
-            raise last_error  # type: ignore[misc]
+        return self._with_retry(command, self.send_command_bool)
 
     def send_goto_command(self, command: str) -> str:
         """Send a GoTo-style command whose success response is a bare ``0`` (no ``#``).
 
         LX200 `:MS#` returns ``0`` on success (no terminator) or an error
-        code like ``e6#`` / ``6#`` on failure.  Normal ``_read_until_hash``
-        would hang on the success case.
+        code like ``e6#`` / ``6#`` on failure.  Returns the response without
+        ``#`` (empty on timeout).
         """
-        with self._lock:
-            self._clear_input()
-            self._write(command.encode("ascii"))
+        buf = self._send_exclusive(command)
+        logger.debug("TX %s  RX(goto) %s%s", command, buf, "  [success]" if buf == "0" else "")
+        return buf
 
-            buf = ""
+    def _clear_input(self) -> None:
+        """Discard any buffered incoming bytes (e.g. trailing text after ``:SC``)."""
+        self._reset_input_buffer()
+        with self._cond:
+            if not any(not p.abandoned for p in self._in_flight):
+                self.stray_bytes += self._framer.discard()
+
+    def _settle(self) -> None:
+        """After a SHORT reply, wait until the line has been quiet for a moment and drop what arrived.
+
+        Caller holds ``_lock``, so nothing new is written meanwhile.  Like
+        fire-and-forget pacing, this runs on the next request rather than
+        blocking the command that produced the reply.
+        """
+        self._settle_pending = False
+        deadline = time.monotonic() + self.timeout_s
+        while True:
+            with self._cond:
+                quiet_at = self._last_rx + _SHORT_TRAILER_QUIET_S
+            now = time.monotonic()
+            if now >= quiet_at or now >= deadline:
+                break
+            time.sleep(min(quiet_at, deadline) - now)
+        self._clear_input()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Per-command-type round-trip histograms plus link counters."""
+        with self._cond:
+            return {
+                "in_flight": len(self._in_flight),
+                "stray_bytes": self.stray_bytes,
+                "timeouts": self.timeouts,
+                "latency": {name: hist.to_dict() for name, hist in sorted(self._latency.items())},
+            }
+
+    # ---- request pipeline ----
+
+    def _submit(self, command: str, kind: FrameKind) -> _PendingResponse:
+        """Queue a response slot for *command* and write it.  Blocks while ``max_in_flight`` are pending."""
+        with self._lock:
+            self._ensure_reader()
+            if self._settle_pending:
+                self._settle()
             deadline = time.monotonic() + self.timeout_s
-            while time.monotonic() < deadline:
-                ch = self._try_read_one()
-                if ch is None:
-                    if buf == "0":
-                        logger.debug("TX %s  RX(goto) %s  [success]", command, buf)
-                        return buf
-                    time.sleep(0.01)
-                    continue
-                if ch == "#":
-                    break
-                buf += ch
-                if buf == "0":
-                    time.sleep(0.15)
-                    extra = self._try_read_one()
-                    if extra is None:
-                        logger.debug("TX %s  RX(goto) %s  [success]", command, buf)
-                        return buf
-                    if extra == "#":
+            with self._cond:
+                while self._live_in_flight() >= self.max_in_flight:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise TimeoutError(f"Timed out waiting for a pipeline slot for {command!r}")
+                    self._cond.wait(remaining)
+                if not self._live_in_flight():
+                    # Nothing we still care about is outstanding: drop abandoned
+                    # slots and leftover bytes so the next response frames cleanly.
+                    self._in_flight.clear()
+                    self.stray_bytes += self._framer.discard()
+                pending = _PendingResponse(command=command, kind=kind, sent_at=time.monotonic())
+                self._in_flight.append(pending)
+            self._pace()
+            try:
+                pending.sent_at = time.monotonic()
+                self._write(command.encode("ascii"))
+            except Exception:
+                with self._cond:
+                    if pending in self._in_flight:
+                        self._in_flight.remove(pending)
+                raise
+            return pending
+
+    def _await(self, pending: _PendingResponse) -> str:
+        remaining = pending.sent_at + self.timeout_s - time.monotonic()
+        if not pending.done.wait(max(0.0, remaining)):
+            with self._cond:
+                if not pending.done.is_set():
+                    # Leave the slot queued so a late reply is consumed by it, not
+                    # by the next command; _submit drops it once nothing else is live.
+                    pending.abandoned = True
+                    self.timeouts += 1
+                    self._cond.notify_all()
+                    raise TimeoutError(
+                        f"Timed out waiting for response to {pending.command!r} (got so far: {self._framer.partial!r})"
+                    )
+        if pending.error is not None:
+            raise pending.error
+        assert pending.response is not None
+        return pending.response
+
+    def _send_exclusive(self, command: str) -> str:
+        """Run a ``SHORT``-reply command alone on the line; return its reply, or ``""`` on timeout."""
+        with self._lock:
+            with self._cond:
+                deadline = time.monotonic() + self.timeout_s
+                while self._live_in_flight():
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
                         break
-                    buf += extra
+                    self._cond.wait(remaining)
+            try:
+                return self._await(self._submit(command, FrameKind.SHORT))
+            except TimeoutError as exc:
+                logger.debug("%s", exc)
+                return ""
+            finally:
+                # Trailing text (``:SC``'s "Updating Planetary Data#") may
+                # still be on its way; the next request must not frame it.
+                self._settle_pending = True
+
+    def _with_retry(self, label: str, send: Callable[[str], _T]) -> _T:
+        last_error: Exception | None = None
+        for attempt in range(self.retry_count):
+            try:
+                return send(label)
+            except Exception as exc:
+                logger.warning("Command %r failed (attempt %d/%d): %s", label, attempt + 1, self.retry_count, exc)
+                last_error = exc
+        raise last_error  # type: ignore[misc]
 
-            logger.debug("TX %s  RX(goto) %s", command, buf)
-            return buf
+    def _live_in_flight(self) -> int:
+        return sum(1 for p in self._in_flight if not p.abandoned)
 
-    @abstractmethod
-    def _try_read_one(self) -> str | None:
-        """Non-blocking read of a single character, or ``None`` if nothing available."""
+    def _pace(self) -> None:
+        delay = self._quiet_until - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+
+    # ---- reader thread ----
+
+    def _ensure_reader(self) -> None:
+        if self._reader is not None and self._reader.is_alive():
+            return
+        if not self.is_open():
+            raise ConnectionError("Mount transport is not open")
+        self._reader_stop.clear()
+        self._reader_error = None
+        self._reader = threading.Thread(target=self._reader_loop, name="zwo-am-reader", daemon=True)
+        self._reader.start()
+
+    def _stop_reader(self) -> None:
+        """Stop the reader thread and fail anything still in flight.  Call before closing the handle."""
+        self._reader_stop.set()
+        reader, self._reader = self._reader, None
+        if reader is not None and reader is not threading.current_thread():
+            reader.join(timeout=_READ_SLICE_S * 4)
+        self._fail_in_flight(ConnectionError("Mount transport closed"))
+
+    def _reader_loop(self) -> None:
+        while not self._reader_stop.is_set():
+            try:
+                data = self._read_available()
+            except Exception as exc:
+                if self._reader_stop.is_set():
+                    return
+                logger.warning("Mount transport read failed: %s", exc)
+                self._reader_error = exc
+                self._fail_in_flight(ConnectionError(f"Mount transport read failed: {exc}"))
+                return
+            if data:
+                self._on_bytes(data)
+
+    def _on_bytes(self, data: bytes) -> None:
+        now = time.monotonic()
+        with self._cond:
+            self._last_rx = now
+            self._framer.feed(data)
+            while self._in_flight:
+                head = self._in_flight[0]
+                frame = self._framer.pop(head.kind)
+                if frame is None:
+                    break
+                self._in_flight.popleft()
+                if not head.abandoned:
+                    self._latency.setdefault(command_type(head.command), LatencyHistogram()).record(now - head.sent_at)
+                head.response = frame
+                head.done.set()
+                self._cond.notify_all()
+            if not self._in_flight:
+                self.stray_bytes += self._framer.discard()
+
+    def _fail_in_flight(self, error: Exception) -> None:
+        with self._cond:
+            while self._in_flight:
+                pending = self._in_flight.popleft()
+                pending.error = error
+                pending.done.set()
+            self._framer.discard()
+            self._cond.notify_all()
 
 
 # ---------------------------------------------------------------------------
@@ -203,8 +523,9 @@ class SerialTransport(ZwoAmTransport):
         baud_rate: int = DEFAULT_BAUD_RATE,
         timeout_s: float = DEFAULT_TIMEOUT_S,
         retry_count: int = DEFAULT_RETRY_COUNT,
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
     ) -> None:
-        super().__init__(timeout_s=timeout_s, retry_count=retry_count)
+        super().__init__(timeout_s=timeout_s, retry_count=retry_count, max_in_flight=max_in_flight)
         self.port_path = port
         self.baud_rate = baud_rate
         self._serial: Any = None
@@ -219,16 +540,22 @@ class SerialTransport(ZwoAmTransport):
                 bytesize=_serial.EIGHTBITS,
                 parity=_serial.PARITY_NONE,
                 stopbits=_serial.STOPBITS_ONE,
-                timeout=self.timeout_s,
+                timeout=_READ_SLICE_S,
                 write_timeout=self.timeout_s,
             )
             time.sleep(0.1)
+            self._serial.reset_input_buffer()
+            self._ensure_reader()
 
     def close(self) -> None:
         with self._lock:
-            if self._serial and self._serial.is_open:
-                self._serial.close()
-            self._serial = None
+            serial_port, self._serial = self._serial, None
+            self._reader_stop.set()
+            if serial_port is not None and hasattr(serial_port, "cancel_read"):
+                serial_port.cancel_read()
+            if serial_port is not None and serial_port.is_open:
+                serial_port.close()
+            self._stop_reader()
 
     def __del__(self) -> None:
         self.close()
@@ -241,33 +568,17 @@ class SerialTransport(ZwoAmTransport):
         self._serial.write(data)
         self._serial.flush()
 
-    def _read_until_hash(self) -> str:
-        assert self._serial is not None
-        buf = ""
-        deadline = time.monotonic() + self.timeout_s
-        while time.monotonic() < deadline:
-            raw = self._serial.read(1)
-            if raw:
-                ch = raw.decode("ascii", errors="replace")
-                buf += ch
-                if ch == "#":
-                    return buf
-            else:
-                time.sleep(0.01)
-        raise TimeoutError(f"Timed out waiting for response (got so far: {buf!r})")
+    def _read_available(self) -> bytes:
+        serial_port = self._serial
+        if serial_port is None:
+            raise ConnectionError("Serial port closed")
+        # Returns as soon as anything arrives, or after the port's read timeout.
+        return serial_port.read(serial_port.in_waiting or 1)
 
-    def _clear_input(self) -> None:
+    def _reset_input_buffer(self) -> None:
         if self._serial:
             self._serial.reset_input_buffer()
 
-    def _try_read_one(self) -> str | None:
-        assert self._serial is not None
-        if self._serial.in_waiting:
-            raw = self._serial.read(1)
-            if raw:
-                return raw.decode("ascii", errors="replace")
-        return None
-
 
 # ---------------------------------------------------------------------------
 # TCP (WiFi) transport
@@ -283,8 +594,9 @@ class TcpTransport(ZwoAmTransport):
         port: int,
         timeout_s: float = DEFAULT_TIMEOUT_S,
         retry_count: int = DEFAULT_RETRY_COUNT,
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
     ) -> None:
-        super().__init__(timeout_s=timeout_s, retry_count=retry_count)
+        super().__init__(timeout_s=timeout_s, retry_count=retry_count, max_in_flight=max_in_flight)
         self.host = host
         self.tcp_port = port
         self._sock: socket.socket | None = None
@@ -294,17 +606,21 @@ class TcpTransport(ZwoAmTransport):
             self._sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
             self._sock.settimeout(self.timeout_s)
             self._sock.connect((self.host, self.tcp_port))
+            self._sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
             time.sleep(0.1)
+            self._ensure_reader()
 
     def close(self) -> None:
         with self._lock:
-            if self._sock:
+            sock, self._sock = self._sock, None
+            self._reader_stop.set()
+            if sock:
                 try:
-                    self._sock.shutdown(socket.SHUT_RDWR)
+                    sock.shutdown(socket.SHUT_RDWR)
                 except OSError:
                     pass
-                self._sock.close()
-            self._sock = None
+                sock.close()
+            self._stop_reader()
 
     def __del__(self) -> None:
         self.close()
@@ -316,45 +632,14 @@ class TcpTransport(ZwoAmTransport):
         assert self._sock is not None
         self._sock.sendall(data)
 
-    def _read_until_hash(self) -> str:
-        assert self._sock is not None
-        buf = ""
-        deadline = time.monotonic() + self.timeout_s
-        while time.monotonic() < deadline:
-            try:
-                raw = self._sock.recv(1)
-            except TimeoutError:
-                continue
-            if raw:
-                ch = raw.decode("ascii", errors="replace")
-                buf += ch
-                if ch == "#":
-                    return buf
-        raise TimeoutError(f"Timed out waiting for TCP response (got so far: {buf!r})")
-
-    def _clear_input(self) -> None:
-        if self._sock is None:
-            return
-        self._sock.setblocking(False)
-        try:
-            while True:
-                data = self._sock.recv(256)
-                if not data:
-                    break
-        except BlockingIOError:
-            pass
-        finally:
-            self._sock.settimeout(self.timeout_s)
-
-    def _try_read_one(self) -> str | None:
-        assert self._sock is not None
-        self._sock.setblocking(False)
-        try:
-            raw = self._sock.recv(1)
-            if raw:
-                return raw.decode("ascii", errors="replace")
-        except BlockingIOError:
-            pass
-        finally:
-            self._sock.settimeout(self.timeout_s)
-        return None
+    def _read_available(self) -> bytes:
+        sock = self._sock
+        if sock is None:
+            raise ConnectionError("Socket closed")
+        ready, _, _ = select.select([sock], [], [], _READ_SLICE_S)
+        if not ready:
+            return b""
+        data = sock.recv(4096)
+        if not data:
+            raise ConnectionError("Connection closed by mount")
+        return data
@@ -1210,6 +1210,14 @@ class DirectHardwareAdapter(AbstractAstroHardwareAdapter):
             return False
         return self._mount.is_slewing()
 
+    def wait_for_telescope_idle(
+        self, timeout: float | None = None, cancelled: Callable[[], bool] | None = None
+    ) -> bool:
+        """Wait on the mount state cache's change notifications rather than polling the mount."""
+        if self._mount_cache is not None and self._mount_cache.is_running:
+            return self._mount_cache.wait_until_idle(timeout=timeout, cancelled=cancelled)
+        return super().wait_for_telescope_idle(timeout=timeout, cancelled=cancelled)
+
     def select_camera(self, device_name: str) -> bool:
         """Select camera device (not applicable for direct control).
 
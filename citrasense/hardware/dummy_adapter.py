@@ -26,6 +26,7 @@ from citrasense.hardware.abstract_astro_hardware_adapter import (
     SettingSchemaEntry,
 )
 from citrasense.hardware.devices.camera.abstract_camera import AbstractCamera
+from citrasense.hardware.devices.camera.fits_writer import write_capture_fits
 from citrasense.hardware.devices.focuser.abstract_focuser import AbstractFocuser
 from citrasense.hardware.devices.mount.abstract_mount import AbstractMount
 from citrasense.hardware.devices.mount.mount_state_cache import MountStateCache
@@ -826,7 +827,7 @@ class DummyAdapter(AbstractAstroHardwareAdapter):
         hdu.header["EXPTIME"] = (exposure_duration_seconds, "Exposure time (seconds)")
         hdu.header["DATE-OBS"] = (date_obs_str, "UTC start of exposure")
         hdu.header["TASKID"] = task_id
-        hdu.writeto(filepath, overwrite=True)
+        write_capture_fits(hdu, filepath)
 
         self.logger.info(f"DummyAdapter: Image saved to {filepath}")
         return str(filepath)
@@ -1,3 +1,17 @@
-from citrasense.hardware.indi.indi_adapter import IndiAdapter
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from citrasense.hardware.indi.indi_adapter import IndiAdapter
 
 __all__ = ["IndiAdapter"]
+
+
+def __getattr__(name: str):
+    # Lazy: importing the adapter pulls in PyIndi, which blob_sink and its tests don't need.
+    if name == "IndiAdapter":
+        from citrasense.hardware.indi.indi_adapter import IndiAdapter
+
+        return IndiAdapter
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,218 @@
+"""Off-thread persistence for INDI BLOB payloads.
+
+PyIndi delivers BLOBs on the client's single callback thread, so writing a
+large frame to disk there stalls every other property update (mount
+coordinates, exposure state) until the write completes.  :class:`IndiBlobSink`
+moves the write to a dedicated thread: the callback only copies the payload
+out of the INDI buffer and enqueues it.
+
+``take_image`` arms the sink with :meth:`IndiBlobSink.expect` before
+starting the exposure and blocks on the returned :class:`BlobFrame` —
+woken by an event when the file is on disk, rather than sleep-polling.
+
+The sink has no PyIndi dependency; the adapter hands it plain bytes.
+"""
+
+from __future__ import annotations
+
+import logging
+import queue
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+
+# Payloads waiting for the writer.  A full queue blocks the INDI thread for at
+# most _ENQUEUE_TIMEOUT_S (backpressure) before the frame is failed.
+DEFAULT_MAX_PENDING = 4
+_ENQUEUE_TIMEOUT_S = 5.0
+
+
+@dataclass
+class BlobFrame:
+    """One expected image BLOB, from arming through the disk write.
+
+    Attributes:
+        task_id: Task the frame belongs to.
+        path: Where the payload is (or will be) written.
+        size_bytes: Payload size once received.
+        received_at: ``time.monotonic()`` when the INDI callback handed the payload over.
+        written_at: ``time.monotonic()`` when the file was closed.
+        error: Why the frame failed, if it did.
+    """
+
+    task_id: str
+    path: Path
+    size_bytes: int = 0
+    received_at: float | None = None
+    written_at: float | None = None
+    error: str | None = None
+    _received: threading.Event = field(default_factory=threading.Event, repr=False)
+    _done: threading.Event = field(default_factory=threading.Event, repr=False)
+
+    @property
+    def received(self) -> bool:
+        return self._received.is_set()
+
+    @property
+    def done(self) -> bool:
+        return self._done.is_set()
+
+    @property
+    def succeeded(self) -> bool:
+        return self.done and self.error is None
+
+    @property
+    def receive_to_disk_seconds(self) -> float | None:
+        if self.received_at is None or self.written_at is None:
+            return None
+        return self.written_at - self.received_at
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """Block until the frame is written or has failed."""
+        return self._done.wait(timeout)
+
+    def _finish(self, error: str | None = None) -> None:
+        self.error = error
+        self._done.set()
+
+
+class IndiBlobSink:
+    """Single writer thread persisting image BLOBs for the task that armed it."""
+
+    def __init__(self, images_dir: Path, logger: logging.Logger | None = None, max_pending: int = DEFAULT_MAX_PENDING):
+        """
+        Args:
+            images_dir: Directory frames are written to
+            logger: Logger instance
+            max_pending: Received payloads buffered for the writer
+        """
+        self.images_dir = Path(images_dir)
+        self.logger = logger or logging.getLogger(__name__)
+        self._queue: queue.Queue[tuple[BlobFrame, bytes | bytearray] | None] = queue.Queue(maxsize=max(1, max_pending))
+        self._lock = threading.Lock()
+        self._armed: BlobFrame | None = None
+        self._thread: threading.Thread | None = None
+
+        self.frames_written = 0
+        self.frames_failed = 0
+        self.unsolicited = 0
+        self.bytes_written = 0
+        self.last_latency_s: float | None = None
+        self._latency_total_s = 0.0
+
+    # ── INDI side ──────────────────────────────────────────────────────
+
+    def expect(self, task_id: str) -> BlobFrame:
+        """Arm the sink: the next BLOB is written for *task_id*.  Re-arming fails any frame still armed."""
+        frame = BlobFrame(task_id=task_id, path=self.images_dir / f"citra_task_{task_id}_image.fits")
+        with self._lock:
+            previous, self._armed = self._armed, frame
+        if previous is not None:
+            previous._finish("superseded before its BLOB arrived")
+        return frame
+
+    def disarm(self, frame: BlobFrame, reason: str = "cancelled") -> None:
+        """Stop waiting for *frame*'s BLOB (no-op if it already arrived)."""
+        with self._lock:
+            if self._armed is not frame:
+                return
+            self._armed = None
+        frame._finish(reason)
+
+    def submit(self, payload: bytes | bytearray, fmt: str = "") -> BlobFrame | None:
+        """Hand a received payload to the writer.  Called on the INDI callback thread.
+
+        *payload* must already be a copy (the INDI buffer is reused once the
+        callback returns).  Returns the frame it was bound to, or ``None`` if
+        nothing was armed (unsolicited BLOB — e.g. a looping preview).
+        """
+        received_at = time.monotonic()
+        with self._lock:
+            frame, self._armed = self._armed, None
+        if frame is None:
+            with self._lock:
+                self.unsolicited += 1
+            self.logger.debug(f"Ignoring unsolicited BLOB ({len(payload)} bytes, format {fmt!r})")
+            return None
+
+        frame.received_at = received_at
+        frame.size_bytes = len(payload)
+        frame._received.set()
+        self._ensure_started()
+        try:
+            self._queue.put((frame, payload), timeout=_ENQUEUE_TIMEOUT_S)
+        except queue.Full:
+            self._fail(frame, "BLOB writer backlog full")
+        return frame
+
+    # ── Writer thread ──────────────────────────────────────────────────
+
+    def _writer_loop(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            frame, payload = item
+            try:
+                with open(frame.path, "wb") as f:
+                    f.write(payload)
+            except OSError as e:
+                self.logger.error(f"Failed to write {frame.path}: {e}")
+                self._fail(frame, str(e))
+                continue
+            frame.written_at = time.monotonic()
+            latency = frame.receive_to_disk_seconds or 0.0
+            with self._lock:
+                self.frames_written += 1
+                self.bytes_written += frame.size_bytes
+                self.last_latency_s = latency
+                self._latency_total_s += latency
+            self.logger.info(f"Saved {frame.path} ({frame.size_bytes} bytes, {latency * 1000:.1f} ms receive-to-disk)")
+            frame._finish()
+
+    def _fail(self, frame: BlobFrame, error: str) -> None:
+        with self._lock:
+            self.frames_failed += 1
+        frame._finish(error)
+
+    # ── Lifecycle / stats ──────────────────────────────────────────────
+
+    def _ensure_started(self) -> None:
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._thread = threading.Thread(target=self._writer_loop, name="IndiBlobWriter", daemon=True)
+            self._thread.start()
+
+    def start(self) -> None:
+        """Start the writer thread (also started lazily on the first BLOB)."""
+        self._ensure_started()
+
+    def stop(self, timeout: float = 10.0) -> None:
+        """Finish queued writes, then stop the writer.  An armed frame is failed."""
+        with self._lock:
+            armed, self._armed = self._armed, None
+            thread, self._thread = self._thread, None
+        if armed is not None:
+            armed._finish("BLOB sink stopped")
+        if thread is not None:
+            self._queue.put(None)
+            thread.join(timeout)
+
+    def get_stats(self) -> dict:
+        """Lifetime counters and receive-to-disk latency."""
+        with self._lock:
+            return {
+                "frames_written": self.frames_written,
+                "frames_failed": self.frames_failed,
+                "unsolicited": self.unsolicited,
+                "bytes_written": self.bytes_written,
+                "pending": self._queue.qsize(),
+                "last_receive_to_disk_ms": (
+                    round(self.last_latency_s * 1000, 2) if self.last_latency_s is not None else None
+                ),
+                "avg_receive_to_disk_ms": (
+                    round(self._latency_total_s / self.frames_written * 1000, 2) if self.frames_written else None
+                ),
+            }
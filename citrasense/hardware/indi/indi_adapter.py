@@ -9,6 +9,10 @@ from citrasense.hardware.abstract_astro_hardware_adapter import (
     ObservationStrategy,
     SettingSchemaEntry,
 )
+from citrasense.hardware.indi.blob_sink import IndiBlobSink
+
+# take_image wakes this often to notice an exposure that ended without a BLOB.
+_BLOB_WAIT_SLICE_S = 0.5
 
 
 # The IndiClient class which inherits from the module PyIndi.BaseClient class
@@ -40,8 +44,9 @@ class IndiAdapter(PyIndi.BaseClient, AbstractAstroHardwareAdapter):
         # slots for any code path that accidentally used ``IndiAdapter._x``
         # instead of ``self._x``.  Multi-sensor deployments construct one
         # IndiAdapter per telescope sensor — keep the state local.
-        self._current_task_id: str = ""
-        self._last_saved_filename: str = ""
+        # Image BLOBs are written off the INDI callback thread; take_image
+        # arms the sink and waits on the returned frame.
+        self.blob_sink = IndiBlobSink(images_dir, logger=self.logger)
         self._alignment_offset_ra: float = 0.0
         self._alignment_offset_dec: float = 0.0
 
@@ -137,14 +142,9 @@ class IndiAdapter(PyIndi.BaseClient, AbstractAstroHardwareAdapter):
                 size = blobProperty[0].getSize()
                 self.logger.debug(f"Received BLOB of format {format}, size {size}, length {bloblen}")
 
-                # if there's a task underway, save the image to a file
-                if self._current_task_id != "":
-                    self._last_saved_filename = str(self.images_dir / f"citra_task_{self._current_task_id}_image.fits")
-                    for b in blobProperty:
-                        with open(self._last_saved_filename, "wb") as f:
-                            f.write(b.getblobdata())
-                            self.logger.info(f"Saved {self._last_saved_filename}")
-                    self._current_task_id = ""
+                # getblobdata() returns a copy of the INDI buffer; hand it to the
+                # writer thread — the disk write must not block this callback.
+                self.blob_sink.submit(blobProperty[0].getblobdata(), format)
         except Exception as e:
             self.logger.error(f"Error processing updated property {p.getName()}: {e}")
 
@@ -171,9 +171,9 @@ class IndiAdapter(PyIndi.BaseClient, AbstractAstroHardwareAdapter):
     def newBLOB(self, bp):
         """INDI BLOB arrival callback.
 
-        Actual image persistence happens in :meth:`updateProperty` where we
-        have access to the current task id and can write into the sensor's
-        ``images_dir``. Writing ``image.fits`` into the process CWD here
+        Actual image persistence happens in :meth:`updateProperty`, which
+        hands the payload to :attr:`blob_sink` — it knows the current task
+        and writes into the sensor's ``images_dir``. Writing ``image.fits`` into the process CWD here
         would clobber between multiple INDI sensors sharing one daemon.
         """
         try:
@@ -185,6 +185,7 @@ class IndiAdapter(PyIndi.BaseClient, AbstractAstroHardwareAdapter):
     # ========================= AstroHardwareAdapter Methods =========================
 
     def connect(self) -> bool:
+        self.blob_sink.start()
         self.setServer(self.host, self.port)
         connected = self.connectServer()
 
@@ -339,6 +340,7 @@ class IndiAdapter(PyIndi.BaseClient, AbstractAstroHardwareAdapter):
 
     def disconnect(self):
         self.disconnectServer()
+        self.blob_sink.stop()
 
     def is_telescope_connected(self) -> bool:
         """Check if telescope is connected and responsive."""
@@ -606,23 +608,27 @@ class IndiAdapter(PyIndi.BaseClient, AbstractAstroHardwareAdapter):
             return None
 
         self.logger.info(f"Taking {exposure_duration_seconds} second exposure...")
-        self._current_task_id = task_id
+        frame = self.blob_sink.expect(task_id)
 
         try:
             ccd_exposure[0].setValue(exposure_duration_seconds)
             self.sendNewNumber(ccd_exposure)
         except Exception as e:
             self.logger.error(f"Error sending exposure command to camera: {e}")
-            self._current_task_id = ""
+            self.blob_sink.disarm(frame)
             return None
 
-        while self.is_camera_busy() and self._current_task_id != "":
-            self.logger.debug("Waiting for camera to finish exposure...")
-            time.sleep(0.2)
-
-        filename = self._last_saved_filename
-        self._last_saved_filename = ""
-        return filename
+        # Woken as soon as the frame is on disk; the periodic wake only checks
+        # for an exposure that finished (or failed) without sending a BLOB.
+        while not frame.wait(_BLOB_WAIT_SLICE_S):
+            if not frame.received and not self.is_camera_busy():
+                # No-op if the BLOB arrived in the meantime: keep waiting for its write.
+                self.blob_sink.disarm(frame, "exposure ended without a BLOB")
+
+        if not frame.succeeded:
+            self.logger.error(f"No image saved for task {task_id}: {frame.error}")
+            return ""
+        return str(frame.path)
 
     def is_camera_busy(self) -> bool:
         """Check if the camera is currently busy taking an image."""
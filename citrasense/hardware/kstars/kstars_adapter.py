@@ -11,6 +11,14 @@ from citrasense.hardware.abstract_astro_hardware_adapter import (
     ObservationStrategy,
     SettingSchemaEntry,
 )
+from citrasense.hardware.capture_watcher import CaptureWatcher
+
+# Scheduler status is read over D-Bus on this period while waiting; new image
+# files wake the wait immediately via the CaptureWatcher.  (dbus-python only
+# dispatches the scheduler's newStatus signal with a GLib main loop, which the
+# adapter doesn't run.)
+_SCHEDULER_POLL_S = 1.0
+_SCHEDULER_STOP_TIMEOUT_S = 2.0
 
 
 class KStarsDBusAdapter(AbstractAstroHardwareAdapter):
@@ -95,6 +103,8 @@ class KStarsDBusAdapter(AbstractAstroHardwareAdapter):
         self._ekos_mount: dbus.Interface | None = None
         self._ekos_camera: dbus.Interface | None = None
         self.scheduler: dbus.Interface | None = None
+        # Last frame on disk -> images handed back to the caller, for the most recent task
+        self.last_capture_tail_seconds: float | None = None
 
     @classmethod
     def get_settings_schema(cls, **kwargs) -> list[SettingSchemaEntry]:
@@ -421,16 +431,28 @@ class KStarsDBusAdapter(AbstractAstroHardwareAdapter):
         self.logger.info(f"Created scheduler job: {job_file}")
         return job_file
 
-    def _wait_for_job_completion(self, timeout: int = 300, task_id: str = "", output_dir: Path | None = None) -> bool:
+    def _wait_for_job_completion(
+        self,
+        timeout: int = 300,
+        task_id: str = "",
+        output_dir: Path | None = None,
+        watcher: CaptureWatcher | None = None,
+    ) -> bool:
         """
-        Poll the scheduler status until job completes or times out.
-        With Loop completion, we poll for images and stop when we have all expected images.
+        Wait until the scheduler job completes or times out.
+        With Loop completion, we watch for images and stop when we have all expected images.
         For multi-filter sequences, waits until images from all filters are captured.
 
+        New images are picked up through a :class:`CaptureWatcher` on the
+        task directory (inotify, or a fast rescan), so the wait ends as soon
+        as the last frame is closed rather than on the next poll.
+
         Args:
             timeout: Maximum time to wait in seconds
             task_id: Task identifier for image detection
             output_dir: Output directory for image detection
+            watcher: Already-running watcher on ``output_dir / task_id``; one is
+                created for the duration of the wait if omitted
 
         Returns:
             True if job completed successfully, False otherwise
@@ -438,6 +460,10 @@ class KStarsDBusAdapter(AbstractAstroHardwareAdapter):
         if not self.scheduler:
             raise RuntimeError("Scheduler interface not connected")
 
+        if watcher is None and task_id and output_dir:
+            with CaptureWatcher(output_dir / task_id, logger=self.logger) as own_watcher:
+                return self._wait_for_job_completion(timeout, task_id, output_dir, own_watcher)
+
         assert self.bus is not None
 
         # Calculate expected number of images based on enabled filters
@@ -448,34 +474,37 @@ class KStarsDBusAdapter(AbstractAstroHardwareAdapter):
 
         self.logger.info(
             f"Waiting for scheduler job completion (timeout: {timeout}s, "
-            f"expecting {expected_total_images} images across {enabled_filter_count} filters)..."
+            f"expecting {expected_total_images} images across {enabled_filter_count} filters, "
+            f"watching via {watcher.backend if watcher else 'none'})..."
         )
-        start_time = time.time()
+        deadline = time.monotonic() + timeout
 
         # Get scheduler object for property access
         scheduler_obj = self.bus.get_object(self.bus_name, "/KStars/Ekos/Scheduler")
         props = dbus.Interface(scheduler_obj, "org.freedesktop.DBus.Properties")
 
-        while time.time() - start_time < timeout:
+        seen = 0
+        while time.monotonic() < deadline:
             try:
-                # Get scheduler status (0=Idle, 1=Running, 2=Paused, etc.)
-                status = int(props.Get("org.kde.kstars.Ekos.Scheduler", "status"))
-                current_job = props.Get("org.kde.kstars.Ekos.Scheduler", "currentJobName")
-
-                self.logger.debug(f"Scheduler status: {status}, Current job: {current_job}")
-
                 # Check for images if we're using Loop completion
-                if task_id and output_dir:
-                    images = self._retrieve_captured_images(task_id, output_dir)
+                if watcher is not None:
+                    images = watcher.files()
                     if len(images) >= expected_total_images:
                         self.logger.info(
                             f"Found {len(images)} images (expected {expected_total_images}), stopping scheduler"
                         )
                         self.scheduler.stop()
-                        time.sleep(1)  # Give it time to stop
+                        self._wait_for_scheduler_idle(props)
                         return True
-                    elif images:
-                        self.logger.debug(f"Found {len(images)}/{expected_total_images} images so far, continuing...")
+                    if len(images) > seen:
+                        seen = len(images)
+                        self.logger.debug(f"Found {seen}/{expected_total_images} images so far, continuing...")
+
+                # Get scheduler status (0=Idle, 1=Running, 2=Paused, etc.)
+                status = int(props.Get("org.kde.kstars.Ekos.Scheduler", "status"))
+                current_job = props.Get("org.kde.kstars.Ekos.Scheduler", "currentJobName")
+
+                self.logger.debug(f"Scheduler status: {status}, Current job: {current_job}")
 
                 # Status 0 = Idle, meaning job finished or not started
                 # If we were running and now idle, job completed
@@ -483,7 +512,11 @@ class KStarsDBusAdapter(AbstractAstroHardwareAdapter):
                     self.logger.info("Scheduler job completed")
                     return True
 
-                time.sleep(5)  # Poll every 5 seconds (slower since we're checking files)
+                wait_s = min(_SCHEDULER_POLL_S, max(0.0, deadline - time.monotonic()))
+                if watcher is not None:
+                    watcher.wait_for(expected_total_images, timeout=wait_s)
+                else:
+                    time.sleep(wait_s)
 
             except dbus.DBusException as e:
                 if "ServiceUnknown" in str(e) or "NoReply" in str(e):
@@ -498,6 +531,17 @@ class KStarsDBusAdapter(AbstractAstroHardwareAdapter):
         self.logger.error(f"Scheduler job did not complete within {timeout}s")
         return False
 
+    def _wait_for_scheduler_idle(self, props) -> None:
+        """After ``scheduler.stop()``, wait (briefly) for Ekos to report Idle before the next job is loaded."""
+        deadline = time.monotonic() + _SCHEDULER_STOP_TIMEOUT_S
+        while time.monotonic() < deadline:
+            try:
+                if int(props.Get("org.kde.kstars.Ekos.Scheduler", "status")) == 0:
+                    return
+            except dbus.DBusException:
+                return
+            time.sleep(0.1)
+
     def _retrieve_captured_images(self, task_id: str, output_dir: Path) -> list[str]:
         """
         Find and return paths to captured images for this task.
@@ -590,17 +634,19 @@ class KStarsDBusAdapter(AbstractAstroHardwareAdapter):
             job_file = self._create_scheduler_job(task.id, satellite_data, sequence_file)
 
             # Ensure temp files are cleaned up even on failure
-            try:
-                self._execute_observation(task.id, output_dir, sequence_file, job_file)
-            finally:
-                # Cleanup temp files
-                self._cleanup_temp_files(sequence_file, job_file)
+            with CaptureWatcher(task_output_dir, logger=self.logger) as watcher:
+                try:
+                    self._execute_observation(task.id, output_dir, sequence_file, job_file, watcher=watcher)
+                finally:
+                    # Cleanup temp files
+                    self._cleanup_temp_files(sequence_file, job_file)
 
-            # Retrieve and return captured images
-            image_paths = self._retrieve_captured_images(task.id, output_dir)
+            # The watcher already holds every finished frame; only rescan if it saw nothing
+            image_paths = watcher.files() or self._retrieve_captured_images(task.id, output_dir)
             if not image_paths:
                 raise RuntimeError(f"No images captured for task {task.id}")
 
+            self._record_capture_tail(image_paths)
             self.logger.info(f"Observation sequence complete: {len(image_paths)} images captured")
             return image_paths
 
@@ -608,7 +654,14 @@ class KStarsDBusAdapter(AbstractAstroHardwareAdapter):
             self.logger.error(f"Failed to execute observation sequence: {e}")
             raise
 
-    def _execute_observation(self, task_id: str, output_dir: Path, sequence_file: Path, job_file: Path):
+    def _execute_observation(
+        self,
+        task_id: str,
+        output_dir: Path,
+        sequence_file: Path,
+        job_file: Path,
+        watcher: CaptureWatcher | None = None,
+    ):
         """Execute the observation by loading scheduler job and waiting for completion.
 
         Args:
@@ -616,6 +669,7 @@ class KStarsDBusAdapter(AbstractAstroHardwareAdapter):
             output_dir: Base output directory
             sequence_file: Path to ESQ sequence file
             job_file: Path to ESL scheduler job file
+            watcher: Watcher on the task directory, forwarded to the completion wait
         """
         assert self.scheduler is not None
         assert self.bus is not None
@@ -707,10 +761,19 @@ class KStarsDBusAdapter(AbstractAstroHardwareAdapter):
         except Exception as e:
             self.logger.debug(f"Could not read scheduler logs: {e}")
 
-        # Wait for completion (with Loop mode, this polls for images and stops when found)
-        if not self._wait_for_job_completion(timeout=300, task_id=task_id, output_dir=output_dir):
+        # Wait for completion (with Loop mode, this watches for images and stops when found)
+        if not self._wait_for_job_completion(timeout=300, task_id=task_id, output_dir=output_dir, watcher=watcher):
             raise RuntimeError("Scheduler job did not complete in time")
 
+    def _record_capture_tail(self, image_paths: list[str]) -> None:
+        """Log the dead time between the last frame hitting disk and the images being handed off."""
+        try:
+            last_written = max(Path(p).stat().st_mtime for p in image_paths)
+        except OSError:
+            return
+        self.last_capture_tail_seconds = max(0.0, time.time() - last_written)
+        self.logger.info(f"Capture tail latency: {self.last_capture_tail_seconds:.2f}s (last frame written -> handoff)")
+
     def _cleanup_temp_files(self, sequence_file: Path, job_file: Path):
         """Clean up temporary ESQ and ESL files.
 
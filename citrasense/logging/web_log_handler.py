@@ -1,18 +1,68 @@
-"""Log handler that streams logs to web clients via WebSocket."""
+"""Log handler that streams logs to web clients via WebSocket.
+
+Records are buffered in two places: a history deque served by
+``GET /api/logs``, and a bounded pending ring that the web event loop
+drains every :attr:`WebLogHandler.flush_interval` seconds into one
+``{"type": "logs"}`` frame.  The handler schedules at most one flush
+callback per interval no matter how many lines arrive, so a chatty DEBUG
+session can't flood the loop with per-line coroutines.
+
+Each frame carries at most ``max_lines_per_second * flush_interval``
+entries.  Over budget, WARNING and above are kept first, then INFO, and
+DEBUG is evenly sampled into whatever room is left; everything else is
+counted per level and reported in the frame's ``dropped`` field (and in
+:meth:`WebLogHandler.get_stats`).
+"""
 
 import asyncio
 import logging
-from collections import deque
+import re
+import threading
+from collections import Counter, deque
+from datetime import datetime
 
+_ANSI_RE = re.compile(r"\x1b\[\d+m")
+# Routine web chatter hidden from the web panel below ERROR (mirrors ExcludeWebLogsFilter).
+_ROUTINE_RE = re.compile(r"WebSocket|HTTP Request:")
+_PREFIX = "citrasense."
+
+DEFAULT_FLUSH_INTERVAL_S = 0.25
+DEFAULT_MAX_LINES_PER_SECOND = 200
+DEFAULT_MAX_PENDING = 5000
 
-class WebLogHandler(logging.Handler):
-    """Custom log handler that buffers logs and makes them available to web clients."""
 
-    def __init__(self, max_logs: int = 1000):
+class WebLogHandler(logging.Handler):
+    """Custom log handler that buffers logs and streams them to web clients in rate-limited batches."""
+
+    def __init__(
+        self,
+        max_logs: int = 1000,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL_S,
+        max_lines_per_second: int = DEFAULT_MAX_LINES_PER_SECOND,
+        max_pending: int = DEFAULT_MAX_PENDING,
+    ):
+        """
+        Args:
+            max_logs: History entries kept for ``GET /api/logs``
+            flush_interval: Seconds between streamed frames
+            max_lines_per_second: Streaming budget; excess lines are dropped or sampled by level
+            max_pending: Ring capacity between flushes; the oldest lines are dropped beyond it
+        """
         super().__init__()
         self.log_buffer = deque(maxlen=max_logs)
         self.web_app = None
         self.loop = None
+        self.flush_interval = flush_interval
+        self.max_lines_per_second = max_lines_per_second
+
+        self._pending: deque[tuple[int, dict]] = deque(maxlen=max_pending)
+        self._pending_lock = threading.Lock()
+        self._flush_scheduled = False
+        self._dropped: Counter[str] = Counter()  # since the last frame
+        # Broadcast tasks in flight; the loop only holds weak references to them.
+        self._broadcasts: set[asyncio.Task] = set()
+        self._stats = {"emitted": 0, "streamed": 0, "frames": 0}
+        self._dropped_total: Counter[str] = Counter()
 
     def set_web_app(self, web_app, loop=None):
         """Set the web app instance for broadcasting logs."""
@@ -22,26 +72,16 @@ class WebLogHandler(logging.Handler):
     def emit(self, record):
         """Emit a log record."""
         try:
+            message = record.getMessage()
             # Filter out routine web-related logs from the web UI
             # but keep ERROR and CRITICAL level messages
             if record.levelno < logging.ERROR:
-                if (
-                    record.name.startswith("uvicorn")
-                    or "WebSocket" in record.getMessage()
-                    or "HTTP Request:" in record.getMessage()
-                ):
+                if record.name.startswith("uvicorn") or _ROUTINE_RE.search(message):
                     return
 
-            # Get the original levelname without color codes
             # Record.levelname might have ANSI codes from ColoredFormatter
-            level = record.levelname
-            # Strip ANSI codes from level if present
-            import re
-
-            level = re.sub(r"\x1b\[\d+m", "", level)
-
-            _prefix = "citrasense."
-            short_name = record.name[len(_prefix) :] if record.name.startswith(_prefix) else record.name
+            level = _ANSI_RE.sub("", record.levelname)
+            short_name = record.name[len(_PREFIX) :] if record.name.startswith(_PREFIX) else record.name
 
             # ``sensor_id`` is populated by a LoggerAdapter in per-sensor
             # scopes (SensorRuntime, TelescopeSensor, managers, …) so the web
@@ -52,29 +92,28 @@ class WebLogHandler(logging.Handler):
             log_entry = {
                 "timestamp": self.format_time(record),
                 "level": level,
-                "message": record.getMessage(),
+                "message": message,
                 "module": short_name,
                 "sensor_id": sensor_id,
             }
             self.log_buffer.append(log_entry)
 
-            # Broadcast to web clients if available
-            if self.web_app and hasattr(self.web_app, "broadcast_log") and self.loop:
-                # Schedule the broadcast in the web server's event loop
-                try:
-                    if self.loop.is_running():
-                        asyncio.run_coroutine_threadsafe(self.web_app.broadcast_log(log_entry), self.loop)
-                except Exception:
-                    # Silently fail if we can't broadcast
-                    pass
+            with self._pending_lock:
+                self._stats["emitted"] += 1
+                if len(self._pending) == self._pending.maxlen:
+                    self._drop(self._pending[0][1]["level"])
+                self._pending.append((record.levelno, log_entry))
+                arm = not self._flush_scheduled and self.web_app is not None and self.loop is not None
+                if arm:
+                    self._flush_scheduled = True
+            if arm:
+                self._arm_flush()
 
         except Exception:
             self.handleError(record)
 
     def format_time(self, record):
         """Format the timestamp."""
-        from datetime import datetime
-
         return datetime.fromtimestamp(record.created).isoformat()
 
     def get_recent_logs(self, limit: int | None = None):
@@ -82,3 +121,80 @@ class WebLogHandler(logging.Handler):
         if limit:
             return list(self.log_buffer)[-limit:]
         return list(self.log_buffer)
+
+    def get_stats(self) -> dict:
+        """Lifetime counters: lines emitted, streamed, frames sent and lines dropped per level."""
+        with self._pending_lock:
+            return dict(self._stats, pending=len(self._pending), dropped=dict(self._dropped_total))
+
+    # ── Streaming ──────────────────────────────────────────────────────
+
+    def drain(self) -> tuple[list[dict], dict[str, int]]:
+        """Take the pending lines for one frame, applying the rate budget.
+
+        Returns ``(entries, dropped)``: the entries to send, oldest first,
+        and per-level counts of lines dropped since the previous frame.
+        """
+        budget = max(1, int(self.max_lines_per_second * self.flush_interval))
+        with self._pending_lock:
+            pending = list(self._pending)
+            self._pending.clear()
+            self._flush_scheduled = False
+
+            if len(pending) > budget:
+                keep = _select_by_level(pending, budget)
+                for i, (_, entry) in enumerate(pending):
+                    if i not in keep:
+                        self._drop(entry["level"])
+                pending = [pending[i] for i in sorted(keep)]
+
+            dropped = dict(self._dropped)
+            self._dropped.clear()
+            self._stats["streamed"] += len(pending)
+            if pending or dropped:
+                self._stats["frames"] += 1
+        return [entry for _, entry in pending], dropped
+
+    def _drop(self, level: str) -> None:
+        self._dropped[level] += 1
+        self._dropped_total[level] += 1
+
+    def _arm_flush(self) -> None:
+        loop = self.loop
+        try:
+            if loop is not None and loop.is_running():
+                loop.call_soon_threadsafe(loop.call_later, self.flush_interval, self._start_flush)
+                return
+        except RuntimeError:
+            pass  # loop closed between the check and the call
+        with self._pending_lock:
+            self._flush_scheduled = False
+
+    def _start_flush(self) -> None:
+        """Runs on the web loop: drain and hand one frame to the web app."""
+        entries, dropped = self.drain()
+        if (entries or dropped) and self.web_app is not None and hasattr(self.web_app, "broadcast_logs"):
+            task = self.loop.create_task(self.web_app.broadcast_logs(entries, dropped))
+            self._broadcasts.add(task)
+            task.add_done_callback(self._broadcasts.discard)
+
+
+def _select_by_level(pending: list[tuple[int, dict]], budget: int) -> set[int]:
+    """Indices of at most *budget* lines: WARNING+ first, then INFO, then an even sample of DEBUG."""
+    keep: set[int] = set()
+    tiers = (
+        [i for i, (levelno, _) in enumerate(pending) if levelno >= logging.WARNING],
+        [i for i, (levelno, _) in enumerate(pending) if logging.INFO <= levelno < logging.WARNING],
+        [i for i, (levelno, _) in enumerate(pending) if levelno < logging.INFO],
+    )
+    for tier in tiers:
+        room = budget - len(keep)
+        if room <= 0:
+            break
+        if len(tier) <= room:
+            keep.update(tier)
+        else:
+            # Even sample across the window rather than the first N, so a burst doesn't hide its tail.
+            step = len(tier) / room
+            keep.update(tier[int(k * step)] for k in range(room))
+    return keep
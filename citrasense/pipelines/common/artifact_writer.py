@@ -58,16 +58,16 @@ def _safe_value(v: Any) -> Any:
     return v
 
 
-def _sanitize(obj: Any) -> Any:
+def sanitize_json(obj: Any) -> Any:
     """Recursively make a data structure JSON-safe.
 
     Converts NaN -> None, numpy scalars -> native Python types,
     pd.Timestamp -> ISO string, Path -> str, bytes -> str.
     """
     if isinstance(obj, dict):
-        return {k: _sanitize(v) for k, v in obj.items()}
+        return {k: sanitize_json(v) for k, v in obj.items()}
     if isinstance(obj, (list, tuple)):
-        return [_sanitize(v) for v in obj]
+        return [sanitize_json(v) for v in obj]
     return _safe_value(obj)
 
 
@@ -80,7 +80,7 @@ def dump_json(working_dir: Path, filename: str, data: Any, logger: Any | None =
     try:
         path = working_dir / filename
         with open(path, "w", encoding="utf-8") as f:
-            json.dump(_sanitize(data), f, indent=2, default=str)
+            json.dump(sanitize_json(data), f, indent=2, default=str)
     except Exception as exc:
         _log(logger).warning("Failed to write artifact %s: %s", filename, exc)
 
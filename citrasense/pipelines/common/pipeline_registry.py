@@ -61,6 +61,8 @@ def _build_optical_pipeline() -> PipelineDefinition:
         ]
 
     def _post_report(context: ProcessingContext, _aggregated: AggregatedResult) -> None:
+        if getattr(context, "defer_rendering", False):
+            return  # built by the render lane (or on demand by the analysis UI)
         generate_html_report(context.working_dir, report_logger=context.logger)
 
     return PipelineDefinition(
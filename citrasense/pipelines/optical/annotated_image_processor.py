@@ -5,18 +5,19 @@ from __future__ import annotations
 import io
 import json
 import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 import numpy as np
-from astropy.io import fits
-from astropy.wcs import WCS
 from PIL import Image, ImageDraw, ImageFont
 
 from citrasense.pipelines.common.abstract_processor import AbstractImageProcessor
 from citrasense.pipelines.common.processing_context import ProcessingContext
 from citrasense.pipelines.common.processor_result import ProcessorResult
 from citrasense.pipelines.optical.optical_processing_context import OpticalProcessingContext
+from citrasense.pipelines.optical.wcs_projection import WcsProjection
 from citrasense.tasks.views.telescope_task_view import TelescopeTaskView
 
 if TYPE_CHECKING:
@@ -53,6 +54,24 @@ _MAX_DETECTION_MARKERS = 200
 _ELONGATION_THRESHOLD = 1.5
 
 
+@dataclass
+class AnnotationSnapshot:
+    """Inputs for one annotated render, detached from the processing working dir."""
+
+    image_data: np.ndarray = field(repr=False)
+    wcs: WcsProjection | None
+    detected_sources: pd.DataFrame | None = field(repr=False)
+    tracking_mode: str | None
+    matched_sats: list[dict]
+    unmatched_preds: list[dict]
+    epoch_str: str | None
+    match_count: int
+    task_name: str | None
+    preview_dir: Path
+    preview_name: str
+    working_dir: Path
+
+
 class AnnotatedImageProcessor(AbstractImageProcessor):
     """Renders a stretched PNG with four annotation layers overlaid.
 
@@ -84,53 +103,22 @@ class AnnotatedImageProcessor(AbstractImageProcessor):
             return self._skip("No image data available", start_time)
 
         try:
-            img = self._stretch_to_rgb(context.image_data)
-            original_height = img.height
-            pixel_scale = 1.0
-            if img.width > _ANNOTATED_WIDTH:
-                pixel_scale = _ANNOTATED_WIDTH / img.width
-                new_h = max(1, int(img.height * pixel_scale))
-                _lanczos = getattr(Image, "Resampling", Image).LANCZOS  # type: ignore[attr-defined]
-                img = img.resize((_ANNOTATED_WIDTH, new_h), _lanczos)
-
-            wcs = self._load_wcs(context.working_image_path)
-            debug = self._load_debug_json(context.working_dir)
-
-            matched_sats, unmatched_preds, epoch_str, match_count = self._parse_annotations(debug)
-
-            draw = ImageDraw.Draw(img)
-            font = self._get_font()
-
-            if wcs is not None:
-                if context.detected_sources is not None:
-                    self._draw_stars(
-                        draw, wcs, context.detected_sources, original_height, context.tracking_mode, pixel_scale
-                    )
-                    self._draw_detections(
-                        draw, wcs, context.detected_sources, original_height, context.tracking_mode, pixel_scale
-                    )
-                self._draw_predictions(draw, wcs, unmatched_preds, font, original_height, pixel_scale)
-                self._draw_matches(draw, wcs, matched_sats, font, original_height, pixel_scale)
-
-            task_name = (
-                TelescopeTaskView(context.task).satellite_name
-                if context.task and getattr(context.task, "sensor_type", "telescope") == "telescope"
-                else None
-            )
-            self._draw_overlay(draw, img.width, task_name, epoch_str, match_count, font)
-
-            image_bytes = self._encode_image(img)
-            # ``latest_preview.jpg`` used to be a single site-wide rolling
-            # file in ``images_dir``.  In multi-sensor deployments that made
-            # two scopes overwrite each other's preview — the operator saw
-            # scope B's image in scope A's card (and vice versa).  Scope
-            # the filename by ``sensor_id`` so each rig gets its own
-            # slot (falling back to the legacy name on empty sensor_id for
-            # single-sensor configs).
-            sensor_id = getattr(context, "sensor_id", "") or ""
-            preview_name = f"latest_preview_{sensor_id}.jpg" if sensor_id else "latest_preview.jpg"
-            preview_path = self._save_preview(image_bytes, context.image_path.parent, preview_name)
-            working_path = self._save_to_working_dir(image_bytes, context.working_dir)
+            snapshot = self.snapshot(context)
+
+            if context.defer_rendering:
+                # ProcessingQueue hands the snapshot to the render lane after the pipeline returns.
+                context.deferred_annotation = snapshot
+                elapsed = time.time() - start_time
+                return ProcessorResult(
+                    should_upload=True,
+                    extracted_data={"deferred": True},
+                    confidence=1.0,
+                    reason=f"Annotated image deferred to render lane ({snapshot.match_count} matches)",
+                    processing_time_seconds=elapsed,
+                    processor_name=self.name,
+                )
+
+            preview_path, working_path = self.render_to_disk(snapshot)
 
             elapsed = time.time() - start_time
             return ProcessorResult(
@@ -140,7 +128,7 @@ class AnnotatedImageProcessor(AbstractImageProcessor):
                     "working_dir_path": str(working_path) if working_path else None,
                 },
                 confidence=1.0,
-                reason=f"Annotated image saved in {elapsed:.1f}s ({match_count} matches drawn)",
+                reason=f"Annotated image saved in {elapsed:.1f}s ({snapshot.match_count} matches drawn)",
                 processing_time_seconds=elapsed,
                 processor_name=self.name,
             )
@@ -158,6 +146,105 @@ class AnnotatedImageProcessor(AbstractImageProcessor):
                 processor_name=self.name,
             )
 
+    def snapshot(self, context: OpticalProcessingContext) -> AnnotationSnapshot:
+        """Capture everything :meth:`render` needs, so rendering can outlive the working dir.
+
+        Cheap: reads the WCS header and matcher debug JSON, and keeps
+        references (not copies) to the pixel array and source table.
+        """
+        assert context.image_data is not None
+        debug = self._load_debug_json(context.working_dir)
+        matched_sats, unmatched_preds, epoch_str, match_count = self._parse_annotations(debug)
+        task_name = (
+            TelescopeTaskView(context.task).satellite_name
+            if context.task and getattr(context.task, "sensor_type", "telescope") == "telescope"
+            else None
+        )
+        # ``latest_preview.jpg`` used to be a single site-wide rolling
+        # file in ``images_dir``.  In multi-sensor deployments that made
+        # two scopes overwrite each other's preview — the operator saw
+        # scope B's image in scope A's card (and vice versa).  Scope
+        # the filename by ``sensor_id`` so each rig gets its own
+        # slot (falling back to the legacy name on empty sensor_id for
+        # single-sensor configs).
+        sensor_id = getattr(context, "sensor_id", "") or ""
+        return AnnotationSnapshot(
+            image_data=context.image_data,
+            wcs=self._load_wcs(context),
+            detected_sources=context.detected_sources,
+            tracking_mode=context.tracking_mode,
+            matched_sats=matched_sats,
+            unmatched_preds=unmatched_preds,
+            epoch_str=epoch_str,
+            match_count=match_count,
+            task_name=task_name,
+            preview_dir=context.image_path.parent,
+            preview_name=f"latest_preview_{sensor_id}.jpg" if sensor_id else "latest_preview.jpg",
+            working_dir=context.working_dir,
+        )
+
+    def render(self, snap: AnnotationSnapshot, check_cancelled: Callable[[], None] | None = None) -> bytes:
+        """Stretch, resize, annotate and JPEG-encode a snapshot.
+
+        ``check_cancelled`` is called between the expensive steps; it
+        should raise to abandon the render.
+        """
+        check = check_cancelled or (lambda: None)
+
+        img = self._stretch_to_rgb(snap.image_data)
+        original_height = img.height
+        pixel_scale = 1.0
+        if img.width > _ANNOTATED_WIDTH:
+            check()
+            pixel_scale = _ANNOTATED_WIDTH / img.width
+            new_h = max(1, int(img.height * pixel_scale))
+            _lanczos = getattr(Image, "Resampling", Image).LANCZOS  # type: ignore[attr-defined]
+            img = img.resize((_ANNOTATED_WIDTH, new_h), _lanczos)
+        check()
+
+        draw = ImageDraw.Draw(img)
+        font = self._get_font()
+
+        wcs = snap.wcs
+        if wcs is not None:
+            sources = snap.detected_sources
+            if sources is not None:
+                self._draw_stars(draw, wcs, sources, original_height, snap.tracking_mode, pixel_scale)
+                self._draw_detections(draw, wcs, sources, original_height, snap.tracking_mode, pixel_scale)
+            self._draw_predictions(draw, wcs, snap.unmatched_preds, font, original_height, pixel_scale)
+            self._draw_matches(draw, wcs, snap.matched_sats, font, original_height, pixel_scale)
+
+        self._draw_overlay(draw, img.width, snap.task_name, snap.epoch_str, snap.match_count, font)
+        check()
+        return self._encode_image(img)
+
+    def render_to_disk(
+        self,
+        snap: AnnotationSnapshot,
+        check_cancelled: Callable[[], None] | None = None,
+        write_working_copy: bool = True,
+    ) -> tuple[Path, Path | None]:
+        """Render *snap* and write the rolling preview (and ``annotated.jpg`` in the working dir).
+
+        Returns:
+            ``(preview_path, working_path)``; ``working_path`` is None when
+            the working copy was skipped or could not be written.
+        """
+        return self.write_rendered(self.render(snap, check_cancelled), snap, write_working_copy)
+
+    def write_rendered(
+        self, image_bytes: bytes, snap: AnnotationSnapshot, write_working_copy: bool = True
+    ) -> tuple[Path, Path | None]:
+        """Write already-rendered *image_bytes*: the per-task working copy first, then the rolling preview.
+
+        The rolling preview is shared by every render for the sensor, so
+        callers that need *this* task's image must use the working copy
+        or the bytes, never re-read the rolling file.
+        """
+        working_path = self._save_to_working_dir(image_bytes, snap.working_dir) if write_working_copy else None
+        preview_path = self._save_preview(image_bytes, snap.preview_dir, snap.preview_name)
+        return preview_path, working_path
+
     def _skip(self, reason: str, start_time: float) -> ProcessorResult:
         return ProcessorResult(
             should_upload=True,
@@ -207,13 +294,9 @@ class AnnotatedImageProcessor(AbstractImageProcessor):
         return Image.fromarray(stretched, mode="RGB")
 
     @staticmethod
-    def _load_wcs(fits_path: Path) -> WCS | None:
+    def _load_wcs(context: OpticalProcessingContext) -> WcsProjection | None:
         try:
-            with fits.open(fits_path) as hdul:
-                header = hdul[0].header  # type: ignore[union-attr]
-                if "CRVAL1" not in header:
-                    return None
-                return WCS(header)
+            return context.wcs_projection()
         except Exception:
             return None
 
@@ -246,14 +329,20 @@ class AnnotatedImageProcessor(AbstractImageProcessor):
         return observations, unmatched, epoch_str, match_count
 
     def _draw_matches(
-        self, draw: ImageDraw.ImageDraw, wcs: WCS, matches: list[dict], font, img_height: int, pixel_scale: float = 1.0
+        self,
+        draw: ImageDraw.ImageDraw,
+        wcs: WcsProjection,
+        matches: list[dict],
+        font,
+        img_height: int,
+        pixel_scale: float = 1.0,
     ) -> None:
-        for sat in matches:
-            ra, dec = sat.get("ra"), sat.get("dec")
+        matches = [sat for sat in matches if sat.get("ra") is not None and sat.get("dec") is not None]
+        positions = self._radec_to_pixels(
+            wcs, [sat["ra"] for sat in matches], [sat["dec"] for sat in matches], img_height, pixel_scale
+        )
+        for sat, (px, py) in zip(matches, positions, strict=True):
             name = sat.get("name", "?")
-            if ra is None or dec is None:
-                continue
-            px, py = self._radec_to_pixel(wcs, ra, dec, img_height, pixel_scale)
             if px is None or py is None:
                 continue
             self._draw_circle(draw, px, py, _MATCH_COLOR, _MATCH_RADIUS)
@@ -262,19 +351,24 @@ class AnnotatedImageProcessor(AbstractImageProcessor):
     def _draw_predictions(
         self,
         draw: ImageDraw.ImageDraw,
-        wcs: WCS,
+        wcs: WcsProjection,
         predictions: list[dict],
         font,
         img_height: int,
         pixel_scale: float = 1.0,
     ) -> None:
-        for pred in predictions:
-            ra = pred.get("predicted_ra_deg")
-            dec = pred.get("predicted_dec_deg")
+        predictions = [
+            p for p in predictions if p.get("predicted_ra_deg") is not None and p.get("predicted_dec_deg") is not None
+        ]
+        positions = self._radec_to_pixels(
+            wcs,
+            [p["predicted_ra_deg"] for p in predictions],
+            [p["predicted_dec_deg"] for p in predictions],
+            img_height,
+            pixel_scale,
+        )
+        for pred, (px, py) in zip(predictions, positions, strict=True):
             name = pred.get("name", "?")
-            if ra is None or dec is None:
-                continue
-            px, py = self._radec_to_pixel(wcs, ra, dec, img_height, pixel_scale)
             if px is None or py is None:
                 continue
             self._draw_dashed_circle(draw, px, py, _PREDICTION_COLOR, _PREDICTION_RADIUS)
@@ -283,7 +377,7 @@ class AnnotatedImageProcessor(AbstractImageProcessor):
     def _draw_stars(
         self,
         draw: ImageDraw.ImageDraw,
-        wcs: WCS,
+        wcs: WcsProjection,
         sources: pd.DataFrame,
         img_height: int,
         tracking_mode: str | None,
@@ -304,8 +398,10 @@ class AnnotatedImageProcessor(AbstractImageProcessor):
             point_like = sources[sources["elongation"] < _ELONGATION_THRESHOLD]
         brightest = point_like.sort_values(by="mag").head(_MAX_STAR_MARKERS)  # type: ignore[call-overload]
 
-        for _, row in brightest.iterrows():
-            px, py = self._radec_to_pixel(wcs, row["ra"], row["dec"], img_height, pixel_scale)
+        positions = self._radec_to_pixels(
+            wcs, brightest["ra"].to_numpy(), brightest["dec"].to_numpy(), img_height, pixel_scale
+        )
+        for px, py in positions:
             if px is None or py is None:
                 continue
             self._draw_diamond(draw, px, py, _STAR_COLOR, _STAR_RADIUS)
@@ -313,7 +409,7 @@ class AnnotatedImageProcessor(AbstractImageProcessor):
     def _draw_detections(
         self,
         draw: ImageDraw.ImageDraw,
-        wcs: WCS,
+        wcs: WcsProjection,
         sources: pd.DataFrame,
         img_height: int,
         tracking_mode: str | None,
@@ -335,27 +431,47 @@ class AnnotatedImageProcessor(AbstractImageProcessor):
 
         capped = candidates.head(_MAX_DETECTION_MARKERS)
 
-        for _, row in capped.iterrows():
-            px, py = self._radec_to_pixel(wcs, row["ra"], row["dec"], img_height, pixel_scale)
+        positions = self._radec_to_pixels(
+            wcs, capped["ra"].to_numpy(), capped["dec"].to_numpy(), img_height, pixel_scale
+        )
+        for px, py in positions:
             if px is None or py is None:
                 continue
             self._draw_dotted_circle(draw, px, py, _DETECTION_COLOR, _DETECTION_RADIUS)
 
     @staticmethod
-    def _radec_to_pixel(
-        wcs: WCS, ra_deg: float, dec_deg: float, img_height: int, pixel_scale: float = 1.0
-    ) -> tuple[int | None, int | None]:
+    def _radec_to_pixels(
+        wcs: WcsProjection, ra_deg, dec_deg, img_height: int, pixel_scale: float = 1.0
+    ) -> list[tuple[int | None, int | None]]:
+        """Project arrays of RA/Dec to display coordinates in one WCS call.
+
+        Unprojectable points (and the whole batch, if the WCS raises) come
+        back as ``(None, None)``.
+        """
+        ra = np.atleast_1d(np.asarray(ra_deg, dtype=float))
+        dec = np.atleast_1d(np.asarray(dec_deg, dtype=float))
+        if ra.size == 0:
+            return []
         try:
-            result = wcs.world_to_pixel_values(ra_deg, dec_deg)
-            # WCS pixel y is 0 at bottom (FITS convention); display image is
-            # np.flipud'd so row 0 is at top.  Invert for display coordinates.
-            # img_height must be the ORIGINAL (pre-resize) height for the flip,
-            # then pixel_scale maps to the downscaled canvas.
-            px = round(float(result[0]) * pixel_scale)
-            py = round((img_height - 1 - float(result[1])) * pixel_scale)
-            return px, py
+            result = wcs.world_to_pixel_values(ra, dec)
+            x = np.broadcast_to(np.asarray(result[0], dtype=float), ra.shape)
+            y = np.broadcast_to(np.asarray(result[1], dtype=float), ra.shape)
         except Exception:
-            return None, None
+            return [(None, None)] * ra.size
+        # WCS pixel y is 0 at bottom (FITS convention); display image is
+        # np.flipud'd so row 0 is at top.  Invert for display coordinates.
+        # img_height must be the ORIGINAL (pre-resize) height for the flip,
+        # then pixel_scale maps to the downscaled canvas.
+        px = np.rint(x * pixel_scale)
+        py = np.rint((img_height - 1 - y) * pixel_scale)
+        ok = np.isfinite(px) & np.isfinite(py)
+        return [(int(a), int(b)) if good else (None, None) for a, b, good in zip(px, py, ok, strict=True)]
+
+    @staticmethod
+    def _radec_to_pixel(
+        wcs: WcsProjection, ra_deg: float, dec_deg: float, img_height: int, pixel_scale: float = 1.0
+    ) -> tuple[int | None, int | None]:
+        return AnnotatedImageProcessor._radec_to_pixels(wcs, [ra_deg], [dec_deg], img_height, pixel_scale)[0]
 
     @staticmethod
     def _draw_circle(draw: ImageDraw.ImageDraw, cx: int, cy: int, color: tuple, radius: int):
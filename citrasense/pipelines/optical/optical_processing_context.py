@@ -6,10 +6,13 @@ from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
 from citrasense.pipelines.common.processing_context import ProcessingContext
+from citrasense.pipelines.optical.wcs_projection import WcsProjection
 
 if TYPE_CHECKING:
     import pandas as pd
 
+    from citrasense.pipelines.optical.annotated_image_processor import AnnotationSnapshot
+
 
 @dataclass
 class OpticalProcessingContext(ProcessingContext):
@@ -29,3 +32,30 @@ class OpticalProcessingContext(ProcessingContext):
 
     detected_sources: pd.DataFrame | None = field(default=None, repr=False)
     zero_point: float | None = None
+
+    # Presentation artifacts (annotated JPEG, HTML report) go to the render
+    # lane instead of being built inline.  Set by ProcessingQueue; the
+    # annotated-image processor leaves its snapshot here for the queue.
+    defer_rendering: bool = False
+    deferred_annotation: AnnotationSnapshot | None = field(default=None, repr=False)
+
+    # Parsed-once WCS for the current working image, keyed by (path, mtime)
+    # so a re-solve or promoted file is picked up.  See wcs_projection().
+    _wcs_cache: tuple[tuple[str, int], WcsProjection | None] | None = field(default=None, repr=False, compare=False)
+
+    def wcs_projection(self) -> WcsProjection | None:
+        """Shared sky ↔ pixel projection for ``working_image_path``, or None if it isn't plate-solved.
+
+        The header is parsed once per solved frame; processors call this
+        instead of building their own ``WCS``.
+        """
+        path = self.working_image_path
+        try:
+            key = (str(path), path.stat().st_mtime_ns)
+        except OSError:
+            return None
+        if self._wcs_cache is not None and self._wcs_cache[0] == key:
+            return self._wcs_cache[1]
+        projection = WcsProjection.from_fits(path)
+        self._wcs_cache = (key, projection)
+        return projection
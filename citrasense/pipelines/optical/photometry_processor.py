@@ -10,8 +10,6 @@ from typing import TYPE_CHECKING
 import numpy as np
 import pandas as pd
 import requests
-from astropy.io import fits
-from astropy.wcs import WCS
 from scipy.spatial import KDTree
 
 from citrasense.pipelines.common.abstract_processor import AbstractImageProcessor
@@ -20,6 +18,7 @@ from citrasense.pipelines.common.processing_context import ProcessingContext
 from citrasense.pipelines.common.processor_result import ProcessorResult
 from citrasense.pipelines.optical.optical_processing_context import OpticalProcessingContext
 from citrasense.pipelines.optical.processor_dependencies import read_source_catalog
+from citrasense.pipelines.optical.wcs_projection import WcsProjection
 from citrasense.tasks.views.telescope_task_view import TelescopeTaskView
 
 if TYPE_CHECKING:
@@ -74,7 +73,12 @@ class PhotometryProcessor(AbstractImageProcessor):
     description = "Photometric calibration via APASS catalog (requires source extraction)"
 
     def _calibrate_photometry(
-        self, sources: pd.DataFrame, image_path: Path, filter_name: str, apass_catalog: ApassCatalog | None = None
+        self,
+        sources: pd.DataFrame,
+        image_path: Path,
+        filter_name: str,
+        apass_catalog: ApassCatalog | None = None,
+        projection: WcsProjection | None = None,
     ) -> tuple[float, int, pd.DataFrame, pd.DataFrame]:
         """Query APASS catalog and calculate magnitude zero point.
 
@@ -86,6 +90,7 @@ class PhotometryProcessor(AbstractImageProcessor):
             image_path: Path to FITS image (for WCS info)
             filter_name: Filter name (Clear, g, r, i)
             apass_catalog: ApassCatalog instance (None to use HTTP fallback)
+            projection: Shared WCS projection for the frame (read from image_path if None)
 
         Returns:
             Tuple of (zero_point, num_matched_stars, apass_catalog_df, crossmatch_df)
@@ -94,16 +99,11 @@ class PhotometryProcessor(AbstractImageProcessor):
             RuntimeError: If calibration fails
         """
         # Get field center from WCS
-        with fits.open(image_path) as hdul:
-            primary = hdul[0]
-            assert isinstance(primary, fits.PrimaryHDU)
-            wcs = WCS(primary.header)
-            header = primary.header
-            nx = int(header["NAXIS1"])  # type: ignore[arg-type]
-            ny = int(header["NAXIS2"])  # type: ignore[arg-type]
-            center = wcs.pixel_to_world(nx / 2, ny / 2)
-            ra_center = float(center.ra.deg)  # type: ignore[union-attr]
-            dec_center = float(center.dec.deg)  # type: ignore[union-attr]
+        if projection is None:
+            projection = WcsProjection.from_fits(image_path)
+        if projection is None:
+            raise RuntimeError("Image has no WCS solution")
+        ra_center, dec_center = projection.center()
 
         if apass_catalog is not None and apass_catalog.is_available():
             apass_stars = apass_catalog.cone_search(ra_center, dec_center, radius=2.0)
@@ -113,8 +113,13 @@ class PhotometryProcessor(AbstractImageProcessor):
         if apass_stars.empty:
             raise RuntimeError("No APASS stars found in field")
 
+        # The 2° cone is much larger than the detector; only stars that can
+        # land within match distance of it are worth a KDTree slot.
+        max_separation = 1.0 / 60.0
+        on_frame = self._on_frame_mask(apass_stars, projection, max_separation)
+
         # Cross-match detected sources with APASS
-        matched = cross_match_catalogs(sources, apass_stars, max_separation=1.0 / 60.0)
+        matched = cross_match_catalogs(sources, apass_stars[on_frame], max_separation=max_separation)
 
         if matched.empty or len(matched) < 3:
             raise RuntimeError(f"Insufficient matched stars for calibration: {len(matched)}")
@@ -137,6 +142,15 @@ class PhotometryProcessor(AbstractImageProcessor):
 
         return zero_point, len(matched_clean), apass_stars, matched_clean
 
+    @staticmethod
+    def _on_frame_mask(catalog: pd.DataFrame, projection: WcsProjection, margin_deg: float) -> np.ndarray:
+        """Mask of catalog rows that project onto the detector (padded by *margin_deg*), in one call."""
+        ra = pd.to_numeric(catalog["radeg"], errors="coerce").to_numpy(dtype=float)
+        dec = pd.to_numeric(catalog["decdeg"], errors="coerce").to_numpy(dtype=float)
+        x, y = projection.world_to_pixel_values(ra, dec)
+        margin_px = margin_deg / projection.pixel_scale_deg + 1.0
+        return projection.contains(x, y, margin=margin_px)
+
     def process(self, context: ProcessingContext) -> ProcessorResult:
         """Process image with photometric calibration.
 
@@ -175,7 +189,11 @@ class PhotometryProcessor(AbstractImageProcessor):
 
             # Calibrate
             zero_point, num_matched, apass_catalog_df, crossmatch_df = self._calibrate_photometry(
-                sources_df, context.working_image_path, filter_name or "Clear", context.apass_catalog
+                sources_df,
+                context.working_image_path,
+                filter_name or "Clear",
+                context.apass_catalog,
+                projection=context.wcs_projection(),
             )
 
             context.zero_point = zero_point
@@ -5,7 +5,19 @@ from __future__ import annotations
 import shutil
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
+from astropy.io import fits
+
+#: SExtractor output parameter → source-catalog column name.
+LDAC_COLUMNS: dict[str, str] = {
+    "ALPHA_J2000": "ra",
+    "DELTA_J2000": "dec",
+    "MAG_AUTO": "mag",
+    "MAGERR_AUTO": "magerr",
+    "FWHM_IMAGE": "fwhm",
+    "ELONGATION": "elongation",
+}
 
 
 def normalize_fits_timestamp(timestamp: str) -> str:
@@ -56,22 +68,71 @@ def check_all_dependencies(settings) -> dict:
     }
 
 
+def is_fits_catalog(catalog_path: Path) -> bool:
+    """True if *catalog_path* is a FITS file (FITS_LDAC / FITS_1.0) rather than ASCII."""
+    with open(catalog_path, "rb") as f:
+        return f.read(9) == b"SIMPLE  ="
+
+
+def read_ldac_catalog(catalog_path: Path) -> pd.DataFrame:
+    """Read a binary SExtractor catalog (FITS_LDAC or FITS_1.0) column-wise.
+
+    Columns are pulled straight out of the binary table as arrays — no
+    per-row parsing — and converted to native-endian float64.  Output
+    columns follow :data:`LDAC_COLUMNS`; parameters missing from the
+    catalog are skipped.
+    """
+    with fits.open(catalog_path, memmap=False) as hdul:
+        table = None
+        for hdu in hdul[1:]:
+            if isinstance(hdu, fits.BinTableHDU) and hdu.name != "LDAC_IMHEAD":
+                table = hdu
+        if table is None or table.data is None:
+            return pd.DataFrame(columns=list(LDAC_COLUMNS.values()))
+        names = set(table.columns.names)
+        data = table.data
+        return pd.DataFrame(
+            {col: np.asarray(data[param], dtype=np.float64) for param, col in LDAC_COLUMNS.items() if param in names}
+        )
+
+
 def read_source_catalog(catalog_path: Path) -> pd.DataFrame:
     """Read an output.cat source catalog, auto-detecting the format.
 
-    Supports three layouts:
+    Supports five layouts:
+    - Binary FITS_LDAC / FITS_1.0 (see :func:`read_ldac_catalog`)
+    - ASCII_HEAD, located by its ``# N NAME`` header (columns as in :data:`LDAC_COLUMNS`)
     - Compact 5-column (mag, magerr, ra, dec, elongation)
     - Current 13-column SExtractor (with FWHM_IMAGE at col 10, ELONGATION at col 11)
     - Legacy 11-column SExtractor (without FWHM_IMAGE, ELONGATION at col 10)
     """
+    if is_fits_catalog(catalog_path):
+        return read_ldac_catalog(catalog_path)
+
+    header: dict[int, str] = {}
     with open(catalog_path) as f:
         for line in f:
             if not line.startswith("#"):
                 ncols = len(line.split())
                 break
+            parts = line[1:].split()
+            if len(parts) >= 2 and parts[0].isdigit() and parts[1] in LDAC_COLUMNS:
+                header[int(parts[0]) - 1] = LDAC_COLUMNS[parts[1]]
         else:
             ncols = 5
 
+    if {"ra", "dec", "mag"} <= set(header.values()):
+        usecols = sorted(header)
+        df = pd.read_csv(
+            catalog_path,
+            sep=r"\s+",
+            comment="#",
+            header=None,
+            usecols=usecols,
+            names=[header[i] for i in usecols],
+        )
+        return df[[col for col in LDAC_COLUMNS.values() if col in df.columns]]
+
     if ncols <= 5:
         return pd.read_csv(
             catalog_path,
@@ -311,6 +311,7 @@ class SatelliteMatcherProcessor(AbstractImageProcessor):
         debug["predictions_all"] = all_propagations
         debug["predictions_in_field"] = [p for p in all_propagations if p.get("in_field")]
         debug["predictions_in_field_count"] = len(predictions)
+        self._project_predictions(debug["predictions_in_field"], context, debug)
 
         if not predictions:
             debug["early_exit"] = "no TLE predictions in field"
@@ -407,6 +408,25 @@ class SatelliteMatcherProcessor(AbstractImageProcessor):
         debug["satellite_observations"] = observations
         return observations, debug
 
+    @staticmethod
+    def _project_predictions(
+        records: list[dict[str, Any]], context: OpticalProcessingContext, debug: dict[str, Any]
+    ) -> None:
+        """Annotate in-field prediction records with detector pixel positions (one batched WCS call)."""
+        projection = context.wcs_projection()
+        if projection is None or not records:
+            return
+        xs, ys = projection.world_to_pixel_values(
+            [r["predicted_ra_deg"] for r in records], [r["predicted_dec_deg"] for r in records]
+        )
+        on_detector = projection.contains(xs, ys)
+        for record, x, y, on in zip(records, xs, ys, on_detector, strict=True):
+            finite = bool(np.isfinite(x) and np.isfinite(y))
+            record["predicted_x_px"] = round(float(x), 2) if finite else None
+            record["predicted_y_px"] = round(float(y), 2) if finite else None
+            record["on_detector"] = bool(on)
+        debug["predictions_on_detector_count"] = int(np.count_nonzero(on_detector))
+
     def process(self, context: ProcessingContext) -> ProcessorResult:
         """Process image with satellite matching.
 
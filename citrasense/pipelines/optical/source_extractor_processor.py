@@ -1,7 +1,11 @@
 """Source extraction processor using SExtractor."""
 
+import hashlib
+import os
 import shutil
 import subprocess
+import tempfile
+import threading
 import time
 from pathlib import Path
 
@@ -13,8 +17,103 @@ from citrasense.pipelines.common.artifact_writer import dump_processor_result
 from citrasense.pipelines.common.processing_context import ProcessingContext
 from citrasense.pipelines.common.processor_result import ProcessorResult
 from citrasense.pipelines.optical.optical_processing_context import OpticalProcessingContext
+from citrasense.settings.directory_manager import DirectoryManager
 
-from .processor_dependencies import check_sextractor
+from .processor_dependencies import check_sextractor, read_source_catalog
+
+# default.sex keys that name other config files.  The staged copy rewrites
+# them to absolute paths so SExtractor can run from the task's working dir.
+_CONFIG_PATH_KEYS = ("PARAMETERS_NAME", "FILTER_NAME", "STARNNW_NAME")
+_CONFIG_SUFFIXES = (".sex", ".param", ".conv", ".nnw")
+
+_stage_lock = threading.Lock()
+# (config dir, source fingerprint, stage root) -> (staged dir, expected bytes per file)
+_staged_config_dirs: dict[tuple, tuple[Path, dict[str, bytes]]] = {}
+
+
+def default_stage_root() -> Path:
+    """Where configs are staged when the caller doesn't pass a root: the app's cache dir."""
+    return DirectoryManager.default_cache_dir() / "sextractor"
+
+
+def stage_sextractor_configs(config_dir: Path, stage_root: Path | None = None) -> Path | None:
+    """Copy the SExtractor config files to a private staging directory, once per process.
+
+    SExtractor can't cope with spaces in paths, so each run used to copy
+    the config files into the task's working dir and delete them again.
+    Instead they are staged once under *stage_root* (the app's cache dir
+    by default, created owner-only) — keyed by the source files' size and
+    mtime, so edited configs are re-staged — and every run points ``-c``
+    at the staged ``default.sex``.
+
+    A staging directory is built under a temporary name and renamed into
+    place, and every file in it is compared with what it should contain
+    before it is used, so a partial or altered copy is replaced rather
+    than handed to SExtractor.
+
+    Args:
+        config_dir: Directory holding ``default.sex`` and the files it names
+        stage_root: Parent of the staging directories; None uses :func:`default_stage_root`
+
+    Returns:
+        The staged directory, or ``None`` if its path contains whitespace
+        (callers then fall back to per-run copies).
+    """
+    config_dir = config_dir.resolve()
+    root = (stage_root or default_stage_root()).resolve()
+    files = sorted(p for p in config_dir.iterdir() if p.suffix in _CONFIG_SUFFIXES)
+    fingerprint = tuple((p.name, p.stat().st_size, p.stat().st_mtime_ns) for p in files)
+    key = (str(config_dir), fingerprint, str(root))
+
+    with _stage_lock:
+        cached = _staged_config_dirs.get(key)
+        if cached is not None and _staged_intact(*cached):
+            return cached[0]
+
+        digest = hashlib.sha1(repr(key[:2]).encode()).hexdigest()[:12]
+        staged = root / f"configs-{digest}"
+        if any(c.isspace() for c in str(staged)):
+            return None
+
+        expected = {src.name: src.read_bytes() for src in files}
+        if "default.sex" in expected:
+            expected["default.sex"] = _absolutize_config_paths(expected["default.sex"].decode(), staged).encode()
+
+        if not _staged_intact(staged, expected):
+            root.mkdir(mode=0o700, parents=True, exist_ok=True)
+            tmp = Path(tempfile.mkdtemp(prefix=f"{staged.name}.", dir=root))
+            for name, content in expected.items():
+                (tmp / name).write_bytes(content)
+            shutil.rmtree(staged, ignore_errors=True)
+            try:
+                os.replace(tmp, staged)
+            except OSError:
+                # Another process staged the same fingerprint first.
+                shutil.rmtree(tmp, ignore_errors=True)
+            if not _staged_intact(staged, expected):
+                raise RuntimeError(f"Could not stage SExtractor configs in {staged}")
+
+        _staged_config_dirs[key] = (staged, expected)
+        return staged
+
+
+def _staged_intact(staged: Path, expected: dict[str, bytes]) -> bool:
+    """True if *staged* holds every expected config file with exactly the expected bytes."""
+    try:
+        return all((staged / name).read_bytes() == content for name, content in expected.items())
+    except OSError:
+        return False
+
+
+def _absolutize_config_paths(sex_text: str, staged_dir: Path) -> str:
+    lines = []
+    for line in sex_text.splitlines():
+        parts = line.split(None, 2)
+        if len(parts) >= 2 and parts[0] in _CONFIG_PATH_KEYS:
+            comment = parts[2] if len(parts) == 3 else ""
+            line = f"{parts[0]:<16} {staged_dir / parts[1]} {comment}".rstrip()
+        lines.append(line)
+    return "\n".join(lines) + "\n"
 
 
 class SourceExtractorProcessor(AbstractImageProcessor):
@@ -31,44 +130,9 @@ class SourceExtractorProcessor(AbstractImageProcessor):
     friendly_name = "Source Extractor"
     description = "Detect stars and satellites via SExtractor (requires plate-solved image)"
 
-    def _parse_sex_catalog(self, catalog_path: Path) -> pd.DataFrame:
-        """Parse SExtractor catalog into DataFrame.
-
-        Column layout from default.param (0-indexed):
-          0=NUMBER, 1=EXT_NUMBER, 2=FLUX_AUTO, 3=FLUXERR_AUTO,
-          4=MAG_AUTO, 5=MAGERR_AUTO, 6=X_IMAGE, 7=Y_IMAGE,
-          8=ALPHA_J2000, 9=DELTA_J2000, 10=FWHM_IMAGE,
-          11=ELONGATION, 12=ELLIPTICITY
-
-        Returns:
-            DataFrame with columns: ra, dec, mag, magerr, fwhm, elongation
-        """
-        sources = []
-
-        with open(catalog_path) as f:
-            for line in f:
-                if line.startswith("#"):
-                    continue
-
-                cols = line.split()
-                if len(cols) < 12:
-                    continue
-
-                try:
-                    sources.append(
-                        {
-                            "ra": float(cols[8]),  # ALPHA_J2000
-                            "dec": float(cols[9]),  # DELTA_J2000
-                            "mag": float(cols[4]),  # MAG_AUTO
-                            "magerr": float(cols[5]),  # MAGERR_AUTO
-                            "fwhm": float(cols[10]),  # FWHM_IMAGE
-                            "elongation": float(cols[11]),  # ELONGATION
-                        }
-                    )
-                except (ValueError, IndexError):
-                    continue
-
-        return pd.DataFrame(sources)
+    #: SExtractor ``CATALOG_TYPE``.  The binary FITS_LDAC table loads straight
+    #: into arrays; ``"ASCII_HEAD"`` keeps the human-readable text catalog.
+    catalog_type = "FITS_LDAC"
 
     def _extract_sources(
         self,
@@ -80,6 +144,8 @@ class SourceExtractorProcessor(AbstractImageProcessor):
         detect_thresh: float | None = None,
         detect_minarea: int | None = None,
         filter_name: str | None = None,
+        catalog_type: str | None = None,
+        stage_root: Path | None = None,
     ) -> pd.DataFrame:
         """Run SExtractor and parse catalog.
 
@@ -93,6 +159,8 @@ class SourceExtractorProcessor(AbstractImageProcessor):
             filter_name: Convolution kernel name (without .conv extension).
                 ``"default"`` or ``None`` uses ``default.conv``; other values
                 select the corresponding ``<name>.conv`` file from config_dir.
+            catalog_type: SExtractor ``CATALOG_TYPE``. None uses :attr:`catalog_type`.
+            stage_root: Where config files are staged (see :func:`stage_sextractor_configs`)
 
         Returns:
             DataFrame with columns: ra, dec, mag, magerr, fwhm
@@ -114,12 +182,15 @@ class SourceExtractorProcessor(AbstractImageProcessor):
         catalog_name = "output.cat"
         catalog_path = working_dir / catalog_name
 
-        # Determine which config files need to be copied
-        config_files_to_copy = ["default.sex", "default.param", "default.conv", "default.nnw"]
+        staged_dir = stage_sextractor_configs(config_dir, stage_root)
+
+        # Without a staging dir, copy the config files into working_dir so relative paths work
+        config_files_to_copy = [] if staged_dir else ["default.sex", "default.param", "default.conv", "default.nnw"]
         if filter_name and filter_name != "default":
             conv_file = f"{filter_name}.conv"
             if (config_dir / conv_file).exists():
-                config_files_to_copy.append(conv_file)
+                if not staged_dir:
+                    config_files_to_copy.append(conv_file)
             else:
                 logger.warning("Convolution kernel %s not found in %s, using default.conv", conv_file, config_dir)
                 filter_name = None
@@ -130,21 +201,22 @@ class SourceExtractorProcessor(AbstractImageProcessor):
                 image_symlink.unlink()
             image_symlink.symlink_to(image_path)
 
-            # Copy config files to working_dir so relative paths work
             for config_file in config_files_to_copy:
                 src = config_dir / config_file
                 dst = working_dir / config_file
                 if not dst.exists():
                     shutil.copy(src, dst)
 
-            # Build SExtractor command - all files in working_dir now
+            # Build SExtractor command - image and catalog relative to working_dir
             cmd = [
                 "sex",
                 "input.fits",
                 "-c",
-                "default.sex",
+                str(staged_dir / "default.sex") if staged_dir else "default.sex",
                 "-CATALOG_NAME",
-                "output.cat",
+                catalog_name,
+                "-CATALOG_TYPE",
+                catalog_type or self.catalog_type,
             ]
 
             # Apply user-configurable overrides via CLI flags (override default.sex values)
@@ -153,7 +225,8 @@ class SourceExtractorProcessor(AbstractImageProcessor):
             if detect_minarea is not None:
                 cmd.extend(["-DETECT_MINAREA", str(detect_minarea)])
             if filter_name and filter_name != "default":
-                cmd.extend(["-FILTER_NAME", f"{filter_name}.conv"])
+                conv_file = f"{filter_name}.conv"
+                cmd.extend(["-FILTER_NAME", str(staged_dir / conv_file) if staged_dir else conv_file])
 
             logger.info("Running SExtractor from cwd: %s", working_dir)
             logger.info("SExtractor command: %s", " ".join(cmd))
@@ -186,9 +259,7 @@ class SourceExtractorProcessor(AbstractImageProcessor):
                 if cfg.exists():
                     cfg.unlink()
 
-        # Parse catalog
-        sources = self._parse_sex_catalog(catalog_path)
-        return sources
+        return read_source_catalog(catalog_path)
 
     def process(self, context: ProcessingContext) -> ProcessorResult:
         """Process image with source extraction.
@@ -243,10 +314,14 @@ class SourceExtractorProcessor(AbstractImageProcessor):
             detect_thresh: float | None = None
             detect_minarea: int | None = None
             filter_name: str | None = None
+            stage_root: Path | None = None
             if context.settings is not None:
                 detect_thresh = getattr(context.settings, "sextractor_detect_thresh", None)
                 detect_minarea = getattr(context.settings, "sextractor_detect_minarea", None)
                 filter_name = getattr(context.settings, "sextractor_filter_name", None)
+                directories = getattr(context.settings, "directories", None)
+                if isinstance(directories, DirectoryManager):
+                    stage_root = directories.cache_dir / "sextractor"
 
             sources_df = self._extract_sources(
                 context.working_image_path,
@@ -256,6 +331,7 @@ class SourceExtractorProcessor(AbstractImageProcessor):
                 detect_thresh=detect_thresh,
                 detect_minarea=detect_minarea,
                 filter_name=filter_name,
+                stage_root=stage_root,
             )
             context.detected_sources = sources_df
 
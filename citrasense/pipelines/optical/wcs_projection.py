@@ -0,0 +1,216 @@
+"""Vectorized sky ↔ pixel projection shared by the optical processors.
+
+The plate-solved WCS is parsed once per frame (see
+:meth:`OpticalProcessingContext.wcs_projection`) and every consumer —
+photometry's catalog cut, the satellite matcher's predicted positions,
+the annotated-image markers — converts whole RA/Dec arrays in one call.
+
+For TAN solutions whose distortion terms are negligible across the
+frame, :class:`WcsProjection` switches to a closed-form gnomonic
+projection plus the linear CD matrix.  The switch is gated on a bounded
+error check: a grid of detector positions is mapped to the sky with the
+full WCS and back with the linear model, and the fast path is only used
+if every round trip lands within ``tolerance_px``.  Otherwise it falls
+back to astropy's ``all_world2pix`` (still one vectorized call).
+"""
+
+from __future__ import annotations
+
+import logging
+from pathlib import Path
+
+import numpy as np
+from astropy.io import fits
+from astropy.wcs import WCS
+
+_logger = logging.getLogger("citrasense.WcsProjection")
+
+LINEAR_TOLERANCE_PX = 0.05
+_CHECK_GRID_POINTS = 7
+
+
+class WcsProjection:
+    """Batched RA/Dec ↔ pixel conversion for one plate-solved frame.
+
+    Pixel coordinates are 0-based FITS convention (``y = 0`` is the bottom
+    row).  The ``*_values`` methods mirror astropy's
+    ``world_to_pixel_values`` / ``pixel_to_world_values`` signatures, so a
+    projection can stand in wherever a :class:`~astropy.wcs.WCS` is used
+    for plain coordinate conversion.  Points more than 90° from the
+    tangent point come back as NaN.
+    """
+
+    def __init__(
+        self,
+        wcs: WCS,
+        shape: tuple[int, int] | None = None,
+        tolerance_px: float = LINEAR_TOLERANCE_PX,
+    ):
+        """
+        Args:
+            wcs: Celestial WCS of the frame
+            shape: Detector size as ``(width, height)``; defaults to the
+                WCS ``pixel_shape``.  Without it the linear check cannot run
+                and the exact path is always used.
+            tolerance_px: Max round-trip error (pixels) allowed for the
+                linearized TAN fast path
+        """
+        self.wcs = wcs
+        self.shape = shape or (tuple(wcs.pixel_shape) if wcs.pixel_shape else None)  # type: ignore[assignment]
+        self.tolerance_px = tolerance_px
+        self.linear_max_error_px: float | None = None
+        self._linear = False
+
+        self._ra0 = self._dec0 = 0.0
+        self._crpix0 = np.zeros(2)
+        self._cd = np.eye(2)
+        self._cd_inv = np.eye(2)
+        if self._is_plain_tan():
+            self._ra0, self._dec0 = (float(v) for v in wcs.wcs.crval)
+            self._crpix0 = np.asarray(wcs.wcs.crpix, dtype=float) - 1.0
+            self._cd = np.asarray(wcs.pixel_scale_matrix, dtype=float)
+            try:
+                self._cd_inv = np.linalg.inv(self._cd)
+            except np.linalg.LinAlgError:
+                return
+            self._linear = self._check_linear()
+
+    # ── Construction ───────────────────────────────────────────────────
+
+    @classmethod
+    def from_header(cls, header: fits.Header, tolerance_px: float = LINEAR_TOLERANCE_PX) -> WcsProjection | None:
+        """Build from a FITS header, or return None if it carries no celestial solution."""
+        if "CRVAL1" not in header:
+            return None
+        try:
+            wcs = WCS(header).celestial
+        except Exception as e:
+            _logger.debug(f"Could not parse WCS: {e}")
+            return None
+        if wcs.naxis != 2:
+            return None
+        shape = None
+        if "NAXIS1" in header and "NAXIS2" in header:
+            shape = (int(header["NAXIS1"]), int(header["NAXIS2"]))  # type: ignore[arg-type]
+        return cls(wcs, shape=shape, tolerance_px=tolerance_px)
+
+    @classmethod
+    def from_fits(cls, fits_path: Path, tolerance_px: float = LINEAR_TOLERANCE_PX) -> WcsProjection | None:
+        """Read the primary header of *fits_path* (header only) and build a projection."""
+        try:
+            header = fits.getheader(fits_path, 0)
+        except Exception:
+            return None
+        return cls.from_header(header, tolerance_px=tolerance_px)
+
+    # ── Public API ─────────────────────────────────────────────────────
+
+    @property
+    def uses_linear(self) -> bool:
+        """True when conversions take the linearized TAN fast path."""
+        return self._linear
+
+    @property
+    def pixel_scale_deg(self) -> float:
+        """Mean pixel scale in degrees per pixel."""
+        return float(np.sqrt(abs(np.linalg.det(np.asarray(self.wcs.pixel_scale_matrix, dtype=float)))))
+
+    def world_to_pixel_values(self, ra_deg, dec_deg) -> tuple[np.ndarray, np.ndarray]:
+        """Convert RA/Dec (degrees, scalars or arrays) to 0-based pixel x/y arrays."""
+        ra = np.asarray(ra_deg, dtype=float)
+        dec = np.asarray(dec_deg, dtype=float)
+        if self._linear:
+            return self._linear_world_to_pixel(ra, dec)
+        with np.errstate(invalid="ignore"):
+            x, y = self.wcs.all_world2pix(ra, dec, 0, quiet=True)
+        return np.asarray(x, dtype=float), np.asarray(y, dtype=float)
+
+    def pixel_to_world_values(self, x, y) -> tuple[np.ndarray, np.ndarray]:
+        """Convert 0-based pixel x/y (scalars or arrays) to RA/Dec in degrees."""
+        px = np.asarray(x, dtype=float)
+        py = np.asarray(y, dtype=float)
+        if self._linear:
+            return self._linear_pixel_to_world(px, py)
+        ra, dec = self.wcs.all_pix2world(px, py, 0)
+        return np.asarray(ra, dtype=float), np.asarray(dec, dtype=float)
+
+    def contains(self, x, y, margin: float = 0.0) -> np.ndarray:
+        """Boolean mask of pixel positions on the detector (NaN is never inside).
+
+        When the detector size is unknown, every finite position counts as inside.
+        """
+        px = np.asarray(x, dtype=float)
+        py = np.asarray(y, dtype=float)
+        if self.shape is None:
+            return np.isfinite(px) & np.isfinite(py)
+        width, height = self.shape
+        return (
+            (px >= -0.5 - margin) & (px < width - 0.5 + margin) & (py >= -0.5 - margin) & (py < height - 0.5 + margin)
+        )
+
+    def center(self) -> tuple[float, float]:
+        """RA/Dec (degrees) of the detector centre, or of CRPIX when the size is unknown."""
+        if self.shape is None:
+            return float(self.wcs.wcs.crval[0]), float(self.wcs.wcs.crval[1])
+        ra, dec = self.pixel_to_world_values(self.shape[0] / 2, self.shape[1] / 2)
+        return float(ra), float(dec)
+
+    # ── Linearized TAN ─────────────────────────────────────────────────
+
+    def _is_plain_tan(self) -> bool:
+        ctype = [str(c).upper() for c in self.wcs.wcs.ctype]
+        if len(ctype) != 2 or not ctype[0].startswith("RA") or ctype[0][5:8] != "TAN" or ctype[1][5:8] != "TAN":
+            return False
+        try:
+            self.wcs.wcs.set()
+        except Exception:
+            return False
+        # Native pole at 180° is the TAN default; anything else rotates the projection.
+        return bool(np.isclose(self.wcs.wcs.lonpole, 180.0))
+
+    def _linear_world_to_pixel(self, ra: np.ndarray, dec: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        ra0, dec0 = np.radians(self._ra0), np.radians(self._dec0)
+        a = np.radians(ra) - ra0
+        d = np.radians(dec)
+        cos_d = np.cos(d)
+        cos_c = np.sin(dec0) * np.sin(d) + np.cos(dec0) * cos_d * np.cos(a)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            cos_c = np.where(cos_c > 0.0, cos_c, np.nan)
+            xi = np.degrees(cos_d * np.sin(a) / cos_c)
+            eta = np.degrees((np.cos(dec0) * np.sin(d) - np.sin(dec0) * cos_d * np.cos(a)) / cos_c)
+        inv = self._cd_inv
+        x = inv[0, 0] * xi + inv[0, 1] * eta + self._crpix0[0]
+        y = inv[1, 0] * xi + inv[1, 1] * eta + self._crpix0[1]
+        return x, y
+
+    def _linear_pixel_to_world(self, x: np.ndarray, y: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        dx = x - self._crpix0[0]
+        dy = y - self._crpix0[1]
+        cd = self._cd
+        xi = np.radians(cd[0, 0] * dx + cd[0, 1] * dy)
+        eta = np.radians(cd[1, 0] * dx + cd[1, 1] * dy)
+        dec0 = np.radians(self._dec0)
+        denom = np.cos(dec0) - eta * np.sin(dec0)
+        ra = np.mod(self._ra0 + np.degrees(np.arctan2(xi, denom)), 360.0)
+        dec = np.degrees(np.arctan2(np.sin(dec0) + eta * np.cos(dec0), np.hypot(xi, denom)))
+        return ra, dec
+
+    def _check_linear(self) -> bool:
+        """Round-trip a detector grid through the full WCS and the linear model."""
+        if self.shape is None:
+            return False
+        width, height = self.shape
+        gx, gy = np.meshgrid(
+            np.linspace(0, width - 1, _CHECK_GRID_POINTS), np.linspace(0, height - 1, _CHECK_GRID_POINTS)
+        )
+        gx, gy = gx.ravel(), gy.ravel()
+        try:
+            ra, dec = self.wcs.all_pix2world(gx, gy, 0)
+        except Exception:
+            return False
+        lx, ly = self._linear_world_to_pixel(np.asarray(ra), np.asarray(dec))
+        err = np.hypot(lx - gx, ly - gy)
+        if not np.all(np.isfinite(err)):
+            return False
+        self.linear_max_error_px = float(err.max())
+        return self.linear_max_error_px <= self.tolerance_px
@@ -8,6 +8,7 @@ The chain is assembled via :func:`build_radar_pipeline`.
 
 from __future__ import annotations
 
+from citrasense.pipelines.radar.radar_artifact_log import RadarArtifactLog
 from citrasense.pipelines.radar.radar_artifact_writer import RadarArtifactWriter, radar_artifact_dir
 from citrasense.pipelines.radar.radar_detection_filter import RadarDetectionFilter
 from citrasense.pipelines.radar.radar_detection_formatter import RadarDetectionFormatter
@@ -15,12 +16,17 @@ from citrasense.pipelines.radar.radar_pipeline import RadarPipeline
 from citrasense.pipelines.radar.radar_processing_context import RadarProcessingContext
 
 
-def build_radar_pipeline() -> RadarPipeline:
-    """Factory for the radar filter → formatter → writer chain."""
-    return RadarPipeline()
+def build_radar_pipeline(*, retention_days: int | None = None) -> RadarPipeline:
+    """Factory for the radar filter → formatter → writer chain.
+
+    Args:
+        retention_days: Days of artifact segments to keep; ``None`` keeps them forever.
+    """
+    return RadarPipeline(writer=RadarArtifactWriter(retention_days=retention_days))
 
 
 __all__ = [
+    "RadarArtifactLog",
     "RadarArtifactWriter",
     "RadarDetectionFilter",
     "RadarDetectionFormatter",
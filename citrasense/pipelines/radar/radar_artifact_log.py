@@ -0,0 +1,361 @@
+"""Segmented, append-only log of radar observation artifacts.
+
+One JSON file per observation adds up to hundreds of thousands of tiny
+files per busy night.  That makes directory listings, retention sweeps
+and backups slow.  :class:`RadarArtifactLog` appends each artifact as
+one compact JSON line to a rotating segment file.  For every line it
+records ``(timestamp, offset, length)`` in a fixed-width index beside
+the segment:
+
+::
+
+    <root>/20260315-0000.jsonl   one artifact per line
+    <root>/20260315-0000.idx     20-byte records: float64 unix time, uint64 offset, uint32 length
+
+A segment holds one UTC day.  It rotates early once it passes
+``max_segment_bytes``.  Appends are group-committed: the caller only
+encodes the line and queues it.  A background flusher writes whatever
+has queued every ``flush_interval`` seconds, or sooner when
+``max_batch`` lines are waiting.  Each batch takes one ``write`` per
+file.  ``fsync`` runs at most every ``fsync_interval`` seconds, on
+:meth:`~RadarArtifactLog.flush` and on
+:meth:`~RadarArtifactLog.close`.  A crash therefore loses at most the
+unsynced tail.
+
+A batch's data is written before its index records.  A torn write
+therefore leaves at most unreferenced bytes at the end of a segment.  A
+partial index record is trimmed when the segment is reopened.
+
+Range queries binary-search the index.  The index is loaded with
+:func:`numpy.fromfile` and cached per segment.  Index times are kept
+non-decreasing across the log, the same way as
+:class:`~citrasense.sensors.allsky.frame_archive.AllskyFrameArchive`.
+An artifact stamped earlier than its predecessor is indexed at the
+predecessor's time.  The artifact itself is stored unchanged.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+import time
+from collections.abc import Iterator
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, BinaryIO
+
+import numpy as np
+
+from citrasense.pipelines.common.artifact_writer import sanitize_json
+
+INDEX_DTYPE = np.dtype([("t", "<f8"), ("offset", "<u8"), ("length", "<u4")])
+
+DEFAULT_FLUSH_INTERVAL_S = 0.5
+DEFAULT_FSYNC_INTERVAL_S = 5.0
+DEFAULT_MAX_BATCH = 1000
+DEFAULT_MAX_SEGMENT_BYTES = 256 * 1024 * 1024
+
+_DATA_SUFFIX = ".jsonl"
+_INDEX_SUFFIX = ".idx"
+
+
+class RadarArtifactLog:
+    """Append-only radar artifact store with group commit and time-range reads.
+
+    Thread-safe: the processing workers append while web requests and
+    tools read.  Appended artifacts become visible to readers at the next
+    group commit; call :meth:`flush` to read your own writes.
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        *,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL_S,
+        fsync_interval: float = DEFAULT_FSYNC_INTERVAL_S,
+        max_batch: int = DEFAULT_MAX_BATCH,
+        max_segment_bytes: int = DEFAULT_MAX_SEGMENT_BYTES,
+        retention_days: float | None = None,
+        logger: logging.Logger | logging.LoggerAdapter | None = None,
+    ):
+        """
+        Args:
+            root: Directory holding the segment files (created on first write)
+            flush_interval: Seconds between group commits
+            fsync_interval: Minimum seconds between fsyncs; 0 syncs every batch
+            max_batch: Queued lines that trigger an early commit
+            max_segment_bytes: Size past which a segment rotates within its day
+            retention_days: Segments whose day ended longer ago than this are
+                deleted as new days start; None keeps everything
+            logger: Logger instance
+        """
+        self.root = Path(root)
+        self.flush_interval = flush_interval
+        self.fsync_interval = fsync_interval
+        self.max_batch = max_batch
+        self.max_segment_bytes = max_segment_bytes
+        self.retention_days = retention_days
+        self.logger = logger or logging.getLogger(__name__)
+
+        self._pending: list[tuple[float, bytes]] = []
+        self._appended = 0
+        self._pending_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._closed = False
+        self._flusher: threading.Thread | None = None
+
+        # Writer state, guarded by _io_lock.
+        self._io_lock = threading.Lock()
+        self._segment: str | None = None
+        self._data: BinaryIO | None = None
+        self._index: BinaryIO | None = None
+        self._data_size = 0
+        self._last_t: float | None = None
+        self._last_fsync = 0.0
+        self._stats = {"batches": 0, "fsyncs": 0, "write_errors": 0}
+
+        self._index_cache: dict[str, tuple[int, np.ndarray]] = {}  # segment -> (index file size, records)
+        self._cache_lock = threading.Lock()
+
+    # ── Writing ────────────────────────────────────────────────────────
+
+    def append(self, record: dict[str, Any], when: datetime) -> None:
+        """Queue *record* (made JSON-safe) as of *when* (timezone-aware; naive is taken as UTC)."""
+        line = json.dumps(sanitize_json(record), default=str, separators=(",", ":")).encode("utf-8") + b"\n"
+        with self._pending_lock:
+            if self._closed:
+                raise RuntimeError("RadarArtifactLog is closed")
+            self._pending.append((_to_unix(when), line))
+            self._appended += 1
+            if self._flusher is None:
+                self._flusher = threading.Thread(target=self._run, name=f"RadarArtifactLog[{self.root.name}]")
+                self._flusher.daemon = True
+                self._flusher.start()
+            if len(self._pending) >= self.max_batch:
+                self._wake.set()
+
+    def flush(self, fsync: bool = True) -> None:
+        """Commit everything queued so far, and fsync unless *fsync* is False."""
+        self._commit(force_fsync=fsync)
+
+    def close(self) -> None:
+        """Commit and fsync the queue, stop the flusher and close the segment files."""
+        with self._pending_lock:
+            self._closed = True
+            flusher = self._flusher
+        self._wake.set()
+        if flusher is not None:
+            flusher.join(timeout=10.0)
+        self._commit(force_fsync=True)
+        with self._io_lock:
+            self._close_segment()
+
+    def _run(self) -> None:
+        while True:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            with self._pending_lock:
+                if self._closed:
+                    return
+            self._commit(force_fsync=False)
+
+    def _commit(self, force_fsync: bool) -> None:
+        with self._io_lock:
+            # Taking the batch under _io_lock keeps concurrent commits in append order.
+            with self._pending_lock:
+                batch, self._pending = self._pending, []
+            try:
+                if batch:
+                    self._write_batch(batch)
+                if self._data is not None and (
+                    force_fsync or time.monotonic() - self._last_fsync >= self.fsync_interval
+                ):
+                    self._fsync()
+            except OSError as exc:
+                self._stats["write_errors"] += 1
+                self.logger.warning(f"Radar artifact log write failed in {self.root}: {exc}")
+                # Reopen on the next batch so the write offset is re-read from the file.
+                try:
+                    self._close_segment()
+                except OSError:
+                    self._data = self._index = None
+                    self._segment = None
+
+    def _write_batch(self, batch: list[tuple[float, bytes]]) -> None:
+        """Append *batch*, one write per file per segment touched; caller holds ``_io_lock``."""
+        chunk: list[tuple[float, int, bytes]] = []
+        for t, line in batch:
+            if self._last_t is not None and t < self._last_t:
+                t = self._last_t
+            day = _day_for(t)
+            if self._segment is None or day != self._segment[:8] or self._data_size >= self.max_segment_bytes:
+                self._write_chunk(chunk)
+                chunk = []
+                self._open_segment(day)
+                t = max(t, self._last_t or t)  # reopening may have recovered a later time from disk
+            chunk.append((t, self._data_size, line))
+            self._data_size += len(line)
+            self._last_t = t
+        self._write_chunk(chunk)
+
+    def _write_chunk(self, chunk: list[tuple[float, int, bytes]]) -> None:
+        """Data first, then its index records, so a torn write never indexes missing bytes."""
+        if not chunk:
+            return
+        assert self._data is not None
+        assert self._index is not None
+        self._data.write(b"".join(line for _, _, line in chunk))
+        self._data.flush()
+        index = np.array([(t, offset, len(line)) for t, offset, line in chunk], dtype=INDEX_DTYPE)
+        self._index.write(index.tobytes())
+        self._index.flush()
+        self._stats["batches"] += 1
+
+    def _fsync(self) -> None:
+        assert self._data is not None
+        assert self._index is not None
+        os.fsync(self._data.fileno())
+        os.fsync(self._index.fileno())
+        self._last_fsync = time.monotonic()
+        self._stats["fsyncs"] += 1
+
+    def _open_segment(self, day: str) -> None:
+        """Switch writing to the newest segment of *day*, or a new one; caller holds ``_io_lock``."""
+        if self._data is not None:
+            self._fsync()
+        self._close_segment()
+        self.root.mkdir(parents=True, exist_ok=True)
+        existing = [s for s in self.segments() if s[:8] == day]
+        segment = existing[-1] if existing else f"{day}-0000"
+        data_path, index_path = self._paths(segment)
+        if data_path.exists() and data_path.stat().st_size >= self.max_segment_bytes:
+            segment = f"{day}-{int(segment[9:]) + 1:04d}"
+            data_path, index_path = self._paths(segment)
+        if index_path.exists():
+            size = index_path.stat().st_size
+            whole = size - size % INDEX_DTYPE.itemsize
+            if whole != size:
+                self.logger.warning(f"Trimming torn radar artifact index record in {index_path.name}")
+                os.truncate(index_path, whole)
+            records = self._records(segment)
+            if len(records):
+                self._last_t = max(self._last_t or 0.0, float(records["t"][-1]))
+        self._data = open(data_path, "ab")
+        self._index = open(index_path, "ab")
+        self._data_size = self._data.tell()
+        self._segment = segment
+        if self.retention_days is not None:
+            self._prune(day)
+
+    def _close_segment(self) -> None:
+        for handle in (self._data, self._index):
+            if handle is not None:
+                handle.close()
+        self._data = self._index = None
+        self._segment = None
+
+    def _prune(self, current_day: str) -> None:
+        cutoff = datetime.strptime(current_day, "%Y%m%d").replace(tzinfo=timezone.utc) - timedelta(
+            days=self.retention_days or 0
+        )
+        for segment in self.segments():
+            day_end = datetime.strptime(segment[:8], "%Y%m%d").replace(tzinfo=timezone.utc) + timedelta(days=1)
+            if day_end <= cutoff:
+                for path in self._paths(segment):
+                    path.unlink(missing_ok=True)
+                with self._cache_lock:
+                    self._index_cache.pop(segment, None)
+                self.logger.info(f"Pruned radar artifact segment {segment}")
+
+    # ── Reading ────────────────────────────────────────────────────────
+
+    def segments(self) -> list[str]:
+        """Segment names (``YYYYMMDD-NNNN``) present on disk, oldest first."""
+        if not self.root.is_dir():
+            return []
+        return sorted(p.stem for p in self.root.glob(f"*{_INDEX_SUFFIX}"))
+
+    def iter_between(self, start: datetime, end: datetime, limit: int | None = None) -> Iterator[dict[str, Any]]:
+        """Committed artifacts indexed in ``[start, end]``, oldest first, at most *limit* of them."""
+        t0, t1 = _to_unix(start), _to_unix(end)
+        first, last = _day_for(t0), _day_for(t1)
+        remaining = limit
+        for segment in self.segments():
+            if not first <= segment[:8] <= last:
+                continue
+            records = self._records(segment)
+            lo = int(np.searchsorted(records["t"], t0, side="left"))
+            hi = int(np.searchsorted(records["t"], t1, side="right"))
+            if remaining is not None:
+                hi = min(hi, lo + remaining)
+                remaining -= hi - lo
+            if hi <= lo:
+                continue
+            # Records in [lo, hi) are contiguous on disk: one read per segment.
+            begin = int(records["offset"][lo])
+            finish = int(records["offset"][hi - 1]) + int(records["length"][hi - 1])
+            with open(self._paths(segment)[0], "rb") as f:
+                f.seek(begin)
+                blob = f.read(finish - begin)
+            for offset, length in zip(
+                records["offset"][lo:hi].tolist(), records["length"][lo:hi].tolist(), strict=True
+            ):
+                yield json.loads(blob[offset - begin : offset - begin + length])
+            if remaining == 0:
+                return
+
+    def records_between(self, start: datetime, end: datetime, limit: int | None = None) -> list[dict[str, Any]]:
+        """List form of :meth:`iter_between`."""
+        return list(self.iter_between(start, end, limit))
+
+    def stats(self) -> dict[str, Any]:
+        """Record and file counts, bytes on disk and writer counters, for status displays."""
+        segments = self.segments()
+        size = sum(p.stat().st_size for s in segments for p in self._paths(s) if p.exists())
+        with self._pending_lock:
+            pending, appended = len(self._pending), self._appended
+        with self._io_lock:
+            counters = dict(self._stats)
+        return {
+            "records": sum(len(self._records(s)) for s in segments),
+            "segments": len(segments),
+            "files": 2 * len(segments),
+            "bytes": size,
+            "appended": appended,
+            "pending": pending,
+            **counters,
+        }
+
+    # ── Internals ──────────────────────────────────────────────────────
+
+    def _paths(self, segment: str) -> tuple[Path, Path]:
+        return self.root / f"{segment}{_DATA_SUFFIX}", self.root / f"{segment}{_INDEX_SUFFIX}"
+
+    def _records(self, segment: str) -> np.ndarray:
+        """Index records of *segment*, re-read only when the index file has grown."""
+        _, index_path = self._paths(segment)
+        try:
+            size = index_path.stat().st_size
+        except FileNotFoundError:
+            return np.empty(0, dtype=INDEX_DTYPE)
+        with self._cache_lock:
+            cached = self._index_cache.get(segment)
+            if cached is not None and cached[0] == size:
+                return cached[1]
+        count = size // INDEX_DTYPE.itemsize
+        records = np.fromfile(index_path, dtype=INDEX_DTYPE, count=count)
+        with self._cache_lock:
+            self._index_cache[segment] = (size, records)
+        return records
+
+
+def _to_unix(when: datetime) -> float:
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return when.timestamp()
+
+
+def _day_for(t: float) -> str:
+    return datetime.fromtimestamp(min(max(t, 0.0), 253402300799.0), tz=timezone.utc).strftime("%Y%m%d")
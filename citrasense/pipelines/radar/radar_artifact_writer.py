@@ -1,7 +1,9 @@
 """Persist radar observation artifacts to disk.
 
-Every event the radar pipeline processes produces a single JSON file
-under ``<analysis_dir>/radar/<sensor_id>/<timestamp>.json`` containing:
+Every event the radar pipeline processes produces one artifact record
+in the sensor's :class:`~citrasense.pipelines.radar.radar_artifact_log.RadarArtifactLog`
+under ``<analysis_dir>/radar/<sensor_id>/`` (rotating ``.jsonl``
+segments with a time index) containing:
 
 - ``observation`` — the raw ``pr_sensor`` enriched observation dict
   (what came off ``radar.sensor.{id}.observations``).
@@ -18,37 +20,37 @@ debugging can reason about what was dropped and why.
 
 from __future__ import annotations
 
-import re
+import threading
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import TYPE_CHECKING
 
-from citrasense.pipelines.common.artifact_writer import dump_json
+from citrasense.pipelines.radar.radar_artifact_log import RadarArtifactLog
 
 if TYPE_CHECKING:
-    from citrasense.pipelines.radar.radar_processing_context import RadarProcessingContext
-
-_UNSAFE_CHARS = re.compile(r"[^0-9A-Za-z._-]")
+    from citrasense.pipelines.radar.radar_processing_context import LoggerLike, RadarProcessingContext
 
 
 class RadarArtifactWriter:
-    """Best-effort disk artifact for a single radar observation."""
+    """Best-effort disk artifact for each radar observation, one log per artifact directory.
+
+    Args:
+        retention_days: Passed to every :class:`RadarArtifactLog` this writer
+            opens; ``None`` keeps segments forever.
+    """
 
     name = "radar_artifact_writer"
 
+    def __init__(self, *, retention_days: int | None = None) -> None:
+        self.retention_days = retention_days
+        self._logs: dict[Path, RadarArtifactLog] = {}
+        self._lock = threading.Lock()
+
     def process(self, ctx: RadarProcessingContext) -> bool:
         artifact_dir = ctx.artifact_dir
         if artifact_dir is None:
             return True  # no-op when deployed without a configured dir
 
-        try:
-            artifact_dir.mkdir(parents=True, exist_ok=True)
-        except Exception as exc:
-            if ctx.logger:
-                ctx.logger.warning("Failed to mkdir %s: %s", artifact_dir, exc)
-            return True  # best-effort only
-
-        filename = _filename_for(ctx)
         data = {
             "sensor_id": ctx.sensor_id,
             "received_at": (ctx.received_at or datetime.now(timezone.utc)).isoformat(),
@@ -56,15 +58,29 @@ class RadarArtifactWriter:
             "drop_reason": ctx.drop_reason,
             "upload_payload": ctx.upload_payload,
         }
-        dump_json(artifact_dir, filename, data, logger=ctx.logger)
-        return True
-
-
-def _filename_for(ctx: RadarProcessingContext) -> str:
-    ts = ctx.event.timestamp.astimezone(timezone.utc).strftime("%Y%m%dT%H%M%S.%f")
-    obs_id = ctx.event.payload.get("observation_id") or "obs"
-    safe_obs = _UNSAFE_CHARS.sub("_", str(obs_id))[:40]
-    return f"{ts}Z_{safe_obs}.json"
+        try:
+            self.log_for(artifact_dir, ctx.logger).append(data, ctx.event.timestamp)
+        except Exception as exc:
+            if ctx.logger:
+                ctx.logger.warning("Failed to queue radar artifact for %s: %s", artifact_dir, exc)
+        return True  # best-effort only
+
+    def log_for(self, artifact_dir: Path, logger: LoggerLike | None = None) -> RadarArtifactLog:
+        """The (lazily opened) artifact log for *artifact_dir*."""
+        with self._lock:
+            log = self._logs.get(artifact_dir)
+            if log is None:
+                log = self._logs[artifact_dir] = RadarArtifactLog(
+                    artifact_dir, retention_days=self.retention_days, logger=logger
+                )
+            return log
+
+    def close(self) -> None:
+        """Flush and close every open log; a later :meth:`process` reopens them."""
+        with self._lock:
+            logs, self._logs = list(self._logs.values()), {}
+        for log in logs:
+            log.close()
 
 
 def radar_artifact_dir(base: Path, sensor_id: str) -> Path:
@@ -71,17 +71,22 @@ def _get_snr_db(payload: dict) -> float | None:
 
 
 def _is_tasked(ctx: RadarProcessingContext, citra_uuid: str) -> bool:
-    """Lookup currently-tasked satellites via the dispatcher snapshot.
-
-    ``task_index`` is expected to expose ``get_tasks_snapshot()`` (the
-    :class:`~citrasense.tasks.task_dispatcher.TaskDispatcher` method
-    referenced from the radar issue).  When ``task_index`` is ``None``
-    we fail open — the gate reduces to a no-op, matching v1 intent.
+    """Lookup currently-tasked satellites on the dispatcher.
+
+    ``task_index`` is normally the
+    :class:`~citrasense.tasks.task_dispatcher.TaskDispatcher`, whose
+    ``tasked_satellite_ids()`` is a lock-free set lookup.  Indexes that
+    only expose ``get_tasks_snapshot()`` fall back to a linear scan.
+    When ``task_index`` is ``None`` we fail open — the gate reduces to a
+    no-op, matching v1 intent.
     """
     ti = ctx.task_index
     if ti is None:
         return True
     try:
+        tasked_ids = getattr(ti, "tasked_satellite_ids", None)
+        if callable(tasked_ids):
+            return citra_uuid in tasked_ids()
         tasks = ti.get_tasks_snapshot()
     except Exception:
         return True
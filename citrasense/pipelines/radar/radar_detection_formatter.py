@@ -15,8 +15,9 @@ Key transforms:
   only include the transmitter block when lat/lon are both available.
   Altitude is omitted in v1 (``pr_sensor`` doesn't emit it).
 - ``geometry.az_deg`` / ``el_deg`` → ``rightAscension`` / ``declination``
-  via an astropy ``AltAz → ICRS`` transform anchored at the receiver
-  position and the observation epoch.  If the receiver position is
+  via an ``AltAz → ICRS`` transform anchored at the receiver position
+  and the observation epoch (:class:`~citrasense.astro.altaz_icrs.AltAzToIcrs`,
+  one cached engine per receiver site).  If the receiver position is
   missing we skip the angular fields and upload range-only data.
 - ``bistatic.doppler_hz`` → ``rangeRate`` via the standard
   bistatic Doppler-to-range-rate conversion, using the configured
@@ -32,9 +33,11 @@ from __future__ import annotations
 
 import logging
 from datetime import datetime, timezone
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
+    from citrasense.astro.altaz_icrs import AltAzToIcrs
     from citrasense.pipelines.radar.radar_processing_context import RadarProcessingContext
 
 
@@ -211,6 +214,28 @@ def _ensure_iso8601(value: Any, fallback: datetime) -> str:
     return fb.isoformat().replace("+00:00", "Z")
 
 
+@lru_cache(maxsize=8)
+def _transform_engine(lat_deg: float, lon_deg: float, alt_m: float) -> AltAzToIcrs:
+    """One engine per receiver site; a sensor's site never moves, so this is effectively one per sensor."""
+    from citrasense.astro.altaz_icrs import AltAzToIcrs
+
+    return AltAzToIcrs(lat_deg, lon_deg, alt_m)
+
+
+def _parse_epoch(epoch: str) -> datetime:
+    cleaned = epoch.strip()
+    if cleaned.endswith("Z"):
+        cleaned = cleaned[:-1] + "+00:00"
+    try:
+        when = datetime.fromisoformat(cleaned)
+    except ValueError:
+        # Non-ISO spellings astropy accepts (e.g. "2026-03-15 04:00:00.5").
+        from astropy.time import Time
+
+        return Time(epoch, scale="utc").to_datetime(timezone=timezone.utc)
+    return when if when.tzinfo else when.replace(tzinfo=timezone.utc)
+
+
 def _azel_to_radec(
     *,
     az_deg: float,
@@ -221,35 +246,21 @@ def _azel_to_radec(
     epoch: str,
     log: Any,
 ) -> tuple[float, float] | None:
-    """Transform local alt/az to ICRS RA/Dec via astropy.
+    """Transform local alt/az to ICRS RA/Dec.
 
-    Imported lazily because astropy is already in the optical critical
-    path; deferring the import keeps the radar cold-start fast on
-    systems that don't run radar.
+    The engine (and with it astropy) is imported lazily because
+    astropy is already in the optical critical path; deferring the
+    import keeps the radar cold-start fast on systems that don't run
+    radar.
     """
     try:
-        from astropy import units as u  # type: ignore[import-not-found]
-        from astropy.coordinates import AltAz, EarthLocation, SkyCoord
-        from astropy.time import Time
+        engine = _transform_engine(lat_deg, lon_deg, alt_m)
     except Exception as exc:
         log.warning("astropy not importable; skipping RA/Dec conversion: %s", exc)
         return None
 
     try:
-        location = EarthLocation(
-            lat=lat_deg * u.deg,  # type: ignore[attr-defined]
-            lon=lon_deg * u.deg,  # type: ignore[attr-defined]
-            height=alt_m * u.m,  # type: ignore[attr-defined]
-        )
-        obstime = Time(epoch)
-        altaz_frame = AltAz(obstime=obstime, location=location)
-        coord = SkyCoord(
-            alt=el_deg * u.deg,  # type: ignore[attr-defined]
-            az=az_deg * u.deg,  # type: ignore[attr-defined]
-            frame=altaz_frame,
-        )
-        icrs = coord.icrs
-        return float(icrs.ra.deg), float(icrs.dec.deg)  # type: ignore[attr-defined,union-attr]
+        return engine.transform_one(az_deg, el_deg, _parse_epoch(epoch))
     except Exception as exc:
         log.warning("AltAz→ICRS conversion failed: %s", exc)
         return None
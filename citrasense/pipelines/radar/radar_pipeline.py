@@ -99,6 +99,10 @@ class RadarPipeline:
 
         return passed_filter and formatted
 
+    def close(self) -> None:
+        """Flush the artifact writer's logs; call when the owning runtime stops."""
+        self._writer.close()
+
     def _record_run(self, name: str, *, failed: bool, reason: str | None) -> None:
         with self._stats_lock:
             s = self._processor_stats.get(name)
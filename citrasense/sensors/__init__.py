@@ -17,7 +17,7 @@ from citrasense.sensors.abstract_sensor import (
     SensorAcquisitionMode,
     SensorCapabilities,
 )
-from citrasense.sensors.bus import InProcessBus, SensorBus, Subscription
+from citrasense.sensors.bus import Delivery, DeliveryMode, InProcessBus, OverflowPolicy, SensorBus, Subscription
 from citrasense.sensors.sensor_manager import SensorManager
 from citrasense.sensors.sensor_registry import (
     REGISTERED_SENSORS,
@@ -32,7 +32,10 @@ __all__ = [
     "AcquisitionContext",
     "AcquisitionEvent",
     "AcquisitionResult",
+    "Delivery",
+    "DeliveryMode",
     "InProcessBus",
+    "OverflowPolicy",
     "SensorAcquisitionMode",
     "SensorBus",
     "SensorCapabilities",
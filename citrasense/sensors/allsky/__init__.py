@@ -3,7 +3,8 @@
 Home of :class:`AllskyCameraSensor` — a streaming sensor that runs a wide-FOV
 camera (USB or Raspberry Pi HQ) in a periodic-capture loop and pushes JPEG
 previews to :class:`~citrasense.sensors.preview_bus.PreviewBus` for the web
-UI.
+UI, plus :class:`~citrasense.sensors.allsky.frame_archive.AllskyFrameArchive`,
+the time-indexed store of captured frames behind timelapse playback.
 
 No Citra task flow, no upload, no processing pipeline (yet) — those land in
 follow-up issues.  The runtime queues still build per the
@@ -2,9 +2,13 @@
 
 Wraps an :class:`~citrasense.hardware.devices.camera.AbstractCamera`
 implementation (USB or Raspberry Pi HQ today) in a periodic-capture loop.
-Each frame is encoded as a JPEG, stored as the latest snapshot for HTTP
-download, and pushed to :class:`~citrasense.sensors.preview_bus.PreviewBus`
-so the web UI can render it live.
+Each frame is JPEG-encoded once; those bytes are stored as the latest
+snapshot for HTTP download, appended to the sensor's
+:class:`~citrasense.sensors.allsky.frame_archive.AllskyFrameArchive`
+(when enabled), and handed to
+:class:`~citrasense.sensors.preview_bus.PreviewBus` as the full-resolution
+level of a :class:`~citrasense.sensors.preview_bus.PreviewFrame`, so the
+web UI renders it live without a second encode.
 
 The sensor advertises ``STREAMING`` so
 :meth:`SensorRuntime._start_streaming_sensor` calls :meth:`start_stream`
@@ -16,7 +20,6 @@ events; the public surface stays unchanged.
 
 from __future__ import annotations
 
-import base64
 import logging
 import threading
 import time
@@ -38,7 +41,8 @@ from citrasense.sensors.abstract_sensor import (
     SensorAcquisitionMode,
     SensorCapabilities,
 )
-from citrasense.sensors.preview_bus import array_to_jpeg_data_url
+from citrasense.sensors.allsky.frame_archive import AllskyFrameArchive
+from citrasense.sensors.preview_bus import PreviewFrame
 
 if TYPE_CHECKING:
     from citrasense.hardware.devices.camera import AbstractCamera
@@ -63,6 +67,13 @@ _DEFAULT_EXPOSURE_S: float = 1.0
 _DEFAULT_GAIN: float = 1.0
 _DEFAULT_JPEG_QUALITY: int = 85
 
+#: Frame archive defaults.  The archive is opt-in since it writes every
+#: frame to disk.  At the default 30 s interval a night is ~1000 frames;
+#: two days of retention keeps last night's timelapse available through
+#: the following day without letting a Pi's SD card fill up.
+_DEFAULT_ARCHIVE_ENABLED: bool = False
+_DEFAULT_ARCHIVE_RETENTION_DAYS: float = 2.0
+
 #: How long capture-loop start/stop will wait for the worker thread.  The
 #: loop checks the stop event before every sleep, so a graceful shutdown
 #: from inside ``stop_stream`` should always complete in well under this.
@@ -99,6 +110,7 @@ class AllskyCameraSensor(AbstractSensor):
         jpeg_quality: int = _DEFAULT_JPEG_QUALITY,
         flip_horizontal: bool = False,
         preview_bus: PreviewBus | None = None,
+        archive: AllskyFrameArchive | None = None,
         dependency_issues: list[dict[str, str]] | None = None,
     ) -> None:
         super().__init__(sensor_id=sensor_id)
@@ -130,6 +142,8 @@ class AllskyCameraSensor(AbstractSensor):
         # callback).  The capture loop tolerates ``None`` so a misconfigured
         # site doesn't crash — frames just won't reach the browser.
         self.preview_bus: PreviewBus | None = preview_bus
+        # Time-indexed store of every captured JPEG; ``None`` disables archiving.
+        self.archive: AllskyFrameArchive | None = archive
 
         # Public-facing bookkeeping (consumed by ``get_live_status`` and the
         # web routes).  Guarded by ``_state_lock`` so the capture thread and
@@ -170,13 +184,14 @@ class AllskyCameraSensor(AbstractSensor):
         - ``camera_type``: one of ``usb_camera``, ``rpi_hq``.  Required.
         - ``capture_interval_s`` / ``exposure_s`` / ``gain`` / ``jpeg_quality``
           / ``flip_horizontal``: allsky-loop tuning, all optional.
+        - ``archive_enabled`` / ``archive_retention_days``: the frame
+          archive under ``images_dir/allsky/<sensor id>`` (off unless enabled).
         - any key prefixed with ``camera_`` is forwarded to the camera
           constructor with the prefix stripped (e.g.
           ``camera_camera_index`` → ``camera_index`` for ``UsbCamera``).
           Mirrors the prefix scheme :class:`DirectHardwareAdapter` uses
           so the existing form renderer drives both consistently.
         """
-        del images_dir  # allsky writes nothing to disk in phase 1
         from citrasense.logging.sensor_logger import get_sensor_logger
 
         adapter_settings = dict(cfg.adapter_settings or {})
@@ -238,11 +253,20 @@ class AllskyCameraSensor(AbstractSensor):
             logger.getChild(f"AllskyCameraSensor[{cfg.id}]"),
             cfg.id,
         )
+        archive = None
+        if bool(adapter_settings.get("archive_enabled", _DEFAULT_ARCHIVE_ENABLED)):
+            retention = adapter_settings.get("archive_retention_days", _DEFAULT_ARCHIVE_RETENTION_DAYS)
+            archive = AllskyFrameArchive(
+                Path(images_dir) / "allsky" / cfg.id,
+                retention_days=float(retention) if retention else None,
+                logger=logger.getChild(f"AllskyFrameArchive[{cfg.id}]"),
+            )
         return cls(
             sensor_id=cfg.id,
             camera=camera,
             camera_type=camera_type,
             logger=sensor_logger,
+            archive=archive,
             dependency_issues=dependency_issues,
             capture_interval_s=float(adapter_settings.get("capture_interval_s", _DEFAULT_CAPTURE_INTERVAL_S)),
             exposure_s=float(adapter_settings.get("exposure_s", _DEFAULT_EXPOSURE_S)),
@@ -347,6 +371,27 @@ class AllskyCameraSensor(AbstractSensor):
                 "description": "Mirror the image left/right (corrects for diagonal mirrors / dome flips).",
                 "required": False,
             },
+            {
+                "name": "archive_enabled",
+                "friendly_name": "Archive frames",
+                "type": "bool",
+                "default": _DEFAULT_ARCHIVE_ENABLED,
+                "group": "Archive",
+                "description": "Keep every captured frame in a time-indexed archive for timelapse playback.",
+                "required": False,
+            },
+            {
+                "name": "archive_retention_days",
+                "friendly_name": "Archive retention (days)",
+                "type": "float",
+                "default": _DEFAULT_ARCHIVE_RETENTION_DAYS,
+                "group": "Archive",
+                "description": "Whole UTC days of frames to keep; older days are deleted. 0 keeps everything.",
+                "required": False,
+                "min": 0.0,
+                "max": 365.0,
+                "visible_when": {"field": "archive_enabled", "value": "true"},
+            },
         ]
 
         # Pull in the chosen camera's own schema, prefixed so its keys
@@ -591,7 +636,7 @@ class AllskyCameraSensor(AbstractSensor):
             self._stop_event.wait(self._capture_interval_s)
 
     def _capture_once(self) -> bool:
-        """Capture one frame; encode it; push to the preview bus.
+        """Capture one frame; encode it once; archive it and push to the preview bus.
 
         Returns ``True`` on success, ``False`` if the capture failed (the
         error is also recorded on ``self._last_error`` so ``get_live_status``
@@ -615,24 +660,28 @@ class AllskyCameraSensor(AbstractSensor):
                 return False
             duration = time.perf_counter() - t_start
 
+            captured_at = datetime.now(timezone.utc)
+
             try:
-                data_url = array_to_jpeg_data_url(
-                    frame,
-                    quality=self._jpeg_quality,
-                    flip_horizontal=self._flip_horizontal,
-                )
+                preview = PreviewFrame(frame, quality=self._jpeg_quality, flip_horizontal=self._flip_horizontal)
+                jpeg_bytes = preview.jpeg().jpeg
             except Exception as exc:
                 with self._state_lock:
                     self._last_error = f"encode: {exc}"
                 self._logger.error("JPEG encode failed: %s", exc, exc_info=True)
                 return False
 
-            jpeg_bytes = self._extract_jpeg_bytes(data_url)
             frame_size = self._frame_dimensions(frame)
 
+            if self.archive is not None:
+                try:
+                    self.archive.append(jpeg_bytes, captured_at)
+                except OSError as exc:
+                    self._logger.warning("Allsky archive append failed: %s", exc)
+
             with self._state_lock:
                 self._latest_jpeg = jpeg_bytes
-                self._last_capture_at = datetime.now(timezone.utc)
+                self._last_capture_at = captured_at
                 self._last_capture_duration_s = duration
                 self._last_frame_size = frame_size
                 self._capture_count += 1
@@ -640,7 +689,7 @@ class AllskyCameraSensor(AbstractSensor):
 
             if self.preview_bus is not None:
                 try:
-                    self.preview_bus.push(data_url, source="allsky", sensor_id=self.sensor_id)
+                    self.preview_bus.push_array(preview, source="allsky", sensor_id=self.sensor_id)
                 except Exception as exc:
                     self._logger.warning("PreviewBus push failed: %s", exc)
             else:
@@ -649,15 +698,6 @@ class AllskyCameraSensor(AbstractSensor):
         finally:
             self._capture_lock.release()
 
-    @staticmethod
-    def _extract_jpeg_bytes(data_url: str) -> bytes:
-        """Strip the ``data:image/jpeg;base64,`` prefix and decode."""
-        marker = ";base64,"
-        idx = data_url.find(marker)
-        if idx < 0:
-            return b""
-        return base64.b64decode(data_url[idx + len(marker) :])
-
     @staticmethod
     def _frame_dimensions(frame: Any) -> tuple[int, int] | None:
         """Return ``(width, height)`` from a 2-D or 3-D ndarray, else ``None``."""
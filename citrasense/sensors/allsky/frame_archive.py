@@ -0,0 +1,258 @@
+"""Append-only, time-indexed store for allsky JPEG frames.
+
+A timelapse of one night is a few thousand frames; keeping each as its
+own file means every timelapse request lists, sorts and stats the whole
+directory.  :class:`AllskyFrameArchive` instead appends frames to one
+data file per UTC day and records ``(timestamp, offset, length)`` in a
+fixed-width index file beside it:
+
+::
+
+    <root>/20260315.frames   concatenated JPEG bytes
+    <root>/20260315.idx      20-byte records: float64 unix time, uint64 offset, uint32 length
+
+Finding the frames for a time range is a binary search over the index
+(loaded with :func:`numpy.fromfile`, cached per segment) followed by one
+seek-and-read per frame.  Frame data is written before its index record, so
+a crash mid-append leaves at most unreferenced bytes at the end of the
+data file; a torn trailing index record is ignored on read and trimmed
+on the next append.
+
+Timestamps within the archive are kept non-decreasing: a frame stamped
+earlier than its predecessor (clock step) is recorded at the
+predecessor's time so the binary search stays valid.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+from collections.abc import Iterator
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import numpy as np
+
+INDEX_DTYPE = np.dtype([("t", "<f8"), ("offset", "<u8"), ("length", "<u4")])
+
+_DATA_SUFFIX = ".frames"
+_INDEX_SUFFIX = ".idx"
+
+
+@dataclass(frozen=True)
+class ArchivedFrame:
+    """Location of one archived frame."""
+
+    captured_at: datetime
+    segment: str
+    offset: int
+    length: int
+
+
+class AllskyFrameArchive:
+    """Daily-segmented JPEG archive with timestamp seek.
+
+    Thread-safe: the capture thread appends while web requests read.  The
+    index cache is only touched under ``_lock`` (re-entrant, since
+    :meth:`append` reads the index while opening a segment).
+    """
+
+    def __init__(self, root: Path, retention_days: float | None = None, logger: logging.Logger | None = None):
+        """
+        Args:
+            root: Directory holding the segment files (created on first append)
+            retention_days: Segments whose day ended longer ago than this are
+                deleted as new days start; None keeps everything
+            logger: Logger instance
+        """
+        self.root = Path(root)
+        self.retention_days = retention_days
+        self.logger = logger or logging.getLogger(__name__)
+        self._lock = threading.RLock()
+        self._index_cache: dict[str, tuple[int, np.ndarray]] = {}  # segment -> (index file size, records)
+        self._last_t: float | None = None
+        self._active_segment: str | None = None
+
+    # ── Writing ────────────────────────────────────────────────────────
+
+    def append(self, jpeg: bytes, captured_at: datetime) -> ArchivedFrame:
+        """Store *jpeg* as captured at *captured_at* (timezone-aware; naive is taken as UTC)."""
+        t = _to_unix(captured_at)
+        segment = _segment_for(t)
+        with self._lock:
+            if segment != self._active_segment:
+                self._open_segment(segment)
+            if self._last_t is not None and t < self._last_t:
+                t = self._last_t
+            data_path, index_path = self._paths(segment)
+            with open(data_path, "ab") as f:
+                offset = f.tell()
+                f.write(jpeg)
+            record = np.array([(t, offset, len(jpeg))], dtype=INDEX_DTYPE)
+            with open(index_path, "ab") as f:
+                f.write(record.tobytes())
+            self._last_t = t
+        return ArchivedFrame(_from_unix(t), segment, offset, len(jpeg))
+
+    def _open_segment(self, segment: str) -> None:
+        """Start appending to *segment*: create the directory, repair a torn index tail, apply retention."""
+        self.root.mkdir(parents=True, exist_ok=True)
+        _, index_path = self._paths(segment)
+        if index_path.exists():
+            size = index_path.stat().st_size
+            whole = size - size % INDEX_DTYPE.itemsize
+            if whole != size:
+                self.logger.warning(f"Trimming torn allsky index record in {index_path.name}")
+                os.truncate(index_path, whole)
+        records = self._records(segment)
+        self._last_t = float(records["t"][-1]) if len(records) else self._last_t
+        self._active_segment = segment
+        if self.retention_days is not None:
+            self._prune(segment)
+
+    def _prune(self, current: str) -> None:
+        cutoff = datetime.strptime(current, "%Y%m%d").replace(tzinfo=timezone.utc) - timedelta(
+            days=self.retention_days or 0
+        )
+        for segment in self.segments():
+            day_end = datetime.strptime(segment, "%Y%m%d").replace(tzinfo=timezone.utc) + timedelta(days=1)
+            if day_end <= cutoff:
+                for path in self._paths(segment):
+                    path.unlink(missing_ok=True)
+                self._index_cache.pop(segment, None)
+                self.logger.info(f"Pruned allsky archive segment {segment}")
+
+    # ── Reading ────────────────────────────────────────────────────────
+
+    def segments(self) -> list[str]:
+        """Segment names (``YYYYMMDD``) present on disk, oldest first."""
+        if not self.root.is_dir():
+            return []
+        return sorted(p.stem for p in self.root.glob(f"*{_INDEX_SUFFIX}"))
+
+    def frames_between(self, start: datetime, end: datetime, max_frames: int | None = None) -> list[ArchivedFrame]:
+        """Frames captured in ``[start, end]``, oldest first.
+
+        With *max_frames*, the range is thinned to at most that many
+        evenly spaced frames (for a timelapse at a fixed frame budget).
+
+        Raises:
+            ValueError: If *max_frames* is less than 1
+        """
+        if max_frames is not None and max_frames < 1:
+            raise ValueError(f"max_frames must be at least 1, got {max_frames}")
+        t0, t1 = _to_unix(start), _to_unix(end)
+        first, last = _segment_for(t0), _segment_for(t1)
+        hits: list[ArchivedFrame] = []
+        for segment in self.segments():
+            if not first <= segment <= last:
+                continue
+            records = self._records(segment)
+            lo = int(np.searchsorted(records["t"], t0, side="left"))
+            hi = int(np.searchsorted(records["t"], t1, side="right"))
+            hits.extend(_to_frame(segment, r) for r in records[lo:hi])
+        if max_frames is not None and len(hits) > max_frames:
+            picks = np.linspace(0, len(hits) - 1, max_frames).round().astype(int)
+            hits = [hits[i] for i in picks]
+        return hits
+
+    def nearest(self, when: datetime) -> ArchivedFrame | None:
+        """The archived frame closest in time to *when*, or None if the archive is empty."""
+        t = _to_unix(when)
+        target = _segment_for(t)
+        segments = self.segments()
+        # The closest frame is in the target day or the nearest non-empty day either side of it.
+        before = [s for s in segments if s <= target]
+        after = [s for s in segments if s > target]
+        candidates = []
+        for segment in before[-2:] + after[:1]:
+            records = self._records(segment)
+            if not len(records):
+                continue
+            i = int(np.searchsorted(records["t"], t))
+            for j in (i - 1, i):
+                if 0 <= j < len(records):
+                    candidates.append((abs(float(records["t"][j]) - t), _to_frame(segment, records[j])))
+        return min(candidates, key=lambda c: c[0])[1] if candidates else None
+
+    def read(self, frame: ArchivedFrame) -> bytes:
+        """JPEG bytes of *frame*."""
+        data_path, _ = self._paths(frame.segment)
+        with open(data_path, "rb") as f:
+            f.seek(frame.offset)
+            return f.read(frame.length)
+
+    def iter_jpegs(
+        self, start: datetime, end: datetime, max_frames: int | None = None
+    ) -> Iterator[tuple[datetime, bytes]]:
+        """``(captured_at, jpeg)`` for each frame of :meth:`frames_between`, reading one segment file at a time."""
+        frames = self.frames_between(start, end, max_frames)
+        handle = None
+        segment = None
+        try:
+            for frame in frames:
+                if frame.segment != segment:
+                    if handle is not None:
+                        handle.close()
+                    segment = frame.segment
+                    handle = open(self._paths(segment)[0], "rb")
+                assert handle is not None
+                handle.seek(frame.offset)
+                yield frame.captured_at, handle.read(frame.length)
+        finally:
+            if handle is not None:
+                handle.close()
+
+    def stats(self) -> dict[str, int | str | None]:
+        """Frame count, bytes on disk and time span, for status displays."""
+        indexes = [self._records(s) for s in self.segments()]
+        times = [r["t"] for r in indexes if len(r)]
+        size = sum(p.stat().st_size for s in self.segments() for p in self._paths(s) if p.exists())
+        return {
+            "frames": sum(len(r) for r in indexes),
+            "segments": len(indexes),
+            "bytes": size,
+            "first": _from_unix(float(times[0][0])).isoformat() if times else None,
+            "last": _from_unix(float(times[-1][-1])).isoformat() if times else None,
+        }
+
+    # ── Internals ──────────────────────────────────────────────────────
+
+    def _paths(self, segment: str) -> tuple[Path, Path]:
+        return self.root / f"{segment}{_DATA_SUFFIX}", self.root / f"{segment}{_INDEX_SUFFIX}"
+
+    def _records(self, segment: str) -> np.ndarray:
+        """Index records of *segment*, re-read only when the index file has grown."""
+        _, index_path = self._paths(segment)
+        with self._lock:
+            try:
+                size = index_path.stat().st_size
+            except FileNotFoundError:
+                return np.empty(0, dtype=INDEX_DTYPE)
+            cached = self._index_cache.get(segment)
+            if cached is not None and cached[0] == size:
+                return cached[1]
+            count = size // INDEX_DTYPE.itemsize
+            records = np.fromfile(index_path, dtype=INDEX_DTYPE, count=count)
+            self._index_cache[segment] = (size, records)
+            return records
+
+
+def _to_unix(when: datetime) -> float:
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return when.timestamp()
+
+
+def _from_unix(t: float) -> datetime:
+    return datetime.fromtimestamp(t, tz=timezone.utc)
+
+
+def _segment_for(t: float) -> str:
+    return _from_unix(min(max(t, 0.0), 253402300799.0)).strftime("%Y%m%d")
+
+
+def _to_frame(segment: str, record: np.void) -> ArchivedFrame:
+    return ArchivedFrame(_from_unix(float(record["t"])), segment, int(record["offset"]), int(record["length"]))
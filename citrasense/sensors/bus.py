@@ -28,17 +28,91 @@ Scope notes (intentional non-goals for phase 1)
   pydantic ``BaseModel`` instances.
 * No schema versioning.
 * No harmonization with :mod:`citrasense.preview_bus` (tracked as a follow-up).
+
+Routing and delivery
+--------------------
+
+:class:`InProcessBus` indexes subscriptions in a trie keyed on the literal
+leading segments of each pattern (everything before the first glob
+character), so a publish only runs the compiled glob of patterns that share
+the subject's prefix.  The matched subscription list is cached per subject
+and the cache is rebuilt whenever a subscription is added or removed, so
+steady-state publishing is one dict lookup.
+
+Each subscription picks a :class:`Delivery`:
+
+* ``INLINE`` (default) — the handler runs on the publisher's thread and its
+  exceptions propagate to the publisher, as in phase 1.
+* ``QUEUED`` — events go into a bounded per-subscription queue drained by a
+  dedicated thread, so a slow handler can't stall the publisher (e.g. the
+  NATS callback thread feeding radar detections).  When the queue is full
+  the :class:`OverflowPolicy` decides what gives.  Handler exceptions are
+  logged and counted.
+
+:meth:`InProcessBus.get_stats` reports per-subscription delivered/dropped
+counts, queue depth and publish-to-handler lag.
 """
 
 from __future__ import annotations
 
+import logging
+import re
 import threading
+import time
+from collections import deque
 from collections.abc import Callable
-from fnmatch import fnmatchcase
-from typing import Protocol, runtime_checkable
+from dataclasses import dataclass
+from enum import Enum
+from fnmatch import translate
+from typing import Any, Protocol, runtime_checkable
 
 from pydantic import BaseModel
 
+Handler = Callable[[str, BaseModel], None]
+
+_GLOB_CHARS = re.compile(r"[*?\[]")
+_SUBJECT_CACHE_MAX = 4096
+
+logger = logging.getLogger(__name__)
+
+
+class DeliveryMode(str, Enum):
+    """Where a subscription's handler runs."""
+
+    INLINE = "inline"
+    QUEUED = "queued"
+
+
+class OverflowPolicy(str, Enum):
+    """What a ``QUEUED`` subscription does when its queue is full."""
+
+    DROP_OLDEST = "drop_oldest"  # evict the oldest queued event to make room
+    DROP_NEWEST = "drop_newest"  # discard the event being published
+    BLOCK = "block"  # make the publisher wait up to ``block_timeout``, then drop the new event
+
+
+@dataclass(frozen=True)
+class Delivery:
+    """Per-subscription delivery options for :meth:`InProcessBus.subscribe`.
+
+    Attributes:
+        mode: ``INLINE`` runs the handler on the publisher's thread;
+            ``QUEUED`` hands events to a dedicated worker thread.
+        max_pending: Queue capacity for ``QUEUED`` delivery.
+        overflow: Policy applied when the queue is full.
+        block_timeout: Longest a publisher waits under ``OverflowPolicy.BLOCK``.
+        name: Label used for the worker thread and in :meth:`InProcessBus.get_stats`.
+    """
+
+    mode: DeliveryMode = DeliveryMode.INLINE
+    max_pending: int = 1024
+    overflow: OverflowPolicy = OverflowPolicy.DROP_OLDEST
+    block_timeout: float = 1.0
+    name: str | None = None
+
+
+INLINE = Delivery()
+
 
 @runtime_checkable
 class Subscription(Protocol):
@@ -63,92 +137,242 @@ class SensorBus(Protocol):
     """
 
     def publish(self, subject: str, event: BaseModel) -> None:
-        """Synchronously fan out ``event`` to every matching subscriber."""
+        """Fan out ``event`` to every matching subscriber."""
         ...
 
     def subscribe(
         self,
         subject_pattern: str,
-        handler: Callable[[str, BaseModel], None],
+        handler: Handler,
+        delivery: Delivery | None = None,
     ) -> Subscription:
         """Register ``handler`` for subjects matching ``subject_pattern``.
 
         ``subject_pattern`` uses :func:`fnmatch.fnmatchcase` semantics
         (``*`` matches any single segment-less substring, ``?`` a single
         character). A literal pattern equal to the subject always matches.
+        ``delivery`` selects inline or queued dispatch; implementations
+        without a choice may ignore it.
         """
         ...
 
 
 class _InProcessSubscription:
-    """Concrete :class:`Subscription` backed by a reference to the owning bus."""
+    """Concrete :class:`Subscription`: pattern, handler, delivery state and counters."""
 
-    __slots__ = ("_active", "_bus", "_handler", "_pattern")
-
-    def __init__(
-        self,
-        bus: InProcessBus,
-        pattern: str,
-        handler: Callable[[str, BaseModel], None],
-    ) -> None:
+    def __init__(self, bus: InProcessBus, pattern: str, handler: Handler, delivery: Delivery) -> None:
         self._bus = bus
-        self._pattern = pattern
-        self._handler = handler
+        self.pattern = pattern
+        self.handler = handler
+        self.delivery = delivery
+        self.name = delivery.name or getattr(handler, "__qualname__", None) or repr(handler)
         self._active = True
+        self._regex = None if pattern == _literal_prefix(pattern) else re.compile(translate(pattern))
+
+        self.delivered = 0
+        self.dropped = 0
+        self.errors = 0
+        self.max_depth = 0
+        self._lag_total = 0.0
+        self.lag_max = 0.0
+        self.lag_last = 0.0
+
+        self._cond = threading.Condition()
+        self._queue: deque[tuple[float, str, BaseModel]] = deque()
+        self._thread: threading.Thread | None = None
+        if delivery.mode is DeliveryMode.QUEUED:
+            self._thread = threading.Thread(target=self._run, name=f"bus-{self.name}", daemon=True)
+            self._thread.start()
+
+    def matches(self, subject: str) -> bool:
+        if self._regex is None:
+            return subject == self.pattern
+        return self._regex.match(subject) is not None
 
     def unsubscribe(self) -> None:
         if not self._active:
             return
         self._active = False
-        self._bus._remove(self._pattern, self._handler)
+        self._bus._remove(self)
+        if self._thread is not None:
+            with self._cond:
+                self._queue.clear()
+                self._cond.notify_all()
+            if self._thread is not threading.current_thread():
+                self._thread.join(timeout=2.0)
+
+    # ── Delivery ───────────────────────────────────────────────────────
+
+    def deliver(self, subject: str, event: BaseModel, published_at: float) -> None:
+        if self._thread is None:
+            self._record(published_at)
+            self.handler(subject, event)
+            return
+
+        policy = self.delivery.overflow
+        with self._cond:
+            if len(self._queue) >= self.delivery.max_pending:
+                if policy is OverflowPolicy.DROP_OLDEST:
+                    self._queue.popleft()
+                    self.dropped += 1
+                elif policy is OverflowPolicy.BLOCK and self._thread is not threading.current_thread():
+                    deadline = published_at + self.delivery.block_timeout
+                    while self._active and len(self._queue) >= self.delivery.max_pending:
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            break
+                        self._cond.wait(remaining)
+                if len(self._queue) >= self.delivery.max_pending or not self._active:
+                    self.dropped += 1
+                    return
+            self._queue.append((published_at, subject, event))
+            self.max_depth = max(self.max_depth, len(self._queue))
+            self._cond.notify_all()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while self._active and not self._queue:
+                    self._cond.wait()
+                if not self._active:
+                    return
+                published_at, subject, event = self._queue.popleft()
+                self._record(published_at)
+                self._cond.notify_all()  # wake a publisher blocked on a full queue
+            try:
+                self.handler(subject, event)
+            except Exception:
+                self.errors += 1
+                logger.exception("Bus handler %s failed on %s", self.name, subject)
+
+    def _record(self, published_at: float) -> None:
+        lag = time.monotonic() - published_at
+        self.delivered += 1
+        self._lag_total += lag
+        self.lag_last = lag
+        self.lag_max = max(self.lag_max, lag)
+
+    def stats(self) -> dict[str, Any]:
+        with self._cond:
+            depth = len(self._queue)
+        return {
+            "name": self.name,
+            "pattern": self.pattern,
+            "mode": self.delivery.mode.value,
+            "delivered": self.delivered,
+            "dropped": self.dropped,
+            "errors": self.errors,
+            "pending": depth,
+            "max_pending": self.max_depth,
+            "lag_ms": {
+                "last": round(self.lag_last * 1000, 3),
+                "mean": round(self._lag_total / self.delivered * 1000, 3) if self.delivered else 0.0,
+                "max": round(self.lag_max * 1000, 3),
+            },
+        }
+
+
+class _TrieNode:
+    __slots__ = ("children", "subs")
+
+    def __init__(self) -> None:
+        self.children: dict[str, _TrieNode] = {}
+        self.subs: list[_InProcessSubscription] = []
 
 
 class InProcessBus:
-    """Phase-1 in-process pub/sub. Synchronous dispatch on publish.
+    """In-process pub/sub with a compiled subject router.
 
     Thread-safe for concurrent ``publish`` / ``subscribe`` / unsubscribe.
-    ``publish`` snapshots the handlers matching the current subject while
-    holding the lock, then dispatches outside the lock (avoids reentrancy
-    deadlocks if a handler publishes during its own execution).
+    ``publish`` resolves the matching subscriptions under the lock (from the
+    per-subject cache, falling back to a trie walk), then dispatches outside
+    it so a handler may publish or unsubscribe during its own execution.
+    Handlers are called in registration order.
     """
 
     def __init__(self) -> None:
         self._lock = threading.RLock()
-        # {pattern: [handlers]} — ordered by registration.
-        self._subs: dict[str, list[Callable[[str, BaseModel], None]]] = {}
+        self._root = _TrieNode()
+        self._order: dict[_InProcessSubscription, int] = {}
+        self._seq = 0
+        self._cache: dict[str, tuple[_InProcessSubscription, ...]] = {}
 
     def publish(self, subject: str, event: BaseModel) -> None:
+        published_at = time.monotonic()
         with self._lock:
-            # Snapshot the handlers that match so dispatch is lock-free.
-            matched: list[Callable[[str, BaseModel], None]] = []
-            for pattern, handlers in self._subs.items():
-                if pattern == subject or fnmatchcase(subject, pattern):
-                    matched.extend(handlers)
+            matched = self._cache.get(subject)
+            if matched is None:
+                matched = self._match(subject)
+                if len(self._cache) >= _SUBJECT_CACHE_MAX:
+                    self._cache.clear()
+                self._cache[subject] = matched
 
-        for handler in matched:
-            handler(subject, event)
+        for sub in matched:
+            if sub._active:
+                sub.deliver(subject, event, published_at)
 
     def subscribe(
         self,
         subject_pattern: str,
-        handler: Callable[[str, BaseModel], None],
+        handler: Handler,
+        delivery: Delivery | None = None,
     ) -> Subscription:
+        sub = _InProcessSubscription(self, subject_pattern, handler, delivery or INLINE)
         with self._lock:
-            self._subs.setdefault(subject_pattern, []).append(handler)
-        return _InProcessSubscription(self, subject_pattern, handler)
-
-    def _remove(
-        self,
-        pattern: str,
-        handler: Callable[[str, BaseModel], None],
-    ) -> None:
+            node = self._root
+            for segment in _trie_path(subject_pattern):
+                node = node.children.setdefault(segment, _TrieNode())
+            node.subs.append(sub)
+            self._order[sub] = self._seq
+            self._seq += 1
+            self._cache.clear()
+        return sub
+
+    def get_stats(self) -> list[dict[str, Any]]:
+        """Delivery counters and lag for every live subscription, in registration order."""
         with self._lock:
-            handlers = self._subs.get(pattern)
-            if not handlers:
-                return
-            try:
-                handlers.remove(handler)
-            except ValueError:
+            subs = sorted(self._order, key=self._order.__getitem__)
+        return [sub.stats() for sub in subs]
+
+    def _match(self, subject: str) -> tuple[_InProcessSubscription, ...]:
+        """Walk the trie along *subject*'s segments, testing only patterns whose literal prefix fits."""
+        node = self._root
+        hits = [sub for sub in node.subs if sub.matches(subject)]
+        for segment in subject.split("."):
+            next_node = node.children.get(segment)
+            if next_node is None:
+                break
+            node = next_node
+            hits.extend(sub for sub in node.subs if sub.matches(subject))
+        hits.sort(key=self._order.__getitem__)
+        return tuple(hits)
+
+    def _remove(self, sub: _InProcessSubscription) -> None:
+        with self._lock:
+            if self._order.pop(sub, None) is None:
                 return
-            if not handlers:
-                del self._subs[pattern]
+            segments = _trie_path(sub.pattern)
+            path = [self._root]
+            for segment in segments:
+                path.append(path[-1].children[segment])
+            path[-1].subs.remove(sub)
+            # Prune empty branches so the trie doesn't grow with churn.
+            for depth in range(len(segments), 0, -1):
+                node = path[depth]
+                if node.subs or node.children:
+                    break
+                del path[depth - 1].children[segments[depth - 1]]
+            self._cache.clear()
+
+
+def _literal_prefix(pattern: str) -> str:
+    """*pattern* up to its first glob character (the whole pattern if it has none)."""
+    m = _GLOB_CHARS.search(pattern)
+    return pattern if m is None else pattern[: m.start()]
+
+
+def _trie_path(pattern: str) -> list[str]:
+    """Segments a pattern is indexed under: all of a literal pattern, else the complete ones before the glob."""
+    prefix = _literal_prefix(pattern)
+    parts = prefix.split(".")
+    return parts if prefix == pattern else parts[:-1]
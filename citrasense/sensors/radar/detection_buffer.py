@@ -0,0 +1,266 @@
+"""Columnar, time-indexed ring buffer of slim radar detections.
+
+The radar UI plots bistatic range / Doppler against time.  Keeping one
+Python dict per detection caps practical history at a few minutes: at
+~10 Hz an hour is 36k dicts, each several hundred bytes, and every
+``?since=`` query walks all of them.  :class:`DetectionRingBuffer`
+instead keeps each slim-dict field in its own preallocated numpy column:
+
+- ``ts_unix`` and the measured quantities (range, range-rate, Doppler,
+  SNR, az/el, altitude) as ``float64``, ``NaN`` standing in for ``None``;
+- the low-cardinality strings (sensor id, satellite UUID / name, FM
+  station) as ``int32`` codes into an interned table.
+
+A second timestamp column holds the running maximum of ``ts_unix``.  It
+is non-decreasing even when pr_sensor emits a detection slightly out of
+order, so cursor and range queries are a :func:`numpy.searchsorted` over
+(at most) two contiguous segments of the ring, followed by an exact
+``ts_unix`` mask on the slice.  Upper bounds (``end``) are located on the
+running maximum, i.e. by arrival order.
+
+:meth:`DetectionRingBuffer.downsample` thins a time window to a point
+budget for the range-Doppler plot, keeping the highest-SNR detection of
+each time bin so tracks survive the thinning.
+"""
+
+from __future__ import annotations
+
+import math
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any
+
+import numpy as np
+
+#: Retained history when the sensor config doesn't say otherwise.
+DEFAULT_HISTORY_HOURS = 4.0
+
+#: Detection rate used to turn a history duration into a row capacity.
+#: pr_sensor emits at most a few detections per CPI (~10 Hz sustained).
+ASSUMED_DETECTION_RATE_HZ = 10.0
+
+#: Rows returned by an unthinned snapshot when the caller sets no limit
+#: (the old deque-backed buffer's size).  Longer history goes through
+#: :meth:`DetectionRingBuffer.downsample`.
+DEFAULT_SNAPSHOT_LIMIT = 500
+
+_FLOAT_FIELDS = ("range_km", "range_rate_km_s", "doppler_hz", "snr_db", "az_deg", "el_deg", "alt_km")
+_STRING_FIELDS = ("sensor_id", "sat_uuid", "sat_name", "station")
+
+
+def capacity_for_hours(hours: float, rate_hz: float = ASSUMED_DETECTION_RATE_HZ) -> int:
+    """Row capacity holding *hours* of history at *rate_hz*."""
+    return max(1, math.ceil(hours * 3600.0 * rate_hz))
+
+
+class DetectionRingBuffer:
+    """Thread-safe bounded columnar store of slim-dict radar detections.
+
+    ``append`` runs on the NATS asyncio thread and the queries on FastAPI
+    worker threads, so one :class:`threading.Lock` serialises them.
+    Queries select and copy their rows under the lock (numpy work only)
+    and build the returned dicts outside it; callers own the returned lists.
+
+    Only the slim-dict schema fields are stored; other keys are dropped.
+    """
+
+    def __init__(self, maxlen: int = capacity_for_hours(DEFAULT_HISTORY_HOURS)) -> None:
+        """
+        Args:
+            maxlen: Row capacity; the oldest detection is overwritten beyond it
+        """
+        if maxlen < 1:
+            raise ValueError("maxlen must be positive")
+        self._capacity = maxlen
+        self._ts = np.empty(maxlen, dtype=np.float64)
+        self._key = np.empty(maxlen, dtype=np.float64)  # running max of _ts, for searchsorted
+        self._floats = {name: np.empty(maxlen, dtype=np.float64) for name in _FLOAT_FIELDS}
+        self._codes = {name: np.empty(maxlen, dtype=np.int32) for name in _STRING_FIELDS}
+        self._strings: list[str | None] = [None]  # code 0 is None
+        self._interned: dict[str, int] = {}
+        self._head = 0  # next physical write slot
+        self._count = 0
+        self._last_key = -math.inf
+        self._lock = threading.Lock()
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the preallocated columns."""
+        columns = [self._ts, self._key, *self._floats.values(), *self._codes.values()]
+        return sum(c.nbytes for c in columns)
+
+    def append(self, slim: dict[str, Any]) -> None:
+        ts = _as_float(slim.get("ts_unix"))
+        ts = 0.0 if math.isnan(ts) else ts
+        with self._lock:
+            i = self._head
+            self._ts[i] = ts
+            self._last_key = max(self._last_key, ts)
+            self._key[i] = self._last_key
+            for name, column in self._floats.items():
+                column[i] = _as_float(slim.get(name))
+            for name, column in self._codes.items():
+                column[i] = self._intern(slim.get(name))
+            self._head = (i + 1) % self._capacity
+            self._count = min(self._count + 1, self._capacity)
+
+    def snapshot_since(self, since_ts: float | None, limit: int | None = None) -> list[dict[str, Any]]:
+        """Return detections with ``ts_unix > since_ts``, oldest first.
+
+        ``since_ts`` is interpreted as follows:
+
+        - ``None`` → the whole buffer.
+        - Non-negative value → an absolute Unix epoch cursor.
+        - Negative value → "last ``|since_ts|`` seconds" relative to
+          ``time.time()``.
+
+        With *limit*, only the newest *limit* matches are returned.
+        """
+        cutoff = _cutoff(since_ts)
+        with self._lock:
+            lo = 0 if cutoff is None else self._bisect(cutoff, "right")
+            picks = np.arange(lo, self._count)
+            if cutoff is not None:
+                picks = picks[self._window(self._ts, lo, self._count) > cutoff]
+            if limit is not None:
+                picks = picks[len(picks) - min(len(picks), max(0, limit)) :]
+            rows = self._gather(picks)
+        return self._to_dicts(rows)
+
+    def downsample(self, since_ts: float | None, max_points: int, end_ts: float | None = None) -> list[dict[str, Any]]:
+        """Detections in ``(since_ts, end_ts]`` thinned to at most *max_points*, oldest first.
+
+        The window is split into *max_points* equal time bins and the
+        highest-SNR detection of each non-empty bin is kept (detections
+        without an SNR rank last).  Windows already within budget are
+        returned whole.  ``since_ts`` follows :meth:`snapshot_since`.
+        """
+        if max_points < 1:
+            raise ValueError("max_points must be positive")
+        cutoff = _cutoff(since_ts)
+        with self._lock:
+            lo = 0 if cutoff is None else self._bisect(cutoff, "right")
+            hi = max(lo, self._count if end_ts is None else self._bisect(end_ts, "right"))
+            ts = self._window(self._ts, lo, hi)
+            keep = np.ones(len(ts), dtype=bool)
+            if cutoff is not None:
+                keep &= ts > cutoff
+            if end_ts is not None:
+                keep &= ts <= end_ts
+            picks = np.flatnonzero(keep)
+            if len(picks) > max_points:
+                ts = ts[picks]
+                snr = np.nan_to_num(self._window(self._floats["snr_db"], lo, hi)[picks], nan=-np.inf)
+                start, stop = float(ts.min()), float(ts.max())
+                width = (stop - start) / max_points or 1.0
+                bins = np.minimum(((ts - start) / width).astype(np.int64), max_points - 1)
+                picks = picks[_bin_maxima(bins, snr)]
+            rows = self._gather(lo + picks)
+        return self._to_dicts(rows)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._count
+
+    # ── Internals ──────────────────────────────────────────────────────
+
+    def _intern(self, value: Any) -> int:
+        """Code for *value*; caller holds ``_lock``."""
+        if value is None:
+            return 0
+        text = str(value)
+        code = self._interned.get(text)
+        if code is None:
+            code = len(self._strings)
+            self._strings.append(text)
+            self._interned[text] = code
+        return code
+
+    def _segments(self) -> list[tuple[int, int]]:
+        """Physical ``(start, stop)`` slices of the live rows in logical (oldest-first) order."""
+        start = (self._head - self._count) % self._capacity
+        if start + self._count <= self._capacity:
+            return [(start, start + self._count)]
+        return [(start, self._capacity), (0, self._head)]
+
+    def _bisect(self, t: float, side: str) -> int:
+        """Logical row index of ``searchsorted(key, t, side)`` across the ring's segments."""
+        offset = 0
+        for a, b in self._segments():
+            pos = int(np.searchsorted(self._key[a:b], t, side=side))  # type: ignore[call-overload]
+            if pos < b - a:
+                return offset + pos
+            offset += b - a
+        return self._count
+
+    def _window(self, column: np.ndarray, lo: int, hi: int) -> np.ndarray:
+        """Copy of logical rows ``[lo, hi)`` of *column*; caller holds ``_lock``."""
+        start = (self._head - self._count) % self._capacity
+        a, b = start + lo, start + hi
+        if b <= self._capacity:
+            return column[a:b].copy()
+        if a >= self._capacity:
+            return column[a - self._capacity : b - self._capacity].copy()
+        return np.concatenate((column[a:], column[: b - self._capacity]))
+
+    def _gather(self, picks: np.ndarray) -> dict[str, np.ndarray]:
+        """Copies of the logical rows *picks* per field; caller holds ``_lock``."""
+        idx = (self._head - self._count + picks) % self._capacity
+        rows = {"ts_unix": self._ts[idx]}
+        rows.update({name: column[idx] for name, column in self._floats.items()})
+        rows.update({name: column[idx] for name, column in self._codes.items()})
+        return rows
+
+    def _to_dicts(self, rows: dict[str, np.ndarray]) -> list[dict[str, Any]]:
+        strings = self._strings  # append-only, so a reference is a consistent snapshot
+        ts_list = rows["ts_unix"].tolist()
+        floats = [[None if v != v else v for v in rows[name].tolist()] for name in _FLOAT_FIELDS]
+        codes = [[strings[c] for c in rows[name].tolist()] for name in _STRING_FIELDS]
+        out = []
+        for i, ts in enumerate(ts_list):
+            entry: dict[str, Any] = {"ts": _iso(ts), "ts_unix": ts}
+            for name, values in zip(_FLOAT_FIELDS, floats, strict=True):
+                entry[name] = values[i]
+            for name, values in zip(_STRING_FIELDS, codes, strict=True):
+                entry[name] = values[i]
+            out.append(entry)
+        return out
+
+
+def _as_float(value: Any) -> float:
+    if value is None:
+        return math.nan
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return math.nan
+
+
+def _cutoff(since_ts: float | None) -> float | None:
+    if since_ts is None:
+        return None
+    return since_ts if since_ts >= 0 else time.time() + since_ts
+
+
+def _bin_maxima(bins: np.ndarray, snr: np.ndarray) -> np.ndarray:
+    """Sorted positions of the highest-*snr* entry of each distinct bin (first one on ties)."""
+    if len(bins) > 1 and (np.diff(bins) < 0).any():
+        # Out-of-order detections: group by sorting.
+        order = np.lexsort((-snr, bins))
+        _, first = np.unique(bins[order], return_index=True)
+        return np.sort(order[first])
+    # Time-ordered window (the usual case): bins are contiguous runs, so stay O(n).
+    starts = np.flatnonzero(np.r_[True, bins[1:] != bins[:-1]])
+    peak = np.repeat(np.maximum.reduceat(snr, starts), np.diff(np.r_[starts, len(bins)]))
+    hits = np.flatnonzero(snr == peak)
+    run = np.searchsorted(starts, hits, side="right")
+    return hits[np.r_[True, run[1:] != run[:-1]]]
+
+
+def _iso(ts: float) -> str:
+    return datetime.fromtimestamp(ts, tz=timezone.utc).isoformat().replace("+00:00", "Z")
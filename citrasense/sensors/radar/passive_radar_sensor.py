@@ -34,7 +34,6 @@ from __future__ import annotations
 import logging
 import threading
 import time
-from collections import deque
 from collections.abc import Callable
 from datetime import datetime, timezone
 from logging import Logger, LoggerAdapter
@@ -47,6 +46,12 @@ from citrasense.sensors.abstract_sensor import (
     SensorAcquisitionMode,
     SensorCapabilities,
 )
+from citrasense.sensors.radar.detection_buffer import (
+    DEFAULT_HISTORY_HOURS,
+    DEFAULT_SNAPSHOT_LIMIT,
+    DetectionRingBuffer,
+    capacity_for_hours,
+)
 from citrasense.sensors.radar.detection_source import DetectionSource
 from citrasense.sensors.radar.events import RadarObservationEvent
 
@@ -60,11 +65,6 @@ _SPEED_OF_LIGHT_M_S = 299_792_458.0
 #: sensor's configured radar_config provides one.
 _DEFAULT_CARRIER_HZ = 100e6
 
-#: Maximum number of detections retained in each sensor's ring buffer.
-#: At ~10 Hz this is ~50 s of history — enough to hydrate a reloaded
-#: browser tab without bloating the WebSocket payload size.
-_RING_BUFFER_MAX = 500
-
 #: Anything that quacks like a logger.  ``SensorLoggerAdapter`` (which
 #: ``get_sensor_logger`` returns) extends :class:`logging.LoggerAdapter`
 #: rather than :class:`logging.Logger`, so pyright rightly rejects
@@ -132,54 +132,6 @@ _RADAR_CONFIG_FIELDS: tuple[tuple[str, str, str, str], ...] = (
 )
 
 
-class DetectionRingBuffer:
-    """Thread-safe bounded queue of slim-dict radar detections.
-
-    Backed by a :class:`collections.deque` with ``maxlen`` — appends
-    drop the oldest entry in O(1), which matches what we want for a
-    live scatter plot.  A single :class:`threading.Lock` serialises
-    ``append`` and ``snapshot_since`` because the former runs on the
-    NATS asyncio thread and the latter runs on the FastAPI worker
-    thread (or any other reader).
-
-    ``snapshot_since`` returns a *copy* — callers must never mutate
-    the returned list because doing so would race other readers.
-    """
-
-    __slots__ = ("_buf", "_lock")
-
-    def __init__(self, maxlen: int = _RING_BUFFER_MAX) -> None:
-        self._buf: deque[dict[str, Any]] = deque(maxlen=maxlen)
-        self._lock = threading.Lock()
-
-    def append(self, slim: dict[str, Any]) -> None:
-        with self._lock:
-            self._buf.append(slim)
-
-    def snapshot_since(self, since_ts: float | None) -> list[dict[str, Any]]:
-        """Return a copy of all detections with ``ts_unix > since_ts``.
-
-        ``since_ts`` is interpreted as follows:
-
-        - ``None`` → return the full buffer (bounded by ``maxlen``).
-        - Non-negative value → treated as an absolute Unix epoch cursor.
-        - Negative value → treated as "last ``|since_ts|`` seconds"
-          relative to ``time.time()``.
-
-        The list is returned in insertion order (oldest first).
-        """
-        with self._lock:
-            snapshot = list(self._buf)
-        if since_ts is None:
-            return snapshot
-        cutoff = since_ts if since_ts >= 0 else time.time() + since_ts
-        return [d for d in snapshot if float(d.get("ts_unix") or 0.0) > cutoff]
-
-    def __len__(self) -> int:
-        with self._lock:
-            return len(self._buf)
-
-
 class PassiveRadarSensor(AbstractSensor):
     """``AbstractSensor`` implementation for the ``pr_sensor`` NATS daemon."""
 
@@ -208,6 +160,7 @@ class PassiveRadarSensor(AbstractSensor):
         detection_min_snr_db: float = 0.0,
         forward_only_tasked_satellites: bool = False,
         pr_control_url: str = "",
+        detection_history_hours: float = DEFAULT_HISTORY_HOURS,
     ) -> None:
         super().__init__(sensor_id=sensor_id)
         self._source = source
@@ -266,7 +219,7 @@ class PassiveRadarSensor(AbstractSensor):
         # is free-threading on purpose: consumers are expected to marshal
         # onto their own event loop (the web app uses
         # :func:`asyncio.run_coroutine_threadsafe`).
-        self._detections = DetectionRingBuffer()
+        self._detections = DetectionRingBuffer(maxlen=capacity_for_hours(detection_history_hours))
         self.on_detection_broadcast: Callable[[str, dict[str, Any]], None] | None = None
 
     # ── Factory ────────────────────────────────────────────────────────
@@ -330,6 +283,7 @@ class PassiveRadarSensor(AbstractSensor):
             detection_min_snr_db=float(adapter_settings.get("detection_min_snr_db", 0.0)),
             forward_only_tasked_satellites=bool(adapter_settings.get("forward_only_tasked_satellites", False)),
             pr_control_url=str(adapter_settings.get("pr_control_url") or ""),
+            detection_history_hours=float(adapter_settings.get("detection_history_hours", DEFAULT_HISTORY_HOURS)),
         )
 
     # ── AbstractSensor surface ────────────────────────────────────────
@@ -435,6 +389,15 @@ class PassiveRadarSensor(AbstractSensor):
                 "description": "Drop detections that don't match a satellite tasked at this site.",
                 "required": False,
             },
+            {
+                "name": "detection_history_hours",
+                "friendly_name": "Detection history (h)",
+                "type": "float",
+                "default": DEFAULT_HISTORY_HOURS,
+                "group": "History",
+                "description": "Detections kept for the radar plot; about 3 MB per hour is preallocated.",
+                "required": False,
+            },
         ]
         for name, friendly, typ, description in _RADAR_CONFIG_FIELDS:
             schema.append(
@@ -720,14 +683,20 @@ class PassiveRadarSensor(AbstractSensor):
 
     # ── Detection buffer / slim projection ───────────────────────────
 
-    def get_recent_detections(self, since_ts: float | None = None) -> list[dict[str, Any]]:
+    def get_recent_detections(
+        self, since_ts: float | None = None, max_points: int | None = None
+    ) -> list[dict[str, Any]]:
         """Return a snapshot of the detection ring buffer.
 
         See :meth:`DetectionRingBuffer.snapshot_since` for the cursor
         semantics (``None`` = all, non-negative = absolute epoch,
-        negative = "last N seconds").
+        negative = "last N seconds").  With *max_points* the window is
+        thinned by :meth:`DetectionRingBuffer.downsample`; without it only
+        the newest :data:`DEFAULT_SNAPSHOT_LIMIT` detections are returned.
         """
-        return self._detections.snapshot_since(since_ts)
+        if max_points is not None:
+            return self._detections.downsample(since_ts, max_points)
+        return self._detections.snapshot_since(since_ts, limit=DEFAULT_SNAPSHOT_LIMIT)
 
     def _project_slim_dict(self, payload: dict[str, Any]) -> dict[str, Any] | None:
         """Reduce a full radar observation payload to a UI-sized dict.
@@ -33,6 +33,7 @@ if TYPE_CHECKING:
     import logging
     from collections.abc import Callable
 
+    from citrasense.acquisition.upload_spool import UploadSpool
     from citrasense.analysis.task_index import TaskIndex
     from citrasense.api.citra_api_client import AbstractCitraApiClient
     from citrasense.astro.elset_cache import ElsetCache
@@ -83,6 +84,8 @@ class BuildContext:
     # init orchestrator; the daemon itself shouldn't need to import
     # the toast wiring.
     init_state_callback_factory: Callable[[str], Callable[[str, str | None], None] | None] | None = None
+    # Durable store shared by every runtime's upload queue (None: in-memory only).
+    upload_spool: UploadSpool | None = None
 
 
 class RuntimeBuilder(Protocol):
@@ -19,6 +19,7 @@ from typing import TYPE_CHECKING, Any, Literal
 
 from citrasense.acquisition.acquisition_queue import AcquisitionQueue
 from citrasense.acquisition.processing_queue import ProcessingQueue
+from citrasense.acquisition.render_queue import RenderQueue
 from citrasense.acquisition.upload_queue import UploadQueue
 from citrasense.logging.sensor_logger import get_sensor_logger
 
@@ -81,6 +82,7 @@ class SensorRuntime:
         task_index: Any = None,
         safety_monitor: Any = None,
         sensor_bus: SensorBus | None = None,
+        upload_spool: Any = None,
     ) -> None:
         self.sensor = sensor
         self.sensor_id = sensor.sensor_id
@@ -158,15 +160,24 @@ class SensorRuntime:
             api_client=api_client,
             runtime=self,
         )
+        # Presentation rendering (annotated JPEG, HTML report) has its own
+        # worker budget so it never sits between processing and upload.
+        self.render_queue = RenderQueue(
+            num_workers=settings.render_workers,
+            logger=self.logger,
+        )
         self.processing_queue = ProcessingQueue(
             num_workers=1,
             settings=settings,
             logger=self.logger,
+            render_queue=self.render_queue,
         )
         self.upload_queue = UploadQueue(
-            num_workers=1,
+            num_workers=settings.upload_workers,
             settings=settings,
             logger=self.logger,
+            spool=upload_spool,
+            sensor_id=sensor.sensor_id,
         )
 
         # ── Hardware managers (telescope-specific) ─────────────────────
@@ -182,7 +193,8 @@ class SensorRuntime:
         if sensor.sensor_type == "passive_radar":
             from citrasense.pipelines.radar import build_radar_pipeline
 
-            self._radar_pipeline = build_radar_pipeline()
+            retention_days = int(settings.radar_artifact_retention_days)
+            self._radar_pipeline = build_radar_pipeline(retention_days=retention_days if retention_days > 0 else None)
 
         if sensor.sensor_type == "telescope" and hardware_adapter is not None:
             from citrasense.sensors.telescope.managers.alignment_manager import AlignmentManager
@@ -325,6 +337,8 @@ class SensorRuntime:
         self.acquisition_queue.start()
         self.processing_queue.start()
         self.upload_queue.start()
+        self.upload_queue.resubmit_spooled(self.api_client, self.settings)
+        self.render_queue.start()
         self._subscribe_streaming()
 
     def attach_calibration_library(self, library: Any) -> None:
@@ -557,8 +571,19 @@ class SensorRuntime:
         from citrasense.sensors.abstract_sensor import SensorAcquisitionMode
 
         if caps.acquisition_mode == SensorAcquisitionMode.STREAMING:
+            from citrasense.sensors.bus import Delivery, DeliveryMode, OverflowPolicy
+
             pattern = f"sensors.{self.sensor_id}.events.acquisition"
-            self._streaming_sub = self._sensor_bus.subscribe(pattern, self._on_streaming_event)
+            # Queued so the producer's thread (the NATS callback for radar)
+            # never waits on context building; under a sustained backlog the
+            # oldest detections are dropped and counted in the bus stats.
+            delivery = Delivery(
+                mode=DeliveryMode.QUEUED,
+                max_pending=10_000,
+                overflow=OverflowPolicy.DROP_OLDEST,
+                name=f"{self.sensor_id}-acquisition",
+            )
+            self._streaming_sub = self._sensor_bus.subscribe(pattern, self._on_streaming_event, delivery)
             self.logger.info("Subscribed to streaming events: %s", pattern)
 
     def _on_streaming_event(self, subject: str, event: BaseModel) -> None:
@@ -653,12 +678,17 @@ class SensorRuntime:
 
     def stop(self) -> None:
         self._stop_streaming_sensor()
-        self.acquisition_queue.stop()
-        self.processing_queue.stop()
-        self.upload_queue.stop()
+        # Unsubscribe first: it joins the QUEUED delivery thread, which may
+        # still be feeding events into the radar pipeline closed below.
         if self._streaming_sub:
             self._streaming_sub.unsubscribe()
             self._streaming_sub = None
+        self.acquisition_queue.stop()
+        self.processing_queue.stop()
+        self.upload_queue.stop()
+        self.render_queue.stop()
+        if self._radar_pipeline is not None:
+            self._radar_pipeline.close()
         with self._queues_started_lock:
             self._queues_started = False
 
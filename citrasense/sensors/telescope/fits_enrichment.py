@@ -3,13 +3,43 @@
 Adds contextual metadata (location, target, observatory info) to FITS files
 before upload. This centralizes metadata management and keeps cameras focused
 on capture-time intrinsic metadata (DATE-OBS, EXPTIME, etc.).
+
+Only the primary header blocks are rewritten (:func:`patch_primary_header`);
+the data block is never touched as long as the new cards fit in the space
+reserved at capture time (:mod:`citrasense.hardware.devices.camera.fits_writer`).
+Frames written by external software without that padding are rewritten
+once, streamed, with padding added for next time.
 """
 
+from __future__ import annotations
+
+import os
+import shutil
+from collections.abc import Callable
+from dataclasses import dataclass
 from pathlib import Path
+from typing import TYPE_CHECKING
 
+from citrasense.hardware.devices.camera.fits_writer import reserve_header_space
 from citrasense.logging import CITRASENSE_LOGGER
 from citrasense.tasks.views.telescope_task_view import TelescopeTaskView
 
+if TYPE_CHECKING:
+    from astropy.io import fits
+
+_BLOCK_SIZE = 2880
+_CARD_SIZE = 80
+_COPY_CHUNK_BYTES = 4 * 1024 * 1024
+
+
+@dataclass
+class HeaderPatch:
+    """Outcome of one :func:`patch_primary_header` call."""
+
+    bytes_written: int
+    in_place: bool
+    header_bytes: int
+
 
 def enrich_fits_metadata(
     filepath: str,
@@ -17,7 +47,7 @@ def enrich_fits_metadata(
     location_service=None,
     telescope_record: dict | None = None,
     ground_station: dict | None = None,
-) -> None:
+) -> HeaderPatch | None:
     """
     Enrich FITS file with observation context metadata before upload.
 
@@ -48,42 +78,124 @@ def enrich_fits_metadata(
         Traceability (from task):
             - TASKID: Task UUID for database linking
 
+    Returns:
+        The :class:`HeaderPatch` describing what was written, or None if
+        nothing was (already enriched, missing file, or failure).
+
     Note:
         This function modifies FITS files in-place and fails gracefully.
         Missing metadata is skipped without raising exceptions.
     """
     try:
-        from astropy.io import fits
+        import astropy.io.fits  # noqa: F401
     except ImportError:
         CITRASENSE_LOGGER.error("astropy not installed. Cannot enrich FITS metadata.")
-        return
+        return None
 
     if not Path(filepath).exists():
         CITRASENSE_LOGGER.warning(f"FITS file not found: {filepath}")
-        return
+        return None
+
+    def _enrich(header: fits.Header) -> bool:
+        if task and hasattr(task, "id") and task.id:
+            if "TASKID" in header:
+                CITRASENSE_LOGGER.debug(f"FITS file already enriched (TASKID present): {filepath}")
+                return False
+
+        _add_location_metadata(header, location_service=location_service, ground_station_record=ground_station)
+
+        if task:
+            _add_task_metadata(header, task, telescope_record, ground_station)
+
+        header["ORIGIN"] = ("Citra.space", "Data origin")
+        return True
 
     try:
-        with fits.open(filepath, mode="update") as hdul:
-            primary = hdul[0]
-            assert isinstance(primary, fits.PrimaryHDU)
-            header = primary.header
+        patch = patch_primary_header(filepath, _enrich)
+    except Exception as e:
+        CITRASENSE_LOGGER.warning(f"Failed to enrich FITS metadata for {filepath}: {e}")
+        return None
 
-            if task and hasattr(task, "id") and task.id:
-                if "TASKID" in header:
-                    CITRASENSE_LOGGER.debug(f"FITS file already enriched (TASKID present): {filepath}")
-                    return
+    if patch is not None:
+        how = "header only" if patch.in_place else "full rewrite, header padded"
+        CITRASENSE_LOGGER.debug(f"Enriched FITS metadata: {filepath} ({patch.bytes_written} bytes written, {how})")
+    return patch
 
-            _add_location_metadata(header, location_service=location_service, ground_station_record=ground_station)
 
-            if task:
-                _add_task_metadata(header, task, telescope_record, ground_station)
+def patch_primary_header(filepath: str | Path, update: Callable[[fits.Header], bool | None]) -> HeaderPatch | None:
+    """Apply *update* to the primary header without rewriting the data block.
 
-            header["ORIGIN"] = ("Citra.space", "Data origin")
+    The header blocks are read raw, *update* mutates the parsed header, and
+    the result is written back over the same byte range — astropy fills
+    trailing blank cards first, so capture-time padding absorbs new cards.
+    If the header shrinks it is padded back to its on-disk size.
 
-        CITRASENSE_LOGGER.debug(f"Enriched FITS metadata: {filepath}")
+    If it no longer fits, the file is rewritten once: the new header (with
+    fresh padding) followed by the data streamed from the original, via a
+    temp file and an atomic rename.
 
-    except Exception as e:
-        CITRASENSE_LOGGER.warning(f"Failed to enrich FITS metadata for {filepath}: {e}")
+    Args:
+        filepath: FITS file to patch
+        update: Mutates the header; returning False means nothing to write
+
+    Returns:
+        What was written, or None if *update* returned False.
+    """
+    from astropy.io import fits
+
+    path = Path(filepath)
+    with open(path, "rb+") as f:
+        raw = _read_header_blocks(f)
+        header = fits.Header.fromstring(raw.decode("ascii"))
+        if update(header) is False:
+            return None
+
+        new = _serialize_to_size(header, len(raw))
+        if len(new) == len(raw):
+            f.seek(0)
+            f.write(new)
+            return HeaderPatch(bytes_written=len(new), in_place=True, header_bytes=len(new))
+
+    reserve_header_space(header)
+    new = header.tostring().encode("ascii")
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    try:
+        with open(path, "rb") as src, open(tmp_path, "wb") as out:
+            out.write(new)
+            src.seek(len(raw))
+            shutil.copyfileobj(src, out, _COPY_CHUNK_BYTES)
+            written = out.tell()
+        shutil.copymode(path, tmp_path)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    return HeaderPatch(bytes_written=written, in_place=False, header_bytes=len(new))
+
+
+def _read_header_blocks(f) -> bytes:
+    """Read 2880-byte blocks from the start of *f* up to and including the one holding ``END``."""
+    blocks = []
+    while True:
+        block = f.read(_BLOCK_SIZE)
+        if len(block) < _BLOCK_SIZE:
+            raise ValueError("Truncated FITS header (no END card)")
+        blocks.append(block)
+        for i in range(0, _BLOCK_SIZE, _CARD_SIZE):
+            if block[i : i + 3] == b"END" and not block[i + 3 : i + _CARD_SIZE].strip():
+                return b"".join(blocks)
+
+
+def _serialize_to_size(header: fits.Header, size: int) -> bytes:
+    """Serialize *header*, padding with blank cards up to *size* bytes if it came out shorter."""
+    from astropy.io import fits
+
+    new = header.tostring().encode("ascii")
+    if len(new) < size:
+        for _ in range((size - len(new)) // _CARD_SIZE):
+            header.append(fits.Card(), useblanks=False, bottom=True)
+        new = header.tostring().encode("ascii")
+    return new
 
 
 def _add_location_metadata(header, location_service=None, ground_station_record: dict | None = None) -> None:
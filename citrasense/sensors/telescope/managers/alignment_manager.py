@@ -28,6 +28,8 @@ if TYPE_CHECKING:
     from citrasense.hardware.devices.mount.altaz_pointing_model import AltAzPointingModel
     from citrasense.settings.citrasense_settings import CitraSenseSettings, SensorConfig
 
+_SLEW_TIMEOUT_S = 300.0
+
 
 class AlignmentManager:
     """Manages on-demand alignment and full pointing model calibration.
@@ -468,17 +470,12 @@ class AlignmentManager:
                     self.logger.warning("Calibration: slew failed for point %d — skipping", i + 1)
                     continue
 
-                timeout = 300
-                start = time.time()
-                while mount.is_slewing():
-                    if time.time() - start > timeout:
-                        mount.abort_slew()
+                if not self.hardware_adapter.wait_for_telescope_idle(
+                    timeout=_SLEW_TIMEOUT_S, cancelled=self._calibration_cancel.is_set
+                ):
+                    mount.abort_slew()
+                    if not self._calibration_cancel.is_set():
                         self.logger.warning("Calibration: slew timeout for point %d — skipping", i + 1)
-                        break
-                    if self._calibration_cancel.is_set():
-                        mount.abort_slew()
-                        break
-                    time.sleep(0.5)
 
                 if self._calibration_cancel.is_set():
                     break
@@ -570,14 +567,9 @@ class AlignmentManager:
             try:
                 self.hardware_adapter.point_telescope(target_ra, target_dec)
 
-                timeout = 300
-                start = time.time()
-                while mount.is_slewing():
-                    if time.time() - start > timeout:
-                        mount.abort_slew()
-                        self.logger.warning("Verification: slew timeout for target %d — skipping", i + 1)
-                        break
-                    time.sleep(0.5)
+                if not self.hardware_adapter.wait_for_telescope_idle(timeout=_SLEW_TIMEOUT_S):
+                    mount.abort_slew()
+                    self.logger.warning("Verification: slew timeout for target %d — skipping", i + 1)
 
                 solve_result = self._plate_solve_at_current_position(telescope_record)
                 if solve_result is None:
@@ -463,14 +463,11 @@ class AutofocusManager:
         return preset["ra"], preset["dec"]
 
     def _on_af_image(self, image: np.ndarray) -> None:
-        """Convert an autofocus sweep frame to JPEG and push to the preview bus."""
+        """Push an autofocus sweep frame to the preview bus (encoded per subscriber by the web layer)."""
         if not self._preview_bus:
             return
         try:
-            from citrasense.sensors.preview_bus import array_to_jpeg_data_url
-
-            data_url = array_to_jpeg_data_url(image)
-            self._preview_bus.push(data_url, "autofocus", sensor_id=self._sensor_id)
+            self._preview_bus.push_array(image, "autofocus", sensor_id=self._sensor_id)
         except Exception as e:
             self.logger.debug(f"Failed to push AF preview frame: {e}")
 
@@ -106,6 +106,7 @@ class TelescopeRuntimeBuilder:
             task_index=ctx.task_index,
             safety_monitor=ctx.safety_monitor,
             sensor_bus=ctx.sensor_bus,
+            upload_spool=ctx.upload_spool,
         )
 
         if ctx.init_state_callback_factory is not None:
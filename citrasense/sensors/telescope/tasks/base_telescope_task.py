@@ -241,6 +241,7 @@ class AbstractBaseTelescopeTask(ABC):
                         "pointing_report": pointing_report,
                         "tracking_mode": self.tracking_mode,
                         "timing_info": self.timing_info,
+                        "on_rendered": self._on_presentation_rendered,
                     },
                     on_complete=lambda tid, result, fp=image_path: self._on_processing_complete(fp, tid, result),
                 )
@@ -434,12 +435,37 @@ class AbstractBaseTelescopeTask(ABC):
         except Exception as e:
             self.logger.warning(f"Failed to record task {task_id} in analysis index: {e}")
 
+    def _on_presentation_rendered(self, task_id: str, image_path: str, image_bytes: bytes) -> None:
+        """Render-lane callback: the deferred annotated image for *task_id* is on disk.
+
+        *image_path* is the sensor's rolling preview, which a later render may
+        already have replaced; the analysis copy is written from *image_bytes*.
+        """
+        if self._on_annotated_image:
+            self._on_annotated_image(image_path)
+        if not self.task_index:
+            return
+        try:
+            self._store_analysis_preview(task_id, image_bytes)
+            self.task_index.update_annotated_image(task_id, image_path)
+        except Exception as e:
+            self.logger.warning(f"Failed to record annotated image for {task_id}: {e}")
+
     def _copy_annotated_preview(self, task_id: str, result) -> None:
         """Copy annotated image to the long-lived previews directory and generate a thumbnail."""
         if not result or not result.extracted_data:
             return
-        annotated = result.extracted_data.get("annotated_image.image_path")
-        if not annotated or not Path(annotated).exists():
+        # Prefer this task's working copy (kept when processing output is retained) over the rolling preview.
+        working = result.extracted_data.get("annotated_image.working_dir_path")
+        annotated = (
+            working if working and Path(working).exists() else result.extracted_data.get("annotated_image.image_path")
+        )
+        if annotated:
+            self._store_analysis_preview(task_id, annotated)
+
+    def _store_analysis_preview(self, task_id: str, annotated: str | bytes) -> None:
+        """Keep *annotated* (a file path, or the rendered JPEG bytes) as this task's analysis preview."""
+        if isinstance(annotated, str) and not Path(annotated).exists():
             return
         try:
             import shutil
@@ -449,7 +475,10 @@ class AbstractBaseTelescopeTask(ABC):
             previews_dir = self.settings.directories.analysis_previews_dir
             previews_dir.mkdir(parents=True, exist_ok=True)
             dest = previews_dir / f"{task_id}.jpg"
-            shutil.copy2(annotated, dest)
+            if isinstance(annotated, bytes):
+                dest.write_bytes(annotated)
+            else:
+                shutil.copy2(annotated, dest)
 
             thumb_dest = previews_dir / f"{task_id}.thumb.jpg"
             with Image.open(dest) as img:
@@ -728,10 +757,13 @@ class AbstractBaseTelescopeTask(ABC):
 
             slew_start_time = time.time()
             last_correction = self.hardware_adapter.point_telescope(lead_ra, lead_dec)
-            while self.hardware_adapter.telescope_is_moving():
-                if self.is_cancelled:
-                    raise RuntimeError("Task cancelled")
-                time.sleep(0.1)
+            idle = self.hardware_adapter.wait_for_telescope_idle(cancelled=lambda: self.is_cancelled)
+            if self.is_cancelled:
+                raise RuntimeError("Task cancelled")
+            if not idle:
+                # e.g. the mount state cache stopped mid-slew: the duration
+                # would be bogus and feed the slew-rate tracker.
+                raise RuntimeError("Mount did not report the slew finished")
 
             slew_duration = time.time() - slew_start_time
 
@@ -419,10 +419,25 @@ class CitraSenseSettings(BaseModel):
 
     # Global pipeline infrastructure (stays global in v5)
     processing_output_retention_hours: int = 0
+    # Days of radar artifact segments each passive-radar sensor keeps
+    # (0 = keep forever).  The artifact log prunes itself; processing
+    # retention never touches ``processing/radar/``.
+    radar_artifact_retention_days: int = 30
     use_local_apass_catalog: bool = False
     max_task_retries: int = 3
     initial_retry_delay_seconds: int = 30
     max_retry_delay_seconds: int = 300
+    # Build the annotated preview / HTML report on a separate render lane
+    # after processing instead of inline before the upload.
+    defer_presentation_rendering: bool = True
+    render_workers: int = 1
+    # Gzip FITS images before upload (sent as .fits.gz).
+    compress_image_uploads: bool = False
+    # Upload workers per sensor; all but one may carry FITS images.
+    upload_workers: int = 3
+    # Combined pace of all image uploads in Mbit/s (0 = unlimited).  Set it
+    # below the uplink so observation and radar posts never queue behind images.
+    upload_bandwidth_mbps: float = 0.0
 
     # Logging
     file_logging_enabled: bool = True
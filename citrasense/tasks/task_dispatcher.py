@@ -16,6 +16,7 @@ import heapq
 import threading
 import time
 from collections.abc import Callable
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING, Any, cast
 
@@ -30,12 +31,37 @@ if TYPE_CHECKING:
 
 TASK_POLL_INTERVAL_SECONDS = 15
 
+_POLLED_STATUSES = ("Pending", "Scheduled")
+
+# Parsed taskStart/taskStop strings are kept until the cache reaches this size.
+_EPOCH_CACHE_MAX = 50_000
+
 # Sentinel key used in ``_last_safety_action_by_key`` to record the
 # last action reported by a site-level safety check (one with no
 # ``sensor_id``).  Per-sensor checks key off their own ``sensor_id``.
 _SITE_SAFETY_KEY = "__site__"
 
 
+@dataclass(frozen=True)
+class TaskedSatellites:
+    """Immutable set of satellite IDs with a scheduled task, stamped with a version.
+
+    :meth:`TaskDispatcher.tasked_satellite_ids` hands out the current
+    instance without taking a lock; the dispatcher swaps in a new one
+    whenever the heaps change, so a reader always sees a consistent set.
+    ``version`` increases by one each time the set's contents change.
+    """
+
+    version: int
+    ids: frozenset[str]
+
+    def __contains__(self, satellite_id: object) -> bool:
+        return satellite_id in self.ids
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+
 class TaskDispatcher:
     """Site-level task orchestration: poll, schedule, route, track."""
 
@@ -70,7 +96,14 @@ class TaskDispatcher:
         self._sensor_task_dicts: dict[str, dict[str, Task]] = {}
         self._current_task_ids: dict[str, str | None] = {}
         self.heap_lock = threading.RLock()
+        # The API dict each queued task was parsed from (written by the poll
+        # thread, dropped under heap_lock when the task leaves the heaps),
+        # and the poll thread's ISO timestamp -> epoch seconds cache.
+        self._task_fingerprints: dict[str, dict] = {}
+        self._epoch_cache: dict[str, int] = {}
         self._stop_event = threading.Event()
+        # Republished under heap_lock on every heap change; read lock-free.
+        self._tasked_satellites = TaskedSatellites(version=0, ids=frozenset())
 
         # ── Safety / last action ───────────────────────────────────────
         #
@@ -287,8 +320,11 @@ class TaskDispatcher:
                     removed = True
                     ids.discard(task_id)
                     self._sensor_task_dicts[sid].pop(task_id, None)
+                    self._task_fingerprints.pop(task_id, None)
                     self._sensor_heaps[sid] = [e for e in self._sensor_heaps[sid] if e[2] != task_id]
                     heapq.heapify(self._sensor_heaps[sid])
+            if removed:
+                self._publish_tasked_satellites()
         return removed
 
     # ── Stats ──────────────────────────────────────────────────────────
@@ -368,6 +404,28 @@ class TaskDispatcher:
                 tasks.extend(task for _start, _stop, task_id, task in heap if task_id not in active_ids)
             return tasks
 
+    def tasked_satellite_ids(self) -> TaskedSatellites:
+        """Satellite IDs of every scheduled (not yet started) task.
+
+        Lock-free: returns the snapshot published at the last heap change,
+        so hot paths (the radar tasked-satellite filter) can call it per
+        detection without contending with the poll and runner threads.
+        Matches ``{t.satelliteId for t in get_tasks_snapshot()}``.
+        """
+        return self._tasked_satellites
+
+    def _publish_tasked_satellites(self) -> None:
+        """Rebuild the tasked-satellite snapshot; call with ``heap_lock`` held after changing a heap."""
+        ids = frozenset(
+            sat_id
+            for heap in self._sensor_heaps.values()
+            for _start, _stop, _tid, task in heap
+            if (sat_id := getattr(task, "satelliteId", None))
+        )
+        current = self._tasked_satellites
+        if ids != current.ids:
+            self._tasked_satellites = TaskedSatellites(version=current.version + 1, ids=ids)
+
     def get_task_by_id(self, task_id: str) -> Task | None:
         with self.heap_lock:
             for td in self._sensor_task_dicts.values():
@@ -411,6 +469,7 @@ class TaskDispatcher:
                     self._sensor_heaps.setdefault(sid, []),
                     (start, stop, task_id, task),
                 )
+            self._publish_tasked_satellites()
 
     # ── Poll loop ──────────────────────────────────────────────────────
 
@@ -463,7 +522,7 @@ class TaskDispatcher:
                     assert rec is not None
                     batch = self.api_client.get_telescope_tasks(
                         rec["id"],
-                        statuses=["Pending", "Scheduled"],
+                        statuses=list(_POLLED_STATUSES),
                         task_stop_after=now_iso,
                     )
                     if batch:
@@ -473,80 +532,128 @@ class TaskDispatcher:
                     self._stop_event.wait(TASK_POLL_INTERVAL_SECONDS)
                     continue
 
-                added = 0
-                removed = 0
-                now = int(time.time())
-                with self._stage_lock:
-                    inflight_ids = set(self.imaging_tasks) | set(self.processing_tasks) | set(self.uploading_tasks)
-                with self.heap_lock:
-                    api_task_map: dict[str, Task] = {}
-                    for task_dict in tasks:
-                        try:
-                            task = Task.from_dict(task_dict)
-                            tid = task.id
-                            if tid and task.status in ["Pending", "Scheduled"]:
-                                api_task_map[tid] = task
-                        except Exception as e:
-                            self.logger.error("Error parsing task from API: %s", e, exc_info=True)
-
-                    current_ids = {v for v in self._current_task_ids.values() if v}
-                    for sid in list(self._sensor_heaps):
-                        heap = self._sensor_heaps[sid]
-                        ids = self._sensor_task_ids[sid]
-                        dicts = self._sensor_task_dicts[sid]
-                        new_heap = []
-                        for entry in heap:
-                            start_epoch, stop_epoch, tid, task = entry
-                            if tid in current_ids or tid in api_task_map:
-                                new_heap.append(entry)
-                            else:
-                                self.logger.info("Removing task %s from queue (cancelled or status changed)", tid)
-                                ids.discard(tid)
-                                dicts.pop(tid, None)
-                                removed += 1
-                        if len(new_heap) != len(heap):
-                            self._sensor_heaps[sid] = new_heap
-                            heapq.heapify(new_heap)
-
-                    all_known = self._all_task_ids()
-                    for tid, task in api_task_map.items():
-                        if tid in all_known or tid in current_ids or tid in inflight_ids:
-                            continue
-                        rt = self._runtime_for_task(task)
-                        if rt is None:
-                            self.logger.warning(
-                                "Dropping task %s — no matching runtime (sensor_id=%s)", tid, task.sensor_id
-                            )
-                            continue
-                        target_sid = rt.sensor_id
-                        task_start = task.taskStart
-                        task_stop = task.taskStop
-                        try:
-                            start_epoch = int(dtparser.isoparse(task_start).timestamp())
-                            stop_epoch = int(dtparser.isoparse(task_stop).timestamp()) if task_stop else 0
-                        except Exception:
-                            self.logger.error("Could not parse taskStart/taskStop for task %s", tid)
-                            continue
-                        if stop_epoch and stop_epoch < now:
-                            self.logger.debug("Skipping past task %s that ended at %s", tid, task_stop)
-                            continue
-                        heapq.heappush(self._sensor_heaps[target_sid], (start_epoch, stop_epoch, tid, task))
-                        self._sensor_task_ids[target_sid].add(tid)
-                        self._sensor_task_dicts[target_sid][tid] = task
-                        added += 1
-
-                    if added > 0 or removed > 0:
-                        action_parts = []
-                        if added > 0:
-                            action_parts.append(f"Added {added}")
-                        if removed > 0:
-                            action_parts.append(f"Removed {removed}")
-                        self.logger.info(self._heap_summary(f"{', '.join(action_parts)} tasks"))
+                self._sync_tasks(tasks)
             except Exception as e:
                 self.logger.error("Exception in poll_tasks loop: %s", e, exc_info=True)
                 time.sleep(5)
             self._stop_event.wait(TASK_POLL_INTERVAL_SECONDS)
 
+    def _sync_tasks(self, tasks: list[dict]) -> dict[str, Any]:
+        """Apply one poll's task list to the per-sensor heaps, touching only what changed.
+
+        A task still queued whose API dict equals the one it was parsed from
+        last poll is not parsed again.  New and
+        modified tasks are parsed, routed and timestamped before ``heap_lock``
+        is taken; under the lock only the removals, replacements and pushes
+        are applied.  Returns the counts and how long the lock was held.
+        """
+        now = int(time.time())
+        with self.heap_lock:
+            queued = self._all_task_ids()
+        with self._stage_lock:
+            inflight_ids = set(self.imaging_tasks) | set(self.processing_tasks) | set(self.uploading_tasks)
+
+        seen: dict[str, dict] = {}
+        unchanged: set[str] = set()
+        prepared: dict[str, tuple[str, tuple[int, int, str, Task]]] = {}
+        for task_dict in tasks:
+            try:
+                tid = str(task_dict.get("id", ""))
+                if tid in queued and self._task_fingerprints.get(tid) == task_dict:
+                    unchanged.add(tid)
+                    continue
+                task = Task.from_dict(task_dict)
+                if not tid or task.status not in _POLLED_STATUSES:
+                    continue
+            except Exception as e:
+                self.logger.error("Error parsing task from API: %s", e, exc_info=True)
+                continue
+            rt = self._runtime_for_task(task)
+            if rt is None:
+                self.logger.warning("Dropping task %s — no matching runtime (sensor_id=%s)", tid, task.sensor_id)
+                continue
+            try:
+                start_epoch = self._parse_epoch(task.taskStart)
+                stop_epoch = self._parse_epoch(task.taskStop) if task.taskStop else 0
+            except Exception:
+                self.logger.error("Could not parse taskStart/taskStop for task %s", tid)
+                continue
+            if stop_epoch and stop_epoch < now:
+                self.logger.debug("Skipping past task %s that ended at %s", tid, task.taskStop)
+                continue
+            seen[tid] = dict(task_dict)
+            prepared[tid] = (rt.sensor_id, (start_epoch, stop_epoch, tid, task))
+
+        added = removed = updated = 0
+        locked_at = time.perf_counter()
+        with self.heap_lock:
+            current_ids = {v for v in self._current_task_ids.values() if v}
+            keep = unchanged | current_ids
+            replaced_ids: set[str] = set()
+            for sid, heap in self._sensor_heaps.items():
+                ids = self._sensor_task_ids[sid]
+                dicts = self._sensor_task_dicts[sid]
+                gone = ids - keep - prepared.keys()
+                replaced = ids & prepared.keys()
+                if not gone and not replaced:
+                    continue
+                for tid in gone:
+                    self.logger.info("Removing task %s from queue (cancelled or status changed)", tid)
+                    dicts.pop(tid, None)
+                    self._task_fingerprints.pop(tid, None)
+                for tid in replaced:
+                    dicts.pop(tid, None)
+                    self._task_fingerprints.pop(tid, None)
+                ids -= gone | replaced
+                heap[:] = [entry for entry in heap if entry[2] not in gone and entry[2] not in replaced]
+                heapq.heapify(heap)
+                removed += len(gone)
+                replaced_ids |= replaced
+
+            all_known = self._all_task_ids()
+            for tid, (target_sid, entry) in prepared.items():
+                if tid in all_known or tid in current_ids or tid in inflight_ids:
+                    continue
+                heapq.heappush(self._sensor_heaps[target_sid], entry)
+                self._sensor_task_ids[target_sid].add(tid)
+                self._sensor_task_dicts[target_sid][tid] = entry[3]
+                self._task_fingerprints[tid] = seen[tid]
+                if tid in replaced_ids:
+                    updated += 1
+                else:
+                    added += 1
+
+            removed += len(replaced_ids) - updated
+            if added or removed or updated:
+                self._publish_tasked_satellites()
+                action_parts = []
+                if added:
+                    action_parts.append(f"Added {added}")
+                if updated:
+                    action_parts.append(f"Updated {updated}")
+                if removed:
+                    action_parts.append(f"Removed {removed}")
+                self.logger.info(self._heap_summary(f"{', '.join(action_parts)} tasks"))
+        lock_hold = time.perf_counter() - locked_at
+
+        return {
+            "added": added,
+            "updated": updated,
+            "removed": removed,
+            "parsed": len(prepared),
+            "lock_hold_s": lock_hold,
+        }
+
+    def _parse_epoch(self, iso: str) -> int:
+        """Epoch seconds for an API timestamp, memoised across polls."""
+        epoch = self._epoch_cache.get(iso)
+        if epoch is None:
+            if len(self._epoch_cache) >= _EPOCH_CACHE_MAX:
+                self._epoch_cache.clear()
+            epoch = int(dtparser.isoparse(iso).timestamp())
+            self._epoch_cache[iso] = epoch
+        return epoch
+
     def _report_online(self) -> None:
         iso_timestamp = datetime.now(timezone.utc).isoformat()
         statuses = []
@@ -609,10 +716,14 @@ class TaskDispatcher:
                             heapq.heappop(heap)
                             self._sensor_task_ids[sid].discard(tid)
                             self._sensor_task_dicts[sid].pop(tid, None)
+                            self._task_fingerprints.pop(tid, None)
+                            self._publish_tasked_satellites()
                             self.logger.info("Skipping expired task %s (window closed)", tid)
                             continue
                         heapq.heappop(heap)
                         self._sensor_task_ids[sid].discard(tid)
+                        self._task_fingerprints.pop(tid, None)
+                        self._publish_tasked_satellites()
                         self.logger.info("Starting task %s at %s: %s", tid, datetime.now().isoformat(), task)
                         self._current_task_ids[sid] = tid
 
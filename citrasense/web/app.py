@@ -1,5 +1,6 @@
 """FastAPI web application for CitraSense monitoring and configuration."""
 
+import asyncio
 import time
 from pathlib import Path
 
@@ -10,7 +11,7 @@ from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 
 from citrasense.settings.directory_manager import DirectoryManager
-from citrasense.web.connection_manager import ConnectionManager
+from citrasense.web.connection_manager import ConnectionManager, pack_binary_message
 from citrasense.web.helpers import (
     FILTER_NAME_OPTIONS,
     _gps_fix_to_dict,
@@ -155,7 +156,14 @@ class CitraSenseWebApp:
         await self.connection_manager.broadcast({"type": "tasks", "data": tasks})
 
     async def broadcast_preview(self):
-        """Pop all pending preview frames and broadcast them to all clients."""
+        """Pop all pending preview frames and broadcast them to all clients.
+
+        Array frames are encoded (off the event loop) once per pyramid
+        level that some client subscribed to via ``preview_subscribe``,
+        and sent as binary messages: header JSON then raw JPEG bytes (see
+        :func:`pack_binary_message`).  Clients that never subscribed get
+        the full-resolution JSON data URL as before.
+        """
         if not self.daemon:
             return
         bus = getattr(self.daemon, "preview_bus", None)
@@ -163,6 +171,9 @@ class CitraSenseWebApp:
             return
         for payload, source, kind, sensor_id in bus.pop_all():
             msg = {"source": source, "sensor_id": sensor_id}
+            if kind == "array":
+                await self._broadcast_preview_frame(payload, source, sensor_id)
+                continue
             if kind == "url":
                 msg["type"] = "preview_url"
                 msg["url"] = payload
@@ -171,9 +182,28 @@ class CitraSenseWebApp:
                 msg["data"] = payload
             await self.connection_manager.broadcast(msg)
 
-    async def broadcast_log(self, log_entry: dict):
-        """Broadcast log entry to all connected clients."""
-        await self.connection_manager.broadcast({"type": "log", "data": log_entry})
+    async def _broadcast_preview_frame(self, frame, source: str, sensor_id: str) -> None:
+        for level, connections in self.connection_manager.preview_groups().items():
+            if level is None:
+                data_url = await asyncio.to_thread(frame.data_url)
+                msg = {"type": "preview", "source": source, "sensor_id": sensor_id, "data": data_url}
+                await self.connection_manager.broadcast(msg, connections)
+                continue
+            encoded = await asyncio.to_thread(frame.jpeg, level)
+            header = {
+                "type": "preview",
+                "source": source,
+                "sensor_id": sensor_id,
+                "mime": "image/jpeg",
+                "width": encoded.width,
+                "height": encoded.height,
+                "level": level,
+            }
+            await self.connection_manager.broadcast_bytes(pack_binary_message(header, encoded.jpeg), connections)
+
+    async def broadcast_logs(self, entries: list[dict], dropped: dict[str, int] | None = None):
+        """Broadcast one batch of log entries (and per-level counts of lines dropped by the rate limit)."""
+        await self.connection_manager.broadcast({"type": "logs", "data": entries, "dropped": dropped or {}})
 
     async def broadcast_toast(self, message: str, toast_type: str = "info", toast_id: str | None = None):
         """Broadcast a toast notification to all connected web clients."""
@@ -1,11 +1,30 @@
 """WebSocket connection management and streaming helpers for the web layer."""
 
 import asyncio
+import json
+import struct
 import time
+from collections.abc import Awaitable, Callable
 
 from fastapi import WebSocket
 
 from citrasense.logging import CITRASENSE_LOGGER
+from citrasense.sensors.preview_bus import preview_level
+
+_BINARY_HEADER_LEN = struct.Struct(">I")
+
+
+def pack_binary_message(header: dict, body: bytes) -> bytes:
+    """Binary WebSocket envelope: 4-byte big-endian header length, UTF-8 JSON header, raw body."""
+    encoded = json.dumps(header, separators=(",", ":")).encode("utf-8")
+    return _BINARY_HEADER_LEN.pack(len(encoded)) + encoded + body
+
+
+def unpack_binary_message(message: bytes) -> tuple[dict, bytes]:
+    """Inverse of :func:`pack_binary_message`."""
+    (length,) = _BINARY_HEADER_LEN.unpack_from(message)
+    start = _BINARY_HEADER_LEN.size
+    return json.loads(message[start : start + length]), message[start + length :]
 
 
 class ConnectionManager:
@@ -17,6 +36,8 @@ class ConnectionManager:
     def __init__(self):
         self.active_connections: list[WebSocket] = []
         self._last_heard: dict[WebSocket, float] = {}
+        # Preview pyramid level per client; absent = legacy client that gets JSON data URLs.
+        self._preview_sizes: dict[WebSocket, int] = {}
 
     async def connect(self, websocket: WebSocket):
         await websocket.accept()
@@ -28,6 +49,7 @@ class ConnectionManager:
         if websocket in self.active_connections:
             self.active_connections.remove(websocket)
         self._last_heard.pop(websocket, None)
+        self._preview_sizes.pop(websocket, None)
         CITRASENSE_LOGGER.info(f"WebSocket client disconnected. Total: {len(self.active_connections)}")
 
     async def disconnect_and_close(self, websocket: WebSocket) -> None:
@@ -42,6 +64,23 @@ class ConnectionManager:
         """Update last-heard timestamp when a client sends a message."""
         self._last_heard[websocket] = time.time()
 
+    def set_preview_size(self, websocket: WebSocket, max_size: int) -> int:
+        """Subscribe *websocket* to binary previews at the pyramid level covering *max_size* px.
+
+        Returns the level chosen (``0`` = full resolution).
+        """
+        level = preview_level(max_size)
+        if websocket in self.active_connections:
+            self._preview_sizes[websocket] = level
+        return level
+
+    def preview_groups(self) -> dict[int | None, list[WebSocket]]:
+        """Active clients grouped by preview level; ``None`` collects clients that never subscribed."""
+        groups: dict[int | None, list[WebSocket]] = {}
+        for connection in self.active_connections:
+            groups.setdefault(self._preview_sizes.get(connection), []).append(connection)
+        return groups
+
     async def prune_stale(self) -> None:
         """Disconnect clients that haven't sent a heartbeat recently."""
         now = time.time()
@@ -51,12 +90,21 @@ class ConnectionManager:
             CITRASENSE_LOGGER.info("Pruning stale WebSocket client (no heartbeat for %.0fs)", age)
             await self.disconnect_and_close(ws)
 
-    async def broadcast(self, message: dict):
-        """Broadcast message to all connected clients with per-client timeout."""
+    async def broadcast(self, message: dict, connections: list[WebSocket] | None = None):
+        """Broadcast message to all connected clients (or just *connections*) with per-client timeout."""
+        await self._send_all(lambda c: c.send_json(message), connections)
+
+    async def broadcast_bytes(self, message: bytes, connections: list[WebSocket] | None = None):
+        """Send a binary message to all connected clients (or just *connections*)."""
+        await self._send_all(lambda c: c.send_bytes(message), connections)
+
+    async def _send_all(
+        self, send: Callable[[WebSocket], Awaitable[None]], connections: list[WebSocket] | None
+    ) -> None:
         disconnected = []
-        for connection in self.active_connections:
+        for connection in list(self.active_connections if connections is None else connections):
             try:
-                await asyncio.wait_for(connection.send_json(message), timeout=self._SEND_TIMEOUT)
+                await asyncio.wait_for(send(connection), timeout=self._SEND_TIMEOUT)
             except (asyncio.TimeoutError, Exception) as e:
                 CITRASENSE_LOGGER.warning(f"Failed to send to WebSocket client: {e}")
                 disconnected.append(connection)
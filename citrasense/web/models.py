@@ -53,6 +53,9 @@ class SystemStatus(BaseModel):
     # Safety
     safety_status: dict[str, Any] | None = None
     elset_health: dict[str, Any] | None = None
+    # Citra API requests per route: count, errors, p50/p95 latency, bytes received.
+    # The full histograms and status codes are served by ``/api/metrics``.
+    api_telemetry: dict[str, Any] | None = None
 
     # Misc site-level.
     #
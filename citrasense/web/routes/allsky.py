@@ -10,14 +10,21 @@ state to the web UI:
 - ``GET  /allsky/latest.jpg``  → latest JPEG frame, served as a normal
   image response so the detail page can use it as a stable
   ``<img src=...>`` URL with cache-busting.
+- ``GET  /allsky/archive``     → archived frame timestamps in a time
+  range (a timelapse playlist), plus archive stats.
+- ``GET  /allsky/archive/frame.jpg?t=...`` → the archived frame nearest
+  to ``t`` (a redirect to that frame's own timestamp unless ``t`` is exact).
 """
 
 from __future__ import annotations
 
+import asyncio
+from datetime import datetime, timedelta, timezone
 from typing import TYPE_CHECKING, Any
+from urllib.parse import quote
 
 from fastapi import APIRouter
-from fastapi.responses import JSONResponse, Response
+from fastapi.responses import JSONResponse, RedirectResponse, Response
 
 from citrasense.logging import CITRASENSE_LOGGER
 from citrasense.web.helpers import get_sensor_context
@@ -141,4 +148,80 @@ def build_allsky_router(ctx: CitraSenseWebApp) -> APIRouter:
             headers={"Cache-Control": "no-store"},
         )
 
+    @router.get("/allsky/archive")
+    async def allsky_archive(
+        sensor_id: str,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        max_frames: int | None = None,
+    ):
+        """List archived frames in ``[start, end]`` (default: the last 12 hours).
+
+        Returns ``{frames: [{captured_at, url}], stats}``; each ``url``
+        fetches that exact frame, so the list can drive a timelapse
+        player directly.  ``max_frames`` thins a long range to evenly
+        spaced frames and must be at least 1.  409 when the sensor has
+        archiving disabled.
+        """
+        if max_frames is not None and max_frames < 1:
+            return JSONResponse({"error": "max_frames must be at least 1"}, status_code=400)
+        resolved = _get_allsky_sensor(sensor_id)
+        if isinstance(resolved, JSONResponse):
+            return resolved
+        sensor, _runtime = resolved
+        archive = sensor.archive
+        if archive is None:
+            return JSONResponse({"error": "Frame archive is disabled for this sensor"}, status_code=409)
+        end = end or datetime.now(timezone.utc)
+        start = start or end - timedelta(hours=12)
+        frames = await asyncio.to_thread(archive.frames_between, start, end, max_frames)
+        stats = await asyncio.to_thread(archive.stats)
+        return {
+            "frames": [
+                {"captured_at": f.captured_at.isoformat(), "url": _archive_frame_url(sensor_id, f.captured_at)}
+                for f in frames
+            ],
+            "stats": stats,
+        }
+
+    @router.get("/allsky/archive/frame.jpg")
+    async def allsky_archive_frame(sensor_id: str, t: datetime):
+        """Return the archived frame captured nearest to ``t`` as a raw JPEG.
+
+        When ``t`` isn't a frame's exact capture time, the nearest frame can
+        change as new frames arrive, so the response is an uncached redirect
+        to the URL keyed by the resolved frame.  That URL — and every URL
+        from ``/allsky/archive`` — names one frame forever and is served
+        as immutable.
+        """
+        resolved = _get_allsky_sensor(sensor_id)
+        if isinstance(resolved, JSONResponse):
+            return resolved
+        sensor, _runtime = resolved
+        archive = sensor.archive
+        if archive is None:
+            return JSONResponse({"error": "Frame archive is disabled for this sensor"}, status_code=409)
+        frame = await asyncio.to_thread(archive.nearest, t)
+        if frame is None:
+            return JSONResponse({"error": "No archived frames"}, status_code=404)
+        if frame.captured_at != (t if t.tzinfo else t.replace(tzinfo=timezone.utc)):
+            return RedirectResponse(
+                _archive_frame_url(sensor_id, frame.captured_at),
+                status_code=307,
+                headers={"Cache-Control": "no-store"},
+            )
+        jpeg = await asyncio.to_thread(archive.read, frame)
+        return Response(
+            content=jpeg,
+            media_type="image/jpeg",
+            headers={
+                "Cache-Control": "public, max-age=86400, immutable",
+                "X-Captured-At": frame.captured_at.isoformat(),
+            },
+        )
+
     return router
+
+
+def _archive_frame_url(sensor_id: str, captured_at: datetime) -> str:
+    return f"/api/sensors/{quote(sensor_id, safe='')}/allsky/archive/frame.jpg?t={quote(captured_at.isoformat())}"
@@ -20,11 +20,40 @@ from citrasense.web.connection_manager import _TarStreamBuffer
 if TYPE_CHECKING:
     from citrasense.web.app import CitraSenseWebApp
 
+# How long an on-demand request waits for a render already in flight.
+_ON_DEMAND_RENDER_TIMEOUT_S = 30.0
+
 
 def build_analysis_router(ctx: CitraSenseWebApp) -> APIRouter:
     """Analysis, artifact download, reprocess, and autotune endpoints."""
     router = APIRouter(prefix="/api", tags=["analysis"])
 
+    def _render_on_demand(task_id: str) -> bool:
+        """Run (or wait for) the deferred render for *task_id*.
+
+        Returns True if the task had a job on some sensor's render lane and
+        it finished successfully.  Blocking — call via ``asyncio.to_thread``.
+        """
+        td = getattr(ctx.daemon, "task_dispatcher", None)
+        if td is None:
+            return False
+        for rt in td.iter_runtimes():
+            render_queue = getattr(rt, "render_queue", None)
+            if render_queue is None:
+                continue
+            job = render_queue.render_now(task_id, timeout=_ON_DEMAND_RENDER_TIMEOUT_S)
+            if job is not None:
+                return job.succeeded
+        return False
+
+    def _build_report_on_demand(task_id: str, task_dir: Path) -> None:
+        """Make sure ``report.html`` exists for a retained task dir, rendering it if needed."""
+        _render_on_demand(task_id)
+        if not (task_dir / "report.html").is_file() and (task_dir / "processing_summary.json").is_file():
+            from citrasense.pipelines.optical.report_generator import generate_html_report
+
+            generate_html_report(task_dir)
+
     @router.get("/analysis/tasks")
     async def analysis_tasks(
         limit: int = 50,
@@ -105,7 +134,7 @@ def build_analysis_router(ctx: CitraSenseWebApp) -> APIRouter:
 
     @router.get("/analysis/tasks/{task_id}/image")
     async def analysis_task_image(task_id: str, thumb: int = 0):
-        """Serve annotated preview image for a task."""
+        """Serve annotated preview image for a task, rendering it now if it is still on the render lane."""
         if not ctx.daemon:
             return JSONResponse({"error": "Not available"}, status_code=503)
         safe_id = Path(task_id).name
@@ -121,6 +150,8 @@ def build_analysis_router(ctx: CitraSenseWebApp) -> APIRouter:
                 )
 
         preview = previews_dir / f"{safe_id}.jpg"
+        if not preview.is_file():
+            await asyncio.to_thread(_render_on_demand, safe_id)
         if not preview.is_file():
             return JSONResponse({"error": "Image not available"}, status_code=404)
         return FileResponse(
@@ -134,7 +165,8 @@ def build_analysis_router(ctx: CitraSenseWebApp) -> APIRouter:
         """Serve an artifact file from the processing directory.
 
         Supports nested paths (e.g. ``reprocessed/report.html``) so
-        reprocessed output is accessible without a separate route.
+        reprocessed output is accessible without a separate route.  A
+        missing top-level ``report.html`` is rendered on demand.
         """
         if not ctx.daemon:
             return JSONResponse({"error": "Not available"}, status_code=503)
@@ -144,6 +176,8 @@ def build_analysis_router(ctx: CitraSenseWebApp) -> APIRouter:
         artifact = (task_dir / filepath).resolve()
         if not artifact.is_relative_to(resolved_task_dir):
             return JSONResponse({"error": "Invalid path"}, status_code=400)
+        if filepath == "report.html" and not artifact.is_file() and task_dir.is_dir():
+            await asyncio.to_thread(_build_report_on_demand, safe_id, task_dir)
         if not artifact.is_file():
             return JSONResponse({"error": "Artifact not found or expired"}, status_code=404)
         return FileResponse(str(artifact))
@@ -18,7 +18,7 @@ if TYPE_CHECKING:
 
 
 def build_core_router(ctx: CitraSenseWebApp) -> APIRouter:
-    """Core informational endpoints: dashboard root, status, version, config, logs, twilight."""
+    """Core informational endpoints: dashboard root, status, metrics, version, config, logs, twilight."""
     router = APIRouter(tags=["core"])
 
     @router.get("/", response_class=HTMLResponse)
@@ -33,6 +33,12 @@ def build_core_router(ctx: CitraSenseWebApp) -> APIRouter:
             ctx._update_status_from_daemon()
         return ctx.status
 
+    @router.get("/api/metrics")
+    async def get_metrics():
+        """Per-endpoint Citra API request telemetry: latency histograms, bytes, status codes."""
+        api_client = getattr(ctx.daemon, "api_client", None)
+        return {"api_client": api_client.get_request_telemetry() if api_client else {}}
+
     @router.get("/api/task-preview/latest")
     async def get_latest_task_preview(sensor_id: str | None = None):
         """Serve the latest annotated task image for *sensor_id*.
@@ -102,16 +102,21 @@ def build_radar_router(ctx: CitraSenseWebApp) -> APIRouter:
             return JSONResponse({"error": str(exc)}, status_code=502)
 
     @router.get("/radar/detections")
-    async def radar_detections(sensor_id: str, since: float | None = None):
+    async def radar_detections(sensor_id: str, since: float | None = None, max_points: int | None = None):
         """Return the recent slim-dict detection snapshot.
 
         ``since`` cursor semantics match
         :meth:`DetectionRingBuffer.snapshot_since`:
 
-        - unset / ``None`` → whole buffer (≤ ring-buffer cap)
+        - unset / ``None`` → whole buffer
         - non-negative → absolute Unix epoch (return newer than that)
         - negative → "last |since| seconds" (convenience for hydration)
 
+        ``max_points`` thins the window to that many detections
+        (highest SNR per time bin) so hours of history stay plottable.
+        Without it, only the newest 500 detections of the window are
+        returned.
+
         Used by the monitoring and detail pages on page entry to
         back-fill the range-Doppler plot before live WebSocket
         broadcasts take over.
@@ -119,6 +124,10 @@ def build_radar_router(ctx: CitraSenseWebApp) -> APIRouter:
         sensor = _get_radar_sensor(sensor_id)
         if isinstance(sensor, JSONResponse):
             return sensor
+        if max_points is not None:
+            if max_points < 1:
+                return JSONResponse({"error": "max_points must be positive"}, status_code=400)
+            return {"detections": sensor.get_recent_detections(since, max_points=max_points)}
         return {"detections": sensor.get_recent_detections(since)}
 
     return router
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import json
 from typing import TYPE_CHECKING
 
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
@@ -28,7 +29,19 @@ def build_websocket_router(ctx: CitraSenseWebApp) -> APIRouter:
             while True:
                 data = await websocket.receive_text()
                 ctx.connection_manager.record_heard(websocket)
-                if data != "ping":
+                if data == "ping":
+                    continue
+                request = _parse_client_message(data)
+                if request.get("type") == "preview_subscribe":
+                    max_size = _preview_max_size(request)
+                    if max_size is None:
+                        await websocket.send_json(
+                            {"type": "error", "message": "preview_subscribe: max_size must be a non-negative integer"}
+                        )
+                        continue
+                    level = ctx.connection_manager.set_preview_size(websocket, max_size)
+                    await websocket.send_json({"type": "preview_subscribed", "level": level})
+                else:
                     await websocket.send_json({"type": "pong", "data": data})
 
         except WebSocketDisconnect:
@@ -38,3 +51,26 @@ def build_websocket_router(ctx: CitraSenseWebApp) -> APIRouter:
             await ctx.connection_manager.disconnect_and_close(websocket)
 
     return router
+
+
+def _parse_client_message(data: str) -> dict:
+    """Decode a JSON control message from the client; anything else is treated as an echo request."""
+    if not data.startswith("{"):
+        return {}
+    try:
+        request = json.loads(data)
+    except ValueError:
+        return {}
+    return request if isinstance(request, dict) else {}
+
+
+def _preview_max_size(request: dict) -> int | None:
+    """``max_size`` of a ``preview_subscribe`` message (missing means 0), or ``None`` when it is invalid."""
+    value = request.get("max_size") or 0
+    if isinstance(value, bool) or not isinstance(value, (int, float, str)):
+        return None
+    try:
+        max_size = int(value)
+    except (ValueError, OverflowError):
+        return None
+    return max_size if max_size >= 0 else None
@@ -358,8 +358,9 @@ export async function deleteMasterCalibration(sensorId, options = {}) {
 
 // ─── Radar ────────────────────────────────────────────────────────────────────
 
-export async function getRadarDetections(sensorId, since) {
-    return fetchJSON(sensorUrl(sensorId, `/radar/detections?since=${since}`));
+export async function getRadarDetections(sensorId, since, maxPoints = null) {
+    const thin = maxPoints ? `&max_points=${maxPoints}` : '';
+    return fetchJSON(sensorUrl(sensorId, `/radar/detections?since=${since}${thin}`));
 }
 
 // ─── Version ──────────────────────────────────────────────────────────────────
@@ -1,5 +1,5 @@
 // CitraSense Dashboard - Main Application (Alpine.js)
-import { connectWebSocket } from './websocket.js';
+import { connectWebSocket, setPreviewSize } from './websocket.js';
 import { initConfig, initFilterConfig } from './config.js';
 import { showToast } from './toast.js';
 import * as api from './api.js';
@@ -64,12 +64,27 @@ function updateStoreFromTasks(tasks) {
 const MAX_CLIENT_LOGS = 500;
 let logSeq = 0;
 
-function appendLogToStore(log) {
+// The server streams logs in batches and, under load, drops lines over its
+// rate budget; ``dropped`` counts them per level so the panel can say so.
+function appendLogsToStore(batch, dropped = {}) {
     const store = Alpine.store('citrasense');
-    log._id = ++logSeq;
-    const logs = [...store.logs, log];
+    const incoming = [...batch];
+    const droppedTotal = Object.values(dropped).reduce((a, b) => a + b, 0);
+    if (droppedTotal > 0) {
+        const detail = Object.entries(dropped).map(([level, n]) => `${n} ${level}`).join(', ');
+        incoming.push({
+            timestamp: new Date().toISOString(),
+            level: 'WARNING',
+            message: `Log stream rate-limited: ${droppedTotal} lines not shown (${detail})`,
+            module: 'web',
+            sensor_id: null,
+        });
+    }
+    if (incoming.length === 0) return;
+    for (const log of incoming) log._id = ++logSeq;
+    const logs = [...store.logs, ...incoming];
     store.logs = logs.length > MAX_CLIENT_LOGS ? logs.slice(-MAX_CLIENT_LOGS) : logs;
-    store.latestLog = log;
+    store.latestLog = incoming[incoming.length - 1];
 }
 
 function updatePreviewFromPush(dataUrl, source, sensorId) {
@@ -78,7 +93,13 @@ function updatePreviewFromPush(dataUrl, source, sensorId) {
         console.warn('updatePreviewFromPush called without sensorId; dropping preview push');
         return;
     }
-    if (store.isLoopingFor(sensorId)) return;
+    if (store.isLoopingFor(sensorId)) {
+        if (dataUrl.startsWith('blob:')) URL.revokeObjectURL(dataUrl);
+        return;
+    }
+    // Binary previews arrive as object URLs; release the one being replaced.
+    const previous = store.previewDataUrls[sensorId];
+    if (previous && previous !== dataUrl && previous.startsWith('blob:')) URL.revokeObjectURL(previous);
     store.previewDataUrls = { ...store.previewDataUrls, [sensorId]: dataUrl };
     store.previewSource = source || '';
 }
@@ -244,6 +265,8 @@ function initNavigation() {
 // window-level hook.
 window.showToast = showToast;
 window.citrasenseApi = api;
+// The fullscreen preview modal asks for full-resolution frames while open.
+window.citrasenseSetPreviewSize = setPreviewSize;
 
 document.addEventListener('DOMContentLoaded', async () => {
     initNavigation();
@@ -255,7 +278,7 @@ document.addEventListener('DOMContentLoaded', async () => {
 
     connectWebSocket({
         onStatus: updateStoreFromStatus,
-        onLog: appendLogToStore,
+        onLog: appendLogsToStore,
         onTasks: updateStoreFromTasks,
         onPreview: updatePreviewFromPush,
         onToast: handleBackendToast,
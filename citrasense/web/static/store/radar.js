@@ -62,7 +62,9 @@ export const radarMethods = {
             [sensorId]: true,
         };
         try {
-            const result = await api.getRadarDetections(sensorId, -Math.abs(secondsBack));
+            const result = await api.getRadarDetections(
+                sensorId, -Math.abs(secondsBack), this._radarDetectionsMax
+            );
             if (!result.ok) return;
             const rows = Array.isArray(result.data?.detections) ? result.data.detections : [];
             if (!rows.length) return;
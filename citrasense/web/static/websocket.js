@@ -17,6 +17,11 @@ let onToastMessage = null;
 let onRadarDetection = null;
 let onConnectionChange = null;
 
+// Longest edge (device pixels) of the preview images this page shows; the
+// server snaps it to its nearest pyramid level.  0 = full resolution.
+const defaultPreviewSize = Math.round(320 * (window.devicePixelRatio || 1));
+let previewSize = defaultPreviewSize;
+
 /**
  * Initialize WebSocket connection
  * @param {object} handlers - Event handlers {onStatus, onLog, onTasks, onPreview, onToast, onRadarDetection, onConnectionChange}
@@ -42,6 +47,34 @@ export function connectWebSocket(handlers = {}) {
     });
 }
 
+/**
+ * Ask the server for binary preview frames at (at least) this longest edge.
+ * @param {number|null} maxSize - Pixels; 0 for full resolution, null to restore the default
+ */
+export function setPreviewSize(maxSize) {
+    previewSize = maxSize == null ? defaultPreviewSize : maxSize;
+    sendPreviewSubscription();
+}
+
+function sendPreviewSubscription() {
+    if (ws && ws.readyState === WebSocket.OPEN) {
+        try {
+            ws.send(JSON.stringify({ type: 'preview_subscribe', max_size: previewSize }));
+        } catch (_) { /* onclose will fire */ }
+    }
+}
+
+/**
+ * Decode a binary message: 4-byte big-endian header length, JSON header, payload.
+ * @param {ArrayBuffer} buffer
+ * @returns {{header: object, body: Uint8Array}}
+ */
+function unpackBinaryMessage(buffer) {
+    const headerLength = new DataView(buffer).getUint32(0);
+    const header = JSON.parse(new TextDecoder().decode(new Uint8Array(buffer, 4, headerLength)));
+    return { header, body: new Uint8Array(buffer, 4 + headerLength) };
+}
+
 function connect() {
     if (reconnectTimer) {
         clearTimeout(reconnectTimer);
@@ -64,6 +97,7 @@ function connect() {
         }
 
         ws = new WebSocket(wsUrl);
+        ws.binaryType = 'arraybuffer';
 
         connectionTimer = setTimeout(() => {
             if (ws && ws.readyState !== WebSocket.OPEN) {
@@ -79,12 +113,17 @@ function connect() {
                 connectionTimer = null;
             }
             reconnectAttempts = 0;
+            sendPreviewSubscription();
             startHeartbeat();
             notifyConnectionChange(true);
         };
 
         ws.onmessage = (event) => {
             if (event.target !== ws) return;
+            if (event.data instanceof ArrayBuffer) {
+                handleBinaryMessage(event.data);
+                return;
+            }
             let message;
             try {
                 message = JSON.parse(event.data);
@@ -97,8 +136,8 @@ function connect() {
 
             if (message.type === 'status' && onStatusUpdate) {
                 onStatusUpdate(message.data);
-            } else if (message.type === 'log' && onLogMessage) {
-                onLogMessage(message.data);
+            } else if (message.type === 'logs' && onLogMessage) {
+                onLogMessage(message.data, message.dropped || {});
             } else if (message.type === 'tasks' && onTasksUpdate) {
                 onTasksUpdate(message.data);
             } else if (message.type === 'preview' && onPreviewImage) {
@@ -138,6 +177,22 @@ function connect() {
     }
 }
 
+function handleBinaryMessage(buffer) {
+    let decoded;
+    try {
+        decoded = unpackBinaryMessage(buffer);
+    } catch (e) {
+        console.warn('Malformed binary WebSocket message:', e);
+        return;
+    }
+    notifyMessageReceived();
+    const { header, body } = decoded;
+    if (header.type === 'preview' && onPreviewImage) {
+        const url = URL.createObjectURL(new Blob([body], { type: header.mime || 'image/jpeg' }));
+        onPreviewImage(url, header.source, header.sensor_id);
+    }
+}
+
 function startHeartbeat() {
     stopHeartbeat();
     heartbeatTimer = setInterval(() => {
@@ -284,6 +284,9 @@ class StatusCollector:
             else:
                 status.elset_health = None
 
+            api_client = getattr(self.daemon, "api_client", None)
+            status.api_telemetry = api_client.get_request_telemetry(summary=True) if api_client else None
+
             _mark("safety_elset")
 
             # The "latest annotated image" used to be aggregated into a
@@ -351,6 +354,8 @@ class StatusCollector:
                     "imaging": s_runtime.acquisition_queue.get_stats(),
                     "processing": s_runtime.processing_queue.get_stats(),
                     "uploading": s_runtime.upload_queue.get_stats(),
+                    "upload_lanes": s_runtime.upload_queue.get_lane_stats(),
+                    "rendering": s_runtime.render_queue.get_stats(),
                 }
                 sensor_proc_stats: dict[str, dict[str, Any]] = {}
                 reg = getattr(s_runtime, "processor_registry", None)
@@ -11,6 +11,7 @@ from __future__ import annotations
 import logging
 import threading
 import time
+from datetime import datetime
 from pathlib import Path
 from typing import Any
 
@@ -19,7 +20,8 @@ import pytest
 
 from citrasense.sensors.abstract_sensor import AcquisitionContext, SensorAcquisitionMode
 from citrasense.sensors.allsky.allsky_camera_sensor import AllskyCameraSensor
-from citrasense.sensors.preview_bus import PreviewBus
+from citrasense.sensors.allsky.frame_archive import AllskyFrameArchive
+from citrasense.sensors.preview_bus import PreviewBus, PreviewFrame
 
 
 class _FakeCamera:
@@ -148,10 +150,11 @@ def test_start_stream_runs_capture_loop_and_pushes_to_preview_bus() -> None:
     frames = bus.pop_all()
     assert frames, "PreviewBus received no frames"
     payload, source, kind, sensor_id = frames[0]
-    assert kind == "data"
+    assert kind == "array"
     assert source == "allsky"
     assert sensor_id == "allsky-0"
-    assert payload.startswith("data:image/jpeg;base64,")
+    assert isinstance(payload, PreviewFrame)
+    assert payload.data_url().startswith("data:image/jpeg;base64,")
 
 
 def test_get_live_status_after_capture_has_shape() -> None:
@@ -184,6 +187,20 @@ def test_capture_now_succeeds_and_updates_latest_jpeg() -> None:
     assert jpeg[:2] == b"\xff\xd8"
 
 
+def test_capture_encodes_once_and_shares_bytes(tmp_path) -> None:
+    archive = AllskyFrameArchive(tmp_path)
+    sensor, _camera, bus = _make_sensor(archive=archive)
+    assert sensor.connect()
+    assert sensor.capture_now()["ok"] is True
+
+    (preview, _source, _kind, _sid), *_ = bus.pop_all()
+    # The bus frame already holds the full-resolution encode; it is the same object the sensor stored.
+    assert list(preview._encoded) == [0]
+    assert preview.jpeg().jpeg is sensor.latest_jpeg_bytes
+    [archived] = archive.frames_between(datetime.min, datetime.max)
+    assert archive.read(archived) == sensor.latest_jpeg_bytes
+
+
 def test_capture_now_rejects_when_disconnected() -> None:
     sensor, _camera, _bus = _make_sensor()
     with pytest.raises(RuntimeError, match="not connected"):
@@ -372,6 +389,8 @@ def test_from_config_strips_camera_prefix_before_passing_to_camera() -> None:
     assert status["capture_interval_s"] == pytest.approx(5.0)
     assert status["gain"] == pytest.approx(4.0)
     assert status["camera_type"] == "usb_camera"
+    # The frame archive is opt-in.
+    assert sensor.archive is None
 
 
 def test_from_config_records_missing_camera_dependencies_for_banner() -> None:
@@ -0,0 +1,109 @@
+"""Tests for AllskyFrameArchive: append, range seek, nearest, crash repair and retention."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from citrasense.sensors.allsky.frame_archive import INDEX_DTYPE, AllskyFrameArchive
+
+T0 = datetime(2026, 3, 15, 22, 0, tzinfo=timezone.utc)
+
+
+def _jpeg(i: int) -> bytes:
+    return b"\xff\xd8" + f"frame-{i}".encode() + b"\xff\xd9"
+
+
+def _fill(archive: AllskyFrameArchive, count: int, step_s: float = 30.0) -> None:
+    for i in range(count):
+        archive.append(_jpeg(i), T0 + timedelta(seconds=i * step_s))
+
+
+def test_frames_between_spans_utc_midnight(tmp_path):
+    archive = AllskyFrameArchive(tmp_path)
+    _fill(archive, 600)  # 22:00 -> 02:59:30, two daily segments
+
+    assert archive.segments() == ["20260315", "20260316"]
+    frames = archive.frames_between(T0 + timedelta(minutes=119), T0 + timedelta(minutes=121))
+    assert [f.captured_at for f in frames] == [T0 + timedelta(seconds=s) for s in (7140, 7170, 7200, 7230, 7260)]
+    assert {f.segment for f in frames} == {"20260315", "20260316"}
+    assert archive.read(frames[2]) == _jpeg(240)
+
+
+def test_frames_between_thins_to_budget(tmp_path):
+    archive = AllskyFrameArchive(tmp_path)
+    _fill(archive, 100)
+
+    frames = archive.frames_between(T0, T0 + timedelta(hours=2), max_frames=10)
+    assert len(frames) == 10
+    assert frames[0].captured_at == T0
+    assert frames[-1].captured_at == T0 + timedelta(seconds=99 * 30)
+
+    jpegs = list(archive.iter_jpegs(T0, T0 + timedelta(hours=2), max_frames=10))
+    assert [j for _, j in jpegs] == [archive.read(f) for f in frames]
+
+
+@pytest.mark.parametrize("max_frames", [0, -3])
+def test_max_frames_below_one_is_rejected(tmp_path, max_frames):
+    archive = AllskyFrameArchive(tmp_path)
+    _fill(archive, 10)
+    with pytest.raises(ValueError, match="max_frames"):
+        archive.frames_between(T0, T0 + timedelta(hours=1), max_frames=max_frames)
+
+
+def test_nearest(tmp_path):
+    archive = AllskyFrameArchive(tmp_path)
+    assert archive.nearest(T0) is None
+    _fill(archive, 10)
+
+    assert archive.nearest(T0 + timedelta(seconds=44)).captured_at == T0 + timedelta(seconds=30)
+    assert archive.nearest(T0 + timedelta(seconds=46)).captured_at == T0 + timedelta(seconds=60)
+    assert archive.nearest(T0 - timedelta(days=3)).captured_at == T0
+    assert archive.nearest(T0 + timedelta(days=3)).captured_at == T0 + timedelta(seconds=270)
+
+
+def test_reader_sees_appends_from_writer(tmp_path):
+    writer = AllskyFrameArchive(tmp_path)
+    reader = AllskyFrameArchive(tmp_path)
+    _fill(writer, 3)
+    assert len(reader.frames_between(T0, T0 + timedelta(hours=1))) == 3
+    writer.append(_jpeg(3), T0 + timedelta(seconds=90))
+    assert len(reader.frames_between(T0, T0 + timedelta(hours=1))) == 4
+
+
+def test_clock_step_back_keeps_index_sorted(tmp_path):
+    archive = AllskyFrameArchive(tmp_path)
+    archive.append(_jpeg(0), T0)
+    stored = archive.append(_jpeg(1), T0 - timedelta(seconds=5))
+
+    assert stored.captured_at == T0
+    assert len(archive.frames_between(T0, T0)) == 2
+
+
+def test_torn_index_record_is_ignored_then_trimmed(tmp_path):
+    archive = AllskyFrameArchive(tmp_path)
+    _fill(archive, 3)
+    index = tmp_path / "20260315.idx"
+    with open(index, "ab") as f:
+        f.write(b"\x00" * 7)  # crash mid-record
+
+    reopened = AllskyFrameArchive(tmp_path)
+    assert len(reopened.frames_between(T0, T0 + timedelta(hours=1))) == 3
+    reopened.append(_jpeg(3), T0 + timedelta(seconds=90))
+    assert index.stat().st_size == 4 * INDEX_DTYPE.itemsize
+    assert reopened.read(reopened.nearest(T0 + timedelta(seconds=90))) == _jpeg(3)
+
+
+@pytest.mark.parametrize(
+    ("retention", "kept"), [(1.0, ["20260314", "20260315"]), (None, ["20260313", "20260314", "20260315"])]
+)
+def test_retention_prunes_old_days_on_rollover(tmp_path, retention, kept):
+    archive = AllskyFrameArchive(tmp_path, retention_days=retention)
+    for day in (2, 1, 0):
+        archive.append(_jpeg(day), T0 - timedelta(days=day))
+
+    assert archive.segments() == kept
+    stats = archive.stats()
+    assert stats["frames"] == len(kept)
+    assert stats["last"] == T0.isoformat()
@@ -0,0 +1,85 @@
+"""Pins the batched Alt/Az → ICRS engine to astropy's ``SkyCoord(...).icrs``.
+
+The engine replays astropy's own ERFA calls with cached astrometry
+contexts, so any disagreement beyond ``TOLERANCE_ARCSEC`` means either the
+Earth-rotation advance within a bucket or the context reuse is wrong.
+"""
+
+from datetime import datetime, timezone
+
+import numpy as np
+import pytest
+from astropy import units as u
+from astropy.coordinates import AltAz, EarthLocation, SkyCoord
+from astropy.time import Time
+
+from citrasense.astro.altaz_icrs import TOLERANCE_ARCSEC, AltAzToIcrs
+
+_SITES = [(38.82, -104.87, 1660.0), (-33.9, 151.2, 40.0), (64.8, -147.7, 130.0)]
+
+
+def _astropy_radec(site, az, el, unix_time) -> SkyCoord:
+    lat, lon, alt = site
+    location = EarthLocation(lat=lat * u.deg, lon=lon * u.deg, height=alt * u.m)
+    frame = AltAz(obstime=Time(unix_time, format="unix", scale="utc"), location=location)
+    return SkyCoord(alt=np.asarray(el) * u.deg, az=np.asarray(az) * u.deg, frame=frame).icrs
+
+
+@pytest.mark.parametrize("site", _SITES)
+def test_matches_astropy_across_sky_and_buckets(site):
+    rng = np.random.default_rng(7)
+    az = rng.uniform(0.0, 360.0, 300)
+    el = rng.uniform(0.0, 90.0, 300)
+    # Ten minutes of detections: several buckets, including both edges of each.
+    t0 = datetime(2026, 3, 15, 4, 0, tzinfo=timezone.utc).timestamp()
+    t = t0 + rng.uniform(0.0, 600.0, 300)
+    t[:4] = [t0, t0 + 59.999, t0 + 60.0, t0 + 599.999]
+
+    ra, dec = AltAzToIcrs(*site).transform(az, el, t)
+
+    reference = _astropy_radec(site, az, el, t)
+    separation = SkyCoord(ra=ra * u.deg, dec=dec * u.deg).separation(reference).arcsec
+    assert separation.max() < TOLERANCE_ARCSEC
+    assert ((ra >= 0.0) & (ra < 360.0)).all()
+
+
+def test_scalar_and_datetime_wrappers_agree_with_arrays():
+    engine = AltAzToIcrs(38.82, -104.87, 1660.0)
+    when = datetime(2026, 9, 22, 0, 0, 12, tzinfo=timezone.utc)
+
+    ra, dec = engine.transform_one(120.0, 35.0, when)
+    ra_naive, dec_naive = engine.transform_one(120.0, 35.0, when.replace(tzinfo=None))
+    ras, decs = engine.transform_datetimes([120.0, 200.0], [35.0, 10.0], [when, when])
+
+    assert (ra, dec) == (ra_naive, dec_naive)
+    assert ras[0] == pytest.approx(ra, abs=1e-12)
+    assert decs[0] == pytest.approx(dec, abs=1e-12)
+
+
+def test_zenith_declination_is_site_latitude():
+    engine = AltAzToIcrs(35.0, -106.0, 0.0)
+    _, dec = engine.transform_one(0.0, 90.0, datetime(2026, 3, 20, 12, tzinfo=timezone.utc))
+    # Precession since J2000 and aberration move the apparent pole by a few arcmin at most.
+    assert dec == pytest.approx(35.0, abs=0.2)
+
+
+def test_contexts_are_built_once_per_bucket(monkeypatch):
+    engine = AltAzToIcrs(38.82, -104.87, 1660.0, bucket_s=60.0)
+    built: list[int] = []
+    original = engine._build_context
+
+    def _counting(bucket: int):
+        built.append(bucket)
+        return original(bucket)
+
+    monkeypatch.setattr(engine, "_build_context", _counting)
+    t0 = 60.0 * 29_600_000  # bucket-aligned, early 2026
+    engine.transform(np.zeros(50), np.full(50, 45.0), t0 + np.linspace(0.0, 119.0, 50))
+    engine.transform([10.0], [45.0], [t0 + 5.0])
+
+    assert built == [29_600_000, 29_600_001]
+
+
+def test_empty_input():
+    ra, dec = AltAzToIcrs(0.0, 0.0).transform([], [], [])
+    assert ra.shape == dec.shape == (0,)
@@ -237,6 +237,22 @@ class TestAnnotatedImageSaving:
         assert working.exists()
         assert working.name == "annotated.jpg"
 
+    def test_deferred_rendering_snapshots_without_writing(self, tmp_path):
+        proc = AnnotatedImageProcessor()
+        ctx = _make_context(tmp_path, debug_json=_make_debug_json())
+        ctx.defer_rendering = True
+
+        with patch.object(AnnotatedImageProcessor, "_load_wcs", return_value=None):
+            result = proc.process(ctx)
+
+        assert result.extracted_data == {"deferred": True}
+        assert ctx.deferred_annotation is not None
+        assert not (ctx.working_dir / "annotated.jpg").exists()
+
+        preview, working = proc.render_to_disk(ctx.deferred_annotation, write_working_copy=False)
+        assert preview.exists()
+        assert working is None
+
     def test_output_is_valid_jpeg(self, tmp_path):
         proc = AnnotatedImageProcessor()
         debug = _make_debug_json()
@@ -362,6 +378,13 @@ class TestRadecToPixelFlip:
         assert px is None
         assert py is None
 
+    def test_batch_projects_in_one_wcs_call(self):
+        wcs = MagicMock()
+        wcs.world_to_pixel_values.return_value = (np.array([10.0, np.nan]), np.array([20.0, 5.0]))
+        positions = AnnotatedImageProcessor._radec_to_pixels(wcs, [180.0, 181.0], [45.0, 46.0], img_height=100)
+        assert wcs.world_to_pixel_values.call_count == 1
+        assert positions == [(10, 79), (None, None)]
+
     def test_pixel_scale_maps_coords_to_downscaled_canvas(self):
         wcs = MagicMock()
         wcs.world_to_pixel_values.return_value = (1000.0, 500.0)
@@ -443,8 +466,8 @@ class TestDrawStars:
 
         def counting_radec(wcs, ra, dec, h, pixel_scale=1.0):
             nonlocal call_count
-            call_count += 1
-            return 100, 100
+            call_count += len(ra)
+            return [(100, 100)] * len(ra)
 
         sources = pd.DataFrame(
             {
@@ -459,10 +482,11 @@ class TestDrawStars:
         draw = ImageDraw.Draw(img)
         proc = AnnotatedImageProcessor()
 
-        with patch.object(AnnotatedImageProcessor, "_radec_to_pixel", side_effect=counting_radec):
+        with patch.object(AnnotatedImageProcessor, "_radec_to_pixels", side_effect=counting_radec) as mock_project:
             proc._draw_stars(draw, wcs, sources, img.height, tracking_mode=None)
 
         assert call_count == 50
+        assert mock_project.call_count == 1  # one batched projection per layer
 
     def test_empty_sources_is_noop(self):
         import pandas as pd
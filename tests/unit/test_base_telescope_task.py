@@ -5,6 +5,7 @@ from __future__ import annotations
 import math
 import platform
 from datetime import datetime, timezone
+from functools import partial
 from typing import cast
 from unittest.mock import MagicMock, create_autospec, patch
 
@@ -59,6 +60,8 @@ def _make_hardware_adapter(initial_slew_samples=None, **overrides):
     adapter.telescope_is_moving = MagicMock()
     adapter.point_telescope = MagicMock()
     adapter.update_from_plate_solve = MagicMock()
+    # Real default implementation, so slew waits are driven by telescope_is_moving.
+    adapter.wait_for_telescope_idle = partial(AbstractAstroHardwareAdapter.wait_for_telescope_idle, adapter)
 
     tracker = SlewRateTracker()
     for sample in initial_slew_samples or []:
@@ -462,6 +465,25 @@ class TestOnProcessingComplete:
         ct.api_client.mark_task_complete.assert_not_called()
         ct.runtime.remove_task_from_all_stages.assert_called_once_with("task-1")
 
+    def test_deferred_render_stores_the_tasks_own_bytes(self, tmp_path):
+        import io
+
+        from PIL import Image
+
+        ct = self._make_concrete()
+        ct.task_index = MagicMock()
+        ct.settings.directories.analysis_previews_dir = tmp_path / "previews"
+        buf = io.BytesIO()
+        Image.new("RGB", (8, 8), "red").save(buf, "JPEG")
+        rolling = tmp_path / "latest_preview_scope.jpg"
+        rolling.write_bytes(b"another task's render")  # overwritten after this task's render finished
+
+        ct._on_presentation_rendered("task-1", str(rolling), buf.getvalue())
+
+        assert (tmp_path / "previews" / "task-1.jpg").read_bytes() == buf.getvalue()
+        assert (tmp_path / "previews" / "task-1.thumb.jpg").exists()
+        ct.task_index.update_annotated_image.assert_called_once_with("task-1", str(rolling))
+
     def test_feeds_plate_solve_to_adapter(self):
         ct = self._make_concrete()
         ct.pointing_report = {
@@ -598,6 +620,18 @@ class TestCancellation:
             with pytest.raises(RuntimeError, match=r"(?i)cancelled"):
                 ct.point_to_lead_position({"most_recent_elset": {"tle": ["a", "b"]}})
 
+    def test_point_to_lead_raises_when_slew_wait_fails(self):
+        ct = self._make_concrete()
+        adapter = _adapter_mock(ct)
+        adapter.get_telescope_direction.return_value = (0.0, 0.0)
+        adapter.point_telescope = MagicMock()
+        adapter.wait_for_telescope_idle = MagicMock(return_value=False)
+
+        with patch.object(ct, "estimate_lead_position", return_value=(10.0, 20.0, 1.0)):
+            with pytest.raises(RuntimeError, match="slew finished"):
+                ct.point_to_lead_position({"most_recent_elset": {"tle": ["a", "b"]}})
+        assert adapter.slew_rate_tracker.count == 0
+
 
 class TestEstimateSlewTime:
     """Tests for the estimate_slew_time pure function (trapezoidal velocity model)."""
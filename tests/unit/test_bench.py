@@ -0,0 +1,312 @@
+"""Tests for the micro-benchmark CLI (:mod:`citrasense.cli.bench`)."""
+
+from __future__ import annotations
+
+import json
+
+from click.testing import CliRunner
+
+from citrasense.cli.bench import cli
+
+
+def test_sextractor_catalog_writes_report(tmp_path):
+    output = tmp_path / "bench.json"
+    result = CliRunner().invoke(
+        cli, ["sextractor-catalog", "--sizes", "10,200", "--repeat", "1", "--output", str(output)]
+    )
+    assert result.exit_code == 0, result.output
+
+    report = json.loads(output.read_text())
+    assert report["benchmark"] == "sextractor-catalog"
+    assert [r["sources"] for r in report["results"]["parse"]] == [10, 200]
+    assert "cached_stage_seconds" in report["results"]["config_staging"]
+
+
+def test_sextractor_catalog_rejects_bad_sizes():
+    result = CliRunner().invoke(cli, ["sextractor-catalog", "--sizes", "ten"])
+    assert result.exit_code != 0
+    assert "comma-separated integers" in result.output
+
+
+def test_wcs_projection_writes_report(tmp_path):
+    output = tmp_path / "bench.json"
+    result = CliRunner().invoke(
+        cli,
+        [
+            "wcs-projection",
+            "--predictions",
+            "50",
+            "--stars",
+            "200",
+            "--repeat",
+            "1",
+            "--loop-sample",
+            "20",
+            "--output",
+            str(output),
+        ],
+    )
+    assert result.exit_code == 0, result.output
+
+    report = json.loads(output.read_text())
+    by_wcs = {r["wcs"]: r for r in report["results"]}
+    assert by_wcs["tan"]["points"] == 250
+    assert by_wcs["tan"]["uses_linear"] is True
+    assert by_wcs["tan"]["on_frame_max_error_px"] < 0.05
+    assert by_wcs["tan-sip"]["uses_linear"] is False
+
+
+def test_moravian_readout_writes_report(tmp_path):
+    output = tmp_path / "bench.json"
+    result = CliRunner().invoke(
+        cli,
+        [
+            "moravian-readout",
+            "--frame-size",
+            "64",
+            "48",
+            "--exposure",
+            "0.05",
+            "--repeat",
+            "2",
+            "--output",
+            str(output),
+        ],
+    )
+    assert result.exit_code == 0, result.output
+
+    report = json.loads(output.read_text())
+    by_path = {r["path"]: r for r in report["results"]}
+    assert set(by_path) == {"legacy", "capture_array", "take_exposure"}
+    assert by_path["take_exposure"]["peak_alloc_bytes"] < by_path["legacy"]["peak_alloc_bytes"]
+
+
+def test_ximea_datacube_writes_report(tmp_path):
+    output = tmp_path / "bench.json"
+    result = CliRunner().invoke(cli, ["ximea-datacube", "--patterns", "4", "--repeat", "1", "--output", str(output)])
+    assert result.exit_code == 0, result.output
+
+    report = json.loads(output.read_text())
+    (row,) = report["results"]
+    assert row["pattern"] == "4x4"
+    assert row["streamed"]["file_bytes"] == row["legacy"]["file_bytes"]
+
+
+def test_capture_tail_writes_report(tmp_path):
+    output = tmp_path / "bench.json"
+    result = CliRunner().invoke(
+        cli,
+        [
+            "capture-tail",
+            "--frames",
+            "2",
+            "--interval",
+            "0.01",
+            "--frame-bytes",
+            "1024",
+            "--legacy-poll",
+            "0.05",
+            "--repeat",
+            "1",
+            "--output",
+            str(output),
+        ],
+    )
+    assert result.exit_code == 0, result.output
+
+    report = json.loads(output.read_text())
+    assert [r["strategy"] for r in report["results"]] == ["legacy-poll", "watcher-inotify", "watcher-poll"]
+
+
+def test_mount_cache_writes_report(tmp_path):
+    output = tmp_path / "bench.json"
+    result = CliRunner().invoke(
+        cli,
+        [
+            "mount-cache",
+            "--slew-seconds",
+            "0.05",
+            "--repeat",
+            "1",
+            "--seconds",
+            "0.1",
+            "--time-scale",
+            "20",
+            "--output",
+            str(output),
+        ],
+    )
+    assert result.exit_code == 0, result.output
+
+    report = json.loads(output.read_text())
+    settle = {r["strategy"]: r for r in report["results"]["settle"]}
+    assert set(settle) == {"legacy-alignment-loop", "legacy-task-loop", "cache-wait"}
+    traffic = {r["state"]: r for r in report["results"]["traffic"]}
+    assert traffic["parked"]["adaptive_commands_per_hour"] < traffic["parked"]["fixed_2hz_commands_per_hour"]
+
+
+def test_preview_writes_report(tmp_path):
+    output = tmp_path / "bench.json"
+    result = CliRunner().invoke(
+        cli, ["preview", "--frame-size", "800", "600", "--repeat", "1", "--output", str(output)]
+    )
+    assert result.exit_code == 0, result.output
+
+    rows = {(r["path"], r["level"]): r for r in json.loads(output.read_text())["results"]}
+    assert {level for path, level in rows if path == "binary"} == {"320", "640", "1280", "full"}
+    assert (
+        rows[("binary", "320")]["bytes"] < rows[("binary", "full")]["bytes"] < rows[("json-data-url", "full")]["bytes"]
+    )
+
+
+def test_allsky_capture_writes_report(tmp_path):
+    output = tmp_path / "bench.json"
+    result = CliRunner().invoke(
+        cli, ["allsky-capture", "--frame-size", "320", "240", "--repeat", "1", "--output", str(output)]
+    )
+    assert result.exit_code == 0, result.output
+
+    paths = [r["path"] for r in json.loads(output.read_text())["results"]]
+    assert paths[0] == "legacy-data-url"
+    assert "shared-bytes+archive" in paths
+
+
+def test_allsky_archive_writes_report(tmp_path):
+    output = tmp_path / "bench.json"
+    result = CliRunner().invoke(
+        cli, ["allsky-archive", "--frames", "300", "--frame-bytes", "64", "--repeat", "1", "--output", str(output)]
+    )
+    assert result.exit_code == 0, result.output
+
+    report = json.loads(output.read_text())["results"]
+    assert report["frames_in_window"] == 121
+    assert {(r["layout"], r["op"]) for r in report["results"]} >= {("file-per-frame", "seek"), ("archive-warm", "seek")}
+
+
+def test_web_log_writes_report(tmp_path):
+    output = tmp_path / "bench.json"
+    result = CliRunner().invoke(
+        cli, ["web-log", "--lines-per-second", "2000", "--seconds", "0.3", "--output", str(output)]
+    )
+    assert result.exit_code == 0, result.output
+
+    rows = {r["strategy"]: r for r in json.loads(output.read_text())["results"]}
+    assert rows["per-line"]["messages_sent"] == rows["per-line"]["lines_emitted"]
+    assert rows["batched"]["messages_sent"] < rows["per-line"]["messages_sent"]
+
+
+def test_bus_writes_report(tmp_path):
+    output = tmp_path / "bench.json"
+    result = CliRunner().invoke(
+        cli, ["bus", "--subscriptions", "10,40", "--publishes", "200", "--repeat", "1", "--output", str(output)]
+    )
+    assert result.exit_code == 0, result.output
+
+    rows = json.loads(output.read_text())["results"]
+    for count in (10, 40):
+        deliveries = {r["strategy"]: r["deliveries_per_publish"] for r in rows if r["subscriptions"] == count}
+        assert deliveries["fnmatch-scan"] == deliveries["trie-cold"] == deliveries["trie-cached"]
+    assert {r["strategy"] for r in rows} >= {"slow-handler-inline", "slow-handler-queued"}
+
+
+def test_radar_azel_writes_report(tmp_path):
+    output = tmp_path / "bench.json"
+    result = CliRunner().invoke(
+        cli,
+        ["radar-azel", "--detections", "200", "--legacy-detections", "5", "--repeat", "1", "--output", str(output)],
+    )
+    assert result.exit_code == 0, result.output
+
+    report = json.loads(output.read_text())["results"]
+    assert [r["path"] for r in report["results"]] == [
+        "skycoord-per-detection",
+        "engine-per-detection",
+        "engine-batched",
+    ]
+    assert report["max_separation_arcsec"] < 0.01
+
+
+def test_radar_filter_writes_report(tmp_path):
+    output = tmp_path / "bench.json"
+    result = CliRunner().invoke(
+        cli, ["radar-filter", "--tasks", "50", "--detections", "100", "--repeat", "1", "--output", str(output)]
+    )
+    assert result.exit_code == 0, result.output
+
+    rows = json.loads(output.read_text())["results"]
+    assert {r["lookup"] for r in rows} == {"snapshot-scan", "tasked-id-set"}
+    assert {r["passed"] for r in rows} == {50}
+
+
+def test_radar_history_writes_report(tmp_path):
+    output = tmp_path / "bench.json"
+    result = CliRunner().invoke(
+        cli, ["radar-history", "--detections", "5000", "--repeat", "1", "--output", str(output)]
+    )
+    assert result.exit_code == 0, result.output
+
+    rows = json.loads(output.read_text())["results"]
+    assert {r["buffer"] for r in rows} == {"deque-of-dicts", "columnar"}
+    by_query = {(r["buffer"], r["query"]): r["rows"] for r in rows}
+    assert by_query["deque-of-dicts", "last-5-min"] == by_query["columnar", "last-5-min"] == 3000
+    assert by_query["columnar", "all-500-points"] == 500
+
+
+def test_radar_artifacts_writes_report(tmp_path):
+    output = tmp_path / "bench.json"
+    result = CliRunner().invoke(cli, ["radar-artifacts", "--observations", "1500", "--output", str(output)])
+    assert result.exit_code == 0, result.output
+
+    rows = {r["layout"]: r for r in json.loads(output.read_text())["results"]}
+    assert rows["file-per-observation"]["files"] == 1500
+    assert rows["segmented-log"]["files"] == 2
+    assert rows["segmented-log"]["range_hits"] == rows["file-per-observation"]["range_hits"] == 601
+
+
+def test_image_upload_writes_report(tmp_path):
+    output = tmp_path / "bench.json"
+    result = CliRunner().invoke(
+        cli, ["image-upload", "--size-mb", "2", "--uploads", "2", "--chunk-mb", "0.25", "--output", str(output)]
+    )
+    assert result.exit_code == 0, result.output
+
+    rows = {r["mode"]: r for r in json.loads(output.read_text())["results"]}
+    assert rows["bare-post"]["resent_bytes"] > rows["bare-post"]["file_bytes"]
+    assert rows["resumable"]["resent_bytes"] == 0
+    assert rows["resumable"]["attempts"] == 4
+    assert rows["resumable+gzip"]["file_bytes"] < rows["resumable"]["file_bytes"]
+
+
+def test_upload_drain_writes_report(tmp_path):
+    output = tmp_path / "bench.json"
+    args = ["upload-drain", "--uplinks", "40", "--images", "2", "--size-mb", "0.5", "--radar-hz", "20"]
+    result = CliRunner().invoke(cli, [*args, "--output", str(output)])
+    assert result.exit_code == 0, result.output
+
+    rows = {r["mode"]: r for r in json.loads(output.read_text())["results"]}
+    assert set(rows) == {"fifo-1-worker", "lanes-3-workers", "lanes-3-workers+budget"}
+    assert all(r["radar_batches"] > 0 for r in rows.values())
+    assert rows["lanes-3-workers"]["radar_latency_p50_s"] < rows["fifo-1-worker"]["radar_latency_p50_s"]
+
+
+def test_upload_spool_writes_report(tmp_path):
+    output = tmp_path / "bench.json"
+    args = ["upload-spool", "--items", "200", "--upload-ms", "0", "--retry-delay", "0.5", "--probe-interval", "0.1"]
+    result = CliRunner().invoke(cli, [*args, "--output", str(output)])
+    assert result.exit_code == 0, result.output
+
+    rows = {r["mode"]: r for r in json.loads(output.read_text())["results"]}
+    assert rows["in-memory"]["permanent_failures"] == rows["spool"]["permanent_failures"] == 0
+    assert rows["spool"]["spool_file_bytes"] > 0
+    assert rows["spool"]["offline_memory_bytes"] < rows["in-memory"]["offline_memory_bytes"]
+
+
+def test_task_poll_writes_report(tmp_path):
+    output = tmp_path / "bench.json"
+    args = ["task-poll", "--tasks", "400", "--sensors", "2", "--polls", "3", "--churn", "0.05"]
+    result = CliRunner().invoke(cli, [*args, "--output", str(output)])
+    assert result.exit_code == 0, result.output
+
+    rows = {(r["scenario"], r["mode"]): r for r in json.loads(output.read_text())["results"]}
+    assert rows[("steady", "full-rebuild")]["pending"] == rows[("steady", "incremental")]["pending"] == 400
+    assert rows[("churn", "full-rebuild")]["pending"] == rows[("churn", "incremental")]["pending"] == 420
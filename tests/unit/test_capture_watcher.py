@@ -0,0 +1,97 @@
+"""Tests for CaptureWatcher (inotify and polling backends)."""
+
+from __future__ import annotations
+
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from citrasense.hardware.capture_watcher import CaptureWatcher
+
+BACKENDS = [
+    pytest.param(
+        True,
+        marks=pytest.mark.skipif(not sys.platform.startswith("linux"), reason="inotify is Linux-only"),
+        id="inotify",
+    ),
+    pytest.param(False, id="poll"),
+]
+
+
+def _write_later(path: Path, delay: float, payload: bytes = b"SIMPLE  = T") -> threading.Thread:
+    def _write():
+        time.sleep(delay)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(payload)
+
+    thread = threading.Thread(target=_write)
+    thread.start()
+    return thread
+
+
+@pytest.mark.parametrize("use_inotify", BACKENDS)
+def test_wait_for_returns_when_files_land(tmp_path, use_inotify):
+    with CaptureWatcher(tmp_path, poll_interval=0.05, use_inotify=use_inotify) as watcher:
+        _write_later(tmp_path / "Light" / "frame_001.fits", 0.05)
+        _write_later(tmp_path / "Light" / "R" / "frame_002.fit", 0.1)
+
+        assert watcher.wait_for(2, timeout=5)
+
+    assert [Path(p).name for p in watcher.files()] == ["frame_001.fits", "frame_002.fit"]
+    assert watcher.last_file_at is not None
+
+
+@pytest.mark.parametrize("use_inotify", BACKENDS)
+def test_ignores_other_suffixes_and_picks_up_existing_files(tmp_path, use_inotify):
+    (tmp_path / "old.fits").write_bytes(b"x")
+    (tmp_path / "notes.txt").write_bytes(b"x")
+
+    with CaptureWatcher(tmp_path, poll_interval=0.05, use_inotify=use_inotify) as watcher:
+        assert watcher.wait_for(1, timeout=5)
+        time.sleep(0.2)
+
+    assert [Path(p).name for p in watcher.files()] == ["old.fits"]
+
+
+def test_inotify_waits_for_close(tmp_path):
+    if not sys.platform.startswith("linux"):
+        pytest.skip("inotify is Linux-only")
+    with CaptureWatcher(tmp_path) as watcher:
+        assert watcher.backend == "inotify"
+        with open(tmp_path / "frame.fits", "wb") as f:
+            f.write(b"partial")
+            f.flush()
+            assert not watcher.wait_for(1, timeout=0.2)
+        assert watcher.wait_for(1, timeout=5)
+
+
+def test_poll_backend_waits_for_stable_size(tmp_path):
+    with CaptureWatcher(tmp_path, poll_interval=0.05, use_inotify=False) as watcher:
+        assert watcher.backend == "poll"
+        path = tmp_path / "frame.fits"
+        with open(path, "wb") as f:
+            for _ in range(6):
+                f.write(b"x" * 1024)
+                f.flush()
+                time.sleep(0.03)
+                assert watcher.files() == []
+        assert watcher.wait_for(1, timeout=5)
+
+
+def test_missing_root_falls_back_to_polling(tmp_path):
+    root = tmp_path / "not-yet"
+    with CaptureWatcher(root, poll_interval=0.05) as watcher:
+        assert watcher.backend == "poll"
+        _write_later(root / "frame.fits", 0.05)
+        assert watcher.wait_for(1, timeout=5)
+
+
+def test_wake_releases_waiter(tmp_path):
+    with CaptureWatcher(tmp_path, poll_interval=0.05) as watcher:
+        threading.Timer(0.05, watcher.wake).start()
+        t0 = time.monotonic()
+        assert watcher.wait_for(1, timeout=5) is False
+        assert time.monotonic() - t0 < 2
@@ -425,3 +425,30 @@ def test_multiple_obs_different_filters(client, mock_response):
     assert payload is not None
     assert payload[0]["minWavelength"] == pytest.approx(623.0 - 137.0 / 2)
     assert payload[1]["minWavelength"] == pytest.approx(477.0 - 137.0 / 2)
+
+
+def test_request_records_telemetry_and_logs_truncated_body():
+    body = b"[" + b"0," * 50_000 + b"0]"
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/down"):
+            raise httpx.ConnectError("refused")
+        return httpx.Response(200, content=body, headers={"content-type": "application/json"})
+
+    logger = MagicMock()
+    client = CitraApiClient(host="api.test.com", token="t", logger=logger)
+    client.client = httpx.Client(base_url=client.base_url, transport=httpx.MockTransport(handler))
+    child = logger.getChild.return_value
+    child.isEnabledFor.return_value = True
+
+    assert len(client.get_elsets_latest(days=14)) == 50_001
+    assert client._request("POST", "/telescopes/abc-123/down", json={"a": 1}) is None
+
+    stats = client.get_request_telemetry()
+    assert stats["GET /elsets/latest"]["response_bytes"] == len(body)
+    assert stats["GET /elsets/latest"]["status_codes"] == {"200": 1}
+    assert stats["POST /telescopes/{id}/down"]["transport_errors"] == 1
+    assert client.get_request_telemetry(summary=True)["GET /elsets/latest"]["requests"] == 1
+    (line,) = [c.args[0] for c in child.debug.call_args_list if "/elsets/latest" in c.args[0]]
+    assert line.endswith(f"({len(body)} bytes)")
+    assert len(line) < 1000
@@ -1,14 +1,22 @@
 """Unit tests for FITS metadata enrichment."""
 
+import os
 from unittest.mock import MagicMock
 
+import numpy as np
 import pytest
 from astropy.io import fits
 
+from citrasense.hardware.devices.camera.fits_writer import (
+    HEADER_RESERVE_CARDS,
+    reserve_header_space,
+    write_capture_fits,
+)
 from citrasense.sensors.telescope.fits_enrichment import (
     _add_location_metadata,
     _add_task_metadata,
     enrich_fits_metadata,
+    patch_primary_header,
 )
 
 
@@ -142,6 +150,119 @@ def test_enrich_corrupted_file(tmp_path):
     enrich_fits_metadata(str(bad_file))
 
 
+# ---------------------------------------------------------------------------
+# Header-only patching
+# ---------------------------------------------------------------------------
+
+
+def _camera_hdu(extra_cards: int = 25) -> fits.PrimaryHDU:
+    """A frame whose header sits just under a block boundary, like a real camera header."""
+    data = np.arange(120 * 90, dtype=np.uint16).reshape(90, 120)
+    hdu = fits.PrimaryHDU(data)
+    for i in range(extra_cards):
+        hdu.header[f"CAM{i}"] = (i, "camera card")
+    return hdu
+
+
+def _header_size(path) -> int:
+    with fits.open(path) as hdul:
+        return hdul[0]._data_offset  # type: ignore[union-attr]
+
+
+def test_write_capture_fits_reserves_blank_cards(tmp_path):
+    path = tmp_path / "frame.fits"
+    write_capture_fits(_camera_hdu(), path)
+    header = fits.getheader(path)
+    trailing = 0
+    for card in reversed(header.cards):
+        if not card.is_blank:
+            break
+        trailing += 1
+    assert trailing >= HEADER_RESERVE_CARDS
+
+
+def test_reserve_header_space_counts_existing_blanks():
+    header = fits.Header()
+    header["A"] = 1
+    reserve_header_space(header, cards=4)
+    reserve_header_space(header, cards=4)
+    assert len(header) == 5
+
+
+def test_enrich_padded_capture_rewrites_header_only(
+    tmp_path, mock_task, mock_location_service, telescope_record, ground_station
+):
+    path = tmp_path / "frame.fits"
+    write_capture_fits(_camera_hdu(), path)
+    size_before = os.path.getsize(path)
+    header_before = _header_size(path)
+
+    patch = enrich_fits_metadata(
+        str(path),
+        task=mock_task,
+        location_service=mock_location_service,
+        telescope_record=telescope_record,
+        ground_station=ground_station,
+    )
+
+    assert patch is not None
+    assert patch.in_place is True
+    assert patch.bytes_written == header_before
+    assert os.path.getsize(path) == size_before
+    with fits.open(path) as hdul:
+        assert hdul[0].header["TASKID"] == "task-uuid-123"
+        assert hdul[0].header["CAM3"] == 3
+        np.testing.assert_array_equal(hdul[0].data, _camera_hdu().data)
+
+
+def test_enrich_unpadded_overflow_rewrites_once_with_padding(tmp_path, mock_task, mock_location_service):
+    path = tmp_path / "external.fits"
+    _camera_hdu().writeto(path)
+    header_before = _header_size(path)
+
+    patch = enrich_fits_metadata(str(path), task=mock_task, location_service=mock_location_service)
+
+    assert patch is not None
+    assert patch.in_place is False
+    assert patch.bytes_written == os.path.getsize(path)
+    assert _header_size(path) > header_before
+    with fits.open(path) as hdul:
+        assert hdul[0].header["OBJECT"] == "ISS (ZARYA)"
+        np.testing.assert_array_equal(hdul[0].data, _camera_hdu().data)
+
+    # The rewrite left padding behind, so the next patch is header-only.
+    follow_up = patch_primary_header(path, lambda h: h.set("NOTE", "later"))
+    assert follow_up is not None
+    assert follow_up.in_place is True
+
+
+def test_patch_primary_header_shrink_keeps_data_offset(tmp_path):
+    path = tmp_path / "frame.fits"
+    _camera_hdu(extra_cards=60).writeto(path)
+    header_before = _header_size(path)
+
+    def _drop(header):
+        for i in range(60):
+            del header[f"CAM{i}"]
+
+    patch = patch_primary_header(path, _drop)
+
+    assert patch is not None
+    assert patch.in_place is True
+    assert _header_size(path) == header_before
+    with fits.open(path) as hdul:
+        assert "CAM0" not in hdul[0].header
+        np.testing.assert_array_equal(hdul[0].data, _camera_hdu().data)
+
+
+def test_patch_primary_header_declined_update_writes_nothing(tmp_path):
+    path = tmp_path / "frame.fits"
+    _camera_hdu().writeto(path)
+    mtime = os.stat(path).st_mtime_ns
+    assert patch_primary_header(path, lambda h: False) is None
+    assert os.stat(path).st_mtime_ns == mtime
+
+
 # ---------------------------------------------------------------------------
 # _add_location_metadata
 # ---------------------------------------------------------------------------
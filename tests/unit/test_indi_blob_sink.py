@@ -0,0 +1,154 @@
+"""Tests for the off-thread INDI BLOB writer (IndiBlobSink)."""
+
+from __future__ import annotations
+
+import builtins
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+import citrasense.hardware.indi.blob_sink as blob_sink_mod
+from citrasense.hardware.indi.blob_sink import IndiBlobSink
+
+
+class _FakeIndiClient:
+    """Delivers BLOB payloads to the sink from its own thread, like PyIndi's callback thread."""
+
+    def __init__(self, sink: IndiBlobSink):
+        self.sink = sink
+        self.callback_seconds: list[float] = []
+
+    def send_blob(self, payload: bytes, fmt: str = ".fits", delay: float = 0.0) -> threading.Thread:
+        def _callback():
+            time.sleep(delay)
+            t0 = time.perf_counter()
+            self.sink.submit(payload, fmt)
+            self.callback_seconds.append(time.perf_counter() - t0)
+
+        thread = threading.Thread(target=_callback)
+        thread.start()
+        return thread
+
+
+@pytest.fixture
+def sink(tmp_path):
+    s = IndiBlobSink(tmp_path, logger=MagicMock())
+    yield s
+    s.stop()
+
+
+def test_armed_frame_is_written_and_signalled(sink, tmp_path):
+    client = _FakeIndiClient(sink)
+    frame = sink.expect("task-1")
+
+    client.send_blob(b"SIMPLE  = T" * 100, delay=0.05)
+
+    assert frame.wait(5)
+    assert frame.succeeded
+    assert frame.path == tmp_path / "citra_task_task-1_image.fits"
+    assert frame.path.read_bytes() == b"SIMPLE  = T" * 100
+    assert frame.receive_to_disk_seconds is not None
+    stats = sink.get_stats()
+    assert stats["frames_written"] == 1
+    assert stats["bytes_written"] == 1100
+    assert stats["last_receive_to_disk_ms"] is not None
+
+
+def test_unsolicited_blob_is_ignored(sink, tmp_path):
+    assert sink.submit(b"preview") is None
+    assert sink.get_stats()["unsolicited"] == 1
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_callback_does_not_wait_for_slow_disk(sink):
+    real_open = builtins.open
+    release = threading.Event()
+
+    def _slow_open(*args, **kwargs):
+        release.wait(5)
+        return real_open(*args, **kwargs)
+
+    client = _FakeIndiClient(sink)
+    frame = sink.expect("task-1")
+    with patch.object(blob_sink_mod, "open", _slow_open, create=True):
+        client.send_blob(b"x" * 1024).join(5)
+        assert frame.received
+        assert not frame.done
+        assert client.callback_seconds[0] < 0.5
+        release.set()
+        assert frame.wait(5)
+    assert frame.succeeded
+
+
+def test_rearming_fails_the_previous_frame(sink):
+    first = sink.expect("task-1")
+    second = sink.expect("task-2")
+
+    assert first.done
+    assert not first.succeeded
+    assert "superseded" in (first.error or "")
+    assert not second.done
+
+
+def test_disarm_after_receive_is_a_no_op(sink):
+    frame = sink.expect("task-1")
+    sink.submit(b"data")
+    sink.disarm(frame, "exposure ended without a BLOB")
+
+    assert frame.wait(5)
+    assert frame.succeeded
+
+
+def test_write_error_fails_frame(tmp_path):
+    sink = IndiBlobSink(tmp_path / "missing", logger=MagicMock())
+    try:
+        frame = sink.expect("task-1")
+        sink.submit(b"data")
+        assert frame.wait(5)
+        assert not frame.succeeded
+        assert sink.get_stats()["frames_failed"] == 1
+    finally:
+        sink.stop()
+
+
+def test_full_backlog_fails_frame_instead_of_blocking(tmp_path):
+    sink = IndiBlobSink(tmp_path, logger=MagicMock(), max_pending=1)
+    release = threading.Event()
+    real_open = builtins.open
+
+    def _stuck_open(*args, **kwargs):
+        release.wait(5)
+        return real_open(*args, **kwargs)
+
+    try:
+        with (
+            patch.object(blob_sink_mod, "open", _stuck_open, create=True),
+            patch.object(blob_sink_mod, "_ENQUEUE_TIMEOUT_S", 0.05),
+        ):
+            frames = []
+            for i in range(3):  # one being written, one queued, one over the limit
+                frames.append(sink.expect(f"task-{i}"))
+                sink.submit(b"data")
+                time.sleep(0.05)
+            assert frames[2].done
+            assert "backlog full" in (frames[2].error or "")
+            release.set()
+            assert all(f.wait(5) for f in frames[:2])
+    finally:
+        release.set()
+        sink.stop()
+
+
+def test_stop_fails_armed_frame_and_drains_queue(tmp_path):
+    sink = IndiBlobSink(tmp_path, logger=MagicMock())
+    written = sink.expect("task-1")
+    sink.submit(b"data")
+    armed = sink.expect("task-2")
+
+    sink.stop()
+
+    assert written.succeeded
+    assert armed.done
+    assert not armed.succeeded
@@ -0,0 +1,135 @@
+"""Tests for the end-to-end load-test harness (:mod:`citrasense.cli.loadtest`)."""
+
+from __future__ import annotations
+
+import json
+import logging
+
+import pytest
+from click.testing import CliRunner
+
+from citrasense.cli.loadtest import (
+    OPTICAL_SPANS,
+    RADAR_SPANS,
+    LoadTestConfig,
+    StageRecorder,
+    cli,
+    run_load_test,
+    summarize_latencies,
+)
+
+
+def _fast_config(**overrides) -> LoadTestConfig:
+    base = {
+        "duration_seconds": 2.5,
+        "task_rate_per_hour": 3600.0,
+        "exposure_seconds": 0.01,
+        "frame_width": 128,
+        "frame_height": 128,
+        "stars_per_frame": 20,
+        "radar_rate_hz": 20.0,
+        "upload_latency_seconds": 0.0,
+        "radar_upload_latency_seconds": 0.0,
+        "sample_interval_seconds": 0.25,
+        "drain_timeout_seconds": 30.0,
+    }
+    base.update(overrides)
+    return LoadTestConfig(**base)
+
+
+def test_summarize_latencies_percentiles():
+    summary = summarize_latencies([float(i) for i in range(1, 101)])
+    assert summary["count"] == 100
+    assert summary["p50"] == pytest.approx(50.5)
+    assert summary["p99"] == pytest.approx(99.01)
+    assert summary["max"] == 100.0
+
+
+def test_summarize_latencies_empty():
+    summary = summarize_latencies([])
+    assert summary["count"] == 0
+    assert summary["p95"] is None
+
+
+def test_stage_recorder_keeps_first_mark_and_skips_incomplete_items():
+    rec = StageRecorder()
+    rec.mark("a", "published", at=10.0)
+    rec.mark("a", "processed", at=10.5)
+    rec.mark("a", "processed", at=99.0)
+    rec.mark("a", "uploaded", at=11.0)
+    rec.mark("b", "published", at=20.0)
+
+    durations = rec.durations(RADAR_SPANS)
+    assert durations["processing"] == [pytest.approx(0.5)]
+    assert durations["end_to_end"] == [pytest.approx(1.0)]
+    assert rec.count("published") == 2
+    assert rec.count("uploaded") == 1
+
+
+def test_run_load_test_report_shape(tmp_path):
+    report = run_load_test(_fast_config(), tmp_path)
+
+    assert report["timing"]["drained"] is True
+    tp = report["throughput"]
+    assert tp["tasks_generated"] >= 1
+    assert tp["tasks_succeeded"] == tp["tasks_generated"]
+    assert tp["tasks_failed"] == 0
+    assert tp["radar_published"] > 0
+    assert tp["radar_uploaded"] + tp["radar_dropped"] == tp["radar_published"]
+
+    optical = report["latency_seconds"]["optical"]
+    assert set(optical) == {name for name, _s, _e in OPTICAL_SPANS}
+    assert optical["end_to_end"]["count"] == tp["tasks_succeeded"]
+    assert report["latency_seconds"]["radar"]["processing"]["count"] == tp["radar_published"]
+
+    assert set(report["queues"]) == {"telescope-0", "radar-0"}
+    assert report["queues"]["telescope-0"]["upload"]["image_uploads"] == tp["tasks_succeeded"]
+    assert len(report["resources"]["samples"]) >= 2
+    json.dumps(report)
+
+
+def test_run_load_test_retries_failed_uploads(tmp_path):
+    config = _fast_config(radar_rate_hz=0.0, upload_failure_rate=0.5, retry_delay_seconds=0, seed=3)
+    report = run_load_test(config, tmp_path)
+
+    tp = report["throughput"]
+    assert report["timing"]["drained"] is True
+    assert tp["upload_failures"] > 0
+    assert tp["tasks_succeeded"] + tp["tasks_failed"] == tp["tasks_generated"]
+    assert tp["radar_published"] == 0
+    assert "radar-0" not in report["queues"]
+
+
+def test_cli_writes_report(tmp_path):
+    citrasense_logger = logging.getLogger("citrasense")
+    previous_level = citrasense_logger.level
+    output = tmp_path / "report.json"
+    result = CliRunner().invoke(
+        cli,
+        [
+            "--duration",
+            "1.5",
+            "--task-rate",
+            "3600",
+            "--exposure",
+            "0.01",
+            "--frame-size",
+            "128",
+            "128",
+            "--radar-rate",
+            "0",
+            "--upload-latency",
+            "0",
+            "--pipeline",
+            "none",
+            "--output",
+            str(output),
+            "--work-dir",
+            str(tmp_path / "work"),
+        ],
+    )
+    citrasense_logger.setLevel(previous_level)
+    assert result.exit_code == 0, result.output
+    report = json.loads(output.read_text())
+    assert report["config"]["pipeline"] == "none"
+    assert "LOAD TEST SUMMARY" in result.output
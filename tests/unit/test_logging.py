@@ -1,6 +1,8 @@
 """Unit tests for logging modules."""
 
+import asyncio
 import logging
+import threading
 from unittest.mock import MagicMock
 
 from citrasense.logging._citrasense_logger import (
@@ -131,3 +133,87 @@ def test_web_log_handler_set_web_app():
     app = MagicMock()
     h.set_web_app(app, loop=MagicMock())
     assert h.web_app is app
+
+
+def _record(level: int, msg: str) -> logging.LogRecord:
+    return logging.LogRecord("citrasense.test", level, "", 0, msg, (), None)
+
+
+def test_web_log_handler_drain_within_budget_keeps_order():
+    h = WebLogHandler(flush_interval=1.0, max_lines_per_second=10)
+    for i in range(5):
+        h.emit(_record(logging.DEBUG if i % 2 else logging.INFO, f"msg-{i}"))
+    entries, dropped = h.drain()
+    assert [e["message"] for e in entries] == [f"msg-{i}" for i in range(5)]
+    assert entries[0]["module"] == "test"
+    assert dropped == {}
+    assert h.drain() == ([], {})
+
+
+def test_web_log_handler_over_budget_prefers_higher_levels():
+    h = WebLogHandler(flush_interval=1.0, max_lines_per_second=20)
+    for i in range(100):
+        h.emit(_record(logging.DEBUG, f"debug-{i}"))
+        if i % 10 == 0:
+            h.emit(_record(logging.WARNING, f"warn-{i}"))
+            h.emit(_record(logging.INFO, f"info-{i}"))
+
+    entries, dropped = h.drain()
+
+    assert len(entries) == 20
+    messages = [e["message"] for e in entries]
+    assert sum(m.startswith("warn-") for m in messages) == 10
+    assert sum(m.startswith("info-") for m in messages) == 10
+    assert dropped == {"DEBUG": 100}
+    assert h.get_stats()["dropped"] == {"DEBUG": 100}
+
+
+def test_web_log_handler_samples_debug_across_the_window():
+    h = WebLogHandler(flush_interval=1.0, max_lines_per_second=10)
+    for i in range(100):
+        h.emit(_record(logging.DEBUG, f"debug-{i}"))
+    entries, dropped = h.drain()
+    assert [e["message"] for e in entries] == [f"debug-{i}" for i in range(0, 100, 10)]
+    assert dropped == {"DEBUG": 90}
+
+
+def test_web_log_handler_pending_ring_overflow_counts_drops():
+    h = WebLogHandler(flush_interval=1.0, max_lines_per_second=1000, max_pending=10)
+    for i in range(15):
+        h.emit(_record(logging.INFO, f"msg-{i}"))
+    entries, dropped = h.drain()
+    assert entries[0]["message"] == "msg-5"
+    assert dropped == {"INFO": 5}
+    assert len(h.get_recent_logs()) == 15  # the history buffer is unaffected
+    stats = h.get_stats()
+    assert stats["emitted"] == 15
+    assert stats["streamed"] == 10
+
+
+def test_web_log_handler_coalesces_lines_into_one_frame():
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    frames = []
+    done = threading.Event()
+
+    class _App:
+        async def broadcast_logs(self, entries, dropped):
+            frames.append((entries, dropped))
+            done.set()
+
+    try:
+        h = WebLogHandler(flush_interval=0.05, max_lines_per_second=10_000)
+        h.set_web_app(_App(), loop)
+        for i in range(300):
+            h.emit(_record(logging.INFO, f"msg-{i}"))
+        assert done.wait(2)
+    finally:
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(2)
+        loop.close()
+
+    assert len(frames) == 1
+    assert len(frames[0][0]) == 300
+    assert h.get_stats()["frames"] == 1
+    assert h._broadcasts == set()
@@ -11,6 +11,7 @@ import logging
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+import numpy as np
 import pytest
 
 
@@ -176,6 +177,113 @@ class TestMoravianCameraConnect:
         assert result is False
 
 
+class _FakeGxccd:
+    """Minimal gxccd handle: the image becomes ready *ready_after* seconds after start_exposure."""
+
+    is_initialized = True
+
+    def __init__(self, ready_after: float = 0.0, fill: int = 1234):
+        self.ready_after = ready_after
+        self.fill = fill
+        self.ready_polls = 0
+        self._ready_at = 0.0
+
+    def set_gain(self, gain):
+        pass
+
+    def set_binning(self, x, y):
+        pass
+
+    def start_exposure(self, exp_time, use_shutter, x, y, w, h):
+        import time
+
+        self._ready_at = time.monotonic() + self.ready_after
+
+    def image_ready(self):
+        import time
+
+        self.ready_polls += 1
+        return time.monotonic() >= self._ready_at
+
+    def read_image(self, buf, size):
+        import ctypes
+
+        import numpy as np
+
+        src = np.full(size // 2, self.fill, dtype=np.uint16)
+        ctypes.memmove(buf, src.ctypes.data, size)
+
+    def abort_exposure(self, download=False):
+        pass
+
+    def get_value(self, index):
+        return -10.0
+
+
+class TestMoravianReadout:
+    """Readout writes straight into numpy buffers and waits on readiness with a bounded backoff."""
+
+    def _make_camera(self, gx):
+        from citrasense.hardware.devices.camera.moravian_camera import MoravianCamera
+
+        camera = MoravianCamera(logging.getLogger("test"))
+        camera._gxccd = gx
+        camera._camera_info = {"width": 8, "height": 6}
+        return camera
+
+    def test_capture_array_returns_fresh_frame(self):
+        camera = self._make_camera(_FakeGxccd(fill=777))
+
+        first = camera.capture_array(0.0)
+        second = camera.capture_array(0.0, binning=2)
+
+        assert first.shape == (6, 8)
+        assert first.dtype.name == "uint16"
+        assert int(first[0, 0]) == 777
+        assert second.shape == (3, 4)
+        assert not np.shares_memory(first, second)
+        assert camera.last_readout_seconds is not None
+
+    def test_take_exposure_reuses_readout_buffer(self, tmp_path: Path):
+        from astropy.io import fits
+
+        camera = self._make_camera(_FakeGxccd(fill=4321))
+
+        camera.take_exposure(0.0, save_path=tmp_path / "a.fits")
+        buffer = camera._frame_buffer
+        camera.take_exposure(0.0, save_path=tmp_path / "b.fits")
+
+        assert camera._frame_buffer is buffer
+        with fits.open(tmp_path / "b.fits") as hdul:
+            assert int(hdul[0].data[0, 0]) == 4321
+
+    def test_wait_backs_off_instead_of_spinning(self):
+        gx = _FakeGxccd(ready_after=0.3)
+        camera = self._make_camera(gx)
+
+        camera.capture_array(0.0)
+
+        # 2 ms doubling to a 50 ms cap: ~10 polls over 300 ms, not one per spin
+        assert gx.ready_polls < 20
+
+    def test_abort_ends_wait(self):
+        import threading
+
+        camera = self._make_camera(_FakeGxccd(ready_after=60.0))
+        threading.Timer(0.05, camera.abort_exposure).start()
+
+        with pytest.raises(RuntimeError, match="aborted"):
+            camera.capture_array(0.0)
+
+    def test_wait_times_out(self):
+        import citrasense.hardware.devices.camera.moravian_camera as mod
+
+        camera = self._make_camera(_FakeGxccd(ready_after=60.0))
+
+        with patch.object(mod, "_READY_TIMEOUT_S", 0.05), pytest.raises(TimeoutError):
+            camera.capture_array(0.0)
+
+
 class TestMoravianIntegratedFilterWheel:
     """Test the integrated filter wheel that shares the camera handle."""
 
@@ -1,5 +1,6 @@
 """Tests for MountStateCache — polling, snapshots, lifecycle, and staleness."""
 
+import threading
 import time
 from unittest.mock import MagicMock
 
@@ -191,3 +192,184 @@ class TestMountStateCacheStaleness:
         mount = _make_mount()
         cache = MountStateCache(mount)
         assert cache.snapshot.timestamp == 0.0
+
+
+# ------------------------------------------------------------------
+# Adaptive polling
+# ------------------------------------------------------------------
+
+
+class TestMountStateCacheAdaptivePolling:
+    @pytest.mark.parametrize(
+        ("overrides", "full", "tick"),
+        [
+            ({"slewing": True}, 0.5, 0.1),
+            ({"parked": True}, 5.0, 5.0),
+            ({"tracking": True}, 0.5, 0.5),
+        ],
+    )
+    def test_intervals_follow_state(self, overrides, full, tick):
+        cache = MountStateCache(_make_mount(**overrides))
+        cache._poll_once()
+        assert cache.poll_interval == pytest.approx(full)
+        assert cache.tick_interval == pytest.approx(tick)
+
+    def test_fixed_rate_when_not_adaptive(self):
+        cache = MountStateCache(_make_mount(parked=True), adaptive=False)
+        cache._poll_once()
+        assert cache.poll_interval == pytest.approx(0.5)
+
+    def test_parked_mount_is_polled_slowly_and_stop_is_prompt(self):
+        mount = _make_mount(parked=True)
+        cache = MountStateCache(mount, poll_interval=0.02, fast_poll_interval=0.01, parked_poll_interval=10.0)
+        cache.start()
+        time.sleep(0.2)
+        t0 = time.monotonic()
+        cache.stop()
+
+        assert time.monotonic() - t0 < 1.0
+        assert mount.get_radec.call_count == 1
+
+    def test_wait_triggers_immediate_full_poll(self):
+        mount = _make_mount(parked=True)
+        cache = MountStateCache(mount, parked_poll_interval=10.0)
+        cache.start()
+        try:
+            time.sleep(0.05)
+            t0 = time.monotonic()
+            assert cache.wait_for(lambda s: s.is_parked, timeout=5) is not None
+            assert time.monotonic() - t0 < 1.0
+            assert mount.get_radec.call_count == 2
+        finally:
+            cache.stop()
+
+    def test_slewing_is_probed_between_full_polls(self):
+        mount = _make_mount(slewing=True)
+        cache = MountStateCache(mount, poll_interval=0.2, fast_poll_interval=0.01)
+        cache.start()
+        time.sleep(0.3)
+        cache.stop()
+
+        assert cache.probes > 5
+        assert mount.is_slewing.call_count == cache.polls + cache.probes
+        assert mount.get_radec.call_count == cache.polls <= 3
+
+
+# ------------------------------------------------------------------
+# Waiting / subscriptions
+# ------------------------------------------------------------------
+
+
+def _slewing_until(mount, seconds: float) -> float:
+    end = time.monotonic() + seconds
+    mount.is_slewing.side_effect = lambda: time.monotonic() < end
+    return end
+
+
+class TestMountStateCacheWaiting:
+    def test_wait_until_idle_returns_soon_after_slew_ends(self):
+        mount = _make_mount()
+        cache = MountStateCache(mount, poll_interval=1.0, fast_poll_interval=0.01)
+        cache.start()
+        try:
+            end = _slewing_until(mount, 0.2)
+            assert cache.wait_until_idle(timeout=5)
+            assert time.monotonic() - end < 0.15
+            assert cache.snapshot.is_slewing is False
+        finally:
+            cache.stop()
+
+    def test_wait_ignores_snapshots_from_before_the_call(self):
+        mount = _make_mount()
+        cache = MountStateCache(mount, fast_poll_interval=0.01)
+        cache._poll_once()  # idle snapshot, taken before the slew
+        cache.start()
+        try:
+            end = _slewing_until(mount, 0.2)
+            assert cache.wait_until_idle(timeout=5)
+            assert time.monotonic() >= end
+        finally:
+            cache.stop()
+
+    def test_failed_slewing_read_mid_slew_does_not_release_waiters(self):
+        mount = _make_mount(slewing=True)
+        cache = MountStateCache(mount, fast_poll_interval=0.01)
+        cache._poll_once()
+        mount.is_slewing.side_effect = RuntimeError("serial timeout")
+        cache._poll_once()
+        assert cache.snapshot.is_slewing is True
+        assert cache.snapshot.slewing_known is False
+
+        cache.start()
+        try:
+            assert cache.wait_until_idle(timeout=0.2) is False
+            mount.is_slewing.side_effect = None
+            mount.is_slewing.return_value = False
+            assert cache.wait_until_idle(timeout=5)
+            assert cache.snapshot.slewing_known is True
+        finally:
+            cache.stop()
+
+    def test_wait_times_out(self):
+        mount = _make_mount(slewing=True)
+        cache = MountStateCache(mount, fast_poll_interval=0.01)
+        cache.start()
+        try:
+            assert cache.wait_until_idle(timeout=0.1) is False
+        finally:
+            cache.stop()
+
+    def test_wait_is_cancellable(self):
+        mount = _make_mount(slewing=True)
+        cache = MountStateCache(mount, fast_poll_interval=0.01)
+        cancel = threading.Event()
+        threading.Timer(0.05, cancel.set).start()
+        cache.start()
+        try:
+            t0 = time.monotonic()
+            assert cache.wait_until_idle(timeout=5, cancelled=cancel.is_set) is False
+            assert time.monotonic() - t0 < 1.0
+        finally:
+            cache.stop()
+
+    def test_stop_releases_waiters(self):
+        cache = MountStateCache(_make_mount(slewing=True), fast_poll_interval=0.01)
+        cache.start()
+        threading.Timer(0.05, cache.stop).start()
+        assert cache.wait_until_idle(timeout=5) is False
+
+    def test_wait_until_near(self):
+        mount = _make_mount()
+        start = time.monotonic()
+        # Dec converges on 45° over ~0.2 s.
+        mount.get_radec.side_effect = lambda: (180.0, 45.0 + max(0.0, 0.2 - (time.monotonic() - start)))
+        cache = MountStateCache(mount, poll_interval=0.02)
+        cache.start()
+        try:
+            assert cache.wait_until_near(180.0, 45.0, tolerance_arcsec=36.0, timeout=5)
+            assert abs(cache.snapshot.dec_deg - 45.0) <= 0.01
+        finally:
+            cache.stop()
+
+    def test_subscribers_see_changes_only(self):
+        mount = _make_mount()
+        cache = MountStateCache(mount)
+        seen: list[MountSnapshot] = []
+        unsubscribe = cache.subscribe(seen.append)
+
+        cache._poll_once()
+        cache._poll_once()  # same state, new timestamp — not a change
+        mount.is_slewing.return_value = True
+        cache._poll_once()
+        cache.update_azimuth(10.0)
+        unsubscribe()
+        cache.update_azimuth(20.0)
+
+        assert [s.is_slewing for s in seen] == [False, True, True]
+        assert seen[-1].az_deg == 10.0
+
+    def test_subscriber_errors_do_not_stop_polling(self):
+        cache = MountStateCache(_make_mount())
+        cache.subscribe(lambda snap: 1 / 0)
+        cache._poll_once()
+        assert cache.polls == 1
@@ -530,9 +530,9 @@ class TestDetectionRingBuffer:
 
         buf = DetectionRingBuffer(maxlen=3)
         for i in range(5):
-            buf.append({"ts_unix": float(i), "i": i})
+            buf.append({"ts_unix": float(i), "range_km": float(i)})
         snapshot = buf.snapshot_since(None)
-        assert [d["i"] for d in snapshot] == [2, 3, 4]
+        assert [d["range_km"] for d in snapshot] == [2.0, 3.0, 4.0]
         assert len(buf) == 3
 
     def test_snapshot_since_absolute_epoch_filters_older_entries(self):
@@ -550,22 +550,88 @@ class TestDetectionRingBuffer:
         buf = DetectionRingBuffer()
         now = time.time()
         # 10s old, 1s old, fresh — query for "last 5 seconds".
-        buf.append({"ts_unix": now - 10.0, "age": "old"})
-        buf.append({"ts_unix": now - 1.0, "age": "recent"})
-        buf.append({"ts_unix": now, "age": "fresh"})
+        buf.append({"ts_unix": now - 10.0, "sat_name": "old"})
+        buf.append({"ts_unix": now - 1.0, "sat_name": "recent"})
+        buf.append({"ts_unix": now, "sat_name": "fresh"})
         filtered = buf.snapshot_since(-5.0)
-        assert [d["age"] for d in filtered] == ["recent", "fresh"]
+        assert [d["sat_name"] for d in filtered] == ["recent", "fresh"]
 
     def test_snapshot_returns_copy_not_live_view(self):
         """Mutating the returned list must not corrupt the buffer."""
         from citrasense.sensors.radar.passive_radar_sensor import DetectionRingBuffer
 
         buf = DetectionRingBuffer()
-        buf.append({"ts_unix": 1.0, "i": 1})
+        buf.append({"ts_unix": 1.0, "range_km": 1.0})
         snapshot = buf.snapshot_since(None)
         snapshot.clear()
         assert len(buf) == 1
 
+    def test_round_trips_slim_dict_fields(self):
+        from citrasense.sensors.radar.passive_radar_sensor import DetectionRingBuffer
+
+        slim = {
+            "ts": "2025-11-11T18:38:11Z",
+            "ts_unix": 1762886291.0,
+            "sensor_id": "radar-0",
+            "range_km": 1234.5678,
+            "range_rate_km_s": -2.5,
+            "doppler_hz": 833.3,
+            "snr_db": 14.2,
+            "sat_uuid": "sat-a",
+            "sat_name": None,
+            "az_deg": 123.4,
+            "el_deg": None,
+            "alt_km": 550.0,
+            "station": "KOSI",
+        }
+        buf = DetectionRingBuffer()
+        buf.append(slim)
+        assert buf.snapshot_since(None) == [slim]
+
+    def test_binary_search_across_wraparound(self):
+        from citrasense.sensors.radar.passive_radar_sensor import DetectionRingBuffer
+
+        buf = DetectionRingBuffer(maxlen=7)
+        for i in range(12):  # head wraps; live rows are 5..11 split across the ring end
+            buf.append({"ts_unix": float(i)})
+        assert [d["ts_unix"] for d in buf.snapshot_since(None)] == [float(i) for i in range(5, 12)]
+        for cursor in (0.0, 5.0, 6.5, 8.0, 10.0, 11.0):
+            expected = [float(i) for i in range(5, 12) if i > cursor]
+            assert [d["ts_unix"] for d in buf.snapshot_since(cursor)] == expected
+        assert [d["ts_unix"] for d in buf.snapshot_since(0.0, limit=2)] == [10.0, 11.0]
+
+    def test_out_of_order_detection_is_kept_and_filtered_exactly(self):
+        from citrasense.sensors.radar.passive_radar_sensor import DetectionRingBuffer
+
+        buf = DetectionRingBuffer()
+        for ts in (10.0, 12.0, 11.0, 13.0):
+            buf.append({"ts_unix": ts})
+        assert [d["ts_unix"] for d in buf.snapshot_since(10.5)] == [12.0, 11.0, 13.0]
+        assert [d["ts_unix"] for d in buf.snapshot_since(11.5)] == [12.0, 13.0]
+
+    def test_downsample_keeps_highest_snr_per_bin(self):
+        from citrasense.sensors.radar.passive_radar_sensor import DetectionRingBuffer
+
+        buf = DetectionRingBuffer()
+        for i in range(100):
+            buf.append({"ts_unix": float(i), "snr_db": 50.0 if i % 10 == 3 else float(i % 7)})
+        thinned = buf.downsample(None, max_points=10)
+        assert [d["ts_unix"] for d in thinned] == [float(i) for i in range(3, 100, 10)]
+        assert len(buf.downsample(89.0, max_points=10)) == 10  # within budget: returned whole
+        assert [d["ts_unix"] for d in buf.downsample(None, max_points=5, end_ts=3.0)] == [0.0, 1.0, 2.0, 3.0]
+
+        shuffled = DetectionRingBuffer()
+        for ts, snr in ((0.0, 1.0), (5.0, 2.0), (1.0, 9.0), (6.0, 1.0), (9.0, None), (7.0, 3.0)):
+            shuffled.append({"ts_unix": ts, "snr_db": snr})
+        # Two bins over [0, 9]: the best of {0, 1} and of {5, 6, 9, 7}, in arrival order.
+        assert [d["ts_unix"] for d in shuffled.downsample(None, max_points=2)] == [1.0, 7.0]
+
+    def test_capacity_follows_detection_history_hours(self):
+        from citrasense.sensors.radar.detection_buffer import ASSUMED_DETECTION_RATE_HZ
+
+        sensor = _make_sensor(_StubDetectionSource(), detection_history_hours=0.5)
+        assert sensor._detections.capacity == int(0.5 * 3600 * ASSUMED_DETECTION_RATE_HZ)
+
 
 class TestDetectionBroadcast:
     """``on_detection_broadcast`` runs on every observation — even
@@ -628,3 +694,13 @@ class TestDetectionBroadcast:
         snap = sensor.get_recent_detections(None)
         assert len(snap) == 3
         assert [d["sat_uuid"] for d in snap] == ["sat-0", "sat-1", "sat-2"]
+
+    def test_unthinned_snapshot_is_capped_to_the_newest_detections(self):
+        from citrasense.sensors.radar.detection_buffer import DEFAULT_SNAPSHOT_LIMIT
+
+        sensor = _make_sensor(_StubDetectionSource())
+        for i in range(DEFAULT_SNAPSHOT_LIMIT + 10):
+            sensor._detections.append({"ts_unix": float(i)})
+        snap = sensor.get_recent_detections(None)
+        assert len(snap) == DEFAULT_SNAPSHOT_LIMIT
+        assert snap[-1]["ts_unix"] == float(DEFAULT_SNAPSHOT_LIMIT + 9)
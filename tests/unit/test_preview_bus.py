@@ -7,9 +7,16 @@ import io
 from pathlib import Path
 
 import numpy as np
+import pytest
 from PIL import Image
 
-from citrasense.sensors.preview_bus import PreviewBus, array_to_jpeg_data_url
+from citrasense.sensors.preview_bus import (
+    PREVIEW_SIZES,
+    PreviewBus,
+    PreviewFrame,
+    array_to_jpeg_data_url,
+    preview_level,
+)
 
 
 def _pop_first(bus: PreviewBus) -> tuple[str, str, str] | None:
@@ -100,10 +107,17 @@ class TestPreviewBus:
         bus.push_file(p, "calibration")
         frame = _pop_first(bus)
         assert frame is not None
-        data_url, source, kind = frame
+        preview, source, kind = frame
         assert source == "calibration"
-        assert kind == "data"
-        assert data_url.startswith("data:image/jpeg;base64,")
+        assert kind == "array"
+        assert isinstance(preview, PreviewFrame)
+        assert preview.data_url().startswith("data:image/jpeg;base64,")
+
+    def test_push_array_defers_encoding(self):
+        bus = PreviewBus()
+        frame = bus.push_array(np.zeros((8, 8), dtype=np.uint16), "autofocus", sensor_id="scope-0")
+        assert frame._encoded == {}
+        assert bus.pop_all() == [(frame, "autofocus", "array", "scope-0")]
 
     def test_push_url(self):
         bus = PreviewBus()
@@ -172,3 +186,50 @@ class TestArrayToJpegDataUrl:
         arr = np.asarray(data)
         arr_float = arr.astype(np.float32, copy=False)
         assert arr_float.dtype == np.float32
+
+
+class TestPreviewFrame:
+    @staticmethod
+    def _star_field(height: int = 1200, width: int = 1600) -> np.ndarray:
+        rng = np.random.default_rng(7)
+        data = rng.normal(1000, 30, (height, width)).astype(np.uint16)
+        ys, xs = rng.integers(0, height, 200), rng.integers(0, width, 200)
+        data[ys, xs] = 60000
+        return data
+
+    @pytest.mark.parametrize(("requested", "level"), [(0, 0), (100, 320), (320, 320), (500, 640), (5000, 0)])
+    def test_preview_level_snaps_up(self, requested, level):
+        assert preview_level(requested) == level
+        assert level in PREVIEW_SIZES
+
+    def test_levels_are_bounded_and_cached(self):
+        frame = PreviewFrame(self._star_field())
+        thumb = frame.jpeg(320)
+        assert max(thumb.width, thumb.height) <= 320
+        assert (thumb.width, thumb.height) == (320, 240)
+        assert frame.jpeg(320) is thumb
+
+        full = frame.jpeg(0)
+        assert (full.width, full.height) == (1600, 1200)
+        assert len(thumb.jpeg) < len(full.jpeg)
+        # A level larger than the frame is the full-resolution encode.
+        assert frame.jpeg(4096) is full
+
+    def test_levels_share_stretch(self):
+        frame = PreviewFrame(np.full((640, 640), 1000, dtype=np.uint16))
+        small = np.asarray(Image.open(io.BytesIO(frame.jpeg(320).jpeg)))
+        full = np.asarray(Image.open(io.BytesIO(frame.jpeg(0).jpeg)))
+        assert abs(int(small.mean()) - int(full.mean())) <= 1
+
+    def test_subsampled_stretch_matches_full_frame(self):
+        data = self._star_field()
+        frame = PreviewFrame(data)
+        frame.jpeg(320)
+        lo, hi = np.percentile(data.astype(np.float32), [2.0, 98.0])
+        assert frame._limits == pytest.approx((lo, hi), rel=0.01)
+
+    def test_rgb_levels(self):
+        frame = PreviewFrame(np.full((400, 600, 3), 100, dtype=np.uint8))
+        img = Image.open(io.BytesIO(frame.jpeg(320).jpeg))
+        assert img.mode == "RGB"
+        assert img.size == (300, 200)
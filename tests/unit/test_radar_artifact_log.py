@@ -0,0 +1,116 @@
+"""Unit tests for :class:`RadarArtifactLog` and the artifact writer that feeds it."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pytest
+
+from citrasense.pipelines.radar.radar_artifact_log import INDEX_DTYPE, RadarArtifactLog
+from citrasense.pipelines.radar.radar_artifact_writer import RadarArtifactWriter
+from citrasense.pipelines.radar.radar_processing_context import RadarProcessingContext
+from citrasense.sensors.radar.events import RadarObservationEvent
+
+T0 = datetime(2026, 3, 15, 23, 59, 0, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def log(tmp_path):
+    log = RadarArtifactLog(tmp_path / "radar-0", flush_interval=60.0)
+    yield log
+    log.close()
+
+
+def test_range_query_returns_committed_records_in_order(log):
+    for i in range(100):
+        log.append({"i": i, "snr": np.float32(1.5)}, T0 + timedelta(seconds=i))
+    assert log.records_between(T0, T0 + timedelta(hours=1)) == []  # not committed yet
+
+    log.flush()
+    hits = log.records_between(T0 + timedelta(seconds=10), T0 + timedelta(seconds=19))
+    assert [r["i"] for r in hits] == list(range(10, 20))
+    assert hits[0]["snr"] == 1.5
+    assert [r["i"] for r in log.records_between(T0, T0 + timedelta(hours=1), limit=3)] == [0, 1, 2]
+
+
+def test_segments_rotate_per_utc_day_and_by_size(tmp_path):
+    log = RadarArtifactLog(tmp_path, flush_interval=60.0, max_segment_bytes=200)
+    for i in range(120):  # two minutes straddling midnight
+        log.append({"i": i, "pad": "x" * 20}, T0 + timedelta(seconds=i))
+    log.close()
+
+    segments = log.segments()
+    assert {s[:8] for s in segments} == {"20260315", "20260316"}
+    assert len(segments) > 2
+    assert all((tmp_path / f"{s}.jsonl").stat().st_size < 200 + 64 for s in segments)
+
+    reopened = RadarArtifactLog(tmp_path)
+    everything = reopened.records_between(T0, T0 + timedelta(minutes=5))
+    assert [r["i"] for r in everything] == list(range(120))
+    across_midnight = reopened.records_between(T0 + timedelta(seconds=58), T0 + timedelta(seconds=62))
+    assert [r["i"] for r in across_midnight] == [58, 59, 60, 61, 62]
+
+
+def test_out_of_order_record_is_indexed_at_predecessor_time(log):
+    log.append({"i": 0}, T0 + timedelta(seconds=10))
+    log.append({"i": 1}, T0 + timedelta(seconds=5))
+    log.flush()
+    assert [r["i"] for r in log.records_between(T0 + timedelta(seconds=10), T0 + timedelta(seconds=10))] == [0, 1]
+
+
+def test_appends_are_group_committed(log):
+    for i in range(500):
+        log.append({"i": i}, T0)
+    log.flush()
+    stats = log.stats()
+    assert stats["appended"] == 500
+    assert stats["records"] == 500
+    assert stats["batches"] == 1
+    assert stats["files"] == 2
+
+
+def test_torn_index_tail_is_trimmed_on_reopen(tmp_path):
+    log = RadarArtifactLog(tmp_path)
+    log.append({"i": 0}, T0)
+    log.close()
+    index_path = tmp_path / f"{log.segments()[0]}.idx"
+    with open(index_path, "ab") as f:
+        f.write(b"\x00" * 7)
+
+    log = RadarArtifactLog(tmp_path)
+    log.append({"i": 1}, T0 + timedelta(seconds=1))
+    log.close()
+    assert index_path.stat().st_size == 2 * INDEX_DTYPE.itemsize
+    assert [r["i"] for r in log.records_between(T0, T0 + timedelta(seconds=1))] == [0, 1]
+
+
+def test_retention_prunes_old_days(tmp_path):
+    log = RadarArtifactLog(tmp_path, retention_days=1)
+    log.append({"i": 0}, T0 - timedelta(days=3))
+    log.flush()
+    log.append({"i": 1}, T0)
+    log.close()
+    assert [s[:8] for s in log.segments()] == ["20260315"]
+
+
+def test_writer_opens_logs_with_its_retention(tmp_path):
+    writer = RadarArtifactWriter(retention_days=7)
+    assert writer.log_for(tmp_path / "radar-0").retention_days == 7
+    writer.close()
+
+
+def test_writer_appends_to_per_directory_log(tmp_path):
+    writer = RadarArtifactWriter()
+    event = RadarObservationEvent(
+        sensor_id="radar-0", modality="radar", timestamp=T0, payload={"observation_id": "obs-1"}
+    )
+    ctx = RadarProcessingContext(sensor_id="radar-0", event=event, artifact_dir=tmp_path / "radar-0")
+    ctx.drop_reason = "below_snr"
+    assert writer.process(ctx) is True
+    writer.close()
+
+    [record] = RadarArtifactLog(tmp_path / "radar-0").records_between(T0, T0)
+    assert record["observation"] == {"observation_id": "obs-1"}
+    assert record["drop_reason"] == "below_snr"
+    assert len(list((tmp_path / "radar-0").iterdir())) == 2
@@ -136,6 +136,20 @@ class TestTaskedSatellitesGate:
         )
         assert RadarDetectionFilter().process(ctx) is True
 
+    def test_uses_dispatcher_tasked_set_without_snapshot(self):
+        def _no_snapshot() -> list:
+            raise AssertionError("the tasked-satellite set should be used instead")
+
+        task_index = SimpleNamespace(
+            tasked_satellite_ids=lambda: frozenset({"sat-123"}),
+            get_tasks_snapshot=_no_snapshot,
+        )
+        tasked = _make_ctx(self._payload("sat-123"), forward_only_tasked=True, task_index=task_index)
+        untasked = _make_ctx(self._payload("sat-999"), forward_only_tasked=True, task_index=task_index)
+
+        assert RadarDetectionFilter().process(tasked) is True
+        assert RadarDetectionFilter().process(untasked) is False
+
 
 @pytest.mark.parametrize(
     ("payload", "expected"),
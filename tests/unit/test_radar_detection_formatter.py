@@ -180,6 +180,22 @@ class TestAzElToRaDec:
         entry = ctx.upload_payload or {}
         assert abs(entry["declination"] - 35.0) < 1.0
 
+    def test_matches_astropy_skycoord(self):
+        """The cached engine must reproduce the per-detection ``SkyCoord(...).icrs`` answer it replaced."""
+        from astropy import units as u
+        from astropy.coordinates import AltAz, EarthLocation, SkyCoord
+        from astropy.time import Time
+
+        ctx = _make_ctx(_sample_observation_payload())
+        RadarDetectionFormatter().process(ctx)
+        entry = ctx.upload_payload or {}
+
+        location = EarthLocation(lat=35.0 * u.deg, lon=-106.5 * u.deg, height=1500.0 * u.m)
+        frame = AltAz(obstime=Time("2025-11-11T18:38:11"), location=location)
+        expected = SkyCoord(alt=45.0 * u.deg, az=123.4 * u.deg, frame=frame).icrs
+        got = SkyCoord(ra=entry["rightAscension"] * u.deg, dec=entry["declination"] * u.deg)
+        assert got.separation(expected).arcsec < 0.01
+
 
 def test_ensure_iso8601_normalises_plus_zero():
     from citrasense.pipelines.radar.radar_detection_formatter import _ensure_iso8601
@@ -0,0 +1,112 @@
+"""Tests for the NATS stand-in and the radar replay harness (:mod:`citrasense.cli.radar_replay`)."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+
+import pytest
+from click.testing import CliRunner
+from nats.aio.client import Client as NatsClient
+from nats.errors import NoRespondersError
+
+from citrasense.cli.nats_stand_in import LocalNatsBroker, _matches
+from citrasense.cli.radar_replay import BACKLOG_SPANS, ReplayConfig, cli, load_recording, run_replay
+
+
+@pytest.fixture
+def broker():
+    with LocalNatsBroker() as broker:
+        yield broker
+
+
+@pytest.mark.parametrize(
+    ("pattern", "subject", "expected"),
+    [
+        ("radar.sensor.*.status", "radar.sensor.r0.status", True),
+        ("radar.sensor.*.status", "radar.sensor.r0.health", False),
+        ("radar.>", "radar.sensor.r0.status", True),
+        ("radar.>", "radar", False),
+        ("radar.sensor", "radar.sensor.r0", False),
+    ],
+)
+def test_subject_matching(pattern, subject, expected):
+    assert _matches(pattern.split("."), subject.split(".")) is expected
+
+
+def test_broker_routes_pub_sub_and_request_reply(broker):
+    async def scenario():
+        nc = NatsClient()
+        await nc.connect(servers=[broker.url])
+        received: list[tuple[str, bytes]] = []
+
+        async def collect(msg):
+            received.append((msg.subject, msg.data))
+
+        async def echo(msg):
+            await msg.respond(b"pong:" + msg.data)
+
+        await nc.subscribe("radar.sensor.*.observations", cb=collect)
+        await nc.subscribe("radar.control.r0.ping", cb=echo)
+        await nc.flush()
+        broker.publish("radar.sensor.r0.observations", b'{"i": 0}')
+        await nc.publish("radar.sensor.r0.status", b"ignored")
+        reply = await nc.request("radar.control.r0.ping", b"hi", timeout=2)
+        with pytest.raises(NoRespondersError):
+            await nc.request("radar.control.r0.stop", b"", timeout=2)
+        await nc.drain()
+        return received, reply.data
+
+    received, reply = asyncio.run(scenario())
+    assert received == [("radar.sensor.r0.observations", b'{"i": 0}')]
+    assert reply == b"pong:hi"
+    stats = broker.stats()
+    assert stats["no_responders"] == 1
+    assert stats["messages_in"] == 5  # injected, status, request, reply, unanswered request
+
+
+def test_load_recording_accepts_artifact_log_records(tmp_path):
+    path = tmp_path / "rec.jsonl"
+    lines = [{"observation": {"observation_id": "a"}, "drop_reason": None}, {"observation_id": "b"}]
+    path.write_text("\n".join(json.dumps(line) for line in lines) + "\n\n")
+    assert load_recording(path) == [{"observation_id": "a"}, {"observation_id": "b"}]
+
+
+def test_run_replay_finds_upload_backlog(tmp_path):
+    config = ReplayConfig(rates_hz=(20.0, 400.0), step_seconds=1.0, upload_latency_seconds=0.02)
+    report = run_replay(config, tmp_path)
+
+    first, second = report["steps"]
+    assert first["saturated"] is False
+    assert first["drained"] is True
+    assert first["uploaded"] + first["dropped"] == first["published"] == 20
+    for name, _start, _end in BACKLOG_SPANS:
+        assert first["latency_seconds"][name]["count"] > 0, name
+
+    assert second["saturated"] is True
+    assert second["backlog_stage"] == "upload"
+    assert report["saturation"] == {
+        "saturated_at_hz": 400.0,
+        "max_sustained_hz": first["sustained_hz"],
+        "backlog_stage": "upload",
+        "backlog": second["backlog_at_step_end"],
+    }
+    assert report["artifact_log"]["records"] == first["published"] + second["published"]
+    json.dumps(report)
+
+
+def test_cli_writes_report(tmp_path):
+    output = tmp_path / "replay.json"
+    result = CliRunner().invoke(
+        cli,
+        ["--rates", "10", "--step-seconds", "0.5", "--upload-latency", "0", "--output", str(output)],
+    )
+    assert result.exit_code == 0, result.output
+    assert "No saturation up to 10 Hz" in result.output
+    assert json.loads(output.read_text())["steps"][0]["published"] == 5
+
+
+def test_cli_rejects_bad_rates():
+    result = CliRunner().invoke(cli, ["--rates", "10,-5"])
+    assert result.exit_code != 0
+    assert "positive rates" in result.output
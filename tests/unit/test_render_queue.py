@@ -0,0 +1,148 @@
+"""Unit tests for the deferred presentation render lane (RenderQueue)."""
+
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from citrasense.acquisition.render_queue import RenderCancelled, RenderJob, RenderQueue
+
+
+def _job(task_id: str, result="ok", on_done=None) -> RenderJob:
+    return RenderJob(task_id=task_id, render=lambda job: result, on_done=on_done)
+
+
+def test_check_cancelled_raises_after_cancel():
+    job = _job("t1")
+    job.check_cancelled()
+    job.cancel()
+    with pytest.raises(RenderCancelled):
+        job.check_cancelled()
+
+
+def test_submit_supersedes_pending_job_for_same_task():
+    rq = RenderQueue(logger=MagicMock())
+    first = _job("t1")
+    second = _job("t1")
+    rq.submit(first)
+    rq.submit(second)
+
+    assert first.cancelled
+    assert first.done
+    assert not second.done
+    stats = rq.get_stats()
+    assert stats["pending"] == 1
+    assert stats["cancelled"] == 1
+
+
+def test_submit_drops_oldest_beyond_max_pending():
+    rq = RenderQueue(logger=MagicMock(), max_pending=2)
+    jobs = [_job(f"t{i}") for i in range(3)]
+    for job in jobs:
+        rq.submit(job)
+
+    assert jobs[0].cancelled
+    assert not rq.has_job("t0")
+    assert rq.has_job("t1")
+    assert rq.has_job("t2")
+
+
+def test_cancel_pending_job():
+    rq = RenderQueue(logger=MagicMock())
+    job = _job("t1")
+    rq.submit(job)
+
+    assert rq.cancel("t1") is True
+    assert job.cancelled
+    assert job.done
+    assert rq.is_idle()
+    assert rq.cancel("t1") is False
+
+
+def test_render_now_runs_pending_job_inline():
+    rq = RenderQueue(logger=MagicMock())
+    on_done = MagicMock()
+    job = _job("t1", result={"image_path": "/x.jpg"}, on_done=on_done)
+    rq.submit(job)
+
+    returned = rq.render_now("t1")
+
+    assert returned is job
+    assert job.succeeded
+    assert job.result == {"image_path": "/x.jpg"}
+    on_done.assert_called_once_with(job)
+    assert rq.is_idle()
+    stats = rq.get_stats()
+    assert stats["on_demand"] == 1
+    assert stats["rendered"] == 1
+
+
+def test_render_now_unknown_task_returns_none():
+    rq = RenderQueue(logger=MagicMock())
+    assert rq.render_now("missing") is None
+
+
+def test_render_failure_is_recorded_without_on_done():
+    rq = RenderQueue(logger=MagicMock())
+    on_done = MagicMock()
+
+    def _boom(job):
+        raise RuntimeError("bad frame")
+
+    job = RenderJob(task_id="t1", render=_boom, on_done=on_done)
+    rq.submit(job)
+    rq.render_now("t1")
+
+    assert job.error == "bad frame"
+    assert not job.succeeded
+    on_done.assert_not_called()
+    assert rq.get_stats()["failed"] == 1
+
+
+def test_superseding_cancels_in_flight_job_between_steps():
+    rq = RenderQueue(logger=MagicMock())
+    started = threading.Event()
+    release = threading.Event()
+    on_done = MagicMock()
+
+    def _slow(job):
+        started.set()
+        release.wait(5)
+        job.check_cancelled()
+        return "stale"
+
+    first = RenderJob(task_id="t1", render=_slow, on_done=on_done)
+    rq.submit(first)
+    rq.start()
+    try:
+        assert started.wait(5)
+        rq.submit(_job("t1", result="fresh"))
+        release.set()
+        assert first.wait(5)
+        assert first.cancelled
+        on_done.assert_not_called()
+    finally:
+        rq.stop()
+
+
+def test_workers_render_submitted_jobs():
+    rq = RenderQueue(num_workers=2, logger=MagicMock())
+    rq.start()
+    try:
+        jobs = [_job(f"t{i}") for i in range(4)]
+        for job in jobs:
+            rq.submit(job)
+        assert all(job.wait(5) for job in jobs)
+        assert all(job.succeeded for job in jobs)
+        assert rq.get_stats()["rendered"] == 4
+    finally:
+        rq.stop()
+
+
+def test_stop_cancels_pending_jobs():
+    rq = RenderQueue(logger=MagicMock())
+    job = _job("t1")
+    rq.submit(job)
+    rq.stop()
+    assert job.cancelled
+    assert rq.is_idle()
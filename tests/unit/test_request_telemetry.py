@@ -0,0 +1,49 @@
+"""Tests for per-endpoint API request telemetry."""
+
+from __future__ import annotations
+
+from citrasense.api.request_telemetry import RequestTelemetry, body_preview, route_for
+
+
+def test_route_for_strips_query_and_ids():
+    assert route_for("get", "/telescopes/3f2a-81c0/tasks?statuses=Pending") == "GET /telescopes/{id}/tasks"
+    assert route_for("GET", "/elsets/latest?days=14") == "GET /elsets/latest"
+    assert route_for("PUT", "/telescopes") == "PUT /telescopes"
+
+
+def test_body_preview_truncates_large_bodies():
+    assert body_preview(b'{"ok": true}') == '{"ok": true}'
+    preview = body_preview(b"x" * 10_000, limit=16)
+    assert preview == "x" * 16 + "… (10000 bytes)"
+
+
+def test_record_accumulates_per_route():
+    telemetry = RequestTelemetry()
+    route = "GET /elsets/latest"
+    telemetry.record(route, 0.02, status_code=200, request_bytes=0, response_bytes=26_000_000)
+    telemetry.record(route, 3.0, status_code=503, response_bytes=300)
+    telemetry.record(route, 0.5)  # transport error
+
+    stats = telemetry.snapshot()[route]
+    assert stats["requests"] == 3
+    assert stats["errors"] == 2
+    assert stats["transport_errors"] == 1
+    assert stats["status_codes"] == {"200": 1, "503": 1}
+    assert stats["response_bytes"] == 26_000_300
+    assert stats["max_response_bytes"] == 26_000_000
+    assert stats["latency_histogram_ms"]["25"] == 1
+    assert stats["latency_histogram_ms"]["500"] == 1
+    assert stats["latency_histogram_ms"]["5000"] == 1
+    assert stats["p50_ms"] == 500.0
+
+    summary = telemetry.summary()[route]
+    assert set(summary) == {"requests", "errors", "p50_ms", "p95_ms", "response_bytes"}
+
+
+def test_body_logging_is_sampled():
+    telemetry = RequestTelemetry(body_sample_every=3)
+    logged = []
+    for _ in range(7):
+        telemetry.record("GET /x", 0.01, status_code=200)
+        logged.append(telemetry.should_log_body("GET /x"))
+    assert logged == [True, False, True, False, False, True, False]
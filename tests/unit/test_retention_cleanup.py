@@ -71,6 +71,16 @@ class TestCleanupProcessingOutput:
         assert cleanup_processing_output(tmp_path, retention_hours=-1) == 0
         assert d.exists()
 
+    def test_skips_radar_artifact_logs(self, tmp_path):
+        log_dir = tmp_path / "radar" / "radar-0"
+        log_dir.mkdir(parents=True)
+        (log_dir / "20260315-0000.jsonl").write_text("{}\n")
+        old_time = time.time() - 48 * 3600
+        os.utime(log_dir, (old_time, old_time))
+
+        assert cleanup_processing_output(tmp_path, retention_hours=24) == 0
+        assert log_dir.exists()
+
     def test_nonexistent_dir(self, tmp_path):
         assert cleanup_processing_output(tmp_path / "nope", retention_hours=24) == 0
 
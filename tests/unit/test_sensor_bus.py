@@ -3,10 +3,12 @@
 from __future__ import annotations
 
 import threading
+import time
 
+import pytest
 from pydantic import BaseModel
 
-from citrasense.sensors.bus import InProcessBus, SensorBus, Subscription
+from citrasense.sensors.bus import Delivery, DeliveryMode, InProcessBus, OverflowPolicy, SensorBus, Subscription
 
 
 class _Ping(BaseModel):
@@ -111,3 +113,169 @@ class TestInProcessBus:
         for t in threads:
             t.join()
         assert count["n"] == 10
+
+
+class TestRouting:
+    @pytest.mark.parametrize(
+        ("pattern", "subject", "expected"),
+        [
+            ("sensors.*", "sensors.radar-0.events.acquisition", True),  # fnmatch ``*`` crosses dots
+            ("sensors.rad*", "sensors.radar-0.events.status", True),
+            ("sensors.rad*", "sensors.telescope-0.events.status", False),
+            ("sensors.radar-?.events.status", "sensors.radar-7.events.status", True),
+            ("sensors.[rt]*.events.status", "sensors.telescope-0.events.status", True),
+            ("*.events.status", "sensors.radar-0.events.status", True),
+            ("sensors.radar-0", "sensors.radar-0.events.status", False),
+            ("sensors.radar-0.events.status", "sensors.radar-0.events", False),
+        ],
+    )
+    def test_matches_like_fnmatchcase(self, pattern, subject, expected):
+        bus = InProcessBus()
+        received: list[str] = []
+        bus.subscribe(pattern, lambda s, e: received.append(s))
+
+        bus.publish(subject, _Ping(value=0))
+
+        assert received == ([subject] if expected else [])
+
+    def test_handlers_across_patterns_run_in_registration_order(self):
+        bus = InProcessBus()
+        order: list[str] = []
+        bus.subscribe("*", lambda s, e: order.append("any"))
+        bus.subscribe("sensors.radar-0.events.status", lambda s, e: order.append("exact"))
+        bus.subscribe("sensors.*.events.status", lambda s, e: order.append("glob"))
+
+        bus.publish("sensors.radar-0.events.status", _Ping(value=0))
+
+        assert order == ["any", "exact", "glob"]
+
+    def test_cached_route_sees_later_subscriptions_and_removals(self):
+        bus = InProcessBus()
+        a: list[int] = []
+        b: list[int] = []
+        sub_a = bus.subscribe("sensors.*", lambda s, e: a.append(e.value))  # type: ignore[attr-defined]
+        bus.publish("sensors.radar-0", _Ping(value=1))
+
+        bus.subscribe("sensors.radar-0", lambda s, e: b.append(e.value))  # type: ignore[attr-defined]
+        bus.publish("sensors.radar-0", _Ping(value=2))
+        sub_a.unsubscribe()
+        bus.publish("sensors.radar-0", _Ping(value=3))
+
+        assert a == [1, 2]
+        assert b == [2, 3]
+
+    def test_handler_may_unsubscribe_itself_during_publish(self):
+        bus = InProcessBus()
+        received: list[int] = []
+        subs: list[Subscription] = []
+
+        def once(s, e):
+            received.append(e.value)
+            subs[0].unsubscribe()
+
+        subs.append(bus.subscribe("topic", once))
+        bus.publish("topic", _Ping(value=1))
+        bus.publish("topic", _Ping(value=2))
+
+        assert received == [1]
+
+
+class TestQueuedDelivery:
+    @staticmethod
+    def _wait_for(predicate, timeout: float = 2.0) -> None:
+        deadline = time.monotonic() + timeout
+        while not predicate():
+            assert time.monotonic() < deadline, "timed out"
+            time.sleep(0.005)
+
+    def test_slow_handler_does_not_block_publisher(self):
+        bus = InProcessBus()
+        release = threading.Event()
+        threads: list[str] = []
+
+        def slow(s, e):
+            threads.append(threading.current_thread().name)
+            release.wait(2)
+
+        sub = bus.subscribe("radar", slow, Delivery(mode=DeliveryMode.QUEUED, name="radar-0"))
+        t0 = time.monotonic()
+        for i in range(5):
+            bus.publish("radar", _Ping(value=i))
+        assert time.monotonic() - t0 < 0.5
+
+        release.set()
+        self._wait_for(lambda: bus.get_stats()[0]["delivered"] == 5)
+        assert threads[0] == "bus-radar-0"
+        sub.unsubscribe()
+
+    @pytest.mark.parametrize(
+        ("policy", "expected"),
+        [(OverflowPolicy.DROP_OLDEST, [0, 3, 4]), (OverflowPolicy.DROP_NEWEST, [0, 1, 2])],
+    )
+    def test_overflow_policies(self, policy, expected):
+        bus = InProcessBus()
+        gate = threading.Event()
+        received: list[int] = []
+
+        def handler(s, e):
+            gate.wait(2)
+            received.append(e.value)
+
+        bus.subscribe("q", handler, Delivery(mode=DeliveryMode.QUEUED, max_pending=2, overflow=policy))
+        bus.publish("q", _Ping(value=0))
+        self._wait_for(lambda: bus.get_stats()[0]["pending"] == 0)  # 0 is in the handler now
+        for i in range(1, 5):
+            bus.publish("q", _Ping(value=i))
+
+        gate.set()
+        self._wait_for(lambda: len(received) == 3)
+        stats = bus.get_stats()[0]
+        assert received == expected
+        assert stats["dropped"] == 2
+        assert stats["max_pending"] == 2
+
+    def test_block_policy_waits_for_room_then_drops(self):
+        bus = InProcessBus()
+        gate = threading.Event()
+        bus.subscribe(
+            "q",
+            lambda s, e: gate.wait(2),
+            Delivery(mode=DeliveryMode.QUEUED, max_pending=1, overflow=OverflowPolicy.BLOCK, block_timeout=0.1),
+        )
+        bus.publish("q", _Ping(value=0))
+        self._wait_for(lambda: bus.get_stats()[0]["pending"] == 0)
+        bus.publish("q", _Ping(value=1))
+
+        t0 = time.monotonic()
+        bus.publish("q", _Ping(value=2))
+        waited = time.monotonic() - t0
+        gate.set()
+
+        assert waited >= 0.09
+        assert bus.get_stats()[0]["dropped"] == 1
+
+    def test_handler_errors_are_counted_not_raised(self):
+        bus = InProcessBus()
+        bus.subscribe("q", lambda s, e: 1 / 0, Delivery(mode=DeliveryMode.QUEUED))
+
+        bus.publish("q", _Ping(value=0))
+
+        self._wait_for(lambda: bus.get_stats()[0]["errors"] == 1)
+
+    def test_stats_report_lag_and_unsubscribe_stops_worker(self):
+        bus = InProcessBus()
+        bus.subscribe("q", lambda s, e: None)
+        sub = bus.subscribe("q", lambda s, e: time.sleep(0.02), Delivery(mode=DeliveryMode.QUEUED, name="slow"))
+        for i in range(3):
+            bus.publish("q", _Ping(value=i))
+        self._wait_for(lambda: bus.get_stats()[1]["delivered"] == 3)
+
+        inline, queued = bus.get_stats()
+        assert inline["mode"] == "inline"
+        assert inline["delivered"] == 3
+        assert queued["name"] == "slow"
+        assert queued["lag_ms"]["max"] >= 30  # the third event waited behind two 20 ms handlers
+
+        sub.unsubscribe()
+        assert not any(t.name == "bus-slow" for t in threading.enumerate())
+        assert len(bus.get_stats()) == 1
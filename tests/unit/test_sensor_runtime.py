@@ -84,6 +84,9 @@ def _mock_settings():
     s.max_task_retries = 3
     s.initial_retry_delay_seconds = 1
     s.max_retry_delay_seconds = 10
+    s.render_workers = 1
+    s.upload_workers = 2
+    s.radar_artifact_retention_days = 30
     return s
 
 
@@ -258,6 +261,26 @@ class TestStreamingIngestion:
         # Actually InMemoryCaptureBus always records, but the handler won't fire.
         assert len(bus.events) == 1
 
+    def test_stop_unsubscribes_before_closing_the_radar_pipeline(self):
+        bus = InMemoryCaptureBus()
+        rt = _make_runtime(_FakeStreamingSensor("radar-0"), sensor_bus=bus, hardware_adapter=None)
+        calls = []
+        sub = MagicMock()
+        sub.unsubscribe.side_effect = lambda: calls.append("unsubscribe")
+        rt._streaming_sub = sub
+        rt._radar_pipeline = MagicMock()
+        rt._radar_pipeline.close.side_effect = lambda: calls.append("close")
+
+        rt.stop()
+
+        assert calls == ["unsubscribe", "close"]
+        assert rt._streaming_sub is None
+
+    def test_radar_artifact_retention_comes_from_settings(self):
+        rt = _make_runtime(_FakeStreamingSensor("radar-0"), hardware_adapter=None)
+        assert rt._radar_pipeline is not None
+        assert rt._radar_pipeline._writer.retention_days == 30
+
 
 # ── Queue idle helpers ────────────────────────────────────────────────────
 
@@ -1,8 +1,10 @@
-"""Unit tests for SourceExtractorProcessor CLI override flags."""
+"""Unit tests for SourceExtractorProcessor CLI override flags and catalog ingest."""
 
+import shutil
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+import numpy as np
 import pytest
 
 
@@ -57,6 +59,7 @@ def _run_extract(processor, image_path, config_dir, working_dir, **kwargs):
             config_dir,
             working_dir,
             logger=MagicMock(),
+            stage_root=working_dir.parent / "stage",
             **kwargs,
         )
 
@@ -88,7 +91,7 @@ class TestSExtractorCLIOverrides:
     def test_filter_name_override(self, processor, image_path, config_dir, working_dir):
         cmd = _run_extract(processor, image_path, config_dir, working_dir, filter_name="gauss_1.5_3x3")
         idx = cmd.index("-FILTER_NAME")
-        assert cmd[idx + 1] == "gauss_1.5_3x3.conv"
+        assert Path(cmd[idx + 1]).name == "gauss_1.5_3x3.conv"
 
     def test_filter_name_default_not_appended(self, processor, image_path, config_dir, working_dir):
         cmd = _run_extract(processor, image_path, config_dir, working_dir, filter_name="default")
@@ -117,4 +120,119 @@ class TestSExtractorCLIOverrides:
         assert "-FILTER_NAME" in cmd
         assert cmd[cmd.index("-DETECT_THRESH") + 1] == "2.0"
         assert cmd[cmd.index("-DETECT_MINAREA") + 1] == "10"
-        assert cmd[cmd.index("-FILTER_NAME") + 1] == "tophat_3.0_3x3.conv"
+        assert Path(cmd[cmd.index("-FILTER_NAME") + 1]).name == "tophat_3.0_3x3.conv"
+
+    def test_catalog_type_defaults_to_fits_ldac(self, processor, image_path, config_dir, working_dir):
+        cmd = _run_extract(processor, image_path, config_dir, working_dir)
+        assert cmd[cmd.index("-CATALOG_TYPE") + 1] == "FITS_LDAC"
+
+    def test_catalog_type_override(self, processor, image_path, config_dir, working_dir):
+        cmd = _run_extract(processor, image_path, config_dir, working_dir, catalog_type="ASCII_HEAD")
+        assert cmd[cmd.index("-CATALOG_TYPE") + 1] == "ASCII_HEAD"
+
+    def test_configs_not_copied_into_working_dir(self, processor, image_path, config_dir, working_dir):
+        cmd = _run_extract(processor, image_path, config_dir, working_dir)
+        staged_sex = Path(cmd[cmd.index("-c") + 1])
+        assert staged_sex.is_absolute()
+        assert staged_sex.exists()
+        assert not (working_dir / "default.sex").exists()
+
+
+class TestConfigStaging:
+    def test_staged_once_per_process(self, tmp_path, config_dir):
+        from citrasense.pipelines.optical.source_extractor_processor import stage_sextractor_configs
+
+        first = stage_sextractor_configs(config_dir, tmp_path)
+        assert first is not None
+        assert first.parent == tmp_path.resolve()
+        assert stage_sextractor_configs(config_dir, tmp_path) == first
+
+    def test_staged_default_sex_uses_absolute_paths(self, tmp_path, config_dir):
+        from citrasense.pipelines.optical.source_extractor_processor import stage_sextractor_configs
+
+        staged = stage_sextractor_configs(config_dir, tmp_path)
+        keys = {}
+        for line in (staged / "default.sex").read_text().splitlines():
+            parts = line.split()
+            if parts and parts[0] in ("PARAMETERS_NAME", "FILTER_NAME", "STARNNW_NAME"):
+                keys[parts[0]] = Path(parts[1])
+        assert set(keys) == {"PARAMETERS_NAME", "FILTER_NAME", "STARNNW_NAME"}
+        for path in keys.values():
+            assert path.is_absolute()
+            assert path.exists()
+
+    def test_edited_configs_are_restaged(self, tmp_path, config_dir):
+        from citrasense.pipelines.optical.source_extractor_processor import stage_sextractor_configs
+
+        local = tmp_path / "configs"
+        shutil.copytree(config_dir, local)
+        first = stage_sextractor_configs(local, tmp_path / "stage")
+        with open(local / "default.param", "a") as f:
+            f.write("# edited\n")
+        second = stage_sextractor_configs(local, tmp_path / "stage")
+        assert second != first
+        assert (second / "default.param").read_text().endswith("# edited\n")
+
+    def test_tampered_staged_file_is_restaged(self, tmp_path, config_dir):
+        from citrasense.pipelines.optical.source_extractor_processor import stage_sextractor_configs
+
+        staged = stage_sextractor_configs(config_dir, tmp_path)
+        original = (staged / "default.param").read_bytes()
+        (staged / "default.param").write_text("NUMBER\n")
+        (staged / "default.nnw").unlink()
+
+        assert stage_sextractor_configs(config_dir, tmp_path) == staged
+        assert (staged / "default.param").read_bytes() == original
+        assert (staged / "default.nnw").exists()
+
+
+class TestLdacCatalog:
+    @pytest.fixture
+    def ldac_path(self, tmp_path):
+        from citrasense.cli.bench import synthetic_sextractor_columns, write_ldac_catalog
+
+        self.columns = synthetic_sextractor_columns(50, seed=1)
+        return write_ldac_catalog(tmp_path / "output.cat", self.columns)
+
+    def test_read_ldac_catalog_matches_columns(self, ldac_path):
+        from citrasense.pipelines.optical.processor_dependencies import is_fits_catalog, read_ldac_catalog
+
+        assert is_fits_catalog(ldac_path)
+        df = read_ldac_catalog(ldac_path)
+        assert list(df.columns) == ["ra", "dec", "mag", "magerr", "fwhm", "elongation"]
+        assert len(df) == 50
+        np.testing.assert_allclose(df["ra"], self.columns["ALPHA_J2000"])
+        np.testing.assert_allclose(df["mag"], self.columns["MAG_AUTO"], rtol=1e-6)
+
+    def test_read_source_catalog_detects_ldac(self, ldac_path):
+        from citrasense.pipelines.optical.processor_dependencies import read_source_catalog
+
+        df = read_source_catalog(ldac_path)
+        assert len(df) == 50
+        assert "fwhm" in df.columns
+
+    def test_ascii_and_ldac_agree(self, tmp_path, ldac_path):
+        from citrasense.cli.bench import write_ascii_catalog
+        from citrasense.pipelines.optical.processor_dependencies import read_source_catalog
+
+        ascii_path = write_ascii_catalog(tmp_path / "ascii.cat", self.columns)
+        from_ascii = read_source_catalog(ascii_path)
+        from_ldac = read_source_catalog(ldac_path)
+        assert list(from_ascii.columns) == list(from_ldac.columns)
+        np.testing.assert_allclose(from_ascii.to_numpy(), from_ldac.to_numpy(), atol=5e-3)
+
+    def test_extract_sources_parses_ldac_output(self, processor, image_path, config_dir, working_dir, ldac_path):
+        working_dir.mkdir(parents=True, exist_ok=True)
+        mock_result = MagicMock(returncode=0, stderr="")
+
+        def fake_run(cmd, **_kw):
+            shutil.copy(ldac_path, working_dir / "output.cat")
+            return mock_result
+
+        with patch("citrasense.pipelines.optical.source_extractor_processor.subprocess.run", side_effect=fake_run):
+            sources = processor._extract_sources(
+                image_path, config_dir, working_dir, logger=MagicMock(), stage_root=working_dir.parent / "stage"
+            )
+
+        assert len(sources) == 50
+        assert sources["ra"].dtype == np.float64
@@ -6,7 +6,7 @@ from __future__ import annotations
 import heapq
 import time
 from datetime import datetime, timedelta, timezone
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pytest
 from dateutil import parser as dtparser
@@ -189,6 +189,74 @@ class TestDropScheduledTask:
         assert td.drop_scheduled_task("nope") is False
 
 
+# ── Tasked-satellite snapshot ─────────────────────────────────────────────
+
+
+class TestTaskedSatellites:
+    def _task(self, tid: str, sat: str) -> MagicMock:
+        task = _mock_task(sensor_id="scope-0")
+        task.id = tid
+        task.satelliteId = sat
+        task.taskStart = f"2026-03-15T04:00:00Z-{tid}"  # distinct, so heap entries order without comparing tasks
+        task.taskStop = ""
+        return task
+
+    def test_restore_and_drop_publish_new_versions(self):
+        td = _make_dispatcher()
+        td.register_runtime(_mock_runtime("scope-0"))
+        td._runtime_for_task = MagicMock(return_value=td.get_runtime("scope-0"))
+        empty = td.tasked_satellite_ids()
+        assert empty.version == 0
+        assert len(empty) == 0
+
+        td.restore_task_dict({"t1": self._task("t1", "sat-a"), "t2": self._task("t2", "sat-b")})
+        restored = td.tasked_satellite_ids()
+        assert restored.version == 1
+        assert "sat-a" in restored
+        assert "sat-b" in restored
+
+        td.drop_scheduled_task("t1")
+        dropped = td.tasked_satellite_ids()
+        assert dropped.version == 2
+        assert "sat-a" not in dropped
+        # Readers holding the old snapshot keep a consistent view.
+        assert "sat-a" in restored
+
+    def test_unchanged_contents_keep_the_version(self):
+        td = _make_dispatcher()
+        td.register_runtime(_mock_runtime("scope-0"))
+        td._runtime_for_task = MagicMock(return_value=td.get_runtime("scope-0"))
+        td.restore_task_dict({"t1": self._task("t1", "sat-a"), "t2": self._task("t2", "sat-a")})
+
+        td.drop_scheduled_task("t2")  # sat-a is still tasked via t1
+
+        assert td.tasked_satellite_ids().version == 1
+        assert td.tasked_satellite_ids().ids == {t.satelliteId for t in td.get_tasks_snapshot()}
+
+    def test_starting_a_task_removes_its_satellite(self):
+        td = _make_dispatcher()
+        rt = _mock_runtime("scope-0")
+        rt.is_ready = True
+        rt.paused = False
+        rt.is_maintenance_blocking.return_value = False
+        rt.observing_session_manager = None
+        rt.is_focus_or_alignment_active.return_value = False
+        td.register_runtime(rt)
+        task = self._task("t1", "sat-a")
+        with td.heap_lock:
+            heapq.heappush(td._sensor_heaps["scope-0"], (0, 0, "t1", task))
+            td._sensor_task_ids["scope-0"].add("t1")
+            td._sensor_task_dicts["scope-0"]["t1"] = task
+            td._publish_tasked_satellites()
+        assert "sat-a" in td.tasked_satellite_ids()
+
+        td._stop_event.wait = lambda timeout=None: td._stop_event.set()  # one runner pass
+        td.task_runner()
+
+        rt.submit_task.assert_called_once()
+        assert "sat-a" not in td.tasked_satellite_ids()
+
+
 # ── Lifecycle ─────────────────────────────────────────────────────────────
 
 
@@ -434,6 +502,97 @@ def test_poll_tasks_does_not_remove_current_task(wired_dispatcher):
     assert "task-001" in ids
 
 
+def test_sync_tasks_leaves_unchanged_tasks_alone(wired_dispatcher):
+    td, _ = wired_dispatcher
+    polled = [_create_test_task(f"task-{i:03}", start_offset_seconds=60 * (i + 1)).__dict__ for i in range(3)]
+
+    first = td._sync_tasks(polled)
+    assert (first["added"], first["parsed"]) == (3, 3)
+    heap = td._sensor_heaps[WIRED_SID]
+    entries = list(heap)
+
+    with patch.object(Task, "from_dict", side_effect=AssertionError("re-parsed")):
+        second = td._sync_tasks([dict(d) for d in polled])
+    assert (second["added"], second["updated"], second["removed"], second["parsed"]) == (0, 0, 0, 0)
+    assert td._sensor_heaps[WIRED_SID] is heap
+    assert heap == entries
+
+
+def test_sync_tasks_updates_modified_and_removes_missing_tasks(wired_dispatcher):
+    td, _ = wired_dispatcher
+    early = _create_test_task("task-001", start_offset_seconds=60)
+    late = _create_test_task("task-002", start_offset_seconds=120)
+    gone = _create_test_task("task-003", start_offset_seconds=180)
+    td._sync_tasks([early.__dict__, late.__dict__, gone.__dict__])
+
+    rescheduled = _create_test_task("task-002", start_offset_seconds=30)
+    result = td._sync_tasks([early.__dict__, rescheduled.__dict__])
+
+    assert (result["added"], result["updated"], result["removed"], result["parsed"]) == (0, 1, 1, 1)
+    heap = td._sensor_heaps[WIRED_SID]
+    assert heap[0][2] == "task-002"
+    assert heap[0][0] == int(dtparser.isoparse(rescheduled.taskStart).timestamp())
+    assert td._sensor_task_ids[WIRED_SID] == {"task-001", "task-002"}
+    assert td.get_task_by_id("task-002").taskStart == rescheduled.taskStart
+
+
+def test_sync_tasks_drops_tasks_whose_status_changed(wired_dispatcher):
+    td, _ = wired_dispatcher
+    task = _create_test_task("task-001")
+    td._sync_tasks([task.__dict__])
+
+    result = td._sync_tasks([{**task.__dict__, "status": "Cancelled"}])
+    assert result["removed"] == 1
+    assert td.pending_task_count == 0
+
+
+def test_sync_tasks_requeues_a_popped_task_still_pending(wired_dispatcher):
+    td, _ = wired_dispatcher
+    task = _create_test_task("task-001")
+    td._sync_tasks([task.__dict__])
+    with td.heap_lock:
+        heapq.heappop(td._sensor_heaps[WIRED_SID])
+        td._sensor_task_ids[WIRED_SID].discard("task-001")
+
+    # Same fingerprint, but the task left the heap (e.g. failed locally): it is re-evaluated.
+    assert td._sync_tasks([task.__dict__])["added"] == 1
+    td._current_task_ids[WIRED_SID] = "task-001"
+    with td.heap_lock:
+        heapq.heappop(td._sensor_heaps[WIRED_SID])
+        td._sensor_task_ids[WIRED_SID].discard("task-001")
+    assert td._sync_tasks([task.__dict__])["added"] == 0
+
+
+def test_sync_tasks_reparses_when_any_api_field_changes(wired_dispatcher):
+    td, _ = wired_dispatcher
+    task = _create_test_task("task-001")
+    td._sync_tasks([{**task.__dict__, "groundStationName": "Old site"}])
+
+    result = td._sync_tasks([{**task.__dict__, "groundStationName": "New site"}])
+    assert result["updated"] == 1
+
+
+def test_fingerprints_are_dropped_when_tasks_leave_the_heaps(wired_dispatcher):
+    td, _ = wired_dispatcher
+    kept = _create_test_task("task-001")
+    dropped = _create_test_task("task-002")
+    td._sync_tasks([kept.__dict__, dropped.__dict__])
+    assert set(td._task_fingerprints) == {"task-001", "task-002"}
+
+    td.drop_scheduled_task("task-002")
+    assert set(td._task_fingerprints) == {"task-001"}
+    td._sync_tasks([])
+    assert td._task_fingerprints == {}
+
+
+def test_parse_epoch_memoises_timestamps(wired_dispatcher):
+    td, _ = wired_dispatcher
+    stamp = "2026-03-15T04:00:00+00:00"
+    with patch("citrasense.tasks.task_dispatcher.dtparser.isoparse", wraps=dtparser.isoparse) as isoparse:
+        assert td._parse_epoch(stamp) == td._parse_epoch(stamp) == 1773547200
+    assert isoparse.call_count == 1
+
+
 # ── _evaluate_safety_for — cable wrap soft-lock regression (#239) ────────
 
 
@@ -177,6 +177,16 @@ class TestUploadResult:
         assert index.get_task("task-001")["upload_success"] == 0
 
 
+class TestAnnotatedImage:
+    def test_update_annotated_image(self, index):
+        task = _make_task()
+        index.record_task(task=task, result=_make_result(), pointing_report=None, timing_info=None)
+        index.update_annotated_image("task-001", "/analysis/task-001.jpg")
+        row = index.get_task("task-001")
+        assert row["has_annotated_image"] == 1
+        assert row["annotated_image_path"] == "/analysis/task-001.jpg"
+
+
 class TestQueryTasks:
     def _insert_n(self, index, n):
         for i in range(n):
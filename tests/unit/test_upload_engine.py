@@ -0,0 +1,168 @@
+"""Tests for :class:`UploadEngine` against the local upload stand-in server."""
+
+from __future__ import annotations
+
+import gzip
+import os
+from unittest.mock import MagicMock, patch
+
+import httpx
+import pytest
+
+from citrasense.api.citra_api_client import CitraApiClient
+from citrasense.api.upload_engine import UploadEngine, UploadError
+from citrasense.cli.upload_stand_in import LocalUploadServer
+
+CHUNK = 256 * 1024
+
+
+@pytest.fixture
+def server():
+    with LocalUploadServer() as server:
+        yield server
+
+
+@pytest.fixture
+def engine():
+    engine = UploadEngine(chunk_size=CHUNK)
+    yield engine
+    engine.close()
+
+
+@pytest.fixture
+def image(tmp_path):
+    path = tmp_path / "frame.fits"
+    # Compressible but not trivially so: a FITS-like header plus repeating noise.
+    path.write_bytes(b"SIMPLE  =                    T" + os.urandom(4096) * 300)
+    return path
+
+
+def test_resumable_upload_resumes_at_server_offset_after_drop(server, engine, image):
+    size = image.stat().st_size
+    url = server.create_upload(size)
+    server.fail_next(after_bytes=CHUNK // 2)  # first chunk dies half-way
+
+    assert engine.upload_resumable(url, image) == size
+    assert server.upload_data(url) == image.read_bytes()
+    stats = engine.stats()
+    assert stats["uploads"] == 1
+    # Only what was still in flight when the link dropped goes again.
+    assert stats["bytes_resent"] <= CHUNK // 2
+    assert server.stats()["bytes_received"] == size
+
+
+def test_resumable_upload_continues_a_previous_attempt(server, image):
+    size = image.stat().st_size
+    url = server.create_upload(size)
+    engine = UploadEngine(chunk_size=size, max_chunk_retries=0)
+    server.fail_next(after_bytes=int(size * 0.95))  # the link dies at 95% and the attempt gives up
+    with pytest.raises(UploadError):
+        engine.upload_resumable(url, image)
+
+    engine.upload_resumable(url, image)  # e.g. the upload queue's retry
+    engine.close()
+    assert server.upload_data(url) == image.read_bytes()
+    stats = engine.stats()
+    assert stats["resumes"] == 1
+    assert stats["bytes_resent"] <= size - int(size * 0.95)
+    assert server.stats()["bytes_received"] == size
+
+
+def test_form_post_retry_resends_everything(server, engine, image):
+    size = image.stat().st_size
+    server.fail_next(after_bytes=int(size * 0.95))
+    with pytest.raises(httpx.HTTPError):
+        engine.post_form(server.form_url(), {"key": "k"}, image)
+    engine.post_form(server.form_url(), {"key": "k"}, image)
+
+    assert image.read_bytes() in server.form_body()
+    stats = engine.stats()
+    assert stats["failures"] == 1
+    assert stats["bytes_resent"] >= int(size * 0.9)
+
+
+def test_uploads_reuse_one_connection(server, engine, image):
+    for _ in range(3):
+        engine.post_form(server.form_url(), {}, image)
+    url = server.create_upload(image.stat().st_size)
+    engine.upload_resumable(url, image)
+    assert server.stats()["connections"] == 1
+
+
+def test_offset_failure_drops_only_the_chunk_carrying_it(server, engine, image):
+    size = image.stat().st_size
+    url = server.create_upload(size)
+    server.fail_at_offset(url, 3 * CHUNK + 10)
+    engine.upload_resumable(url, image)
+    assert server.upload_data(url) == image.read_bytes()
+    assert engine.stats()["failures"] == 0
+    assert server.stats()["bytes_received"] == size
+
+
+def test_stalled_upload_raises_after_retries(server, image):
+    engine = UploadEngine(chunk_size=CHUNK, max_chunk_retries=2)
+    url = server.create_upload(image.stat().st_size)
+    server.fail_next(after_bytes=0, times=3)
+    with pytest.raises(UploadError, match="stalled at 0/"):
+        engine.upload_resumable(url, image)
+    engine.close()
+
+
+def test_compressed_sidecar_is_deterministic_and_discarded(tmp_path, image):
+    engine = UploadEngine(compress=True)
+    prepared = engine.prepare(image)
+    assert prepared.name == "frame.fits.gz"
+    first = prepared.read_bytes()
+    prepared.unlink()
+    assert engine.prepare(image).read_bytes() == first
+    assert gzip.decompress(first) == image.read_bytes()
+    assert engine.stats()["compression_ratio"] < 0.5
+
+    engine.discard_prepared(image, prepared)
+    assert not prepared.exists()
+    assert image.exists()
+    engine.discard_prepared(image, image)
+    assert image.exists()
+
+
+def test_abandon_removes_sidecar_and_resume_state(server, image):
+    engine = UploadEngine(compress=True)
+    prepared = engine.prepare(image)
+    server.fail_next(after_bytes=100)
+    with pytest.raises(httpx.HTTPError):
+        engine.post_form(server.form_url(), {}, prepared)
+    assert engine._high_water
+
+    engine.abandon(image)
+    assert not prepared.exists()
+    assert image.exists()
+    assert engine._high_water == {}
+    engine.close()
+
+
+def test_citra_client_returns_none_when_the_image_cannot_be_prepared(tmp_path):
+    client = CitraApiClient(host="api.test.com", token="t", logger=MagicMock())
+    with patch.object(client, "_request") as request:
+        assert client.upload_image("task-1", "tel-1", str(tmp_path / "missing.fits")) is None
+    request.assert_not_called()
+
+
+def test_citra_client_uses_resumable_url_when_offered(server, image):
+    size = image.stat().st_size
+    resumable = server.create_upload(size)
+    client = CitraApiClient(
+        host="api.test.com", token="t", logger=MagicMock(), upload_engine=UploadEngine(chunk_size=CHUNK)
+    )
+    signed = {"uploadUrl": server.form_url(), "fields": {}, "resumableUploadUrl": resumable, "resultsUrl": "/r"}
+    with patch.object(client, "_request", return_value=signed) as request:
+        assert client.upload_image("task-1", "tel-1", str(image)) == "/r"
+    assert f"file_size={size}" in request.call_args.args[1]
+    assert server.upload_data(resumable) == image.read_bytes()
+    assert server.form_body() is None
+
+
+def test_citra_client_returns_none_on_failed_form_post(server, image):
+    client = CitraApiClient(host="api.test.com", token="t", logger=MagicMock())
+    server.fail_next(after_bytes=100)
+    with patch.object(client, "_request", return_value={"uploadUrl": server.form_url(), "fields": {}}):
+        assert client.upload_image("task-1", "tel-1", str(image)) is None
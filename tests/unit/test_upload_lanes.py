@@ -0,0 +1,160 @@
+"""Tests for :class:`UploadLanes` scheduling and the concurrent :class:`UploadQueue`."""
+
+from __future__ import annotations
+
+import queue
+import threading
+import time
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from citrasense.acquisition.upload_lanes import UploadLanes
+from citrasense.acquisition.upload_queue import UploadQueue
+from citrasense.api.upload_engine import BandwidthBudget
+
+
+def _item(lane: str, size: int = 0, name: str = "") -> dict:
+    return {"task_id": name or f"{lane}-{size}", "lane": lane, "size": size}
+
+
+@pytest.fixture
+def lanes():
+    return UploadLanes(lambda item: (item["lane"], item["size"]), image_slots=1)
+
+
+def test_small_payloads_overtake_queued_images(lanes):
+    lanes.put(_item("image", 60_000_000, "big"))
+    lanes.put(_item("observations", 2_000, "obs"))
+    lanes.put(_item("radar", 500, "radar"))
+    assert [lanes.get_nowait()["task_id"] for _ in range(3)] == ["radar", "obs", "big"]
+
+
+def test_smaller_image_overtakes_only_within_its_size_difference(lanes):
+    lanes.put(_item("image", 60_000_000, "big"))
+    lanes.put(_item("image", 1_000_000, "small"))
+    assert lanes.get_nowait()["task_id"] == "small"
+
+    aged = UploadLanes(lambda item: (item["lane"], item["size"]))
+    aged.put(_item("image", 60_000_000, "big"))
+    aged._images[0] = (aged._images[0][0] - 120, *aged._images[0][1:])  # queued two minutes ago
+    aged.put(_item("image", 1_000_000, "small"))
+    assert aged.get_nowait()["task_id"] == "big"
+
+
+def test_image_slots_keep_a_worker_for_small_payloads(lanes):
+    lanes.put(_item("image", 10, "a"))
+    lanes.put(_item("image", 10, "b"))
+    first = lanes.get_nowait()
+    with pytest.raises(queue.Empty):
+        lanes.get_nowait()
+    assert lanes.qsize() == 1
+
+    lanes.put(_item("radar", 10, "r"))
+    assert lanes.get_nowait()["task_id"] == "r"
+
+    lanes.finish(first, success=True)
+    assert lanes.get_nowait()["task_id"] == "b"
+
+
+def test_lane_stats_track_backlog_throughput_and_wait(lanes):
+    lanes.put(_item("image", 4_000))
+    lanes.put(_item("image", 8_000))
+    item = lanes.get_nowait()
+    lanes.finish(item, success=True)
+
+    stats = lanes.lane_stats()
+    assert stats["image"]["pending"] == 1
+    assert stats["image"]["completed"] == 1
+    assert stats["image"]["bytes"] == 4_000
+    assert stats["image"]["bytes_per_second"] > 0
+    assert stats["image"]["oldest_pending_age_s"] >= 0
+    assert stats["image"]["wait_max_s"] is not None
+    assert stats["radar"]["wait_p50_s"] is None
+
+
+def test_drain_removes_items_waiting_for_a_slot(lanes):
+    lanes.put(_item("image", 1))
+    lanes.put(_item("image", 2))
+    lanes.get_nowait()
+    assert len(lanes.drain()) == 1
+    assert lanes.qsize() == 0
+    assert lanes.lane_stats()["image"]["pending"] == 0
+
+
+def test_poison_pills_come_after_work(lanes):
+    lanes.put(None)
+    lanes.put(_item("radar"))
+    assert lanes.get_nowait() is not None
+    assert lanes.get_nowait() is None
+
+
+def test_items_are_classified_outside_the_queue_mutex():
+    held = []
+
+    def classify(item):
+        held.append(lanes.mutex.locked())
+        return item["lane"], item["size"]
+
+    lanes = UploadLanes(classify)
+    lanes.put(_item("image", 10))
+    lanes.put(_item("radar", 5))
+    assert held == [False, False]
+    assert lanes.get_nowait()["_upload_lane"] == "radar"
+
+
+def test_bandwidth_budget_paces_concurrent_consumers():
+    budget = BandwidthBudget(1_000_000, burst_bytes=10_000)
+    start = time.monotonic()
+    threads = [threading.Thread(target=lambda: [budget.consume(50_000) for _ in range(2)]) for _ in range(2)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    # 200 kB at 1 MB/s, less the 10 kB burst
+    assert time.monotonic() - start >= 0.18
+    assert budget.stats()["bytes_consumed"] == 200_000
+
+
+def test_upload_queue_sends_radar_while_images_upload(tmp_path):
+    settings = SimpleNamespace(
+        max_task_retries=0, initial_retry_delay_seconds=1, max_retry_delay_seconds=1, keep_images=True
+    )
+    image_started = threading.Event()
+    release_images = threading.Event()
+    api = MagicMock()
+
+    def slow_image(*args):
+        image_started.set()
+        release_images.wait(5)
+        return "/r"
+
+    api.upload_image.side_effect = slow_image
+    api.upload_radar_observations.return_value = True
+    uq = UploadQueue(num_workers=2, settings=settings, logger=MagicMock())
+    uq.start()
+    try:
+        image = tmp_path / "frame.fits"
+        image.write_bytes(b"x" * 1000)
+        done = MagicMock()
+        for i in range(3):
+            uq.submit(f"t{i}", None, str(image), None, api, {"id": "tel"}, settings, done)
+        assert image_started.wait(5)
+
+        radar_done = threading.Event()
+        uq.submit_radar_observation("r0", {"id": 1}, api, settings, on_complete=lambda ok: radar_done.set())
+        assert radar_done.wait(5)  # not stuck behind the three images
+        stats = uq.get_lane_stats()
+        assert stats["image"]["in_flight"] == 1
+        assert stats["image"]["pending"] == 2
+
+        release_images.set()
+        deadline = time.time() + 5
+        while not uq.is_idle() and time.time() < deadline:
+            time.sleep(0.01)
+        assert uq.get_lane_stats()["image"]["completed"] == 3
+        assert uq.get_stats()["image_uploads"] == 3
+    finally:
+        release_images.set()
+        uq.stop()
@@ -138,6 +138,19 @@ def test_on_permanent_failure(uq):
     cb.assert_called_once_with("t1", success=False)
 
 
+def test_on_permanent_failure_abandons_the_image_upload(uq):
+    api = MagicMock()
+    item = {
+        "task_id": "t1",
+        "task": MagicMock(),
+        "on_complete": MagicMock(),
+        "api_client": api,
+        "image_path": "/x.fits",
+    }
+    uq._on_permanent_failure(item)
+    api.abandon_image_upload.assert_called_once_with("/x.fits")
+
+
 def test_execute_work_uncalibrated_obs_falls_back_to_fits(uq):
     """Observations with mag=None (photometry failed) must not take the optical path."""
     pr = MagicMock()
@@ -144,6 +144,7 @@ class TestConfigReloadDropsInFlightStages:
         daemon.latest_annotated_image_paths = {}
         daemon.preview_bus = MagicMock()
         daemon.task_index = MagicMock()
+        daemon.upload_spool = None
         daemon.sensor_bus = MagicMock()
         daemon._retention_timer = None
         daemon._stop_requested = False
@@ -0,0 +1,228 @@
+"""Tests for the durable upload spool, offline parking and the shared retry scheduler."""
+
+from __future__ import annotations
+
+import threading
+import time
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from citrasense.acquisition.retry_scheduler import RetryScheduler
+from citrasense.acquisition.upload_queue import OFFLINE_AFTER_FAILURES, UploadQueue
+from citrasense.acquisition.upload_spool import UploadSpool
+
+SAT_OBS = [{"norad_id": "25544", "mag": 9.1}]
+LOCATION = {"latitude": 34.0, "longitude": -118.0, "altitude": 500.0}
+
+
+def _settings(**overrides):
+    values = {
+        "max_task_retries": 3,
+        "initial_retry_delay_seconds": 60,
+        "max_retry_delay_seconds": 300,
+        "keep_images": True,
+    }
+    values.update(overrides)
+    return SimpleNamespace(**values)
+
+
+def _wait_for(predicate, timeout: float = 5.0) -> bool:
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return predicate()
+
+
+@pytest.fixture
+def spool(tmp_path):
+    spool = UploadSpool(tmp_path / "spool.db")
+    yield spool
+    spool.close()
+
+
+class _FlakyApi:
+    """Radar uploads fail (fast, like a refused connection) while ``online`` is False."""
+
+    def __init__(self) -> None:
+        self.online = False
+        self.uploaded: list[dict] = []
+        self.lock = threading.Lock()
+
+    def upload_radar_observations(self, payloads):
+        if not self.online:
+            raise ConnectionError("uplink down")
+        with self.lock:
+            self.uploaded.extend(payloads)
+        return True
+
+
+def test_spool_round_trip(spool):
+    first = spool.add("s1", "t1", "radar", {"payload": {"a": 1}})
+    spool.add("s2", "t2", "radar", {"payload": {"b": 2}})
+    spool.record_attempt(first)
+
+    (row,) = spool.pending("s1")
+    assert row["spool_id"] == first
+    assert row["record"] == {"payload": {"a": 1}}
+    assert row["attempts"] == 1
+    assert spool.count() == 2
+
+    spool.remove(first)
+    assert spool.get(first) is None
+    assert spool.discard("s2") == 1
+    assert spool.count() == 0
+
+
+def test_restart_resubmits_spooled_uploads(tmp_path):
+    path = tmp_path / "spool.db"
+    settings = _settings()
+    before = UploadQueue(num_workers=2, settings=settings, logger=MagicMock(), spool=UploadSpool(path), sensor_id="s1")
+    before.submit_radar_observation("s1", {"observation_id": "r1"}, MagicMock(), settings)
+    pr = SimpleNamespace(extracted_data={"satellite_matcher.satellite_observations": SAT_OBS})
+    for _ in range(2):  # two images of one task
+        before.submit(
+            "task-1", MagicMock(), "/gone.fits", pr, MagicMock(), {"id": "tel"}, settings, MagicMock(), LOCATION
+        )
+    before.spool.close()  # the daemon dies before the workers ever ran
+
+    spool = UploadSpool(path)
+    api = MagicMock()
+    api.upload_radar_observations.return_value = True
+    api.upload_optical_observations.return_value = True
+    after = UploadQueue(num_workers=2, settings=settings, logger=MagicMock(), spool=spool, sensor_id="s1")
+    after.start()
+    try:
+        assert after.resubmit_spooled(api, settings) == 3
+        assert _wait_for(lambda: spool.count() == 0)
+        assert _wait_for(lambda: api.mark_task_complete.called)
+        assert after.get_stats()["satellites_identified"] == 2
+    finally:
+        after.stop()
+        spool.close()
+
+    api.upload_radar_observations.assert_called_once_with([{"observation_id": "r1"}])
+    assert api.upload_optical_observations.call_count == 2
+    assert api.upload_optical_observations.call_args.args[0] == SAT_OBS
+    api.mark_task_complete.assert_called_once_with("task-1")
+
+
+def test_resubmit_drops_fits_uploads_whose_file_is_gone(spool):
+    spool.add("s1", "t1", "optical", {"image_path": "/gone.fits", "satellite_observations": []})
+    uq = UploadQueue(settings=_settings(), logger=MagicMock(), spool=spool, sensor_id="s1")
+    assert uq.resubmit_spooled(MagicMock(), _settings()) == 0
+    assert spool.count() == 0
+
+
+def test_outage_parks_uploads_and_drains_on_reconnect(spool):
+    settings = _settings()
+    api = _FlakyApi()
+    uq = UploadQueue(num_workers=3, settings=settings, logger=MagicMock(), spool=spool, sensor_id="s1")
+    uq.probe_interval_seconds = 0.05
+    uq.start()
+    try:
+        for i in range(OFFLINE_AFTER_FAILURES + 20):
+            uq.submit_radar_observation("s1", {"observation_id": f"r{i}"}, api, settings)
+        assert _wait_for(lambda: uq.offline and uq.get_stats()["parked"] >= 20)
+        # Parked stubs keep their payload on disk only; no retries are used up.
+        assert all("payload" not in stub for stub in list(uq._parked))
+        assert uq.get_stats()["permanent_failures"] == 0
+        assert spool.count("s1") == OFFLINE_AFTER_FAILURES + 20
+
+        api.online = True
+        # The first few failures are on a 60 s backoff; reconnect makes them due at once.
+        assert _wait_for(lambda: len(api.uploaded) == OFFLINE_AFTER_FAILURES + 20)
+        assert _wait_for(lambda: spool.count("s1") == 0)
+        stats = uq.get_stats()
+        assert stats["offline"] == 0
+        assert stats["parked"] == 0
+        assert stats["permanent_failures"] == 0
+    finally:
+        uq.stop()
+
+
+def test_clear_discards_spooled_and_parked_uploads(spool):
+    settings = _settings()
+    uq = UploadQueue(settings=settings, logger=MagicMock(), spool=spool, sensor_id="s1")
+    uq.offline = True
+    uq.submit_radar_observation("s1", {"observation_id": "r1"}, _FlakyApi(), settings)
+    uq.submit_radar_observation("s1", {"observation_id": "r2"}, _FlakyApi(), settings)
+    assert uq.get_stats()["parked"] == 2
+
+    assert uq.clear() == 2
+    assert spool.count() == 0
+    assert uq.get_stats()["parked"] == 0
+
+
+def test_retry_scheduler_orders_cancels_and_expedites():
+    scheduler = RetryScheduler(name="test-retry-scheduler")
+    fired: list[str] = []
+    done = threading.Event()
+
+    late = scheduler.schedule(60, lambda: fired.append("late"))
+    cancelled = scheduler.schedule(0.05, lambda: fired.append("cancelled"))
+    scheduler.schedule(0.02, lambda: fired.append("soon"))
+    cancelled.cancel()
+    scheduler.expedite([late])
+    scheduler.schedule(0.1, done.set)
+
+    assert done.wait(2)
+    assert fired == ["late", "soon"]
+    assert late.fired
+    assert not cancelled.fired
+    assert scheduler.pending() == 0
+
+
+def test_reload_does_not_resubmit_an_upload_still_in_flight(spool):
+    settings = _settings()
+    started, release = threading.Event(), threading.Event()
+    api = MagicMock()
+
+    def slow_upload(payloads):
+        started.set()
+        release.wait(5)
+        return True
+
+    api.upload_radar_observations.side_effect = slow_upload
+    old = UploadQueue(num_workers=1, settings=settings, logger=MagicMock(), spool=spool, sensor_id="s1")
+    old.start()
+    old.submit_radar_observation("s1", {"observation_id": "r1"}, api, settings)
+    assert started.wait(5)
+
+    # Config reload: the old queue is stopped while its worker is still uploading.
+    stopper = threading.Thread(target=old.stop)
+    stopper.start()
+    new = UploadQueue(num_workers=1, settings=settings, logger=MagicMock(), spool=spool, sensor_id="s1")
+    assert new.resubmit_spooled(api, settings) == 0
+
+    release.set()
+    stopper.join(5)
+    assert _wait_for(lambda: spool.count("s1") == 0)
+    api.upload_radar_observations.assert_called_once()
+
+
+def test_recovered_task_is_completed_once_under_concurrent_workers(spool):
+    uq = UploadQueue(settings=_settings(), logger=MagicMock(), spool=spool, sensor_id="s1")
+    api = MagicMock()
+    images = 200
+    with uq._recovered_lock:
+        uq._recovered_tasks["task-1"] = [images, False, api]
+
+    barrier = threading.Barrier(4)
+
+    def finish(n: int) -> None:
+        barrier.wait()
+        for _ in range(n):
+            uq._on_recovered_image_done("task-1", True)
+
+    threads = [threading.Thread(target=finish, args=(images // 4,)) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    api.mark_task_complete.assert_called_once_with("task-1")
+    assert "task-1" not in uq._recovered_tasks
@@ -0,0 +1,137 @@
+"""Tests for the shared batched WCS projection (WcsProjection)."""
+
+import numpy as np
+import pytest
+from astropy.io import fits
+
+from citrasense.pipelines.optical.optical_processing_context import OpticalProcessingContext
+from citrasense.pipelines.optical.wcs_projection import WcsProjection
+
+
+def _header(sip_a20: float | None = None, rotation_cd: float = 1.5e-6) -> fits.Header:
+    sip = sip_a20 is not None
+    header = fits.Header()
+    header.update(
+        {
+            "NAXIS": 2,
+            "NAXIS1": 2000,
+            "NAXIS2": 1500,
+            "CTYPE1": "RA---TAN-SIP" if sip else "RA---TAN",
+            "CTYPE2": "DEC--TAN-SIP" if sip else "DEC--TAN",
+            "CRVAL1": 359.9,
+            "CRVAL2": 62.0,
+            "CRPIX1": 1000.5,
+            "CRPIX2": 750.5,
+            "CD1_1": -3.0e-4,
+            "CD1_2": rotation_cd,
+            "CD2_1": rotation_cd,
+            "CD2_2": 3.0e-4,
+        }
+    )
+    if sip:
+        header.update({"A_ORDER": 2, "B_ORDER": 2, "A_2_0": sip_a20})
+    return header
+
+
+def _sky_grid(projection: WcsProjection, n: int = 500):
+    rng = np.random.default_rng(1)
+    x = rng.uniform(0, 1999, n)
+    y = rng.uniform(0, 1499, n)
+    ra, dec = projection.wcs.all_pix2world(x, y, 0)
+    return x, y, ra, dec
+
+
+class TestLinearTan:
+    def test_plain_tan_uses_linear_path_and_matches_astropy(self):
+        projection = WcsProjection.from_header(_header())
+        assert projection is not None
+        assert projection.uses_linear
+        assert projection.linear_max_error_px < 1e-6
+
+        x, y, ra, dec = _sky_grid(projection)
+        px, py = projection.world_to_pixel_values(ra, dec)
+        np.testing.assert_allclose(px, x, atol=1e-6)
+        np.testing.assert_allclose(py, y, atol=1e-6)
+
+    def test_pixel_to_world_round_trips_across_ra_wrap(self):
+        projection = WcsProjection.from_header(_header())
+        assert projection is not None
+        x, y, ra, dec = _sky_grid(projection)
+        assert ra.min() < 1.0  # field straddles RA = 0
+        assert ra.max() > 359.0
+        r, d = projection.pixel_to_world_values(x, y)
+        np.testing.assert_allclose(np.mod(r - ra + 180.0, 360.0) - 180.0, 0.0, atol=1e-9)
+        np.testing.assert_allclose(d, dec, atol=1e-9)
+
+    def test_points_behind_tangent_plane_are_nan(self):
+        projection = WcsProjection.from_header(_header())
+        assert projection is not None
+        x, y = projection.world_to_pixel_values(179.9, -62.0)
+        assert np.isnan(x)
+        assert np.isnan(y)
+        assert not projection.contains(x, y)
+
+    def test_small_distortion_within_tolerance_stays_linear(self):
+        projection = WcsProjection.from_header(_header(sip_a20=1e-12))
+        assert projection is not None
+        assert projection.uses_linear
+
+    def test_large_distortion_falls_back_to_exact(self):
+        projection = WcsProjection.from_header(_header(sip_a20=5e-6))
+        assert projection is not None
+        assert not projection.uses_linear
+        assert projection.linear_max_error_px > projection.tolerance_px
+
+        x, y, ra, dec = _sky_grid(projection)
+        px, py = projection.world_to_pixel_values(ra, dec)
+        np.testing.assert_allclose(px, x, atol=1e-3)
+        np.testing.assert_allclose(py, y, atol=1e-3)
+
+
+class TestHelpers:
+    def test_from_header_without_solution_returns_none(self):
+        assert WcsProjection.from_header(fits.Header({"NAXIS": 2, "NAXIS1": 10, "NAXIS2": 10})) is None
+
+    def test_contains_respects_margin(self):
+        projection = WcsProjection.from_header(_header())
+        assert projection is not None
+        mask = projection.contains([-3.0, 10.0, 2001.0], [10.0, 10.0, 10.0], margin=0.0)
+        assert mask.tolist() == [False, True, False]
+        assert projection.contains([-3.0], [10.0], margin=5.0).tolist() == [True]
+
+    def test_center_and_pixel_scale(self):
+        projection = WcsProjection.from_header(_header(rotation_cd=0.0))
+        assert projection is not None
+        _ra, dec = projection.center()
+        assert dec == pytest.approx(62.0, abs=1e-3)
+        assert projection.pixel_scale_deg == pytest.approx(3.0e-4)
+
+
+class TestContextCache:
+    def _context(self, tmp_path, header: fits.Header) -> OpticalProcessingContext:
+        path = tmp_path / "frame.fits"
+        fits.PrimaryHDU(data=np.zeros((1500, 2000), dtype=np.uint8), header=header).writeto(path)
+        return OpticalProcessingContext(image_path=path, working_image_path=path, working_dir=tmp_path)
+
+    def test_projection_parsed_once_per_frame(self, tmp_path):
+        ctx = self._context(tmp_path, _header())
+        first = ctx.wcs_projection()
+        assert first is not None
+        assert ctx.wcs_projection() is first
+
+    def test_new_working_image_invalidates_cache(self, tmp_path):
+        ctx = self._context(tmp_path, _header())
+        first = ctx.wcs_projection()
+        solved = tmp_path / "frame.new"
+        header = _header()
+        header["CRVAL1"] = 10.0
+        fits.PrimaryHDU(data=np.zeros((1500, 2000), dtype=np.uint8), header=header).writeto(solved)
+        ctx.working_image_path = solved
+        second = ctx.wcs_projection()
+        assert second is not first
+        assert second is not None
+        assert second.wcs.wcs.crval[0] == pytest.approx(10.0)
+
+    def test_missing_file_returns_none(self, tmp_path):
+        ctx = OpticalProcessingContext(working_image_path=tmp_path / "missing.fits")
+        assert ctx.wcs_projection() is None
@@ -1,12 +1,16 @@
 """Unit tests for the FastAPI web application."""
 
+import asyncio
+import json
 from unittest.mock import MagicMock, patch
 
+import numpy as np
 import pytest
 from fastapi.testclient import TestClient
 
 from citrasense.constants import AUTOFOCUS_TARGET_PRESETS
 from citrasense.web.app import CitraSenseWebApp, ConnectionManager
+from citrasense.web.connection_manager import unpack_binary_message
 
 # ---------------------------------------------------------------------------
 # Fixtures
@@ -161,6 +165,7 @@ def mock_daemon(mock_settings, mock_adapter):
     d.location_service = None
     d.ground_station = None
     d.api_client = MagicMock()
+    d.api_client.get_request_telemetry.return_value = {}
     d.telescope_record = {"id": "tel-1", "name": "Test Scope"}
 
     mock_sensor = MagicMock()
@@ -536,6 +541,20 @@ def test_get_status(client):
     assert sensor["camera_connected"] is True
 
 
+def test_status_includes_api_telemetry_summary(client, mock_daemon):
+    mock_daemon.api_client.get_request_telemetry.return_value = {"PUT /telescopes": {"requests": 1, "errors": 0}}
+    resp = client.get("/api/status")
+    assert resp.json()["api_telemetry"] == {"PUT /telescopes": {"requests": 1, "errors": 0}}
+    mock_daemon.api_client.get_request_telemetry.assert_called_with(summary=True)
+
+
+def test_get_metrics_serves_api_telemetry(client, mock_daemon):
+    mock_daemon.api_client.get_request_telemetry.return_value = {"GET /telescopes/{id}/tasks": {"requests": 3}}
+    resp = client.get("/api/metrics")
+    assert resp.status_code == 200
+    assert resp.json() == {"api_client": {"GET /telescopes/{id}/tasks": {"requests": 3}}}
+
+
 def test_get_status_no_daemon():
     with patch("citrasense.web.app.StaticFiles"):
         app = CitraSenseWebApp(daemon=None)
@@ -918,6 +937,89 @@ def test_connection_manager_disconnect_unknown():
     assert len(cm.active_connections) == 0
 
 
+class _FakeSocket:
+    def __init__(self):
+        self.json: list[dict] = []
+        self.binary: list[bytes] = []
+
+    async def accept(self):
+        pass
+
+    async def send_json(self, message):
+        self.json.append(message)
+
+    async def send_bytes(self, message):
+        self.binary.append(message)
+
+
+def test_broadcast_preview_encodes_once_per_subscribed_level():
+    from citrasense.sensors.preview_bus import PreviewBus
+
+    daemon = MagicMock()
+    daemon.preview_bus = PreviewBus()
+    with patch("citrasense.web.app.StaticFiles"):
+        app = CitraSenseWebApp(daemon=daemon)
+    cm = app.connection_manager
+    thumb_a, thumb_b, full, legacy = (_FakeSocket() for _ in range(4))
+
+    async def _run():
+        for ws in (thumb_a, thumb_b, full, legacy):
+            await cm.connect(ws)
+        assert cm.set_preview_size(thumb_a, 300) == 320
+        cm.set_preview_size(thumb_b, 320)
+        cm.set_preview_size(full, 0)
+        frame = daemon.preview_bus.push_array(np.zeros((960, 1280), dtype=np.uint16), "autofocus", sensor_id="scope-0")
+        await app.broadcast_preview()
+        return frame
+
+    frame = asyncio.run(_run())
+
+    assert sorted(frame._encoded) == [0, 320]
+    assert thumb_a.binary == thumb_b.binary
+    assert len(thumb_a.binary) == 1
+    header, jpeg = unpack_binary_message(thumb_a.binary[0])
+    assert header == {
+        "type": "preview",
+        "source": "autofocus",
+        "sensor_id": "scope-0",
+        "mime": "image/jpeg",
+        "width": 320,
+        "height": 240,
+        "level": 320,
+    }
+    assert jpeg == frame.jpeg(320).jpeg
+    assert unpack_binary_message(full.binary[0])[0]["width"] == 1280
+    assert legacy.binary == []
+    assert legacy.json[0]["type"] == "preview"
+    assert legacy.json[0]["data"].startswith("data:image/jpeg;base64,")
+
+
+def test_websocket_preview_subscribe():
+    with patch("citrasense.web.app.StaticFiles"):
+        app = CitraSenseWebApp(daemon=None)
+    with TestClient(app.app).websocket_connect("/ws") as ws:
+        assert ws.receive_json()["type"] == "status"
+        ws.send_text(json.dumps({"type": "preview_subscribe", "max_size": 700}))
+        assert ws.receive_json() == {"type": "preview_subscribed", "level": 1280}
+        ws.send_text("hello")
+        assert ws.receive_json() == {"type": "pong", "data": "hello"}
+        assert list(app.connection_manager.preview_groups()) == [1280]
+
+
+def test_websocket_preview_subscribe_rejects_bad_max_size():
+    with patch("citrasense.web.app.StaticFiles"):
+        app = CitraSenseWebApp(daemon=None)
+    with TestClient(app.app).websocket_connect("/ws") as ws:
+        assert ws.receive_json()["type"] == "status"
+        for bad in ("big", -5, [700], float("inf")):
+            ws.send_text(json.dumps({"type": "preview_subscribe", "max_size": bad}))
+            assert ws.receive_json()["type"] == "error"
+        # The socket stays usable.
+        ws.send_text("hello")
+        assert ws.receive_json() == {"type": "pong", "data": "hello"}
+        assert list(app.connection_manager.preview_groups()) == [None]
+
+
 # ---------------------------------------------------------------------------
 # Filter batch updates
 # ---------------------------------------------------------------------------
@@ -1538,6 +1640,15 @@ def test_radar_detections_passes_since_cursor_through(client_radar, mock_daemon_
     radar_sensor.get_recent_detections.assert_called_with(-300.0)
 
 
+def test_radar_detections_passes_max_points_through(client_radar, mock_daemon_radar):
+    resp = client_radar.get("/api/sensors/radar-0/radar/detections?since=-3600&max_points=500")
+    assert resp.status_code == 200
+    radar_sensor = mock_daemon_radar.sensor_manager.get_sensor("radar-0")
+    radar_sensor.get_recent_detections.assert_called_with(-3600.0, max_points=500)
+
+    assert client_radar.get("/api/sensors/radar-0/radar/detections?max_points=0").status_code == 400
+
+
 def test_radar_detections_404s_for_unknown_sensor(client_radar):
     resp = client_radar.get("/api/sensors/does-not-exist/radar/detections")
     assert resp.status_code == 404
@@ -1678,6 +1789,60 @@ def test_allsky_latest_jpg_404s_before_first_capture(client_allsky, mock_daemon_
     assert resp.status_code == 404
 
 
+def test_allsky_archive_lists_and_serves_frames(client_allsky, mock_daemon_allsky, tmp_path):
+    from datetime import datetime, timedelta, timezone
+
+    from citrasense.sensors.allsky.frame_archive import AllskyFrameArchive
+
+    archive = AllskyFrameArchive(tmp_path)
+    t0 = datetime(2026, 4, 30, 3, 0, tzinfo=timezone.utc)
+    for i in range(5):
+        archive.append(b"\xff\xd8" + bytes([i]), t0 + timedelta(minutes=i))
+    mock_daemon_allsky.sensor_manager.get_sensor("allsky-0").archive = archive
+
+    resp = client_allsky.get(
+        "/api/sensors/allsky-0/allsky/archive",
+        params={"start": "2026-04-30T03:01:00Z", "end": "2026-04-30T03:03:00Z"},
+    )
+    assert resp.status_code == 200
+    body = resp.json()
+    assert [f["captured_at"] for f in body["frames"]] == [
+        "2026-04-30T03:01:00+00:00",
+        "2026-04-30T03:02:00+00:00",
+        "2026-04-30T03:03:00+00:00",
+    ]
+    assert body["stats"]["frames"] == 5
+
+    frame = client_allsky.get(body["frames"][1]["url"])
+    assert frame.status_code == 200
+    assert frame.content == b"\xff\xd8\x02"
+    assert frame.headers["x-captured-at"] == "2026-04-30T03:02:00+00:00"
+    assert "immutable" in frame.headers["cache-control"]
+
+    # Past the newest frame: redirect (uncached) to that frame's own URL.
+    resp = client_allsky.get(
+        "/api/sensors/allsky-0/allsky/archive/frame.jpg",
+        params={"t": "2026-04-30T04:00:00Z"},
+        follow_redirects=False,
+    )
+    assert resp.status_code == 307
+    assert resp.headers["cache-control"] == "no-store"
+    newest = client_allsky.get(resp.headers["location"])
+    assert newest.content == b"\xff\xd8\x04"
+    assert "immutable" in newest.headers["cache-control"]
+
+
+def test_allsky_archive_409s_when_disabled(client_allsky, mock_daemon_allsky):
+    mock_daemon_allsky.sensor_manager.get_sensor("allsky-0").archive = None
+    resp = client_allsky.get("/api/sensors/allsky-0/allsky/archive")
+    assert resp.status_code == 409
+
+
+def test_allsky_archive_rejects_max_frames_below_one(client_allsky):
+    resp = client_allsky.get("/api/sensors/allsky-0/allsky/archive", params={"max_frames": 0})
+    assert resp.status_code == 400
+
+
 def test_allsky_status_404s_for_unknown_sensor(client_allsky):
     resp = client_allsky.get("/api/sensors/does-not-exist/allsky/status")
     assert resp.status_code == 404
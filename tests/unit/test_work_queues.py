@@ -135,16 +135,29 @@ def test_clear_cancels_pending_retry_timers():
     q.work_queue.put({"task_id": "t1", "task": MagicMock()})
     time.sleep(0.5)
 
-    assert len(q._pending_timers) == 1
-    timer = q._pending_timers[0]
+    assert len(q._pending_retries) == 1
+    (handle,) = q._pending_retries
 
     q.clear()
-    # cancel() prevents the callback; timer thread may take a moment to exit
-    assert timer.finished.is_set()
-    assert len(q._pending_timers) == 0
+    # cancel() prevents the callback from running when its time comes
+    assert handle.finished
+    assert not handle.fired
+    assert len(q._pending_retries) == 0
     q.stop()
 
 
+def test_stop_cancels_pending_retries():
+    q = StubQueue(execute_fn=lambda item: (False, None), max_retries=3, initial_delay=60, max_delay=120)
+    q.start()
+    q.work_queue.put({"task_id": "t1", "task": MagicMock()})
+    time.sleep(0.5)
+    (handle,) = q._pending_retries
+
+    q.stop()
+    assert handle.cancelled
+    assert not q._pending_retries
+
+
 def test_clear_maxes_retry_counts():
     q = StubQueue(max_retries=5)
     q.retry_counts["t1"] = 1
@@ -176,6 +189,30 @@ def test_clear_epoch_discards_in_flight_result():
     assert len(q.success_items) == 0
 
 
+def test_clear_cancels_in_flight_items_on_every_worker():
+    barrier = threading.Event()
+    cancelled = []
+
+    class MultiQueue(StubQueue):
+        def _cancel_current_item(self, item):
+            cancelled.append(item["task_id"])
+
+    q = MultiQueue(execute_fn=lambda item: (barrier.wait(5), (True, "ok"))[1])
+    q.num_workers = 3
+    q.start()
+    for i in range(3):
+        q.work_queue.put({"task_id": f"t{i}", "task": MagicMock()})
+    time.sleep(0.2)
+
+    q.clear()
+    barrier.set()
+    time.sleep(0.3)
+    q.stop()
+
+    assert sorted(cancelled) == ["t0", "t1", "t2"]
+    assert q._in_flight == {}
+
+
 # ---------------------------------------------------------------------------
 # AcquisitionQueue
 # ---------------------------------------------------------------------------
@@ -205,7 +242,7 @@ def test_acquisition_queue_clear_cancels_in_flight_task():
     iq.submit("t1", MagicMock(), FakeTelescopeTask(), MagicMock())
     time.sleep(0.2)
 
-    assert iq._current_item is not None
+    assert iq._in_flight
     iq.clear()
     assert cancel_event.is_set()
     time.sleep(0.3)
@@ -424,6 +461,87 @@ def test_processing_queue_on_success_keeps_output():
     on_complete.assert_called_once_with("t1", "result")
 
 
+def test_processing_queue_on_success_submits_render_job_after_on_complete():
+    from citrasense.acquisition.processing_queue import ProcessingQueue
+
+    global_settings = MagicMock()
+    global_settings.processing_output_retention_hours = -1
+    render_queue = MagicMock()
+    pq = ProcessingQueue(num_workers=1, settings=global_settings, logger=MagicMock(), render_queue=render_queue)
+    calls = []
+    on_complete = MagicMock(side_effect=lambda *_a: calls.append("on_complete"))
+    render_queue.submit.side_effect = lambda _job: calls.append("render")
+    render_job = MagicMock()
+    item = {
+        "task_id": "t1",
+        "context": {"task": MagicMock()},
+        "on_complete": on_complete,
+        "render_job": render_job,
+    }
+    pq._on_success(item, "result")
+    render_queue.submit.assert_called_once_with(render_job)
+    assert calls == ["on_complete", "render"]
+
+
+def test_processing_queue_defers_rendering_only_with_render_queue():
+    from citrasense.acquisition.processing_queue import ProcessingQueue
+
+    settings = MagicMock(defer_presentation_rendering=True)
+    assert ProcessingQueue(num_workers=1, settings=settings, logger=MagicMock()).defers_rendering is False
+    pq = ProcessingQueue(num_workers=1, settings=settings, logger=MagicMock(), render_queue=MagicMock())
+    assert pq.defers_rendering is True
+    settings.defer_presentation_rendering = False
+    assert pq.defers_rendering is False
+
+
+def test_processing_queue_render_job_renders_snapshot_and_notifies(tmp_path):
+    from citrasense.acquisition.processing_queue import ProcessingQueue
+    from citrasense.acquisition.render_queue import RenderQueue
+
+    global_settings = MagicMock()
+    global_settings.processing_output_retention_hours = 0
+    pq = ProcessingQueue(num_workers=1, settings=global_settings, logger=MagicMock())
+    context = MagicMock()
+    context.deferred_annotation = MagicMock()
+    on_rendered = MagicMock()
+    item = {"task_id": "t1", "context": {"on_rendered": on_rendered}}
+
+    preview = tmp_path / "latest_preview.jpg"
+    with (
+        patch(
+            "citrasense.pipelines.optical.annotated_image_processor.AnnotatedImageProcessor.render",
+            return_value=b"jpeg-t1",
+        ),
+        patch(
+            "citrasense.pipelines.optical.annotated_image_processor.AnnotatedImageProcessor.write_rendered",
+            return_value=(preview, None),
+        ) as mock_render,
+        patch("citrasense.pipelines.optical.report_generator.generate_html_report") as mock_report,
+    ):
+        job = pq._build_render_job(item, context)
+        assert job is not None
+        rq = RenderQueue(logger=MagicMock())
+        rq.submit(job)
+        rq.render_now("t1")
+
+    assert job.succeeded
+    assert mock_render.call_args.kwargs["write_working_copy"] is False
+    mock_report.assert_not_called()
+    # The task's own bytes travel with the callback; the rolling preview may be overwritten by then.
+    on_rendered.assert_called_once_with("t1", str(preview), b"jpeg-t1")
+
+
+def test_processing_queue_render_job_skipped_without_snapshot_or_kept_output():
+    from citrasense.acquisition.processing_queue import ProcessingQueue
+
+    global_settings = MagicMock()
+    global_settings.processing_output_retention_hours = 0
+    pq = ProcessingQueue(num_workers=1, settings=global_settings, logger=MagicMock())
+    context = MagicMock()
+    context.deferred_annotation = None
+    assert pq._build_render_job({"task_id": "t1", "context": {}}, context) is None
+
+
 def test_processing_queue_on_permanent_failure():
     from citrasense.acquisition.processing_queue import ProcessingQueue
 
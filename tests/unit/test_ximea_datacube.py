@@ -0,0 +1,110 @@
+"""Tests for the Ximea snapshot-mosaic datacube path and the streaming band writer."""
+
+from __future__ import annotations
+
+import logging
+
+import numpy as np
+import pytest
+from astropy.io import fits
+
+from citrasense.hardware.devices.camera.fits_writer import image_extension_header, write_image_extensions
+from citrasense.hardware.devices.camera.ximea_camera import XimeaHyperspectralCamera
+from citrasense.sensors.telescope.fits_enrichment import patch_primary_header
+
+
+def _camera(bands: int, **kwargs) -> XimeaHyperspectralCamera:
+    return XimeaHyperspectralCamera(logging.getLogger("test"), spectral_bands=bands, data_mode="datacube", **kwargs)
+
+
+def _mosaic(shape: tuple[int, int], dtype=np.uint16) -> np.ndarray:
+    return np.random.default_rng(0).integers(0, np.iinfo(dtype).max, size=shape, dtype=dtype)
+
+
+@pytest.mark.parametrize(("bands", "shape"), [(16, (34, 41)), (25, (27, 53))])
+def test_band_views_match_strided_slices(bands, shape):
+    camera = _camera(bands)
+    mosaic = _mosaic(shape)
+    n = int(np.sqrt(bands))
+    out_h, out_w = shape[0] // n, shape[1] // n
+
+    views = camera._demosaic_band_views(mosaic)
+    cube = camera._demosaic_to_datacube(mosaic)
+
+    assert len(views) == bands
+    assert cube.shape == (out_h, out_w, bands)
+    for i, view in enumerate(views):
+        expected = mosaic[i // n :: n, i % n :: n][:out_h, :out_w]
+        assert np.shares_memory(view, mosaic)
+        np.testing.assert_array_equal(view, expected)
+        np.testing.assert_array_equal(cube[:, :, i], expected)
+
+
+def test_non_square_band_count_raises():
+    with pytest.raises(ValueError, match="not a perfect square"):
+        _camera(20)._demosaic_band_views(_mosaic((40, 40)))
+
+
+@pytest.mark.parametrize("dtype", [np.uint8, np.uint16])
+def test_datacube_save_streams_one_extension_per_band(tmp_path, dtype):
+    wavelengths = ",".join(str(600 + 10 * i) for i in range(16))
+    camera = _camera(16, wavelength_calibration=wavelengths)
+    mosaic = _mosaic((64, 80), dtype)
+    path = tmp_path / "cube.fits"
+
+    camera._save_hyperspectral_data(mosaic, path)
+
+    cube = camera._demosaic_to_datacube(mosaic)
+    with fits.open(path) as hdul:
+        hdul.verify("exception")
+        assert len(hdul) == 17
+        assert hdul[0].header["HIERARCH DATA_MODE"] == "datacube"
+        assert hdul[0].header["HIERARCH WAVELENGTH_COUNT"] == 16
+        for i in range(16):
+            band = hdul[i + 1]
+            assert band.name == f"BAND_{i:03d}"
+            assert band.header["BANDNUM"] == i
+            assert band.header["WAVELENG"] == 600 + 10 * i
+            assert band.data.dtype == np.dtype(dtype)
+            np.testing.assert_array_equal(band.data, cube[:, :, i])
+
+
+def test_write_image_extensions_round_trips_dtypes(tmp_path):
+    rng = np.random.default_rng(1)
+    arrays = [
+        rng.integers(-30000, 30000, size=(5, 7), dtype=np.int16),
+        rng.integers(0, 2**32 - 1, size=(3, 4), dtype=np.uint32),
+        rng.standard_normal((6, 2)).astype(np.float32),
+        rng.standard_normal((2, 9))[:, ::2],  # non-contiguous float64 view
+    ]
+    extensions = [(image_extension_header(a.shape, a.dtype, name=f"E{i}"), a) for i, a in enumerate(arrays)]
+    path = tmp_path / "ext.fits"
+
+    write_image_extensions(path, fits.Header([("OBSERVER", "bench")]), extensions, max_workers=2)
+
+    with fits.open(path) as hdul:
+        hdul.verify("exception")
+        assert hdul[0].header["OBSERVER"] == "bench"
+        for i, expected in enumerate(arrays):
+            np.testing.assert_array_equal(hdul[f"E{i}"].data, expected)
+
+
+def test_write_image_extensions_rejects_shape_mismatch(tmp_path):
+    data = np.zeros((4, 4), dtype=np.uint16)
+    with pytest.raises(ValueError, match="does not match"):
+        write_image_extensions(tmp_path / "x.fits", fits.Header(), [(image_extension_header((4, 5), data.dtype), data)])
+
+
+def test_streamed_primary_header_is_patched_in_place(tmp_path):
+    camera = _camera(16)
+    path = tmp_path / "cube.fits"
+    camera._save_hyperspectral_data(_mosaic((32, 32)), path)
+
+    def _update(header):
+        for i in range(20):
+            header[f"ENR{i}"] = i
+
+    patch = patch_primary_header(path, _update)
+
+    assert patch is not None
+    assert patch.in_place
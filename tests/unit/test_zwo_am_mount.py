@@ -1,5 +1,6 @@
 """Tests for ZwoAmMount device — methods that require a mocked transport."""
 
+import queue
 import threading
 import time
 from datetime import datetime, timezone
@@ -99,18 +100,19 @@ class TestCustomTrackingRates:
 
 
 class _FakeTransport(ZwoAmTransport):
-    """In-memory transport that records command order for concurrency testing."""
+    """In-memory transport: answers each command after a delay, echoing its mnemonic."""
 
     def __init__(self) -> None:
         super().__init__(timeout_s=1.0, retry_count=1)
         self.log: list[str] = []
         self._log_lock = threading.Lock()
+        self._replies: queue.Queue[bytes] = queue.Queue()
 
     def open(self) -> None:
         pass
 
     def close(self) -> None:
-        pass
+        self._stop_reader()
 
     def is_open(self) -> bool:
         return True
@@ -119,53 +121,38 @@ class _FakeTransport(ZwoAmTransport):
         cmd = data.decode("ascii")
         with self._log_lock:
             self.log.append(f"TX:{cmd}")
-        time.sleep(0.05)
-
-    def _read_until_hash(self) -> str:
-        time.sleep(0.05)
-        with self._log_lock:
-            self.log.append("RX")
-        return "ok#"
-
-    def _clear_input(self) -> None:
-        pass
+        self._replies.put(f"ok{cmd[1:4]}#".encode("ascii"))
 
-    def _try_read_one(self) -> str | None:
-        return None
+    def _read_available(self) -> bytes:
+        try:
+            reply = self._replies.get(timeout=0.05)
+        except queue.Empty:
+            return b""
+        time.sleep(0.05)  # firmware turnaround; replies still arrive in command order
+        return reply
 
 
 class TestTransportThreadSafety:
-    def test_concurrent_commands_do_not_interleave(self):
+    def test_concurrent_commands_get_their_own_responses(self):
         transport = _FakeTransport()
         errors: list[Exception] = []
+        results: dict[str, str] = {}
 
-        def send_a():
+        def send(cmd: str):
             try:
-                transport.send_command(":AAA#")
+                results[cmd] = transport.send_command(cmd)
             except Exception as e:
                 errors.append(e)
 
-        def send_b():
-            try:
-                transport.send_command(":BBB#")
-            except Exception as e:
-                errors.append(e)
-
-        t1 = threading.Thread(target=send_a)
-        t2 = threading.Thread(target=send_b)
-        t1.start()
-        t2.start()
-        t1.join()
-        t2.join()
+        threads = [threading.Thread(target=send, args=(cmd,)) for cmd in (":AAA#", ":BBB#")]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        transport.close()
 
         assert not errors
-
-        # With the lock, we expect TX/RX pairs to be atomic (never interleaved).
-        # Either [TX:A, RX, TX:B, RX] or [TX:B, RX, TX:A, RX].
-        assert len(transport.log) == 4
-        assert transport.log[0].startswith("TX:")
-        assert transport.log[1] == "RX"
-        assert transport.log[2].startswith("TX:")
-        assert transport.log[3] == "RX"
-        # The two TX commands should be different (not mixed)
-        assert transport.log[0] != transport.log[2]
+        # Responses are matched to commands by order, so each caller gets its own
+        # reply even though both commands were in flight together.
+        assert results == {":AAA#": "okAAA#", ":BBB#": "okBBB#"}
+        assert len(transport.log) == 2
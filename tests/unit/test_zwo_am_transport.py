@@ -0,0 +1,337 @@
+"""Tests for the ZWO AM transport: response framing, pipelining and latency stats against a pty fake mount."""
+
+from __future__ import annotations
+
+import os
+import select
+import sys
+import threading
+import time
+
+import pytest
+
+from citrasense.hardware.devices.mount.zwo_am_transport import (
+    FrameKind,
+    LatencyHistogram,
+    ResponseFramer,
+    ZwoAmTransport,
+    command_type,
+)
+
+pytestmark = pytest.mark.skipif(sys.platform == "win32", reason="needs a pseudo-terminal")
+
+_REPLIES: dict[str, str | tuple[str, ...]] = {
+    ":GR#": "12:34:56#",
+    ":GD#": "+45*30:00#",
+    ":GZ#": "120*30:00#",
+    ":GA#": "+55*00:00#",
+    ":GU#": "nNZ#",
+    ":GVP#": "AM5#",
+    ":Sr": "1",
+    ":Sd": "1#",
+    ":MS#": "0",
+    ":SC": "1Updating Planetary Data#                              #",
+}
+
+
+class _PtyFakeMount:
+    """Scripted ZWO AM firmware on the master side of a pty.
+
+    Replies by exact command, then by mnemonic; unknown commands (``:Q#``)
+    get no reply.  A tuple reply is written as separate chunks 20 ms apart.
+    With ``hold`` > 1 it answers nothing until that many
+    commands have arrived, which only a pipelining client can satisfy.
+    """
+
+    def __init__(self, hold: int = 1, delay_s: float = 0.0, replies: dict[str, str | tuple[str, ...]] | None = None):
+        import tty
+
+        self.master, self.slave = os.openpty()
+        tty.setraw(self.slave)
+        self.hold = hold
+        self.delay_s = delay_s
+        self.replies = dict(_REPLIES, **(replies or {}))
+        self.received: list[str] = []
+        self._running = True
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def _reply_for(self, command: str) -> str | tuple[str, ...]:
+        return self.replies.get(command, self.replies.get(command_type(command), ""))
+
+    def _run(self) -> None:
+        buf = b""
+        held: list[str] = []
+        while self._running:
+            ready, _, _ = select.select([self.master], [], [], 0.05)
+            if not ready:
+                continue
+            try:
+                buf += os.read(self.master, 1024)
+            except OSError:
+                return
+            while b"#" in buf:
+                raw, _, buf = buf.partition(b"#")
+                command = raw.decode("ascii") + "#"
+                self.received.append(command)
+                held.append(command)
+            if len(held) >= self.hold:
+                for command in held:
+                    time.sleep(self.delay_s)
+                    reply = self._reply_for(command)
+                    for i, chunk in enumerate(reply if isinstance(reply, tuple) else (reply,)):
+                        if i:
+                            time.sleep(0.02)
+                        os.write(self.master, chunk.encode("ascii"))
+                held.clear()
+
+    def close(self) -> None:
+        self._running = False
+        self._thread.join(timeout=2)
+        os.close(self.master)
+        os.close(self.slave)
+
+
+class _PtyTransport(ZwoAmTransport):
+    """Transport over the slave end of the fake mount's pty (what pyserial does on a real tty)."""
+
+    def __init__(self, fd: int, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.fd = fd
+        self._open = False
+
+    def open(self) -> None:
+        self._open = True
+        self._ensure_reader()
+
+    def close(self) -> None:
+        self._open = False
+        self._stop_reader()
+
+    def is_open(self) -> bool:
+        return self._open
+
+    def _write(self, data: bytes) -> None:
+        os.write(self.fd, data)
+
+    def _read_available(self) -> bytes:
+        ready, _, _ = select.select([self.fd], [], [], 0.05)
+        return os.read(self.fd, 1024) if ready else b""
+
+
+@pytest.fixture
+def fake_mount():
+    mounts: list[_PtyFakeMount] = []
+
+    def _make(**kwargs) -> _PtyFakeMount:
+        mounts.append(_PtyFakeMount(**kwargs))
+        return mounts[-1]
+
+    yield _make
+    for m in mounts:
+        m.close()
+
+
+@pytest.fixture
+def connect(fake_mount):
+    transports: list[_PtyTransport] = []
+
+    def _connect(timeout_s: float = 1.0, max_in_flight: int = 4, **mount_kwargs) -> tuple[_PtyTransport, _PtyFakeMount]:
+        mount = fake_mount(**mount_kwargs)
+        transport = _PtyTransport(mount.slave, timeout_s=timeout_s, retry_count=1, max_in_flight=max_in_flight)
+        transport.open()
+        transports.append(transport)
+        return transport, mount
+
+    yield _connect
+    for t in transports:
+        t.close()
+
+
+# ── Framing ────────────────────────────────────────────────────────────
+
+
+def test_framer_reassembles_split_hash_responses():
+    framer = ResponseFramer()
+    framer.feed(b"12:3")
+    assert framer.pop(FrameKind.HASH) is None
+    framer.feed(b"4:56#+45*")
+    assert framer.pop(FrameKind.HASH) == "12:34:56#"
+    assert framer.pop(FrameKind.HASH) is None
+    framer.feed(b"30:00#")
+    assert framer.pop(FrameKind.HASH) == "+45*30:00#"
+
+
+@pytest.mark.parametrize("wire", [b"1nNZ#", b"1#nNZ#"])
+def test_framer_short_reply_with_or_without_hash(wire):
+    framer = ResponseFramer()
+    framer.feed(wire)
+    assert framer.pop(FrameKind.SHORT) == "1"
+    assert framer.pop(FrameKind.HASH) == "nNZ#"
+
+
+def test_framer_short_reply_error_code_and_late_hash():
+    framer = ResponseFramer()
+    framer.feed(b"e6#0")
+    assert framer.pop(FrameKind.SHORT) == "e6"
+    assert framer.pop(FrameKind.SHORT) == "0"
+    framer.feed(b"#")  # terminator arriving in a later read is still dropped
+    assert framer.discard() == 0
+
+
+def test_command_type_and_histogram():
+    assert command_type(":Sr12:34:56#") == ":Sr"
+    assert command_type(":GVP#") == ":GVP"
+
+    hist = LatencyHistogram()
+    for ms in (0.5, 3, 3, 4, 30, 3000):
+        hist.record(ms / 1000)
+    stats = hist.to_dict()
+    assert stats["count"] == 6
+    assert stats["p50_ms"] == 5.0
+    assert stats["p95_ms"] == pytest.approx(3000.0)
+    assert stats["buckets"] == {"<=1ms": 1, "<=5ms": 3, "<=50ms": 1, ">2000ms": 1}
+
+
+# ── Against the pty fake mount ─────────────────────────────────────────
+
+
+def test_round_trip_and_latency_stats(connect):
+    transport, _ = connect()
+
+    assert transport.send_command(":GR#") == "12:34:56#"
+    assert transport.send_command_with_retry(":GVP#") == "AM5#"
+
+    latency = transport.get_stats()["latency"]
+    assert latency[":GR"]["count"] == 1
+    assert latency[":GVP"]["count"] == 1
+    assert latency[":GR"]["max_ms"] < 1000
+
+
+def test_pipelined_queries_are_in_flight_together(connect):
+    # The fake mount answers nothing until three commands have arrived.
+    transport, mount = connect(hold=3)
+
+    responses = transport.send_commands([":GR#", ":GD#", ":GU#"])
+
+    assert responses == ["12:34:56#", "+45*30:00#", "nNZ#"]
+    assert mount.received == [":GR#", ":GD#", ":GU#"]
+
+
+def test_pipeline_depth_is_bounded(connect):
+    transport, _ = connect(max_in_flight=2, hold=3, timeout_s=0.3)
+
+    # Only two of three may be written before the first reply, so the mount never answers.
+    with pytest.raises(TimeoutError):
+        transport.send_commands([":GR#", ":GD#", ":GU#"])
+
+
+def test_concurrent_callers_get_their_own_responses(connect):
+    transport, _ = connect(delay_s=0.005)
+    commands = [":GR#", ":GD#", ":GZ#", ":GA#", ":GU#"] * 4
+    results: dict[int, str] = {}
+
+    def _ask(i: int, command: str) -> None:
+        results[i] = transport.send_command(command)
+
+    threads = [threading.Thread(target=_ask, args=(i, c)) for i, c in enumerate(commands)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join(5)
+
+    assert results == {i: _REPLIES[c] for i, c in enumerate(commands)}
+
+
+def test_bool_reply_without_hash_returns_without_settle_wait(connect):
+    transport, _ = connect()
+
+    t0 = time.monotonic()
+    assert transport.send_command_bool(":Sr12:00:00#") is True
+    elapsed = time.monotonic() - t0
+
+    # The old reader slept 100 ms + 50 ms after a bare digit to look for a '#'.
+    assert elapsed < 0.1
+    assert transport.send_command_bool_with_retry(":Sd+45*00:00#") is True
+    assert transport.send_command(":GU#") == "nNZ#"
+
+
+def test_goto_success_and_error(connect):
+    transport, _ = connect(replies={":MS#": "0"})
+    assert transport.send_goto_command(":MS#") == "0"
+
+    transport, _ = connect(replies={":MS#": "e6#"})
+    assert transport.send_goto_command(":MS#") == "e6"
+
+
+def test_trailing_text_after_set_date_is_dropped(connect):
+    transport, _ = connect()
+
+    assert transport.send_command_bool(":SC03/15/26#") is True
+    assert transport.send_command(":GR#") == "12:34:56#"
+    assert transport.get_stats()["stray_bytes"] > 0
+
+
+def test_short_reply_trailer_in_a_later_chunk_is_not_framed_as_the_next_reply(connect):
+    transport, mount = connect(replies={":SC": ("1", "Updating Planetary Data#")})
+
+    assert transport.send_command_bool(":SC03/15/26#") is True
+    assert transport.send_command(":GR#") == "12:34:56#"
+    assert mount.received == [":SC03/15/26#", ":GR#"]
+    assert transport.get_stats()["stray_bytes"] == len("Updating Planetary Data#")
+
+
+def test_fire_and_forget_then_query(connect):
+    transport, mount = connect()
+
+    transport.send_command_no_response(":Q#")
+    assert transport.send_command(":GD#") == "+45*30:00#"
+    assert mount.received == [":Q#", ":GD#"]
+
+
+def test_timeout_then_late_reply_does_not_shift_responses(connect):
+    transport, _ = connect(timeout_s=0.2, delay_s=0.3)
+
+    with pytest.raises(TimeoutError):
+        transport.send_command(":GR#")
+    assert transport.get_stats()["timeouts"] == 1
+    time.sleep(0.2)  # late :GR# reply arrives while nothing live is waiting
+
+    transport.timeout_s = 2.0
+    assert transport.send_command(":GD#") == "+45*30:00#"
+
+
+def test_close_fails_waiters(connect):
+    transport, _ = connect(hold=99, timeout_s=5.0)
+    errors: list[Exception] = []
+
+    def _ask() -> None:
+        try:
+            transport.send_command(":GR#")
+        except Exception as exc:
+            errors.append(exc)
+
+    thread = threading.Thread(target=_ask)
+    thread.start()
+    time.sleep(0.05)
+    transport.close()
+    thread.join(2)
+
+    assert len(errors) == 1
+    assert isinstance(errors[0], ConnectionError)
+    with pytest.raises(ConnectionError):
+        transport.send_command(":GR#")
+
+
+def test_serial_transport_over_pty(fake_mount):
+    pytest.importorskip("serial")
+    from citrasense.hardware.devices.mount.zwo_am_transport import SerialTransport
+
+    mount = fake_mount()
+    transport = SerialTransport(os.ttyname(mount.slave), timeout_s=1.0, retry_count=1)
+    transport.open()
+    try:
+        assert transport.send_commands([":GR#", ":GD#"]) == ["12:34:56#", "+45*30:00#"]
+        assert transport.send_command_bool(":Sr12:00:00#") is True
+    finally:
+        transport.close()